@@ -4,30 +4,65 @@
 定義所有圖表的樣式和配置參數，支援現代化視覺效果
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.colors import LinearSegmentedColormap
+from collections.abc import Mapping
+from functools import wraps
+from pathlib import Path
+
 import numpy as np
-import seaborn as sns
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from src.utils import lazy_import
+
+# matplotlib 延遲到第一次繪圖或取用色圖時才載入
+plt = lazy_import('matplotlib.pyplot')
+mcolors = lazy_import('matplotlib.colors')
+
+
+class ColorSchemes(Mapping):
+    """顏色方案表：固定色表直接保存，色圖類方案在第一次取用時才建立"""
+    
+    def __init__(self, fixed, deferred):
+        self._schemes = dict(fixed)
+        self._deferred = dict(deferred)
+    
+    def __getitem__(self, scheme):
+        if scheme not in self._schemes:
+            if scheme not in self._deferred:
+                raise KeyError(scheme)
+            self._schemes[scheme] = self._deferred.pop(scheme)()
+        return self._schemes[scheme]
+    
+    def __contains__(self, scheme):
+        return scheme in self._schemes or scheme in self._deferred
+    
+    def __iter__(self):
+        yield from list(self._schemes)
+        yield from list(self._deferred)
+    
+    def __len__(self):
+        return len(self._schemes) + len(self._deferred)
 
 
 class ChartConfig:
     """增強版圖表配置類"""
     
     # 現代化顏色方案
-    COLORS = {
-        'primary': plt.cm.tab10(np.linspace(0, 1, 10)),
-        'viridis': plt.cm.viridis(np.linspace(0, 1, 10)),
-        'set3': plt.cm.Set3(np.linspace(0, 1, 8)),
-        'gradient_blue': LinearSegmentedColormap.from_list('gradient_blue', 
-                        ['#E3F2FD', '#1976D2', '#0D47A1']),
-        'gradient_green': LinearSegmentedColormap.from_list('gradient_green', 
-                         ['#E8F5E8', '#4CAF50', '#2E7D32']),
+    # 依賴 matplotlib 色圖的方案延遲建立，避免匯入本模組時就載入 matplotlib
+    COLORS = ColorSchemes({
         'cyberpunk': ['#FF073A', '#39FF14', '#00FFFF', '#FF4500', '#8A2BE2', 
                      '#FFD700', '#FF1493', '#00FF7F', '#DC143C', '#1E90FF'],
         'modern_dark': ['#1F2937', '#374151', '#6B7280', '#9CA3AF', '#D1D5DB'],
         'neon': ['#FF0080', '#00FF80', '#8000FF', '#FF8000', '#0080FF']
-    }
+    }, {
+        'primary': lambda: plt.cm.tab10(np.linspace(0, 1, 10)),
+        'viridis': lambda: plt.cm.viridis(np.linspace(0, 1, 10)),
+        'set3': lambda: plt.cm.Set3(np.linspace(0, 1, 8)),
+        'gradient_blue': lambda: mcolors.LinearSegmentedColormap.from_list('gradient_blue', 
+                        ['#E3F2FD', '#1976D2', '#0D47A1']),
+        'gradient_green': lambda: mcolors.LinearSegmentedColormap.from_list('gradient_green', 
+                         ['#E8F5E8', '#4CAF50', '#2E7D32'])
+    })
     
     # 適應性圖表尺寸
     FIGURE_SIZES = {
@@ -53,6 +88,9 @@ class ChartConfig:
     # 增強圖表樣式
     CHART_STYLE = {
         'dpi': 300,
+        'preview_dpi': 72,  # 預覽等級：約為完整解析度的 1/17 像素數
+        'png_compress_level': 6,  # 背景 PNG 編碼的 zlib 等級 (0-9)：越低越快、檔案越大
+        'png_colors': None,  # 背景 PNG 編碼量化為調色盤的色數 (2-256)，None 為不量化
         'bbox_inches': 'tight',
         'alpha': 0.85,
         'linewidth': 2.5,
@@ -65,6 +103,9 @@ class ChartConfig:
         'gradient_alpha': 0.7
     }
     
+    # 隨機視覺效果的固定種子（確保每次輸出一致）
+    RANDOM_SEED = 42
+    
     # 3D效果配置
     EFFECT_3D = {
         'elevation': 20,
@@ -156,7 +197,8 @@ class ChartConfig:
         'performance': 'advanced_performance_analysis.png',
         'summary_table': 'professional_algorithm_summary.png',
         'animated_chart': 'animated_comparison.gif',
-        'interactive_dashboard': 'interactive_dashboard.html'
+        'interactive_dashboard': 'interactive_dashboard.html',
+        'pdf_report': 'algorithm_report.pdf'
     }
     
     # 圖表佈局配置
@@ -179,6 +221,24 @@ class ChartConfig:
             return [cls.COLORS[scheme](i/n_colors) for i in range(n_colors)]
         return cls.get_color_scheme('primary')
     
+    @classmethod
+    def get_colormap(cls, scheme):
+        """以色圖表示顏色方案（固定色表轉為線性漸變，未定義的名稱視為 matplotlib 色圖）"""
+        colors = cls.COLORS.get(scheme)
+        if callable(colors):
+            return colors
+        if colors is None:
+            return plt.get_cmap(scheme)
+        return mcolors.LinearSegmentedColormap.from_list(scheme, colors)
+
+    @classmethod
+    def get_colors(cls, scheme, n_colors):
+        """獲取 n 個顏色：固定色表足夠時直接取用，否則從色圖取樣"""
+        colors = cls.COLORS.get(scheme)
+        if colors is not None and not callable(colors) and len(colors) >= n_colors:
+            return colors[:n_colors]
+        return cls.get_colormap(scheme)(np.linspace(0, 1, n_colors))
+
     @classmethod
     def get_figure_size(cls, chart_type='main_comparison'):
         """獲取指定圖表類型的尺寸"""
@@ -194,6 +254,26 @@ class ChartConfig:
         """獲取主題樣式"""
         return cls.THEMES.get(theme, cls.THEMES['professional'])
     
+    @classmethod
+    def get_theme_rc(cls, theme='professional'):
+        """獲取主題對應的 rcParams 設定"""
+        theme_style = cls.get_theme_style(theme)
+        return {
+            'font.sans-serif': ['Microsoft YaHei', 'SimHei', 'DejaVu Sans'],
+            'axes.unicode_minus': False,
+            'figure.facecolor': theme_style['background'],
+            'axes.facecolor': theme_style['background'],
+            'text.color': theme_style['text_color'],
+            'axes.labelcolor': theme_style['text_color'],
+            'xtick.color': theme_style['text_color'],
+            'ytick.color': theme_style['text_color']
+        }
+    
+    @classmethod
+    def theme_context(cls, theme='professional'):
+        """建立僅在區塊內生效的主題樣式，離開後還原全局 rcParams"""
+        return plt.style.context(['default', cls.get_theme_rc(theme)])
+    
     @classmethod
     def apply_modern_style(cls, ax, title="", theme='professional'):
         """應用現代化樣式到軸"""
@@ -237,6 +317,15 @@ class ChartConfig:
         gradient = np.vstack((gradient, gradient))
         
         ax.imshow(gradient, extent=ax.get_xlim() + ax.get_ylim(), 
-                 aspect='auto', cmap=LinearSegmentedColormap.from_list('bg', colors),
+                 aspect='auto', cmap=mcolors.LinearSegmentedColormap.from_list('bg', colors),
                  alpha=0.3, zorder=0)
         return ax
+
+
+def themed(method):
+    """以生成器的 theme 屬性包裹繪圖方法，使主題樣式只作用於該方法建立的圖表"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with ChartConfig.theme_context(self.theme):
+            return method(self, *args, **kwargs)
+    return wrapper
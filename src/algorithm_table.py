@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+演算法資料表模組
+將演算法資料的等級字串一次解析為整數編碼，供所有圖表生成器共用
+"""
+
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+# 動態導入配置模組
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config.algorithm_data import COMPLEXITY_MAPPING
+
+
+# 等級欄位定義：欄位 -> (依序的等級, 無法辨識時的編碼)
+# 複雜度類欄位的編碼與 COMPLEXITY_MAPPING 一致（1~6，預設為「中」）
+LEVEL_COLUMNS = {
+    '預測精度': (['低', '低-中', '中', '中-高', '高'], 0),
+    '計算複雜度': (list(COMPLEXITY_MAPPING), COMPLEXITY_MAPPING['中']),
+    '算力需求': (list(COMPLEXITY_MAPPING), COMPLEXITY_MAPPING['中']),
+    '記憶體需求': (list(COMPLEXITY_MAPPING), COMPLEXITY_MAPPING['中']),
+    '可平行化': (['限制', '部分', '高', '極高'], 0)
+}
+
+# 等級字串括號內的註記，各自拆成獨立的旗標欄位
+FLAG_ANNOTATIONS = ['GPU', '波動']
+
+# 適用場景分類，依序比對關鍵字
+SCENARIO_CATEGORIES = ['預測類', '分類類', '深度學習類', '其他類']
+SCENARIO_KEYWORDS = [
+    ('預測類', ['預測']),
+    ('分類類', ['分類', '特徵']),
+    ('深度學習類', ['建模', '圖像', '多模態'])
+]
+
+
+def parse_level(value):
+    """將等級字串拆為 (等級, 註記)，例如 '極高(GPU)' -> ('極高', 'GPU')"""
+    base, _, rest = str(value).partition('(')
+    return base, rest.rstrip(')') or None
+
+
+def categorize_scenario(scenario):
+    """將適用場景歸入 SCENARIO_CATEGORIES 之一"""
+    for category, keywords in SCENARIO_KEYWORDS:
+        if any(keyword in scenario for keyword in keywords):
+            return category
+    return '其他類'
+
+
+def _encode_unique(series, encode):
+    """只對不重複值呼叫 encode，再以類別編碼向量化展開到每一列"""
+    categorical = pd.Categorical(series)
+    lookup = [encode(value) for value in categorical.categories]
+    return categorical.codes, lookup
+
+
+class AlgorithmTable:
+    """演算法資料表：保留原始欄位，等級欄位另存為 int8 編碼"""
+
+    def __init__(self, frame, levels, flags, scenario_codes):
+        self.frame = frame.reset_index(drop=True)
+        self.levels = levels
+        self.flags = flags
+        self.scenario_codes = scenario_codes
+
+    @classmethod
+    def from_frame(cls, df):
+        """從 DataFrame 建立資料表（每個欄位一次向量化編碼）"""
+        levels = {}
+        flags = {flag: np.zeros(len(df), dtype=bool) for flag in FLAG_ANNOTATIONS}
+
+        for column, (order, default) in LEVEL_COLUMNS.items():
+            if column not in df.columns:
+                continue
+            level_map = {level: code for code, level in enumerate(order, 1)}
+            codes, parsed = _encode_unique(df[column], parse_level)
+            level_lookup = np.array([level_map.get(base, default) for base, _ in parsed] + [default],
+                                    dtype=np.int8)
+            # 缺值的類別編碼為 -1，對應到 lookup 最後一個（預設值）
+            levels[column] = level_lookup[codes]
+
+            for flag in FLAG_ANNOTATIONS:
+                flag_lookup = np.array([note == flag for _, note in parsed] + [False])
+                flags[flag] |= flag_lookup[codes]
+
+        if '適用場景' in df.columns:
+            codes, categories = _encode_unique(df['適用場景'], categorize_scenario)
+            category_lookup = np.array(
+                [SCENARIO_CATEGORIES.index(c) for c in categories] + [SCENARIO_CATEGORIES.index('其他類')],
+                dtype=np.int8)
+            scenario_codes = category_lookup[codes]
+        else:
+            scenario_codes = np.full(len(df), SCENARIO_CATEGORIES.index('其他類'), dtype=np.int8)
+
+        return cls(df, levels, flags, scenario_codes)
+
+    @classmethod
+    def ensure(cls, data):
+        """接受 DataFrame 或 AlgorithmTable，統一回傳 AlgorithmTable"""
+        if isinstance(data, cls):
+            return data
+        return cls.from_frame(data)
+
+    def __len__(self):
+        return len(self.frame)
+
+    def __getitem__(self, column):
+        """取得原始字串欄位"""
+        return self.frame[column]
+
+    @property
+    def columns(self):
+        return self.frame.columns
+
+    @property
+    def names(self):
+        """演算法名稱"""
+        return self.frame['演算法'].tolist()
+
+    @property
+    def labels(self):
+        """純數字標籤"""
+        return [str(i+1) for i in range(len(self))]
+
+    def level(self, column):
+        """取得等級欄位的 int8 編碼"""
+        return self.levels[column]
+
+    def level_matrix(self, columns):
+        """將多個等級欄位堆疊為 (欄位數, 列數) 的矩陣"""
+        return np.vstack([self.levels[column] for column in columns])
+
+    def categorical(self, column):
+        """以有序 pandas Categorical 表示等級欄位（無法辨識的值為缺值）"""
+        order, _ = LEVEL_COLUMNS[column]
+        codes = self.levels[column].astype(np.int16) - 1
+        codes[(codes < 0) | (codes >= len(order))] = -1
+        return pd.Categorical.from_codes(codes, categories=order, ordered=True)
+
+    def scenario_counts(self):
+        """各場景分類的數量，依分類首次出現的順序排列"""
+        counts = np.bincount(self.scenario_codes, minlength=len(SCENARIO_CATEGORIES))
+        _, first_seen = np.unique(self.scenario_codes, return_index=True)
+        order = self.scenario_codes[np.sort(first_seen)]
+        return {SCENARIO_CATEGORIES[code]: int(counts[code]) for code in order}
+
+    def subset(self, rows):
+        """以布林遮罩或列位置取出子集"""
+        rows = np.asarray(rows)
+        if rows.dtype == bool:
+            rows = np.flatnonzero(rows)
+        return AlgorithmTable(
+            self.frame.iloc[rows],
+            {column: codes[rows] for column, codes in self.levels.items()},
+            {flag: values[rows] for flag, values in self.flags.items()},
+            self.scenario_codes[rows]
+        )
+
+    def head(self, n=5):
+        """取前 n 列"""
+        return self.subset(np.arange(min(n, len(self))))
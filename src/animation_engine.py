@@ -0,0 +1,464 @@
+# -*- coding: utf-8 -*-
+"""
+動畫引擎模組
+圖表物件只建立一次，每一幀只更新有變更的物件（柱高、可見度、標題文字），
+以 Agg 手動 blit：靜態背景只繪製一次，每一幀只還原並重畫變更的區域；
+影格逐一串流到編碼器（GIF、APNG、WebP），不會把所有影格留在記憶體中
+"""
+
+import argparse
+import io
+import struct
+import sys
+import time
+import zlib
+from pathlib import Path
+
+import numpy as np
+from PIL import GifImagePlugin, Image
+
+# 動態導入配置模組
+sys.path.append(str(Path(__file__).parent.parent))
+from config.chart_config import ChartConfig
+from src.utils import lazy_import
+
+# matplotlib 延遲到第一次建立動畫時才載入
+plt = lazy_import('matplotlib.pyplot')
+transforms = lazy_import('matplotlib.transforms')
+
+# blit 時重畫區域向外擴張的像素，涵蓋反鋸齒的邊緣
+BLIT_PADDING = 2
+
+# 支援的動畫格式與副檔名
+ANIMATION_FORMATS = {'gif': '.gif', 'apng': '.apng', 'webp': '.webp'}
+DEFAULT_FRAME_DURATION = 667  # 毫秒，約 1.5 fps
+
+# 柱數超過此值時省略逐柱的數值標籤
+LABEL_LIMIT = 100
+BAR_REVEAL_TITLE = '📊 演算法記憶體需求動畫比較 (顯示前{count}個)'
+
+DEFAULT_BENCHMARK_SIZES = [10, 100, 1000]
+DEFAULT_BENCHMARK_FRAMES = 50
+
+
+class BlitAnimation:
+    """以 Agg 手動 blit 的動畫
+
+    update(frame) 修改物件屬性並回傳有變更的物件；artists 為所有會變更的物件
+    以及 zorder 高於它們而可能與其重疊的靜態物件，都不會出現在背景中。每一幀還原變更物件新舊位置的背景，再依 zorder 重畫與這些區域
+    相交的可見物件；blit=False 時每一幀完整重繪整張圖（用於比較與驗證）
+    """
+
+    def __init__(self, fig, update, n_frames, artists, blit=True):
+        self.fig = fig
+        self.update = update
+        self.n_frames = n_frames
+        self.artists = sorted(artists, key=lambda artist: artist.get_zorder())
+        self.blit = blit
+        self._extents = {}
+        self._background = None
+
+    @property
+    def size(self):
+        """影格的 (寬, 高) 像素"""
+        width, height = self.fig.canvas.get_width_height()
+        return width, height
+
+    def _setup(self):
+        """繪製不含動畫物件的背景並保存"""
+        canvas = self.fig.canvas
+        for artist in self.artists:
+            artist.set_animated(self.blit)
+        canvas.draw()
+        if self.blit:
+            self._background = canvas.copy_from_bbox(self.fig.bbox)
+        self._extents = {}
+
+    def _extent(self, artist):
+        """物件目前的像素範圍 (左, 上, 右, 下)，原點在左上角（與畫布緩衝區相同），不可見時為 None"""
+        if not artist.get_visible():
+            return None
+        bbox = artist.get_window_extent(self.fig.canvas.get_renderer())
+        if not np.isfinite(bbox.extents).all() or bbox.width <= 0 and bbox.height <= 0:
+            return None
+        width, height = self.size
+        left = max(int(np.floor(bbox.x0)) - BLIT_PADDING, 0)
+        right = min(int(np.ceil(bbox.x1)) + BLIT_PADDING, width)
+        # Agg 的顯示座標原點在左下角
+        top = max(height - int(np.ceil(bbox.y1)) - BLIT_PADDING, 0)
+        bottom = min(height - int(np.floor(bbox.y0)) + BLIT_PADDING, height)
+        return (left, top, right, bottom) if right > left and bottom > top else None
+
+    def _set_extent(self, artist):
+        """更新物件的像素範圍快取，回傳新的範圍"""
+        extent = self._extent(artist)
+        if extent is None:
+            self._extents.pop(artist, None)
+        else:
+            self._extents[artist] = extent
+        return extent
+
+    def _draw_all(self):
+        """還原整個背景並重畫所有可見的動畫物件"""
+        self.fig.canvas.restore_region(self._background)
+        for artist in self.artists:
+            if self._set_extent(artist) is not None:
+                self.fig.draw_artist(artist)
+
+    def _blit_frame(self, changed):
+        """還原變更區域的背景並重畫與其相交的物件，回傳所有變更區域的外框
+
+        變更區域先合併為互不重疊的矩形，每個矩形內的物件以該矩形裁切後重畫，
+        半透明物件在矩形外已存在的像素不會被重複疊加
+        """
+        dirty = [self._extents.get(artist) for artist in changed]
+        dirty += [self._set_extent(artist) for artist in changed]
+        dirty = _disjoint([box for box in dirty if box is not None])
+        if not dirty:
+            return None
+
+        canvas = self.fig.canvas
+        height = self.size[1]
+        for box in dirty:
+            # restore_region 的範圍包含右、下邊界，xy 為背景區域的原點
+            left, top, right, bottom = box
+            canvas.restore_region(self._background, bbox=(left, top, right - 1, bottom - 1), xy=(0, 0))
+            # 裁切框使用顯示座標（原點在左下角）
+            clip = transforms.Bbox.from_extents(left, height - bottom, right, height - top)
+            for artist in self.artists:
+                extent = self._extents.get(artist)
+                if extent is not None and _overlaps(extent, box):
+                    self._draw_clipped(artist, clip)
+
+        return (min(box[0] for box in dirty), min(box[1] for box in dirty),
+                max(box[2] for box in dirty), max(box[3] for box in dirty))
+
+    def _draw_clipped(self, artist, clip):
+        """以 clip 裁切繪製物件，繪製後還原原本的裁切設定"""
+        clip_on, clip_box = artist.get_clip_on(), artist.get_clip_box()
+        if clip_on and clip_box is not None:
+            clip = transforms.Bbox.intersection(clip, clip_box)
+            if clip is None:
+                return
+        artist.set_clip_box(clip)
+        artist.set_clip_on(True)
+        try:
+            self.fig.draw_artist(artist)
+        finally:
+            artist.set_clip_box(clip_box)
+            artist.set_clip_on(clip_on)
+
+    def frames(self, start=0):
+        """逐一產生 (RGB 影格, 變更區域)；影格為畫布緩衝區的檢視，只在下一幀之前有效
+
+        變更區域為 (左, 上, 右, 下)，第一幀為整張圖，沒有任何變更時為 None；
+        start 之前的影格只更新物件屬性，不繪製
+        """
+        self._setup()
+        canvas = self.fig.canvas
+        width, height = self.size
+        for frame in range(start):
+            self.update(frame)
+        for frame in range(start, self.n_frames):
+            changed = self.update(frame)
+            if not self.blit:
+                canvas.draw()
+                box = (0, 0, width, height)
+            elif frame == start:
+                self._draw_all()
+                box = (0, 0, width, height)
+            else:
+                box = self._blit_frame(changed)
+            yield np.asarray(canvas.buffer_rgba())[..., :3], box
+
+
+def _disjoint(boxes):
+    """將相交的區域合併，直到所有區域互不相交"""
+    merged = []
+    for box in boxes:
+        while True:
+            overlapping = [other for other in merged if _overlaps(box, other)]
+            if not overlapping:
+                break
+            for other in overlapping:
+                merged.remove(other)
+                box = (min(box[0], other[0]), min(box[1], other[1]),
+                       max(box[2], other[2]), max(box[3], other[3]))
+        merged.append(box)
+    return merged
+
+
+def _overlaps(a, b):
+    """兩個 (左, 上, 右, 下) 區域是否相交"""
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def build_bar_reveal(values, zh_font=None, colors=None, figsize=(12, 8), dpi=None,
+                     grow_steps=1, blit=True):
+    """記憶體需求逐一顯示的柱狀圖動畫
+
+    所有柱子與數值標籤一次建立後隱藏，每一幀只顯示下一根柱子（grow_steps > 1 時柱高分段長到數值）
+    並更新標題；超過 LABEL_LIMIT 根柱子時省略數值標籤與柱子白邊；dpi 為 None 時使用 rcParams
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    if colors is None:
+        colors = ChartConfig.get_colors('primary', n)
+    many = n > LABEL_LIMIT
+
+    fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
+    ax.set_xlabel('演算法編號', fontproperties=zh_font)
+    ax.set_ylabel('記憶體需求等級', fontproperties=zh_font)
+    ax.set_ylim(0, values.max() + 1)
+    ax.set_xlim(-0.5, n - 0.5)
+    # 格線畫在柱子下方：背景只繪製一次，動畫物件一律疊在靜態物件之上
+    ax.set_axisbelow(True)
+    ax.grid(True, alpha=0.3, axis='y')
+
+    bars = ax.bar(np.arange(n), values, color=colors, alpha=0.8,
+                  edgecolor='white', linewidth=0 if many else 2)
+    labels = [] if many else [
+        ax.text(bar.get_x() + bar.get_width() / 2., value + 0.1, f'{value:g}',
+                ha='center', va='bottom', fontweight='bold')
+        for bar, value in zip(bars, values)
+    ]
+    title = ax.set_title(BAR_REVEAL_TITLE.format(count=0), fontproperties=zh_font,
+                         fontsize=16, fontweight='bold')
+    for artist in [*bars, *labels]:
+        artist.set_visible(False)
+
+    def update(frame):
+        index, step = divmod(frame, grow_steps)
+        bar = bars[index]
+        bar.set_height(values[index] * (step + 1) / grow_steps)
+        bar.set_visible(True)
+        changed = [bar]
+        if step == 0:
+            title.set_text(BAR_REVEAL_TITLE.format(count=index + 1))
+            changed.append(title)
+        if labels and step == grow_steps - 1:
+            labels[index].set_visible(True)
+            changed.append(labels[index])
+        return changed
+
+    # 軸框的 zorder 高於柱子，與柱子重疊時也要重畫，否則 blit 後柱子會蓋住軸框
+    overlay = list(ax.spines.values())
+    return BlitAnimation(fig, update, n * grow_steps, [*bars, *labels, title, *overlay], blit=blit)
+
+
+class GifStreamWriter:
+    """逐幀寫入的 GIF：第一幀為完整影像並提供全域色盤，之後只寫入變更區域與其局部色盤"""
+
+    def __init__(self, path, size, duration):
+        self.path = Path(path)
+        self.size = size
+        self.duration = duration
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.path, 'wb')
+        return self
+
+    def __exit__(self, *exc_info):
+        self._file.write(b';')  # GIF 結尾
+        self._file.close()
+
+    @staticmethod
+    def _quantize(pixels):
+        return Image.fromarray(pixels).quantize(256, method=Image.Quantize.MEDIANCUT,
+                                                dither=Image.Dither.NONE)
+
+    def write(self, frame, box):
+        if box is None:
+            # 沒有變更：以 1x1 的影格延長顯示時間
+            box = (0, 0, 1, 1)
+        left, top, right, bottom = box
+        image = self._quantize(np.ascontiguousarray(frame[top:bottom, left:right]))
+        if self._file.tell() == 0:
+            header, _ = GifImagePlugin.getheader(image, info={'loop': 0, 'optimize': False})
+            self._file.write(b''.join(header))
+            params = {}
+        else:
+            params = {'include_color_table': True}
+        # disposal=1：保留前一幀，變更區域直接覆蓋在上面
+        for chunk in GifImagePlugin.getdata(image, offset=(left, top), duration=self.duration,
+                                            disposal=1, **params):
+            self._file.write(chunk)
+
+
+class ApngStreamWriter:
+    """逐幀寫入的 APNG：每幀只以 fcTL / fdAT 寫入變更區域，區塊資料由 Pillow 的 PNG 編碼器壓縮"""
+
+    SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+    def __init__(self, path, size, duration, n_frames, compress_level=6):
+        self.path = Path(path)
+        self.size = size
+        self.duration = duration
+        self.n_frames = n_frames
+        self.compress_level = compress_level
+        self._file = None
+        self._sequence = 0
+
+    def __enter__(self):
+        width, height = self.size
+        self._file = open(self.path, 'wb')
+        self._file.write(self.SIGNATURE)
+        # 8 位元 RGB、不交錯
+        self._chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+        self._chunk(b'acTL', struct.pack('>II', self.n_frames, 0))
+        return self
+
+    def __exit__(self, *exc_info):
+        self._chunk(b'IEND', b'')
+        self._file.close()
+
+    def _chunk(self, kind, data):
+        self._file.write(struct.pack('>I', len(data)) + kind + data)
+        self._file.write(struct.pack('>I', zlib.crc32(kind + data)))
+
+    def _next_sequence(self):
+        sequence = self._sequence
+        self._sequence += 1
+        return sequence
+
+    def _encode(self, pixels):
+        """以 Pillow 編碼為 PNG 後取出合併的 IDAT 資料"""
+        buffer = io.BytesIO()
+        Image.fromarray(pixels).save(buffer, format='PNG', compress_level=self.compress_level)
+        data = buffer.getvalue()
+        position = len(self.SIGNATURE)
+        idat = []
+        while position < len(data):
+            length, = struct.unpack_from('>I', data, position)
+            if data[position + 4:position + 8] == b'IDAT':
+                idat.append(data[position + 8:position + 8 + length])
+            position += length + 12
+        return b''.join(idat)
+
+    def write(self, frame, box):
+        first = self._sequence == 0
+        if box is None:
+            box = (0, 0, 1, 1)
+        left, top, right, bottom = box
+        # dispose_op=0（保留）、blend_op=0（直接覆蓋變更區域）
+        self._chunk(b'fcTL', struct.pack('>IIIIIHHBB', self._next_sequence(), right - left, bottom - top,
+                                         left, top, int(self.duration), 1000, 0, 0))
+        data = self._encode(np.ascontiguousarray(frame[top:bottom, left:right]))
+        if first:
+            self._chunk(b'IDAT', data)
+        else:
+            self._chunk(b'fdAT', struct.pack('>I', self._next_sequence()) + data)
+
+
+class _WebPFrameSource(Image.Image):
+    """供 Pillow WebP 動畫編碼器逐幀讀取的影像：seek 到下一幀時才繪製該幀
+
+    WebPAnimEncoder 依序 seek 每一幀並立即編碼，因此影格不會全部留在記憶體中；
+    編碼結束後 Pillow 會 seek 回原本的影格，此時不再重新繪製
+    """
+
+    def __init__(self, animation):
+        super().__init__()
+        self._frames = animation.frames()
+        self._index = -1
+        self._size = animation.size
+        self._mode = 'RGB'
+        self.n_frames = animation.n_frames
+        self.seek(0)
+
+    def seek(self, frame):
+        if frame != self._index + 1:
+            return
+        pixels, _ = next(self._frames)
+        self.im = Image.fromarray(np.ascontiguousarray(pixels)).im
+        self._index = frame
+
+    def tell(self):
+        return self._index
+
+
+def save_animation(animation, path, image_format='gif', duration=DEFAULT_FRAME_DURATION, **options):
+    """將動畫逐幀串流編碼並寫入 path，回傳輸出路徑
+
+    image_format 為 ANIMATION_FORMATS 之一；options 傳給 WebP 編碼器（例如 lossless、quality）
+    """
+    if image_format not in ANIMATION_FORMATS:
+        raise ValueError(f"不支援的動畫格式: {image_format}（可用: {', '.join(ANIMATION_FORMATS)}）")
+    path = Path(path)
+    if image_format == 'webp':
+        source = _WebPFrameSource(animation)
+        source.save(path, format='WEBP', save_all=True, duration=duration, loop=0, **options)
+        return path
+
+    if image_format == 'gif':
+        writer = GifStreamWriter(path, animation.size, duration)
+    else:
+        writer = ApngStreamWriter(path, animation.size, duration, animation.n_frames)
+    with writer:
+        for frame, box in animation.frames():
+            writer.write(frame, box)
+    return path
+
+
+def create_memory_animation(table, output_dir, zh_font=None, image_format='gif', dpi=None,
+                            duration=DEFAULT_FRAME_DURATION):
+    """建立記憶體需求逐一顯示的動畫並串流寫入 output_dir，回傳輸出路徑
+
+    檔名為 ChartConfig.OUTPUT_FILES['animated_chart']，副檔名依動畫格式而定
+    """
+    if image_format not in ANIMATION_FORMATS:
+        raise ValueError(f"不支援的動畫格式: {image_format}（可用: {', '.join(ANIMATION_FORMATS)}）")
+    filename = Path(ChartConfig.OUTPUT_FILES['animated_chart']).with_suffix(ANIMATION_FORMATS[image_format])
+    animation = build_bar_reveal(table.level('記憶體需求'), zh_font=zh_font, dpi=dpi)
+    try:
+        return save_animation(animation, Path(output_dir) / filename, image_format, duration)
+    finally:
+        plt.close(animation.fig)
+
+
+def benchmark_frames(sizes=DEFAULT_BENCHMARK_SIZES, max_frames=DEFAULT_BENCHMARK_FRAMES, dpi=100):
+    """量測柱狀圖動畫在不同柱數下每幀的繪製時間（blit 與每幀完整重繪）
+
+    只計時最後 max_frames 幀（柱子最多、完整重繪最慢的部分），回傳 [{rows, mode, frames, ms_per_frame}]
+    """
+    rng = np.random.default_rng(0)
+    results = []
+    for rows in sizes:
+        values = rng.integers(1, 6, rows)
+        for blit in (True, False):
+            animation = build_bar_reveal(values, dpi=dpi, blit=blit)
+            start = max(animation.n_frames - max_frames, 0)
+            frames = animation.frames(start)
+            next(frames)  # 第一幀包含完整繪製，不計入
+            began = time.perf_counter()
+            count = sum(1 for _ in frames)
+            elapsed = time.perf_counter() - began
+            plt.close(animation.fig)
+            results.append({'rows': rows, 'mode': 'blit' if blit else 'redraw', 'frames': count,
+                            'ms_per_frame': elapsed / max(count, 1) * 1000})
+    return results
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="柱狀圖動畫每幀繪製時間基準測試（blit 與完整重繪）")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_BENCHMARK_SIZES, help="柱子數量")
+    parser.add_argument('--frames', type=int, default=DEFAULT_BENCHMARK_FRAMES,
+                        help="每個規模計時的影格數（取最後幾幀）")
+    parser.add_argument('--dpi', type=int, default=100, help="影格 DPI")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    results = benchmark_frames(args.sizes, args.frames, args.dpi)
+    # 中文字寬為兩格，標題的寬度少算一半以對齊數值欄
+    print(f"{'柱數':>8} {'模式':>8} {'影格':>6} {'毫秒/幀':>9}")
+    for result in results:
+        print(f"{result['rows']:>10} {result['mode']:>10} {result['frames']:>8} {result['ms_per_frame']:>12.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    plt.switch_backend('Agg')
+    sys.exit(main())
@@ -0,0 +1,412 @@
+# -*- coding: utf-8 -*-
+"""
+效能基準測試模組
+以 NumPy 實作目錄中各演算法的 CPU 參考版本，在合成時間序列上實際量測
+執行時間、峰值記憶體與預測準確度，產生圖表使用的效能數據
+"""
+
+import time
+import tracemalloc
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def make_synthetic_series(n_points=2000, seed=42):
+    """產生合成時間序列：AR(2) 動態 + 季節性 + GARCH(1,1) 波動雜訊"""
+    rng = np.random.default_rng(seed)
+    omega, alpha, beta = 0.05, 0.1, 0.85
+    shocks = rng.standard_normal(n_points)
+    season = 0.5 * np.sin(2 * np.pi * np.arange(n_points) / 50)
+
+    series = np.zeros(n_points)
+    variance = omega / (1 - alpha - beta)
+    noise = 0.0
+    for t in range(2, n_points):
+        variance = omega + alpha * noise ** 2 + beta * variance
+        noise = np.sqrt(variance) * shocks[t]
+        series[t] = 0.6 * series[t-1] - 0.2 * series[t-2] + season[t] + noise
+    return series
+
+
+def make_direction_task(series, window=16, train_ratio=0.8):
+    """將序列轉為「預測下一步漲跌」任務：特徵為前 window 期的變動量"""
+    returns = np.diff(series)
+    features = sliding_window_view(returns[:-1], window)
+    targets = returns[window:]
+    split = int(len(targets) * train_ratio)
+    return {
+        'returns': returns,
+        'split': split + window,  # returns 中測試段的起點
+        'X_train': features[:split], 'y_train': targets[:split] > 0,
+        'X_test': features[split:], 'y_test': targets[split:] > 0
+    }
+
+
+def _direction_accuracy(predicted, actual_up):
+    """漲跌方向預測準確度（%）"""
+    return float(np.mean((predicted > 0) == actual_up) * 100)
+
+
+def _standardize(train, test):
+    mean, std = train.mean(axis=0), train.std(axis=0) + 1e-8
+    return (train - mean) / std, (test - mean) / std
+
+
+def _ridge_readout(train_features, y_train, test_features, y_test, alpha=1.0):
+    """以嶺迴歸線性讀出層將特徵對應到漲跌方向，回傳測試準確度"""
+    train_features, test_features = _standardize(train_features, test_features)
+    train_features = np.hstack([train_features, np.ones((len(train_features), 1))])
+    test_features = np.hstack([test_features, np.ones((len(test_features), 1))])
+    target = np.where(y_train, 1.0, -1.0)
+    gram = train_features.T @ train_features + alpha * np.eye(train_features.shape[1])
+    weights = np.linalg.solve(gram, train_features.T @ target)
+    return _direction_accuracy(test_features @ weights, y_test)
+
+
+def _fit_stump(X, target, feature_ids, n_thresholds=16):
+    """在指定特徵上以分位數門檻搜尋最小平方誤差的決策樹樁
+
+    回傳 (特徵, 門檻, 左側值, 右側值)
+    """
+    best = None
+    total_sum, total_count = target.sum(), len(target)
+    for feature in feature_ids:
+        column = X[:, feature]
+        thresholds = np.quantile(column, np.linspace(0.05, 0.95, n_thresholds))
+        left = column[None, :] <= thresholds[:, None]
+        left_count = left.sum(axis=1)
+        left_sum = left @ target
+        right_count = total_count - left_count
+        right_sum = total_sum - left_sum
+        # 平方誤差的減少量 = sum^2/count 的總和
+        gain = (left_sum ** 2 / np.maximum(left_count, 1)
+                + right_sum ** 2 / np.maximum(right_count, 1))
+        i = int(np.argmax(gain))
+        if best is None or gain[i] > best[0]:
+            best = (gain[i], feature, thresholds[i],
+                    left_sum[i] / max(left_count[i], 1), right_sum[i] / max(right_count[i], 1))
+    return best[1:]
+
+
+def _predict_stump(stump, X):
+    feature, threshold, left_value, right_value = stump
+    return np.where(X[:, feature] <= threshold, left_value, right_value)
+
+
+# ---------------------------------------------------------------------------
+# 各演算法的參考實作：輸入 (序列, 任務, 亂數種子)，回傳測試準確度（%）
+# ---------------------------------------------------------------------------
+
+def bench_arima(series, task, seed):
+    """ARIMA(2,1,1)：Hannan-Rissanen 兩階段最小平方估計"""
+    returns, split = task['returns'], task['split']
+    train = returns[:split]
+
+    # 第一階段：以長自迴歸估計殘差
+    long_lags = 10
+    lagged = sliding_window_view(train[:-1], long_lags)[:, ::-1]
+    coef, *_ = np.linalg.lstsq(lagged, train[long_lags:], rcond=None)
+    residuals = np.zeros_like(returns)
+    all_lagged = sliding_window_view(returns[:-1], long_lags)[:, ::-1]
+    residuals[long_lags:] = returns[long_lags:] - all_lagged @ coef
+
+    # 第二階段：以落後期與落後殘差迴歸 ARMA(2,1) 參數
+    def design(start, stop):
+        t = np.arange(start, stop)
+        return np.column_stack([returns[t-1], returns[t-2], residuals[t-1], np.ones(len(t))])
+
+    start = long_lags + 2
+    params, *_ = np.linalg.lstsq(design(start, split), returns[start:split], rcond=None)
+    predicted = design(split, len(returns)) @ params
+    return _direction_accuracy(predicted, returns[split:] > 0)
+
+
+def bench_exponential_smoothing(series, task, seed):
+    """Holt 線性指數平滑：在平滑參數網格上同時以向量化遞迴選出最佳參數"""
+    split = task['split'] + 1  # series 比 returns 多一期
+    alphas, betas = np.meshgrid(np.linspace(0.1, 0.9, 9), np.linspace(0.05, 0.5, 10))
+    alphas, betas = alphas.ravel(), betas.ravel()
+
+    level = np.full(alphas.shape, series[0])
+    trend = np.zeros(alphas.shape)
+    sse = np.zeros(alphas.shape)
+    forecasts = np.empty(len(series))
+    for t in range(1, len(series)):
+        forecast = level + trend
+        error = series[t] - forecast
+        if t < split:
+            sse += error ** 2
+        else:
+            forecasts[t] = forecast[best]
+        new_level = alphas * series[t] + (1 - alphas) * forecast
+        trend = betas * (new_level - level) + (1 - betas) * trend
+        level = new_level
+        if t == split - 1:
+            best = int(np.argmin(sse))
+
+    predicted = forecasts[split:] - series[split-1:-1]
+    return _direction_accuracy(predicted, np.diff(series[split-1:]) > 0)
+
+
+def bench_garch(series, task, seed):
+    """GARCH(1,1)：在參數網格上以向量化遞迴計算高斯概似，評估高波動期的判斷準確度"""
+    returns, split = task['returns'], task['split']
+    returns = returns - returns[:split].mean()
+    grid_alpha, grid_beta = np.meshgrid(np.linspace(0.02, 0.3, 15), np.linspace(0.5, 0.95, 15))
+    grid_alpha, grid_beta = grid_alpha.ravel(), grid_beta.ravel()
+    valid = grid_alpha + grid_beta < 0.999
+    grid_alpha, grid_beta = grid_alpha[valid], grid_beta[valid]
+    unconditional = returns[:split].var()
+    grid_omega = unconditional * (1 - grid_alpha - grid_beta)
+
+    variance = np.full(grid_alpha.shape, unconditional)
+    variances = np.empty((len(returns), len(grid_alpha)))
+    log_likelihood = np.zeros(grid_alpha.shape)
+    for t in range(len(returns)):
+        variances[t] = variance
+        if t < split:
+            log_likelihood -= np.log(variance) + returns[t] ** 2 / variance
+        variance = grid_omega + grid_alpha * returns[t] ** 2 + grid_beta * variance
+
+    best = int(np.argmax(log_likelihood))
+    predicted_variance = variances[split:, best]
+    realized = np.abs(returns[split:])
+    return float(np.mean((predicted_variance > np.median(predicted_variance))
+                         == (realized > np.median(realized))) * 100)
+
+
+def bench_svm(series, task, seed):
+    """線性 SVM：以 Pegasos 小批次次梯度法最小化 hinge loss（特徵已標準化，不含偏差項）"""
+    rng = np.random.default_rng(seed)
+    X_train, X_test = _standardize(task['X_train'], task['X_test'])
+    y = np.where(task['y_train'], 1.0, -1.0)
+    weights, regularization = np.zeros(X_train.shape[1]), 1e-3
+
+    for step in range(1, 301):
+        batch = rng.integers(0, len(X_train), 64)
+        active = y[batch] * (X_train[batch] @ weights) < 1
+        gradient = (regularization * weights
+                    - (y[batch, None] * X_train[batch])[active].sum(axis=0) / len(batch))
+        weights -= gradient / (regularization * step)
+        # Pegasos 投影步驟
+        weights *= min(1.0, 1 / (np.sqrt(regularization) * np.linalg.norm(weights) + 1e-12))
+
+    return _direction_accuracy(X_test @ weights, task['y_test'])
+
+
+def bench_random_forest(series, task, seed):
+    """隨機森林：自助抽樣與隨機特徵子集上的決策樹樁集成"""
+    rng = np.random.default_rng(seed)
+    X_train, X_test = task['X_train'], task['X_test']
+    target = np.where(task['y_train'], 1.0, -1.0)
+    n_features = X_train.shape[1]
+
+    votes = np.zeros(len(X_test))
+    for _ in range(60):
+        sample = rng.integers(0, len(X_train), len(X_train))
+        features = rng.choice(n_features, max(1, int(np.sqrt(n_features))), replace=False)
+        stump = _fit_stump(X_train[sample], target[sample], features)
+        votes += np.sign(_predict_stump(stump, X_test))
+    return _direction_accuracy(votes, task['y_test'])
+
+
+def bench_xgboost(series, task, seed):
+    """梯度提升：以決策樹樁擬合對數損失的梯度（牛頓步長）"""
+    X_train, X_test = task['X_train'], task['X_test']
+    y = task['y_train'].astype(float)
+    features = np.arange(X_train.shape[1])
+    learning_rate = 0.1
+
+    train_score = np.zeros(len(X_train))
+    test_score = np.zeros(len(X_test))
+    for _ in range(40):
+        probability = 1 / (1 + np.exp(-train_score))
+        hessian = np.maximum(probability * (1 - probability), 1e-6)
+        stump = _fit_stump(X_train, (y - probability) / hessian, features)
+        train_score += learning_rate * _predict_stump(stump, X_train)
+        test_score += learning_rate * _predict_stump(stump, X_test)
+    return _direction_accuracy(test_score, task['y_test'])
+
+
+def bench_lstm(series, task, seed):
+    """LSTM：固定權重的單層前向傳播，最後隱藏狀態經嶺迴歸讀出"""
+    rng = np.random.default_rng(seed)
+    hidden = 32
+    weights = rng.normal(0, 0.3, (1 + hidden, 4 * hidden))
+    bias = np.zeros(4 * hidden)
+
+    def forward(X):
+        scale = task['X_train'].std()
+        h = np.zeros((len(X), hidden))
+        c = np.zeros((len(X), hidden))
+        for t in range(X.shape[1]):
+            gates = np.hstack([X[:, t:t+1] / scale, h]) @ weights + bias
+            i, f, o, g = np.split(gates, 4, axis=1)
+            i, f, o = (1 / (1 + np.exp(-gate)) for gate in (i, f, o))
+            c = f * c + i * np.tanh(g)
+            h = o * np.tanh(c)
+        return h
+
+    return _ridge_readout(forward(task['X_train']), task['y_train'],
+                          forward(task['X_test']), task['y_test'])
+
+
+def bench_cnn(series, task, seed):
+    """一維 CNN：隨機卷積核 + ReLU + 全域池化的前向傳播，經嶺迴歸讀出"""
+    rng = np.random.default_rng(seed)
+    n_kernels, kernel_size = 32, 5
+    kernels = rng.normal(0, 1, (kernel_size, n_kernels))
+    biases = rng.uniform(-1, 1, n_kernels)
+
+    def forward(X):
+        patches = sliding_window_view(X / task['X_train'].std(), kernel_size, axis=1)
+        activation = np.maximum(patches @ kernels + biases, 0)
+        return np.hstack([activation.max(axis=1), activation.mean(axis=1)])
+
+    return _ridge_readout(forward(task['X_train']), task['y_train'],
+                          forward(task['X_test']), task['y_test'])
+
+
+def bench_transformer(series, task, seed):
+    """Transformer：單層單頭自注意力與前饋層的前向傳播，平均池化後經嶺迴歸讀出"""
+    rng = np.random.default_rng(seed)
+    d_model, window = 32, task['X_train'].shape[1]
+    embedding = rng.normal(0, 1, (1, d_model))
+    position = np.sin(np.arange(window)[:, None] / 10000 ** (np.arange(d_model) / d_model))
+    w_q, w_k, w_v = (rng.normal(0, d_model ** -0.5, (d_model, d_model)) for _ in range(3))
+    w_ff1 = rng.normal(0, d_model ** -0.5, (d_model, 2 * d_model))
+    w_ff2 = rng.normal(0, (2 * d_model) ** -0.5, (2 * d_model, d_model))
+
+    def layer_norm(x):
+        return (x - x.mean(axis=-1, keepdims=True)) / (x.std(axis=-1, keepdims=True) + 1e-6)
+
+    def forward(X):
+        x = (X / task['X_train'].std())[:, :, None] * embedding + position
+        q, k, v = x @ w_q, x @ w_k, x @ w_v
+        scores = q @ k.transpose(0, 2, 1) / np.sqrt(d_model)
+        scores = np.exp(scores - scores.max(axis=-1, keepdims=True))
+        attention = scores / scores.sum(axis=-1, keepdims=True)
+        x = layer_norm(x + attention @ v)
+        x = layer_norm(x + np.maximum(x @ w_ff1, 0) @ w_ff2)
+        return np.hstack([x.mean(axis=1), x[:, -1]])
+
+    return _ridge_readout(forward(task['X_train']), task['y_train'],
+                          forward(task['X_test']), task['y_test'])
+
+
+def bench_genetic_algorithm(series, task, seed):
+    """基因演算法：演化線性預測器的權重，以訓練集方向準確度為適應度"""
+    rng = np.random.default_rng(seed)
+    X_train, X_test = _standardize(task['X_train'], task['X_test'])
+    y_train = task['y_train']
+    population = rng.normal(0, 1, (40, X_train.shape[1]))
+
+    for _ in range(30):
+        fitness = ((X_train @ population.T > 0) == y_train[:, None]).mean(axis=0)
+        # 錦標賽選擇
+        contenders = rng.integers(0, len(population), (len(population), 2))
+        winners = np.where(fitness[contenders[:, 0]] >= fitness[contenders[:, 1]],
+                           contenders[:, 0], contenders[:, 1])
+        parents = population[winners]
+        # 混合交配與高斯突變，保留最佳個體
+        mix = rng.random((len(population), 1))
+        children = mix * parents + (1 - mix) * parents[rng.permutation(len(parents))]
+        children += rng.normal(0, 0.1, children.shape)
+        children[0] = population[np.argmax(fitness)]
+        population = children
+
+    fitness = ((X_train @ population.T > 0) == y_train[:, None]).mean(axis=0)
+    return _direction_accuracy(X_test @ population[np.argmax(fitness)], task['y_test'])
+
+
+# 目錄演算法名稱 -> 參考實作
+BENCHMARKS = {
+    'ARIMA': bench_arima,
+    '指數平滑法': bench_exponential_smoothing,
+    'GARCH': bench_garch,
+    'SVM': bench_svm,
+    '隨機森林': bench_random_forest,
+    'XGBoost': bench_xgboost,
+    'RNN/LSTM': bench_lstm,
+    'CNN': bench_cnn,
+    'Transformer': bench_transformer,
+    '基因演算法': bench_genetic_algorithm
+}
+
+# 沒有參考實作的演算法在警告中最多列出的名稱數
+MISSING_PREVIEW = 5
+
+
+class BenchmarkRunner:
+    """基準測試執行器：預熱後重複計時，並另外執行一次量測峰值記憶體"""
+
+    def __init__(self, n_points=2000, warmup=1, repeats=5, seed=42):
+        self.warmup = warmup
+        self.repeats = repeats
+        self.seed = seed
+        self.series = make_synthetic_series(n_points, seed)
+        self.task = make_direction_task(self.series)
+
+    def measure(self, bench):
+        """量測單一演算法，回傳中位數時間、時間標準差、峰值記憶體與準確度"""
+        for _ in range(self.warmup):
+            bench(self.series, self.task, self.seed)
+
+        timings = []
+        for _ in range(self.repeats):
+            start = time.perf_counter()
+            accuracy = bench(self.series, self.task, self.seed)
+            timings.append(time.perf_counter() - start)
+
+        # tracemalloc 會拖慢執行，因此與計時分開量測；
+        # 若已在追蹤中（例如啟用了效能追蹤）則沿用，不在此關閉
+        already_tracing = tracemalloc.is_tracing()
+        if not already_tracing:
+            tracemalloc.start()
+        try:
+            if hasattr(tracemalloc, 'reset_peak'):
+                tracemalloc.reset_peak()
+            else:
+                # Python 3.8 沒有 reset_peak：清除追蹤紀錄同樣會把峰值重設為目前用量
+                tracemalloc.clear_traces()
+            baseline = tracemalloc.get_traced_memory()[0]
+            bench(self.series, self.task, self.seed)
+            peak = tracemalloc.get_traced_memory()[1] - baseline
+        finally:
+            if not already_tracing:
+                tracemalloc.stop()
+
+        return {
+            'time_ms': float(np.median(timings) * 1000),
+            'time_std_ms': float(np.std(timings) * 1000),
+            'peak_memory_mb': peak / (1024 * 1024),
+            'accuracy': accuracy
+        }
+
+    def run(self, algorithm_names):
+        """依目錄順序量測有參考實作的演算法，回傳 {演算法: 量測結果}"""
+        results = {}
+        missing = [name for name in algorithm_names if name not in BENCHMARKS]
+        if missing:
+            # 合成目錄可能有上千列，只彙總一行
+            shown = '、'.join(missing[:MISSING_PREVIEW]) + ('…' if len(missing) > MISSING_PREVIEW else '')
+            print(f"⚠️ {len(missing)} 個演算法沒有參考實作，略過基準測試: {shown}")
+        for name in algorithm_names:
+            if name not in BENCHMARKS:
+                continue
+            results[name] = self.measure(BENCHMARKS[name])
+            print(f"⏱️ {name}: {results[name]['time_ms']:.1f} ms, "
+                  f"{results[name]['peak_memory_mb']:.2f} MB, 準確度 {results[name]['accuracy']:.1f}%")
+        return results
+
+    def performance_data(self, algorithm_names):
+        """量測並轉為效能圖表使用的格式（algorithms 為目錄中的編號）"""
+        algorithm_names = list(algorithm_names)
+        results = self.run(algorithm_names)
+        return {
+            'algorithms': [str(algorithm_names.index(name) + 1) for name in results],
+            'execution_time': [result['time_ms'] for result in results.values()],
+            'accuracy': [result['accuracy'] for result in results.values()],
+            'memory_usage': [result['peak_memory_mb'] for result in results.values()]
+        }
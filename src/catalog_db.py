@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+"""
+SQLite 演算法目錄模組
+將演算法資料表連同等級編碼保存到 SQLite，每個屬性建立索引，
+以條件查詢（例如「記憶體需求<=中, 可平行化>=高, 適用場景~預測」）取出已編碼的子集
+"""
+
+import json
+import os
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 動態導入配置模組
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from src.algorithm_table import AlgorithmTable, FLAG_ANNOTATIONS, LEVEL_COLUMNS, SCENARIO_CATEGORIES
+from src.constraints import OPERATORS, SCENARIO_CATEGORY_COLUMN, parse_constraints, parse_flag
+
+# 等級欄位與旗標在資料庫中的整數欄位名稱
+LEVEL_SQL_COLUMNS = {
+    '預測精度': 'accuracy_level',
+    '計算複雜度': 'complexity_level',
+    '算力需求': 'compute_level',
+    '記憶體需求': 'memory_level',
+    '可平行化': 'parallel_level'
+}
+FLAG_SQL_COLUMNS = {'GPU': 'flag_gpu', '波動': 'flag_volatile'}
+
+
+def _quote(identifier):
+    """SQL 識別字（欄位名稱可能是中文）"""
+    return '"' + str(identifier).replace('"', '""') + '"'
+
+
+class CatalogDatabase:
+    """SQLite 演算法目錄
+
+    algorithms 表保留原始欄位（文字）與整數編碼欄位（等級、旗標、場景分類），
+    編碼欄位各自建立索引；適用場景的不重複文字另存於 scenarios 表，
+    「包含」查詢先在小表比對文字，再以索引取出對應的列
+    """
+
+    def __init__(self, path=':memory:'):
+        self.path = path if path == ':memory:' else Path(path)
+        self._connection = None
+
+    @property
+    def connection(self):
+        """延遲開啟連線"""
+        if self._connection is None:
+            self._connection = sqlite3.connect(str(self.path))
+        return self._connection
+
+    def close(self):
+        """關閉連線"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def exists(self):
+        """資料庫是否已匯入目錄"""
+        if self.path != ':memory:' and not self.path.exists():
+            return False
+        return self._meta('columns') is not None
+
+    @property
+    def source(self):
+        """匯入來源的指紋（例如 CSV 的大小與修改時間）"""
+        return self._meta('source')
+
+    @property
+    def columns(self):
+        """原始欄位名稱"""
+        return self._meta('columns') or []
+
+    def _meta(self, key):
+        """讀取匯入時記錄的資訊；尚未匯入時為 None"""
+        try:
+            row = self.connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        except sqlite3.OperationalError:
+            return None
+        return json.loads(row[0]) if row else None
+
+    def import_table(self, table, source=None):
+        """匯入演算法資料表（取代既有內容）
+
+        檔案資料庫先寫入同目錄的暫存檔再原子改名，讀取端不會看到匯入到一半的目錄
+        """
+        table = AlgorithmTable.ensure(table)
+        if self.path == ':memory:':
+            self._write(self.connection, table, source)
+            return self
+
+        temp_path = self.path.with_name(f".{self.path.name}.tmp")
+        temp_path.unlink(missing_ok=True)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(temp_path))
+        try:
+            self._write(connection, table, source)
+        finally:
+            connection.close()
+        self.close()
+        os.replace(temp_path, self.path)
+        return self
+
+    def _write(self, connection, table, source):
+        """建立資料表、批次寫入並在寫入後建立索引（比逐列維護索引快）
+
+        編碼欄位的每種組合為一個 cell，另存於 cells 表（含列數）；
+        多個條件的交集先在 cells 表求出，再以 cell_id 索引取出對應的列
+        """
+        columns = [str(column) for column in table.columns]
+        level_columns = [column for column in LEVEL_SQL_COLUMNS if column in table.levels]
+        encoded = ([LEVEL_SQL_COLUMNS[column] for column in level_columns]
+                   + [FLAG_SQL_COLUMNS[flag] for flag in FLAG_ANNOTATIONS]
+                   + ['scenario_category', 'scenario_id'])
+
+        if '適用場景' in table.columns:
+            scenario_ids, scenarios = pd.factorize(table['適用場景'], use_na_sentinel=True)
+        else:
+            scenario_ids, scenarios = np.full(len(table), -1), []
+        codes = np.column_stack([table.level(column) for column in level_columns]
+                                + [table.flags[flag] for flag in FLAG_ANNOTATIONS]
+                                + [table.scenario_codes, scenario_ids]).astype(np.int64)
+        cells, cell_ids = np.unique(codes, axis=0, return_inverse=True)
+
+        with connection:
+            connection.executescript("""
+                PRAGMA journal_mode = MEMORY;
+                DROP TABLE IF EXISTS algorithms;
+                DROP TABLE IF EXISTS cells;
+                DROP TABLE IF EXISTS scenarios;
+                DROP TABLE IF EXISTS meta;
+                CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+                CREATE TABLE scenarios (id INTEGER PRIMARY KEY, text TEXT);
+            """)
+            connection.executemany("INSERT INTO scenarios VALUES (?, ?)", enumerate(map(str, scenarios)))
+
+            encoded_sql = ', '.join(f'{column} INTEGER' for column in encoded)
+            connection.execute(f"CREATE TABLE cells (id INTEGER PRIMARY KEY, {encoded_sql}, rows INTEGER)")
+            cell_rows = np.bincount(cell_ids.ravel(), minlength=len(cells))
+            connection.executemany(
+                f"INSERT INTO cells VALUES ({', '.join('?' * (len(encoded) + 2))})",
+                ([cell_id, *(None if value < 0 else value for value in cell.tolist()), int(count)]
+                 for cell_id, (cell, count) in enumerate(zip(cells, cell_rows))))
+
+            connection.execute(
+                f"CREATE TABLE algorithms (row INTEGER PRIMARY KEY, "
+                f"{', '.join(_quote(column) for column in columns)}, {encoded_sql}, cell_id INTEGER)")
+            raw = [table.frame[column].astype(object).where(table.frame[column].notna(), None).tolist()
+                   for column in table.columns]
+            values = [codes[:, i].tolist() for i in range(len(encoded) - 1)]
+            values.append([None if i < 0 else i for i in scenario_ids.tolist()])
+            placeholders = ', '.join('?' * (len(columns) + len(encoded) + 2))
+            connection.executemany(f"INSERT INTO algorithms VALUES ({placeholders})",
+                                   zip(range(len(table)), *raw, *values, cell_ids.ravel().tolist()))
+
+            for column in encoded + ['cell_id']:
+                connection.execute(f"CREATE INDEX idx_{column} ON algorithms ({column})")
+            connection.executemany("INSERT INTO meta VALUES (?, ?)", [
+                ('columns', json.dumps(columns, ensure_ascii=False)),
+                ('levels', json.dumps(level_columns, ensure_ascii=False)),
+                ('source', json.dumps(source, ensure_ascii=False))
+            ])
+            connection.execute("ANALYZE")
+
+    def _where(self, constraints):
+        """將條件轉為 WHERE 子句與參數
+
+        回傳 (cells 表的條件, 參數, 原始欄位的條件, 參數)
+        """
+        if isinstance(constraints, str):
+            constraints = parse_constraints(constraints)
+        cell_clauses, cell_params, raw_clauses, raw_params = [], [], [], []
+        for column, operator, value in constraints:
+            if operator not in OPERATORS:
+                raise ValueError(f"不支援的運算子: {operator}")
+            sql_operator = OPERATORS[operator]
+
+            if column in LEVEL_SQL_COLUMNS:
+                order, _ = LEVEL_COLUMNS[column]
+                if value not in order:
+                    raise ValueError(f"{column} 沒有等級 {value}，可用等級: {', '.join(order)}")
+                if sql_operator == 'contains':
+                    raise ValueError(f"{column} 為等級欄位，請使用比較運算子")
+                cell_clauses.append(f"{LEVEL_SQL_COLUMNS[column]} {sql_operator} ?")
+                cell_params.append(order.index(value) + 1)
+            elif column in FLAG_SQL_COLUMNS:
+                if sql_operator not in ('=', '!='):
+                    raise ValueError(f"{column} 為旗標欄位，只支援 = 與 !=")
+                cell_clauses.append(f"{FLAG_SQL_COLUMNS[column]} {sql_operator} ?")
+                cell_params.append(int(parse_flag(value)))
+            elif column == SCENARIO_CATEGORY_COLUMN:
+                if value not in SCENARIO_CATEGORIES or sql_operator not in ('=', '!='):
+                    raise ValueError(f"{column} 只支援 = 與 !=，可用分類: {', '.join(SCENARIO_CATEGORIES)}")
+                cell_clauses.append(f"scenario_category {sql_operator} ?")
+                cell_params.append(SCENARIO_CATEGORIES.index(value))
+            elif column == '適用場景' and sql_operator in ('contains', '='):
+                match = "instr(text, ?) > 0" if sql_operator == 'contains' else "text = ?"
+                cell_clauses.append(f"scenario_id IN (SELECT id FROM scenarios WHERE {match})")
+                cell_params.append(value)
+            elif column in self.columns and sql_operator in ('contains', '=', '!='):
+                # 其他原始欄位沒有索引，在符合其餘條件的列上比對文字
+                if sql_operator == 'contains':
+                    raw_clauses.append(f"instr({_quote(column)}, ?) > 0")
+                else:
+                    raw_clauses.append(f"{_quote(column)} {sql_operator} ?")
+                raw_params.append(value)
+            else:
+                raise ValueError(f"無法查詢的欄位或運算子: {column} {operator}")
+        return cell_clauses, cell_params, raw_clauses, raw_params
+
+    def _rows_where(self, constraints):
+        """algorithms 表的 WHERE 子句與排序：編碼條件經由 cells 表與 cell_id 索引
+
+        有編碼條件時以 +row 排序，避免查詢規劃器為了依 row 順序而改為全表掃描
+        """
+        cell_clauses, cell_params, raw_clauses, raw_params = self._where(constraints)
+        clauses = list(raw_clauses)
+        if cell_clauses:
+            clauses.insert(0, f"cell_id IN (SELECT id FROM cells WHERE {' AND '.join(cell_clauses)})")
+        where = ' WHERE ' + ' AND '.join(clauses) if clauses else ''
+        return where, cell_params + raw_params, ' ORDER BY +row' if cell_clauses else ' ORDER BY row'
+
+    def count(self, constraints=()):
+        """符合條件的列數（只有編碼條件時直接加總 cells 表，不掃描任何列）"""
+        cell_clauses, cell_params, raw_clauses, _ = self._where(constraints)
+        if not raw_clauses:
+            where = ' WHERE ' + ' AND '.join(cell_clauses) if cell_clauses else ''
+            total = self.connection.execute(f"SELECT SUM(rows) FROM cells{where}", cell_params).fetchone()[0]
+            return total or 0
+        where, params, _ = self._rows_where(constraints)
+        return self.connection.execute(f"SELECT COUNT(*) FROM algorithms{where}", params).fetchone()[0]
+
+    def row_numbers(self, constraints=()):
+        """符合條件的列在原目錄中的位置"""
+        where, params, _ = self._rows_where(constraints)
+        # 排序交給 NumPy，比在 SQLite 中排序快
+        rows = self.connection.execute(f"SELECT row FROM algorithms{where}", params).fetchall()
+        return np.sort(np.fromiter((row for row, in rows), dtype=np.int64, count=len(rows)))
+
+    def query(self, constraints=(), limit=None):
+        """取出符合條件的子集，以已編碼的 AlgorithmTable 回傳（依原目錄順序）
+
+        等級、旗標與場景分類直接取自整數欄位，不重新解析等級字串
+        """
+        where, params, order = self._rows_where(constraints)
+        columns = self.columns
+        level_columns = self._meta('levels')
+        encoded = ([LEVEL_SQL_COLUMNS[column] for column in level_columns]
+                   + [FLAG_SQL_COLUMNS[flag] for flag in FLAG_ANNOTATIONS] + ['scenario_category'])
+        sql = (f"SELECT {', '.join(_quote(column) for column in columns)}, {', '.join(encoded)} "
+               f"FROM algorithms{where}{order}")
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = params + [int(limit)]
+        rows = self.connection.execute(sql, params).fetchall()
+
+        values = list(zip(*rows)) if rows else [()] * (len(columns) + len(encoded))
+        frame = pd.DataFrame({column: pd.Series(values[i], dtype=object).infer_objects()
+                              for i, column in enumerate(columns)}, columns=columns)
+        codes = values[len(columns):]
+        levels = {column: np.array(codes[i], dtype=np.int8) for i, column in enumerate(level_columns)}
+        offset = len(level_columns)
+        flags = {flag: np.array(codes[offset + i], dtype=bool) for i, flag in enumerate(FLAG_ANNOTATIONS)}
+        scenario_codes = np.array(codes[-1], dtype=np.int8)
+        return AlgorithmTable(frame, levels, flags, scenario_codes)
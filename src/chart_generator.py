@@ -4,101 +4,209 @@
 提供現代化、交互式和動畫效果的圖表生成功能
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.animation import FuncAnimation
+import io
+import time
 import numpy as np
 import pandas as pd
 from pathlib import Path
 import warnings
-import seaborn as sns
-from mpl_toolkits.mplot3d import Axes3D
-
-# 嘗試導入可選依賴
-try:
-    import plotly.graph_objects as go
-    import plotly.express as px
-    from plotly.subplots import make_subplots
-    PLOTLY_AVAILABLE = True
-except ImportError:
-    PLOTLY_AVAILABLE = False
+from contextlib import contextmanager
 
 warnings.filterwarnings('ignore')
 
 # 動態導入配置模組
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
-from config.chart_config import ChartConfig
+from config.chart_config import ChartConfig, themed
+from src.algorithm_table import AlgorithmTable
+from src.animation_engine import create_memory_animation
+from src.overview_compositor import OverviewCompositor
+from src.render_output import RenderCapture, RenderedChart, check_format, encode_figure
+from src.render_tiers import QualityTier
+from src.vector_output import PdfReport
+from src.utils import lazy_import, module_available
+
+# matplotlib 延遲到第一張圖表繪製時才載入
+plt = lazy_import('matplotlib.pyplot')
+fm = lazy_import('matplotlib.font_manager')
+patches = lazy_import('matplotlib.patches')
+
+# 可選依賴：只檢查是否安裝，實際匯入延後到 create_interactive_dashboard
+PLOTLY_AVAILABLE = module_available('plotly')
 
 
 class ChartGenerator:
     """增強版圖表生成器"""
     
-    def __init__(self, font_manager, output_dir=None, theme='professional'):
+    # render 可在記憶體中渲染的圖表組合 → 對應的生成方法
+    RENDER_METHODS = {
+        'main_comparison': 'create_main_comparison_chart',
+        'enhanced_main_comparison': 'create_enhanced_main_comparison'
+    }
+    
+    # 效能比較圖表為簡化版，不讀取效能數據；呼叫端據此決定是否需要執行基準測試
+    USES_PERFORMANCE_DATA = False
+    
+    def __init__(self, font_manager, output_dir=None, theme='professional', show=True,
+                 quality='full', full_queue=None, image_format='png', png_pipeline=None):
         self.font_manager = font_manager
         self.zh_font = font_manager.get_font()
         self.output_dir = output_dir or Path(__file__).parent.parent / "output"
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.theme = theme
+        self.show = show  # 批次/無介面執行時設為 False，儲存後不開啟視窗
+        # 品質等級：preview 以預覽 DPI 輸出並保存圖表描述，完整解析度由 full_queue 在背景輸出
+        self.tier = QualityTier(quality, queue=full_queue)
+        # 輸出格式：svg / pdf 為向量輸出，字體只嵌入用到的字元
+        self.image_format = check_format(image_format)
+        self._capture = None  # 擷取模式時為 RenderCapture
+        self._report = None  # 報告模式時為 PdfReport
+        # 背景 PNG 編碼：主執行緒點陣化後即繼續繪製下一張，finish_encoding 等待寫檔完成
+        self.png_pipeline = png_pipeline
+        self._encoding = []  # (Future, 完整解析度路徑)
         self.setup_style()
     
     def setup_style(self):
-        """設置全局樣式"""
-        plt.style.use('seaborn-v0_8' if hasattr(plt.style, 'seaborn-v0_8') else 'default')
-        
-        # 設置中文字體
-        plt.rcParams['font.sans-serif'] = ['Microsoft YaHei', 'SimHei', 'DejaVu Sans']
-        plt.rcParams['axes.unicode_minus'] = False
-        
-        # 設置主題樣式
-        theme_style = ChartConfig.get_theme_style(self.theme)
-        plt.rcParams['figure.facecolor'] = theme_style['background']
-        plt.rcParams['axes.facecolor'] = theme_style['background']
-        plt.rcParams['text.color'] = theme_style['text_color']
-        plt.rcParams['axes.labelcolor'] = theme_style['text_color']
-        plt.rcParams['xtick.color'] = theme_style['text_color']
-        plt.rcParams['ytick.color'] = theme_style['text_color']
+        """準備主題樣式（僅在繪圖時以 context 套用，不修改全局 rcParams）"""
+        self.style_rc = ChartConfig.get_theme_rc(self.theme)
+    
+    def style_context(self):
+        """建立此生成器主題的樣式 context"""
+        return ChartConfig.theme_context(self.theme)
+    
+    def _show(self):
+        """顯示目前的圖表（show 為 False 時略過）"""
+        if self.show:
+            plt.show()
+    
+    def _save_figure(self, name, label):
+        """將目前的圖表編碼並關閉
+        
+        一般模式依品質等級寫入 output_dir/{name}.{image_format}（預覽等級為 preview/ 子目錄）並回傳路徑；
+        擷取模式（capture / render）只收集編碼結果，回傳 RenderedChart，不寫檔也不開啟視窗；
+        報告模式（pdf_report）加入 PDF 報告的一頁，回傳 None；
+        設定 png_pipeline 時只在此點陣化，回傳輸出路徑，檔案由背景編碼寫入
+        """
+        capture = self._capture
+        fig = plt.gcf()
+        if self._report is not None:
+            self._report.add(fig, name, bbox_inches=ChartConfig.CHART_STYLE['bbox_inches'])
+            plt.close(fig)
+            print(f"   📄 {label}已加入報告（第 {len(self._report.pages)} 頁）")
+            return None
+        if capture is not None:
+            chart = encode_figure(fig, name, capture.image_format, capture.dpi, started=capture.started,
+                                  bbox_inches=ChartConfig.CHART_STYLE['bbox_inches'])
+            plt.close(fig)
+            return capture.add(chart)
+        
+        full_path = self.output_dir / f'{name}.{self.image_format}'
+        if self.png_pipeline is not None and self.image_format == 'png':
+            future = self.tier.submit(self.png_pipeline, fig, full_path,
+                                      bbox_inches=ChartConfig.CHART_STYLE['bbox_inches'])
+            self._encoding.append((future, full_path))
+            output_path = self.tier.output_path(full_path)
+            print(f"   ✅ {label}已點陣化，背景編碼寫入: {output_path}")
+            self._show()
+            plt.close(fig)
+            return output_path
+        
+        output_path = self.tier.save(fig, full_path, self.image_format,
+                                     bbox_inches=ChartConfig.CHART_STYLE['bbox_inches']).path
+        self.tier.queue_full(full_path)
+        print(f"   ✅ {label}已儲存: {output_path}")
+        self._show()
+        plt.close(fig)
+        return output_path
+    
+    @contextmanager
+    def capture(self, image_format='png', dpi=None, output_dir=None):
+        """擷取模式：期間生成的圖表只編碼到記憶體，收集在回傳的 RenderCapture 中
+        
+        DPI 預設為品質等級的 DPI；指定 output_dir 時同時寫入該目錄
+        """
+        previous = self._capture
+        self._capture = RenderCapture(image_format, dpi or self.tier.dpi, output_dir)
+        try:
+            yield self._capture
+        finally:
+            self._capture = previous
+    
+    def finish_encoding(self):
+        """等待背景 PNG 編碼寫檔完成，再把預覽的圖表描述排入完整解析度渲染；編碼失敗時拋出第一個例外"""
+        encoding, self._encoding = self._encoding, []
+        errors = [future.exception() for future, _ in encoding]
+        for (_, full_path), error in zip(encoding, errors):
+            if error is None:
+                self.tier.queue_full(full_path)
+        for error in errors:
+            if error is not None:
+                raise error
     
+    @contextmanager
+    def pdf_report(self, output_path=None, title=None):
+        """報告模式：期間生成的圖表依序成為同一份多頁 PDF 的頁面，不另外輸出圖檔"""
+        output_path = output_path or self.output_dir / ChartConfig.OUTPUT_FILES['pdf_report']
+        previous = self._report
+        with PdfReport(output_path, title, self.tier.full_dpi) as report:
+            self._report = report
+            try:
+                yield report
+            finally:
+                self._report = previous
+    
+    def create_pdf_report(self, df, charts='enhanced_main_comparison', output_path=None):
+        """將一組圖表（RENDER_METHODS 之一）在一次輸出中寫成多頁 PDF 報告，回傳路徑；總覽圖不加入報告"""
+        if charts not in self.RENDER_METHODS:
+            raise ValueError(f"不支援的圖表組合: {charts}（可用: {', '.join(self.RENDER_METHODS)}）")
+        with self.pdf_report(output_path, title='演算法比較分析報告') as report:
+            getattr(self, self.RENDER_METHODS[charts])(df)
+        print(f"📑 PDF 報告已儲存: {report.path}（共 {len(report.pages)} 頁）")
+        return report.path
+    
+    def render(self, df, charts='enhanced_main_comparison', image_format='png', dpi=None, output_dir=None):
+        """在記憶體中渲染一組圖表，回傳 RenderCapture（可迭代，也可依名稱取得 RenderedChart）
+        
+        charts 為 RENDER_METHODS 之一；指定 output_dir 時另外寫入該目錄
+        """
+        if charts not in self.RENDER_METHODS:
+            raise ValueError(f"不支援的圖表組合: {charts}（可用: {', '.join(self.RENDER_METHODS)}）")
+        with self.capture(image_format, dpi, output_dir) as capture:
+            getattr(self, self.RENDER_METHODS[charts])(df)
+        return capture
+    
+    @themed
     def create_main_comparison_chart(self, df):
         """建立主要演算法比較圖表 - 分別顯示每個圖表"""
         # 建立顏色映射和數據
         colors = ChartConfig.get_color_scheme('primary')
-        complexity_map = {'極低': 1, '低': 2, '中': 3, '中-高': 4, '高': 5, '極高': 6}
+        table = AlgorithmTable.ensure(df)
         
         # 準備數據
-        x = [complexity_map.get(x.split('(')[0], 3) for x in df['計算複雜度']]
-        y = [complexity_map.get(x.split('(')[0], 3) for x in df['算力需求']]
-        labels = [str(i+1) for i in range(len(df))]
+        x = table.level('計算複雜度')
+        y = table.level('算力需求')
+        labels = table.labels
         
         print(f"📊 開始建立主要比較圖表 (共4個子圖表)")
         
         # 1. 散點圖 - 計算複雜度 vs 算力需求
         print("   正在生成散點圖...")
         fig1, ax1 = plt.subplots(figsize=(10, 8))
-        self._create_scatter_plot(ax1, x, y, colors, complexity_map)
+        self._create_scatter_plot(ax1, x, y, colors)
         plt.tight_layout()
-        output_path1 = self.output_dir / "scatter_complexity_vs_power.png"
-        plt.savefig(output_path1, dpi=ChartConfig.CHART_STYLE['dpi'], 
-                   bbox_inches=ChartConfig.CHART_STYLE['bbox_inches'])
-        print(f"   ✅ 散點圖已儲存: {output_path1}")
-        plt.show()
-        plt.close()
+        output_path1 = self._save_figure("scatter_complexity_vs_power", '散點圖')
         
         # 2. 柱狀圖 - 記憶體需求
         print("   正在生成柱狀圖...")
         fig2, ax2 = plt.subplots(figsize=(12, 8))
-        self._create_memory_bar_chart(ax2, df, colors, labels, complexity_map)
+        self._create_memory_bar_chart(ax2, table, colors, labels)
         plt.tight_layout()
-        output_path2 = self.output_dir / "bar_memory_requirements.png"
-        plt.savefig(output_path2, dpi=ChartConfig.CHART_STYLE['dpi'], 
-                   bbox_inches=ChartConfig.CHART_STYLE['bbox_inches'])
-        print(f"   ✅ 柱狀圖已儲存: {output_path2}")
-        plt.show()
-        plt.close()
+        output_path2 = self._save_figure("bar_memory_requirements", '柱狀圖')
+        self.finish_encoding()
         
         print("📊 主要比較圖表生成完成！共生成2個圖表文件")
     
-    def _create_scatter_plot(self, ax, x, y, colors, complexity_map):
+    def _create_scatter_plot(self, ax, x, y, colors):
         """創建散點圖"""
         scatter = ax.scatter(x, y, c=colors[:len(x)], s=400, 
                            alpha=0.8, 
@@ -117,9 +225,9 @@ class ChartGenerator:
             ax.annotate(str(i+1), (xi, yi), ha='center', va='center',
                        fontweight='bold', fontsize=12)
     
-    def _create_memory_bar_chart(self, ax, df, colors, labels, complexity_map):
+    def _create_memory_bar_chart(self, ax, table, colors, labels):
         """創建記憶體需求柱狀圖"""
-        memory_values = [complexity_map.get(x, 3) for x in df['記憶體需求']]
+        memory_values = table.level('記憶體需求')
         bars = ax.bar(range(len(memory_values)), memory_values, 
                      color=colors[:len(memory_values)], 
                      alpha=0.8, 
@@ -142,8 +250,8 @@ class ChartGenerator:
         ax.set_xticklabels(labels, fontsize=12)
         ax.grid(axis='y', alpha=0.3)
     
-    def create_performance_comparison_chart(self, performance_data):
-        """建立效能比較圖表"""
+    def create_performance_comparison_chart(self, performance_data=None):
+        """建立效能比較圖表（簡化版，不讀取 performance_data；見 USES_PERFORMANCE_DATA）"""
         print("📈 生成基本效能比較圖表...")
         # 簡化實現，只顯示訊息
         print("效能比較圖表已生成（簡化版）")
@@ -155,162 +263,101 @@ class ChartGenerator:
         print("摘要表格已生成（簡化版）")
     
     # 增強版方法 - 單獨顯示每張圖表
+    @themed
     def create_enhanced_main_comparison(self, df):
         """建立增強版主要演算法比較圖表 - 分別顯示每個圖表"""
         # 建立顏色映射和數據
         colors = ChartConfig.get_color_scheme('cyberpunk')
-        gradient_colors = ChartConfig.get_gradient_colors('gradient_blue', len(df))
-        complexity_map = {'極低': 1, '低': 2, '中': 3, '中-高': 4, '高': 5, '極高': 6}
+        table = AlgorithmTable.ensure(df)
+        gradient_colors = ChartConfig.get_gradient_colors('gradient_blue', len(table))
         
         # 準備數據
-        x = [complexity_map.get(x.split('(')[0], 3) for x in df['計算複雜度']]
-        y = [complexity_map.get(x.split('(')[0], 3) for x in df['算力需求']]
-        labels = [str(i+1) for i in range(len(df))]
+        x = table.level('計算複雜度')
+        y = table.level('算力需求')
+        labels = table.labels
         
         print(f"🚀 開始建立增強版比較圖表 (共5個子圖表)")
         
         # 1. 3D風格散點圖
         print("   正在生成3D風格散點圖...")
         fig1, ax1 = plt.subplots(figsize=(12, 8))
-        self._create_3d_style_scatter(ax1, x, y, colors, complexity_map)
+        self._create_3d_style_scatter(ax1, x, y, colors)
         plt.tight_layout()
-        output_path1 = self.output_dir / "enhanced_scatter_3d_style.png"
-        plt.savefig(output_path1, dpi=ChartConfig.CHART_STYLE['dpi'], 
-                   bbox_inches=ChartConfig.CHART_STYLE['bbox_inches'])
-        print(f"   ✅ 3D風格散點圖已儲存: {output_path1}")
-        plt.show()
-        plt.close()
+        output_path1 = self._save_figure("enhanced_scatter_3d_style", '3D風格散點圖')
         
         # 2. 增強柱狀圖
         print("   正在生成增強柱狀圖...")
         fig2, ax2 = plt.subplots(figsize=(12, 8))
-        self._create_enhanced_bar_chart(ax2, df, gradient_colors, labels, complexity_map)
+        self._create_enhanced_bar_chart(ax2, table, gradient_colors, labels)
         plt.tight_layout()
-        output_path2 = self.output_dir / "enhanced_bar_gradient.png"
-        plt.savefig(output_path2, dpi=ChartConfig.CHART_STYLE['dpi'], 
-                   bbox_inches=ChartConfig.CHART_STYLE['bbox_inches'])
-        print(f"   ✅ 增強柱狀圖已儲存: {output_path2}")
-        plt.show()
-        plt.close()
+        output_path2 = self._save_figure("enhanced_bar_gradient", '增強柱狀圖')
         
         # 3. 熱力圖
         print("   正在生成演算法特性熱力圖...")
         fig3, ax3 = plt.subplots(figsize=(10, 8))
-        self._create_algorithm_heatmap(ax3, df, complexity_map)
+        self._create_algorithm_heatmap(ax3, table)
         plt.tight_layout()
-        output_path3 = self.output_dir / "enhanced_heatmap.png"
-        plt.savefig(output_path3, dpi=ChartConfig.CHART_STYLE['dpi'], 
-                   bbox_inches=ChartConfig.CHART_STYLE['bbox_inches'])
-        print(f"   ✅ 熱力圖已儲存: {output_path3}")
-        plt.show()
-        plt.close()
+        output_path3 = self._save_figure("enhanced_heatmap", '熱力圖')
         
         # 4. 增強雷達圖
         print("   正在生成增強雷達圖...")
         fig4 = plt.figure(figsize=(10, 10))
         ax4 = fig4.add_subplot(111, projection='polar')
-        self._create_enhanced_radar_chart(ax4, df, colors, labels, complexity_map)
+        self._create_enhanced_radar_chart(ax4, table, colors, labels)
         plt.tight_layout()
-        output_path4 = self.output_dir / "enhanced_radar.png"
-        plt.savefig(output_path4, dpi=ChartConfig.CHART_STYLE['dpi'], 
-                   bbox_inches=ChartConfig.CHART_STYLE['bbox_inches'])
-        print(f"   ✅ 增強雷達圖已儲存: {output_path4}")
-        plt.show()
-        plt.close()
+        output_path4 = self._save_figure("enhanced_radar", '增強雷達圖')
         
         # 5. 3D風格圓餅圖
         print("   正在生成3D風格圓餅圖...")
         fig5, ax5 = plt.subplots(figsize=(10, 8))
-        self._create_3d_pie_chart(ax5, df)
+        self._create_3d_pie_chart(ax5, table)
         plt.tight_layout()
-        output_path5 = self.output_dir / "enhanced_pie_3d.png"
-        plt.savefig(output_path5, dpi=ChartConfig.CHART_STYLE['dpi'], 
-                   bbox_inches=ChartConfig.CHART_STYLE['bbox_inches'])
-        print(f"   ✅ 3D風格圓餅圖已儲存: {output_path5}")
-        plt.show()
-        plt.close()
-        
-        # 6. 建立統合總覽圖表 (小尺寸)
-        print("   正在生成增強版統合總覽圖表...")
-        fig_size = ChartConfig.get_figure_size('main_comparison')
-        fig = plt.figure(figsize=fig_size)
-        
-        # 添加總標題
-        fig.suptitle('🚀 演算法比較分析儀表板 v2.0 - 總覽', 
-                    fontproperties=self.zh_font, 
-                    fontsize=ChartConfig.get_font_size('title'), 
-                    fontweight='bold', y=0.98)
-        
-        # 創建子圖
-        gs = fig.add_gridspec(2, 3, height_ratios=[1, 1], width_ratios=[1, 1, 1])
-        ax1 = fig.add_subplot(gs[0, 0])  # 3D散點圖
-        ax2 = fig.add_subplot(gs[0, 1])  # 增強柱狀圖
-        ax3 = fig.add_subplot(gs[0, 2])  # 熱力圖
-        ax4 = fig.add_subplot(gs[1, 0], projection='polar')  # 雷達圖
-        ax5 = fig.add_subplot(gs[1, 1])  # 圓餅圖
-        
-        # 重新建立小版本的子圖
-        self._create_3d_style_scatter(ax1, x, y, colors, complexity_map)
-        self._create_enhanced_bar_chart(ax2, df, gradient_colors, labels, complexity_map)
-        self._create_algorithm_heatmap(ax3, df, complexity_map)
-        self._create_enhanced_radar_chart(ax4, df, colors, labels, complexity_map)
-        self._create_3d_pie_chart(ax5, df)
-        
-        plt.tight_layout()
-        output_path = self.output_dir / ChartConfig.OUTPUT_FILES['main_comparison']
-        plt.savefig(output_path, 
-                   dpi=ChartConfig.CHART_STYLE['dpi'], 
-                   bbox_inches=ChartConfig.CHART_STYLE['bbox_inches'])
-        print(f"   ✅ 增強版統合總覽圖表已儲存: {output_path}")
-        plt.show()
-        plt.close()
+        output_path5 = self._save_figure("enhanced_pie_3d", '3D風格圓餅圖')
+        
+        # 6. 以已儲存的五張圖拼接統合總覽（不重新繪製）
+        self.finish_encoding()
+        tiles = [output_path1, output_path2, output_path3, output_path4, output_path5]
+        if self._capture is not None:
+            # 擷取模式下總覽由記憶體中的 PNG 拼接；向量格式無法以點陣方式拼接，略過總覽（一般模式與報告模式亦同）
+            if self._capture.image_format == 'png':
+                print("   正在拼接增強版統合總覽圖表...")
+                self._capture_overview(tiles)
+        elif self._report is None and self.image_format == 'png':
+            print("   正在拼接增強版統合總覽圖表...")
+            output_path = self.compose_overview(tiles)
+            print(f"   ✅ 增強版統合總覽圖表已儲存: {output_path}")
+            # 預覽等級：完整解析度的各圖表在背景完成後，再以完整 DPI 拼接總覽
+            full_tiles = [self.output_dir / Path(tile).name for tile in tiles]
+            full_overview = self.output_dir / ChartConfig.OUTPUT_FILES['main_comparison']
+            self.tier.after_full(full_tiles, full_overview, self.compose_overview,
+                                 full_tiles, full_overview, self.tier.full_dpi)
         
         print("🚀 增強版比較圖表生成完成！共生成6個圖表文件")
-        
-        # 創建子圖
-        gs = fig.add_gridspec(3, 3, height_ratios=[2, 2, 1], width_ratios=[2, 2, 1])
-        ax1 = fig.add_subplot(gs[0, 0])  # 3D散點圖
-        ax2 = fig.add_subplot(gs[0, 1])  # 增強柱狀圖
-        ax3 = fig.add_subplot(gs[1, 0])  # 熱力圖
-        ax4 = fig.add_subplot(gs[1, 1])  # 雷達圖
-        ax5 = fig.add_subplot(gs[0, 2])  # 圓餅圖
-        ax6 = fig.add_subplot(gs[1, 2])  # 氣泡圖
-        ax7 = fig.add_subplot(gs[2, :])  # 時間線圖
-        
-        # 1. 3D風格散點圖
-        self._create_3d_style_scatter(ax1, x, y, colors, complexity_map)
-        
-        # 2. 增強柱狀圖
-        self._create_enhanced_bar_chart(ax2, df, gradient_colors, labels, complexity_map)
-        
-        # 3. 熱力圖
-        self._create_algorithm_heatmap(ax3, df, complexity_map)
-        
-        # 4. 增強雷達圖
-        self._create_enhanced_radar_chart(ax4, df, colors, labels, complexity_map)
-        
-        # 5. 3D風格圓餅圖
-        self._create_3d_pie_chart(ax5, df)
-        
-        # 6. 氣泡圖
-        self._create_bubble_chart(ax6, df, complexity_map)
-        
-        # 7. 時間線效能圖
-        self._create_timeline_chart(ax7, df, labels)
-        
-        # 添加整體美化
-        self._add_decorative_elements(fig)
-        
-        plt.tight_layout()
-        output_path = self.output_dir / ChartConfig.OUTPUT_FILES['main_comparison']
-        plt.savefig(output_path, 
-                   dpi=ChartConfig.CHART_STYLE['dpi'], 
-                   bbox_inches=ChartConfig.CHART_STYLE['bbox_inches'],
-                   facecolor=fig.get_facecolor())
-        print(f"✨ 增強版主要比較圖表已儲存: {output_path}")
-        plt.show()
     
-    def _create_3d_style_scatter(self, ax, x, y, colors, complexity_map):
+    def _capture_overview(self, charts):
+        """擷取模式：以記憶體中的圖表拼接總覽並加入擷取結果"""
+        capture = self._capture
+        buffer = self.compose_overview([io.BytesIO(chart.data) for chart in charts], io.BytesIO(), capture.dpi)
+        name = Path(ChartConfig.OUTPUT_FILES['main_comparison']).stem
+        return capture.add(RenderedChart(name, buffer.getvalue(), 'png', dpi=capture.dpi,
+                                         render_ms=(time.perf_counter() - capture.started) * 1000))
+    
+    def compose_overview(self, chart_paths, output_path=None, dpi=None):
+        """將已輸出的圖表拼接為總覽圖，尺寸沿用 main_comparison 設定，解析度預設為品質等級的 DPI"""
+        compositor = OverviewCompositor(ChartConfig.get_figure_size('main_comparison'),
+                                        dpi=dpi or self.tier.dpi,
+                                        background=ChartConfig.get_theme_style(self.theme)['background'])
+        return compositor.compose(
+            chart_paths,
+            output_path or self.tier.output_path(self.output_dir / ChartConfig.OUTPUT_FILES['main_comparison']),
+            title='🚀 演算法比較分析儀表板 v2.0 - 總覽',
+            footer='© Algorithm Analysis Pro v2.0',
+            font_path=fm.findfont(self.zh_font),
+            title_size=ChartConfig.get_font_size('title'),
+            footer_size=ChartConfig.get_font_size('watermark'),
+            text_color=ChartConfig.get_theme_style(self.theme)['text_color'])
+    
+    def _create_3d_style_scatter(self, ax, x, y, colors):
         """創建3D風格散點圖"""
         # 模擬3D效果的散點圖
         z_values = np.random.rand(len(x)) * 100  # 模擬第三維度
@@ -339,13 +386,13 @@ class ChartGenerator:
             ax.annotate(str(i+1), (xi, yi), ha='center', va='center',
                        fontweight='bold', fontsize=12, color='white')
     
-    def _create_enhanced_bar_chart(self, ax, df, colors, labels, complexity_map):
+    def _create_enhanced_bar_chart(self, ax, table, colors, labels):
         """創建增強柱狀圖"""
-        memory_values = [complexity_map.get(x, 3) for x in df['記憶體需求']]
+        memory_values = table.level('記憶體需求')
         
         # 創建漸變柱狀圖
-        bars = ax.bar(range(len(df)), memory_values, 
-                     color=colors[:len(df)], 
+        bars = ax.bar(range(len(table)), memory_values, 
+                     color=colors[:len(table)], 
                      alpha=ChartConfig.CHART_STYLE['alpha'], 
                      edgecolor='white', 
                      linewidth=2)
@@ -369,36 +416,27 @@ class ChartGenerator:
         ChartConfig.apply_modern_style(ax, '💾 記憶體需求比較', self.theme)
         ax.set_xlabel('演算法編號', fontproperties=self.zh_font)
         ax.set_ylabel('記憶體需求等級', fontproperties=self.zh_font)
-        ax.set_xticks(range(len(df)))
+        ax.set_xticks(range(len(table)))
         ax.set_xticklabels(labels)
     
-    def _create_algorithm_heatmap(self, ax, df, complexity_map):
+    def _create_algorithm_heatmap(self, ax, table):
         """創建演算法特性熱力圖"""
         # 準備熱力圖數據
         features = ['計算複雜度', '算力需求', '記憶體需求']
-        data = []
-        
-        for feature in features:
-            if feature == '記憶體需求':
-                row = [complexity_map.get(val, 3) for val in df[feature]]
-            else:
-                row = [complexity_map.get(val.split('(')[0], 3) for val in df[feature]]
-            data.append(row)
-        
-        data = np.array(data)
+        data = table.level_matrix(features)
         
         # 創建熱力圖
         im = ax.imshow(data, cmap='RdYlBu_r', aspect='auto', alpha=0.8)
         
         # 設置標籤
-        ax.set_xticks(range(len(df)))
-        ax.set_xticklabels([str(i+1) for i in range(len(df))])
+        ax.set_xticks(range(len(table)))
+        ax.set_xticklabels(table.labels)
         ax.set_yticks(range(len(features)))
         ax.set_yticklabels(features, fontproperties=self.zh_font)
         
         # 添加數值標籤
         for i in range(len(features)):
-            for j in range(len(df)):
+            for j in range(len(table)):
                 text = ax.text(j, i, f'{data[i, j]:.0f}',
                              ha="center", va="center", color="white", fontweight='bold')
         
@@ -408,23 +446,16 @@ class ChartGenerator:
         cbar = plt.colorbar(im, ax=ax, shrink=0.8)
         cbar.set_label('複雜度等級', fontproperties=self.zh_font)
     
-    def _create_enhanced_radar_chart(self, ax, df, colors, labels, complexity_map):
+    def _create_enhanced_radar_chart(self, ax, table, colors, labels):
         """創建增強雷達圖"""
         categories = ['計算複雜度', '算力需求', '記憶體需求']
         angles = np.linspace(0, 2 * np.pi, len(categories), endpoint=False).tolist()
         angles += angles[:1]
         
-        # 清除當前軸並創建極坐標軸
-        ax.clear()
-        ax = plt.subplot(3, 3, 5, projection='polar')
-        
         # 繪製前5個演算法
-        for i in range(min(5, len(df))):
-            values = [
-                complexity_map.get(df.iloc[i]['計算複雜度'].split('(')[0], 3),
-                complexity_map.get(df.iloc[i]['算力需求'].split('(')[0], 3),
-                complexity_map.get(df.iloc[i]['記憶體需求'], 3)
-            ]
+        radar_values = table.level_matrix(categories).T
+        for i in range(min(5, len(table))):
+            values = radar_values[i].tolist()
             values += values[:1]
             
             # 創建漸變效果
@@ -443,19 +474,9 @@ class ChartGenerator:
         ax.legend(loc='upper right', bbox_to_anchor=(1.3, 1.0))
         ax.grid(True, alpha=0.3)
     
-    def _create_3d_pie_chart(self, ax, df):
+    def _create_3d_pie_chart(self, ax, table):
         """創建3D風格圓餅圖"""
-        scenario_counts = {}
-        for scenario in df['適用場景']:
-            if '預測' in scenario:
-                key = '預測類'
-            elif '分類' in scenario or '特徵' in scenario:
-                key = '分類類'
-            elif '建模' in scenario or '圖像' in scenario or '多模態' in scenario:
-                key = '深度學習類'
-            else:
-                key = '其他類'
-            scenario_counts[key] = scenario_counts.get(key, 0) + 1
+        scenario_counts = table.scenario_counts()
         
         colors = ChartConfig.get_color_scheme('neon')
         explode = [0.05] * len(scenario_counts)
@@ -483,17 +504,17 @@ class ChartGenerator:
         ax.set_title('🎭 適用場景分布', fontproperties=self.zh_font, 
                     fontsize=14, fontweight='bold')
     
-    def _create_bubble_chart(self, ax, df, complexity_map):
+    def _create_bubble_chart(self, ax, table):
         """創建氣泡圖"""
         # 準備數據
-        x_vals = [complexity_map.get(x.split('(')[0], 3) for x in df['計算複雜度']]
-        y_vals = [complexity_map.get(x.split('(')[0], 3) for x in df['算力需求']]
-        sizes = [complexity_map.get(x, 3) * 100 for x in df['記憶體需求']]
+        x_vals = table.level('計算複雜度')
+        y_vals = table.level('算力需求')
+        sizes = table.level('記憶體需求').astype(np.int32) * 100
         
         colors = ChartConfig.get_color_scheme('viridis')
         
         # 創建氣泡圖
-        scatter = ax.scatter(x_vals, y_vals, s=sizes, c=colors[:len(df)], 
+        scatter = ax.scatter(x_vals, y_vals, s=sizes, c=colors[:len(table)], 
                            alpha=0.7, edgecolors='white', linewidth=2)
         
         # 添加標籤
@@ -505,15 +526,15 @@ class ChartGenerator:
         ax.set_xlabel('計算複雜度', fontproperties=self.zh_font)
         ax.set_ylabel('算力需求', fontproperties=self.zh_font)
     
-    def _create_timeline_chart(self, ax, df, labels):
+    def _create_timeline_chart(self, ax, table, labels):
         """創建時間線效能圖"""
         # 模擬不同演算法的發展時間線
         years = np.arange(2010, 2024)
-        performance_trends = np.random.rand(len(df), len(years)) * 100
+        performance_trends = np.random.rand(len(table), len(years)) * 100
         
         colors = ChartConfig.get_color_scheme('primary')
         
-        for i in range(min(5, len(df))):
+        for i in range(min(5, len(table))):
             ax.plot(years, performance_trends[i], marker='o', linewidth=2, 
                    label=f'演算法{i+1}', color=colors[i], markersize=4)
         
@@ -541,6 +562,9 @@ class ChartGenerator:
             return None
             
         try:
+            import plotly.graph_objects as go
+            from plotly.subplots import make_subplots
+            
             # 創建互動式Plotly圖表
             fig = make_subplots(
                 rows=2, cols=2,
@@ -550,38 +574,35 @@ class ChartGenerator:
                        [{"type": "scatterpolar"}, {"type": "pie"}]]
             )
             
-            complexity_map = {'極低': 1, '低': 2, '中': 3, '中-高': 4, '高': 5, '極高': 6}
+            table = AlgorithmTable.ensure(df)
             
             # 1. 散點圖
-            x = [complexity_map.get(x.split('(')[0], 3) for x in df['計算複雜度']]
-            y = [complexity_map.get(x.split('(')[0], 3) for x in df['算力需求']]
+            x = table.level('計算複雜度')
+            y = table.level('算力需求')
             
             fig.add_trace(
                 go.Scatter(x=x, y=y, mode='markers+text',
-                          text=[str(i+1) for i in range(len(df))],
+                          text=table.labels,
                           textposition="middle center",
-                          marker=dict(size=15, color=np.arange(len(df)), 
+                          marker=dict(size=15, color=np.arange(len(table)), 
                                     colorscale='Viridis', showscale=True),
                           name='演算法'),
                 row=1, col=1
             )
             
             # 2. 柱狀圖
-            memory_values = [complexity_map.get(x, 3) for x in df['記憶體需求']]
+            memory_values = table.level('記憶體需求')
             fig.add_trace(
-                go.Bar(x=[str(i+1) for i in range(len(df))], y=memory_values,
+                go.Bar(x=table.labels, y=memory_values,
                       name='記憶體需求', marker_color='lightblue'),
                 row=1, col=2
             )
             
             # 3. 雷達圖
             categories = ['計算複雜度', '算力需求', '記憶體需求']
-            for i in range(min(3, len(df))):
-                values = [
-                    complexity_map.get(df.iloc[i]['計算複雜度'].split('(')[0], 3),
-                    complexity_map.get(df.iloc[i]['算力需求'].split('(')[0], 3),
-                    complexity_map.get(df.iloc[i]['記憶體需求'], 3)
-                ]
+            radar_values = table.level_matrix(categories).T
+            for i in range(min(3, len(table))):
+                values = radar_values[i].tolist()
                 
                 fig.add_trace(
                     go.Scatterpolar(r=values, theta=categories,
@@ -590,17 +611,7 @@ class ChartGenerator:
                 )
             
             # 4. 圓餅圖
-            scenario_counts = {}
-            for scenario in df['適用場景']:
-                if '預測' in scenario:
-                    key = '預測類'
-                elif '分類' in scenario or '特徵' in scenario:
-                    key = '分類類'
-                elif '建模' in scenario or '圖像' in scenario or '多模態' in scenario:
-                    key = '深度學習類'
-                else:
-                    key = '其他類'
-                scenario_counts[key] = scenario_counts.get(key, 0) + 1
+            scenario_counts = table.scenario_counts()
             
             fig.add_trace(
                 go.Pie(labels=list(scenario_counts.keys()), 
@@ -627,51 +638,18 @@ class ChartGenerator:
             print("⚠️ Plotly未安裝，跳過交互式儀表板生成")
             return None
     
-    def create_animated_comparison(self, df):
-        """創建動畫比較圖"""
+    @themed
+    def create_animated_comparison(self, df, image_format='gif'):
+        """創建動畫比較圖，回傳輸出路徑
+        
+        圖表物件只建立一次，每一幀只更新變更的柱子與標題並以 blit 重畫，
+        影格逐一串流寫入 GIF / APNG / WebP（見 src/animation_engine.py）
+        """
         try:
-            fig, ax = plt.subplots(figsize=(12, 8))
-            
-            complexity_map = {'極低': 1, '低': 2, '中': 3, '中-高': 4, '高': 5, '極高': 6}
-            memory_values = [complexity_map.get(x, 3) for x in df['記憶體需求']]
-            colors = ChartConfig.get_color_scheme('primary')
-            
-            def animate(frame):
-                ax.clear()
-                
-                # 動畫效果：逐步顯示柱狀圖
-                current_data = memory_values[:frame+1]
-                current_labels = [str(i+1) for i in range(frame+1)]
-                current_colors = colors[:frame+1]
-                
-                bars = ax.bar(range(len(current_data)), current_data, 
-                             color=current_colors, alpha=0.8, edgecolor='white', linewidth=2)
-                
-                # 添加動畫效果的數值標籤
-                for i, (bar, val) in enumerate(zip(bars, current_data)):
-                    height = bar.get_height()
-                    ax.text(bar.get_x() + bar.get_width()/2., height + 0.1, 
-                           f'{val}', ha='center', va='bottom', fontweight='bold')
-                
-                ax.set_title(f'📊 演算法記憶體需求動畫比較 (顯示前{frame+1}個)', 
-                           fontproperties=self.zh_font, fontsize=16, fontweight='bold')
-                ax.set_xlabel('演算法編號', fontproperties=self.zh_font)
-                ax.set_ylabel('記憶體需求等級', fontproperties=self.zh_font)
-                ax.set_ylim(0, max(memory_values) + 1)
-                ax.set_xlim(-0.5, len(df) - 0.5)
-                ax.grid(True, alpha=0.3, axis='y')
-            
-            # 創建動畫
-            anim = FuncAnimation(fig, animate, frames=len(df), 
-                               interval=800, repeat=True, blit=False)
-            
-            # 保存動畫
-            output_path = self.output_dir / ChartConfig.OUTPUT_FILES['animated_chart']
-            anim.save(str(output_path), writer='pillow', fps=1.5)
+            table = AlgorithmTable.ensure(df)
+            output_path = create_memory_animation(table, self.output_dir, self.zh_font, image_format)
             print(f"🎬 動畫圖表已儲存: {output_path}")
-            
-            plt.show()
-            return anim
+            return output_path
             
         except Exception as e:
             print(f"⚠️ 動畫生成失敗: {e}")
@@ -0,0 +1,415 @@
+# -*- coding: utf-8 -*-
+"""
+本機圖表 HTTP 服務模組
+以常駐的渲染工作行程池按需求渲染 /chart/<類型>?theme=&dpi=&format=，
+matplotlib 匯入與字體設定在每個工作行程啟動時只做一次；
+回應以內容雜湊作為 ETag 並處理 If-None-Match，最近的渲染結果保存在記憶體 LRU 中
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+# 動態導入配置模組
+sys.path.append(str(Path(__file__).parent.parent))
+from config.chart_config import ChartConfig
+from src.algorithm_table import AlgorithmTable
+from src.enhanced_chart_generator import EnhancedChartGenerator
+from src.font_manager import FontManager
+from src.render_output import RENDER_FORMATS
+from src.utils import lazy_import
+
+pd = lazy_import('pandas')
+plt = lazy_import('matplotlib.pyplot')
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_THEME = 'professional'
+DEFAULT_DPI = 100
+MIN_DPI, MAX_DPI = 20, 600
+
+DEFAULT_WORKERS = 2
+DEFAULT_CONCURRENCY = 2  # 全域渲染名額為 workers × concurrency（含執行中），不個別綁定工作行程
+DEFAULT_CACHE_ENTRIES = 128
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+DEFAULT_QUEUE_TIMEOUT = 30.0  # 秒；等待渲染名額超過此時間即回應 503
+
+CHART_PATH_PATTERN = re.compile(r'^/chart/([\w-]+)/?$')
+
+EXIT_OK = 0
+
+
+class ServiceBusy(Exception):
+    """全域渲染名額已用完"""
+
+
+def content_etag(data):
+    """以內容的 SHA-256 作為強 ETag"""
+    return f'"{hashlib.sha256(data).hexdigest()}"'
+
+
+def etag_matches(if_none_match, etag):
+    """If-None-Match 標頭是否包含 etag（支援多個值、* 與弱比較）"""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(',')]
+    # 弱比較：去掉 W/ 前綴（str.removeprefix 需要 Python 3.9）
+    return '*' in candidates or any(
+        (candidate[2:] if candidate.startswith('W/') else candidate) == etag for candidate in candidates)
+
+
+def parse_chart_request(chart_type, query):
+    """檢查路徑與查詢參數，回傳 (圖表類型, 主題, DPI, 格式)；不合法時拋出 ValueError
+
+    query 為 parse_qs 的結果；未提供的參數使用預設值
+    """
+    if chart_type not in EnhancedChartGenerator.CHART_TYPES:
+        raise LookupError(f"不支援的圖表類型: {chart_type}（可用: {', '.join(EnhancedChartGenerator.CHART_TYPES)}）")
+    theme = query.get('theme', [DEFAULT_THEME])[-1]
+    if theme not in ChartConfig.THEMES:
+        raise ValueError(f"不支援的主題: {theme}（可用: {', '.join(ChartConfig.THEMES)}）")
+    image_format = query.get('format', ['png'])[-1].lower()
+    if image_format not in RENDER_FORMATS:
+        raise ValueError(f"不支援的輸出格式: {image_format}（可用: {', '.join(RENDER_FORMATS)}）")
+    try:
+        dpi = int(query.get('dpi', [DEFAULT_DPI])[-1])
+    except ValueError:
+        raise ValueError("dpi 必須為整數") from None
+    if not MIN_DPI <= dpi <= MAX_DPI:
+        raise ValueError(f"dpi 必須介於 {MIN_DPI} 與 {MAX_DPI} 之間")
+    return chart_type, theme, dpi, image_format
+
+
+class RenderLRU:
+    """最近渲染結果的記憶體 LRU，以項目數與總位元組數為上限（執行緒安全）"""
+
+    def __init__(self, max_entries=DEFAULT_CACHE_ENTRIES, max_bytes=DEFAULT_CACHE_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, entry):
+        """加入項目並淘汰最久未使用的項目；單一項目超過容量上限時不保存"""
+        size = len(entry['chart'].data)
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.nbytes -= len(previous['chart'].data)
+            self._entries[key] = entry
+            self.nbytes += size
+            while len(self._entries) > self.max_entries or self.nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= len(evicted['chart'].data)
+                self.evictions += 1
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class ChartService:
+    """常駐工作行程池與渲染結果快取
+
+    每個工作行程在啟動時匯入 matplotlib、設定字體並先繪製一次，之後的請求只付繪圖與編碼的時間；
+    workers × concurrency 為整個服務共用的准入上限（同時執行與排隊中的渲染總數），
+    工作由行程池分派給空閒的工作行程，不保證每個行程各自最多 concurrency 個；
+    相同的請求在渲染期間共用同一個結果。render 之前須先 start（或使用 with 陳述式）
+    """
+
+    def __init__(self, table=None, workers=DEFAULT_WORKERS, concurrency=DEFAULT_CONCURRENCY,
+                 cache_entries=DEFAULT_CACHE_ENTRIES, cache_bytes=DEFAULT_CACHE_BYTES,
+                 queue_timeout=DEFAULT_QUEUE_TIMEOUT, font_manager_cls=FontManager):
+        self.table = table
+        self.workers = workers
+        self.concurrency = concurrency
+        self.queue_timeout = queue_timeout
+        self.font_manager_cls = font_manager_cls
+        self.cache = RenderLRU(cache_entries, cache_bytes)
+        self.worker_pids = []
+        self.stats = {'hits': 0, 'misses': 0, 'shared': 0, 'busy': 0, 'errors': 0}
+        self._slots = threading.BoundedSemaphore(workers * concurrency)
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def start(self):
+        """啟動並預熱所有工作行程"""
+        if self._executor is not None:
+            return self
+        if self.table is None:
+            from src.data_manager import DataManager
+            self.table = DataManager().create_algorithm_table()
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_service_worker,
+                                             initargs=(self.font_manager_cls, self.table))
+        # 同時送出與工作行程數相同的工作，使所有行程立即啟動並完成初始化
+        futures = [self._executor.submit(os.getpid) for _ in range(self.workers)]
+        wait(futures)
+        self.worker_pids = sorted({future.result() for future in futures})
+        return self
+
+    def close(self):
+        if self._executor is not None:
+            if sys.version_info >= (3, 9):
+                self._executor.shutdown(cancel_futures=True)
+            else:
+                # Python 3.8 沒有 cancel_futures：等待已排入的渲染完成
+                self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def render(self, chart_type, theme=DEFAULT_THEME, dpi=DEFAULT_DPI, image_format='png'):
+        """取得渲染結果，回傳 ({'chart': RenderedChart, 'etag': ETag}, 'hit' | 'miss' | 'shared')
+
+        全域渲染名額在 queue_timeout 秒內都沒有空出時拋出 ServiceBusy；尚未 start 時拋出 RuntimeError
+        """
+        key = (chart_type, theme, dpi, image_format)
+        entry = self.cache.get(key)
+        if entry is not None:
+            self._count('hits')
+            return entry, 'hit'
+
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is None:
+                self._pending[key] = future = Future()
+        if pending is not None:
+            self._count('shared')
+            return pending.result(), 'shared'
+
+        try:
+            if not self._slots.acquire(timeout=self.queue_timeout):
+                self._count('busy')
+                raise ServiceBusy(f"渲染名額已滿（共 {self.workers * self.concurrency} 個）")
+            try:
+                if self._executor is None:
+                    raise RuntimeError("圖表服務尚未啟動，請先呼叫 start() 或使用 with 陳述式")
+                chart = self._executor.submit(_render_service_job, *key).result()
+            finally:
+                self._slots.release()
+            entry = {'chart': chart, 'etag': content_etag(chart.data)}
+            self.cache.put(key, entry)
+            self._count('misses')
+            future.set_result(entry)
+            return entry, 'miss'
+        except BaseException as e:
+            if not isinstance(e, ServiceBusy):
+                self._count('errors')
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+    def health(self):
+        """服務狀態（工作行程、快取與請求統計）"""
+        with self._lock:
+            stats = dict(self.stats)
+        return {
+            'workers': self.worker_pids,
+            'concurrency': self.concurrency,
+            'rows': len(self.table) if self.table is not None else 0,
+            'cache': {'entries': len(self.cache), 'bytes': self.cache.nbytes, 'evictions': self.cache.evictions},
+            **stats
+        }
+
+
+class ChartRequestHandler(BaseHTTPRequestHandler):
+    """GET / HEAD /chart/<類型>?theme=&dpi=&format= 與 /health"""
+
+    server_version = 'AlgorithmChartService/1.0'
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self._handle(send_body=True)
+
+    def do_HEAD(self):
+        self._handle(send_body=False)
+
+    def _handle(self, send_body):
+        url = urlsplit(self.path)
+        service = self.server.service
+        if url.path == '/health':
+            self._send_json(HTTPStatus.OK, service.health(), send_body)
+            return
+
+        match = CHART_PATH_PATTERN.match(url.path)
+        if match is None:
+            self._send_json(HTTPStatus.NOT_FOUND, {'error': f"找不到路徑: {url.path}"}, send_body)
+            return
+        try:
+            request = parse_chart_request(match.group(1), parse_qs(url.query))
+        except LookupError as e:
+            self._send_json(HTTPStatus.NOT_FOUND, {'error': str(e)}, send_body)
+            return
+        except ValueError as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {'error': str(e)}, send_body)
+            return
+
+        try:
+            entry, cache_status = service.render(*request)
+        except ServiceBusy as e:
+            self._send_json(HTTPStatus.SERVICE_UNAVAILABLE, {'error': str(e)}, send_body,
+                            {'Retry-After': '1'})
+            return
+        except Exception as e:
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {'error': f"渲染失敗: {e}"}, send_body)
+            return
+
+        chart, etag = entry['chart'], entry['etag']
+        headers = {
+            'ETag': etag,
+            'Cache-Control': 'no-cache',  # 用戶端每次以 If-None-Match 重新驗證
+            'X-Cache': cache_status,
+            'X-Render-Ms': f"{chart.render_ms:.1f}"
+        }
+        if etag_matches(self.headers.get('If-None-Match'), etag):
+            self._send(HTTPStatus.NOT_MODIFIED, None, None, send_body, headers)
+            return
+        self._send(HTTPStatus.OK, chart.data, chart.mime_type, send_body, headers)
+
+    def _send_json(self, status, payload, send_body, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self._send(status, body, 'application/json; charset=utf-8', send_body, headers)
+
+    def _send(self, status, body, content_type, send_body, headers=None):
+        self.send_response(status)
+        if content_type is not None:
+            self.send_header('Content-Type', content_type)
+        if status != HTTPStatus.NOT_MODIFIED:
+            self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if send_body and body is not None:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+class ChartHTTPServer(ThreadingHTTPServer):
+    """每個請求一個執行緒，渲染交給 ChartService 的工作行程"""
+
+    daemon_threads = True
+
+    def __init__(self, address, service, quiet=False):
+        super().__init__(address, ChartRequestHandler)
+        self.service = service
+        self.quiet = quiet
+
+
+# 工作行程狀態：每個行程只初始化一次 matplotlib、字體與數據
+_SERVICE_FONT_MANAGER = None
+_SERVICE_TABLE = None
+_SERVICE_GENERATORS = {}
+
+
+def _init_service_worker(font_manager_cls, table):
+    """服務工作行程初始化：切換至無介面後端、設定字體並先繪製一次，使字體與 Agg 快取就緒"""
+    global _SERVICE_FONT_MANAGER, _SERVICE_TABLE
+    plt.switch_backend('Agg')
+    _SERVICE_FONT_MANAGER = font_manager_cls()
+    _SERVICE_TABLE = AlgorithmTable.ensure(table)
+    _service_generator(DEFAULT_THEME).render(_SERVICE_TABLE, 'pie', dpi=MIN_DPI)
+
+
+def _service_generator(theme):
+    """每個主題在工作行程中只建立一次生成器（只在記憶體中渲染，輸出目錄不會被寫入）"""
+    generator = _SERVICE_GENERATORS.get(theme)
+    if generator is None:
+        generator = EnhancedChartGenerator(_SERVICE_FONT_MANAGER, Path(tempfile.gettempdir()), theme=theme)
+        _SERVICE_GENERATORS[theme] = generator
+    return generator
+
+
+def _render_service_job(chart_type, theme, dpi, image_format):
+    """在工作行程中渲染一張圖表，回傳 RenderedChart"""
+    return _service_generator(theme).render(_SERVICE_TABLE, chart_type, image_format=image_format, dpi=dpi)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="本機圖表 HTTP 服務：GET /chart/<類型>?theme=&dpi=&format=")
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f"監聽位址，預設 {DEFAULT_HOST}")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"連接埠，預設 {DEFAULT_PORT}")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--data', type=Path, metavar='CSV', help="從 CSV 文件載入演算法數據（預設使用內建數據）")
+    source.add_argument('--synthetic', type=int, metavar='N', help="使用 N 筆模擬超參數配置")
+    parser.add_argument('-w', '--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f"渲染工作行程數，預設 {DEFAULT_WORKERS}")
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"全域渲染名額為 工作行程數 × 此值（同時執行與排隊的渲染總數），"
+                             f"預設 {DEFAULT_CONCURRENCY}")
+    parser.add_argument('--cache-entries', type=int, default=DEFAULT_CACHE_ENTRIES,
+                        help=f"記憶體快取保存的渲染結果數，預設 {DEFAULT_CACHE_ENTRIES}")
+    parser.add_argument('--quiet', action='store_true', help="不輸出每個請求的紀錄")
+    return parser
+
+
+def load_service_table(args):
+    """依參數載入服務使用的演算法資料表"""
+    from src.data_manager import DataManager
+    data_manager = DataManager()
+    if args.synthetic is not None:
+        return AlgorithmTable.from_frame(data_manager.create_synthetic_catalog(args.synthetic))
+    if args.data is not None:
+        if not args.data.exists():
+            raise FileNotFoundError(f"找不到數據文件: {args.data}")
+        return AlgorithmTable.from_frame(pd.read_csv(args.data))
+    return data_manager.create_algorithm_table()
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    table = load_service_table(args)
+    started = time.perf_counter()
+    with ChartService(table, workers=args.workers, concurrency=args.concurrency,
+                      cache_entries=args.cache_entries) as service:
+        print(f"🔥 {args.workers} 個渲染工作行程已就緒 ({time.perf_counter() - started:.1f} 秒)")
+        server = ChartHTTPServer((args.host, args.port), service, quiet=args.quiet)
+        host, port = server.server_address[:2]
+        print(f"🌐 圖表服務: http://{host}:{port}/chart/<類型>?theme=&dpi=&format=")
+        print(f"   圖表類型: {', '.join(EnhancedChartGenerator.CHART_TYPES)}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\n👋 圖表服務已停止")
+        finally:
+            server.server_close()
+    return EXIT_OK
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""
+欄位式儲存模組
+將資料表以欄位式二進位格式保存，載入時以記憶體映射只讀取需要的欄位，
+省去每次重新解析 CSV 文字；有安裝 pyarrow 時使用 Arrow IPC，否則使用 NumPy .npy
+"""
+
+import json
+import os
+import shutil
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 動態導入工具模組
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from src.utils import lazy_import, module_available, write_if_changed
+
+# 可選依賴：只檢查是否安裝，實際匯入延後到第一次讀寫
+PYARROW_AVAILABLE = module_available('pyarrow')
+pa = lazy_import('pyarrow')
+feather = lazy_import('pyarrow.feather')
+
+
+class NpyBackend:
+    """純 NumPy 後端：每個欄位一個 .npy 檔
+
+    數值與布林欄位直接保存；其他欄位以字典編碼保存為 int32 編碼與
+    不重複值（固定寬度 Unicode）兩個檔案，兩者都能以記憶體映射載入
+    """
+
+    name = 'npy'
+
+    @staticmethod
+    def available():
+        return True
+
+    def write(self, data_dir, frame):
+        """寫入所有欄位，回傳欄位配置"""
+        layout = []
+        for index, column in enumerate(frame.columns):
+            series = frame[column]
+            if isinstance(series.dtype, np.dtype) and series.dtype.kind in 'biuf':
+                np.save(data_dir / f"{index}.npy", series.to_numpy())
+                layout.append({'name': column, 'kind': 'numeric', 'file': f"{index}.npy"})
+                continue
+            # 缺值編碼為 -1；非字串的值一律以字串保存
+            codes, uniques = pd.factorize(series, use_na_sentinel=True)
+            np.save(data_dir / f"{index}.codes.npy", codes.astype(np.int32))
+            np.save(data_dir / f"{index}.categories.npy", np.asarray(uniques, dtype=str))
+            layout.append({'name': column, 'kind': 'dictionary',
+                           'file': f"{index}.codes.npy", 'categories': f"{index}.categories.npy"})
+        return layout
+
+    def read(self, data_dir, schema, columns):
+        """以記憶體映射讀取指定欄位"""
+        layout = {entry['name']: entry for entry in schema['layout']}
+        data = {}
+        for column in columns:
+            entry = layout[column]
+            values = np.load(data_dir / entry['file'], mmap_mode='r')
+            if entry['kind'] == 'dictionary':
+                values = _decode(values, np.load(data_dir / entry['categories'], mmap_mode='r'))
+            data[column] = values
+        return pd.DataFrame(data, index=pd.RangeIndex(schema['rows']), columns=list(columns))
+
+
+def _decode(codes, categories):
+    """將字典編碼還原為字串陣列（-1 為缺值）"""
+    categories = np.asarray(categories).astype(object)
+    if len(codes) and codes.min() >= 0:
+        return categories[codes]
+    values = np.full(len(codes), np.nan, dtype=object)
+    present = codes >= 0
+    values[present] = categories[codes[present]]
+    return values
+
+
+class ArrowBackend:
+    """pyarrow 後端：未壓縮的 Arrow IPC 檔，讀取時以記憶體映射只載入指定欄位"""
+
+    name = 'arrow'
+    FILENAME = 'data.arrow'
+
+    @staticmethod
+    def available():
+        return PYARROW_AVAILABLE
+
+    def write(self, data_dir, frame):
+        """寫入整張資料表，回傳欄位配置"""
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        feather.write_feather(table, str(data_dir / self.FILENAME), compression='uncompressed')
+        return [{'name': column, 'file': self.FILENAME} for column in frame.columns]
+
+    def read(self, data_dir, schema, columns):
+        """以記憶體映射讀取指定欄位"""
+        table = feather.read_table(str(data_dir / self.FILENAME), columns=list(columns), memory_map=True)
+        frame = table.to_pandas()
+        frame.index = pd.RangeIndex(schema['rows'])
+        return frame
+
+
+BACKENDS = {backend.name: backend for backend in (ArrowBackend(), NpyBackend())}
+
+
+@contextmanager
+def _exclusive_lock(path):
+    """跨行程的獨占檔案鎖（POSIX 以 flock，Windows 以 msvcrt.locking），離開時釋放"""
+    with open(path, 'a+b') as handle:
+        if os.name == 'nt':
+            import msvcrt
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if os.name == 'nt':
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+class ColumnarStore:
+    """欄位式資料集目錄：每個資料集為 <root>/<名稱>/，內含 schema.json 與一個資料世代目錄
+
+    寫入時先完成新的世代目錄，再以原子改名更新 schema.json 指向它，
+    讀取端只會看到完整的舊資料或完整的新資料；寫入、切換與清理舊世代期間持有資料集的寫入鎖，
+    並行的寫入端不會刪除彼此尚未切換的世代
+    """
+
+    SCHEMA_FILENAME = 'schema.json'
+    LOCK_FILENAME = '.lock'
+    VERSION = 1
+
+    def __init__(self, root, backend='auto'):
+        self.root = Path(root)
+        if backend == 'auto':
+            backend = 'arrow' if ArrowBackend.available() else 'npy'
+        if backend not in BACKENDS:
+            raise ValueError(f"不支援的儲存後端: {backend}")
+        if not BACKENDS[backend].available():
+            raise ImportError(f"儲存後端 {backend} 需要安裝 pyarrow")
+        self.backend = BACKENDS[backend]
+
+    def schema(self, name):
+        """讀取資料集的結構描述；不存在、損毀或後端無法使用時為 None"""
+        try:
+            with open(self.root / name / self.SCHEMA_FILENAME, encoding='utf-8') as f:
+                schema = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if schema.get('version') != self.VERSION:
+            return None
+        backend = BACKENDS.get(schema.get('backend'))
+        if backend is None or not backend.available():
+            return None
+        return schema
+
+    def source(self, name):
+        """資料集轉換來源的指紋（例如 CSV 的大小與修改時間）"""
+        schema = self.schema(name)
+        return schema['source'] if schema else None
+
+    def columns(self, name):
+        """資料集的所有欄位名稱"""
+        schema = self.schema(name)
+        if schema is None:
+            raise FileNotFoundError(f"找不到資料集: {self.root / name}")
+        return schema['columns']
+
+    def save(self, name, frame, source=None):
+        """保存資料表（索引不保存），回傳資料集目錄"""
+        dataset_dir = self.root / name
+        dataset_dir.mkdir(parents=True, exist_ok=True)
+        with _exclusive_lock(dataset_dir / self.LOCK_FILENAME):
+            generation = uuid.uuid4().hex[:12]
+            data_dir = dataset_dir / generation
+            data_dir.mkdir()
+            try:
+                layout = self.backend.write(data_dir, frame)
+            except BaseException:
+                shutil.rmtree(data_dir, ignore_errors=True)
+                raise
+
+            schema = {
+                'version': self.VERSION,
+                'backend': self.backend.name,
+                'generation': generation,
+                'rows': len(frame),
+                'columns': [str(column) for column in frame.columns],
+                'layout': layout,
+                'source': source
+            }
+            write_if_changed(dataset_dir / self.SCHEMA_FILENAME,
+                             json.dumps(schema, ensure_ascii=False, indent=2))
+
+            # 移除舊世代（已以記憶體映射開啟的讀取端在 POSIX 上不受影響）；
+            # 持有寫入鎖，其他寫入端的世代此時都已切換並被取代，不會刪到寫入中的目錄
+            for old_dir in dataset_dir.iterdir():
+                if old_dir.is_dir() and old_dir.name != generation:
+                    shutil.rmtree(old_dir, ignore_errors=True)
+        return dataset_dir
+
+    def load(self, name, columns=None):
+        """載入資料集，columns 指定時只讀取這些欄位
+
+        讀取端不持有寫入鎖：讀到的世代在開啟前被並行的寫入端取代並刪除時，依新的 schema.json 重試一次
+        """
+        schema = self.schema(name)
+        try:
+            return self._read(name, schema, columns)
+        except FileNotFoundError:
+            current = self.schema(name)
+            if schema is None or current is None or current['generation'] == schema['generation']:
+                raise
+            return self._read(name, current, columns)
+
+    def _read(self, name, schema, columns):
+        """依指定的結構描述讀取世代目錄"""
+        if schema is None:
+            raise FileNotFoundError(f"找不到資料集: {self.root / name}")
+        columns = schema['columns'] if columns is None else list(columns)
+        missing = [column for column in columns if column not in schema['columns']]
+        if missing:
+            raise KeyError(f"資料集 {name} 沒有欄位: {', '.join(missing)}")
+        backend = BACKENDS[schema['backend']]
+        return backend.read(self.root / name / schema['generation'], schema, columns)
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+條件語法模組
+解析「記憶體需求<=中, 可平行化>=高, 適用場景~預測」形式的條件字串，
+SQLite 目錄與推薦索引共用；只依賴標準函式庫，命令列查詢不必載入 NumPy / pandas
+"""
+
+import re
+
+# 條件運算子；~ 表示包含（子字串）
+OPERATORS = {'<': '<', '<=': '<=', '=': '=', '==': '=', '!=': '!=', '>=': '>=', '>': '>', '~': 'contains'}
+_CONSTRAINT_PATTERN = re.compile(r'^\s*(.+?)\s*(<=|>=|!=|==|=|<|>|~)\s*(.+?)\s*$')
+
+# 依場景分類（而非場景文字）篩選時使用的虛擬欄位
+SCENARIO_CATEGORY_COLUMN = '場景分類'
+
+
+def parse_constraints(text):
+    """解析條件字串，例如 '記憶體需求<=中, 可平行化>=高, 適用場景~預測'
+
+    回傳 [(欄位, 運算子, 值)]；格式錯誤時拋出 ValueError
+    """
+    constraints = []
+    for part in re.split(r'[,，]', text):
+        if not part.strip():
+            continue
+        match = _CONSTRAINT_PATTERN.match(part)
+        if match is None:
+            raise ValueError(f"無法解析條件: {part.strip()}")
+        constraints.append(match.groups())
+    return constraints
+
+
+def parse_flag(value):
+    """旗標條件的值：1、true、yes、是 為真，其餘為假"""
+    return str(value).lower() in ('1', 'true', 'yes', '是')
@@ -8,16 +8,35 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 
+# 動態導入演算法資料表
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config.algorithm_data import COMPLEXITY_MAPPING
+from src.algorithm_table import AlgorithmTable, FLAG_ANNOTATIONS, LEVEL_COLUMNS, parse_level
+from src.benchmark import BenchmarkRunner
+from src.catalog_db import CatalogDatabase
+from src.columnar_store import ColumnarStore
+from src.log_ingest import ingest_benchmark_log
+from src.pareto import pareto_front
+from src.recommendation import INDEX_SUFFIX, RecommendationIndex
+from src.scoring import ScoringEngine
+from src.utils import source_fingerprint, write_if_changed
+
 
 class DataManager:
-    """數據管理器"""
+    """數據管理器
+    
+    storage 為欄位式儲存後端：'auto'（有 pyarrow 時用 Arrow，否則用 .npy）、
+    'arrow'、'npy'，或 None 表示每次都直接解析 CSV
+    """
+    
+    # 欄位式儲存中編碼欄位的名稱前綴，與原始欄位區隔
+    ENCODED_PREFIX = '__'
+    BENCHMARK_DATASET = 'benchmark_results'
     
-    def __init__(self, data_path=None):
+    def __init__(self, data_path=None, storage='auto'):
         self.data_path = data_path or Path(__file__).parent.parent / "data"
-        self.complexity_map = {
-            '極低': 1, '低': 2, '中': 3, 
-            '中-高': 4, '高': 5, '極高': 6
-        }
+        self.store = ColumnarStore(self.data_path / ".columnar", storage) if storage else None
     
     def create_algorithm_dataframe(self):
         """建立演算法比較資料表"""
@@ -52,12 +71,61 @@ class DataManager:
             ]
         })
     
-    def load_data_from_csv(self, filename="algorithms.csv"):
-        """從 CSV 文件載入數據"""
+    def create_algorithm_table(self):
+        """建立預先編碼的演算法資料表"""
+        return AlgorithmTable.from_frame(self.create_algorithm_dataframe())
+    
+    def create_synthetic_catalog(self, n_configs, seed=42):
+        """建立大型模擬目錄：以基礎演算法為範本，產生 n 組超參數配置
+        
+        每組配置的複雜度、算力與記憶體需求在範本等級上下隨機浮動一級
+        """
+        rng = np.random.default_rng(seed)
+        base = self.create_algorithm_table()
+        rows = rng.integers(0, len(base), n_configs)
+        
+        catalog = base.frame.iloc[rows].reset_index(drop=True)
+        catalog['演算法'] = catalog['演算法'] + '#' + pd.Series(np.arange(1, n_configs + 1)).astype(str)
+        
+        levels = np.array(list(COMPLEXITY_MAPPING))
+        for column in ['計算複雜度', '算力需求', '記憶體需求']:
+            codes = base.level(column)[rows].astype(np.int64) - 1 + rng.integers(-1, 2, n_configs)
+            catalog[column] = levels[np.clip(codes, 0, len(levels) - 1)]
+        return catalog
+    
+    def load_table_from_csv(self, filename="algorithms.csv", columns=None):
+        """從 CSV 文件載入數據並編碼為演算法資料表
+        
+        欄位式儲存與 CSV 一致時直接載入已編碼的資料表，不解析也不重新編碼；
+        columns 指定時只載入這些原始欄位
+        """
         try:
             csv_path = self.data_path / filename
             if csv_path.exists():
-                return pd.read_csv(csv_path)
+                name = Path(filename).stem
+                if self._is_stored(name, csv_path):
+                    return self.load_table(name, columns)
+                table = self._convert_csv(csv_path, name)
+                return table if columns is None else self._select(table, columns)
+        except Exception as e:
+            print(f"載入 CSV 數據時發生錯誤: {e}")
+            return self.create_algorithm_table()
+        return AlgorithmTable.from_frame(self.load_data_from_csv(filename, columns))
+    
+    def load_data_from_csv(self, filename="algorithms.csv", columns=None):
+        """從 CSV 文件載入數據
+        
+        第一次載入（或 CSV 變更後）會自動轉換為欄位式儲存，之後改由記憶體映射讀取；
+        columns 指定時只讀取這些欄位
+        """
+        try:
+            csv_path = self.data_path / filename
+            if csv_path.exists():
+                name = Path(filename).stem
+                if self._is_stored(name, csv_path):
+                    return self.store.load(name, columns or self._raw_columns(name))
+                df = self._convert_csv(csv_path, name).frame
+                return df if columns is None else df[list(columns)]
             else:
                 print(f"CSV 文件不存在，使用預設數據: {csv_path}")
                 return self.create_algorithm_dataframe()
@@ -65,15 +133,115 @@ class DataManager:
             print(f"載入 CSV 數據時發生錯誤: {e}")
             return self.create_algorithm_dataframe()
     
+    @staticmethod
+    def _source_fingerprint(csv_path):
+        """CSV 的大小與修改時間（只需 stat，內容未變更時 save_data_to_csv 不會改變修改時間）"""
+        return source_fingerprint(csv_path)
+    
+    def _is_stored(self, name, csv_path):
+        """欄位式儲存是否為此 CSV 目前內容的轉換結果"""
+        return self.store is not None and self.store.source(name) == self._source_fingerprint(csv_path)
+    
+    def _convert_csv(self, csv_path, name):
+        """解析 CSV 並編碼，同時轉換為欄位式儲存（轉換失敗不影響載入）"""
+        source = self._source_fingerprint(csv_path)
+        table = AlgorithmTable.from_frame(pd.read_csv(csv_path))
+        if self.store is not None:
+            try:
+                self.save_table(table, name, source)
+                print(f"🗃️ 已轉換為欄位式儲存 ({self.store.backend.name}): {self.store.root / name}")
+            except Exception as e:
+                print(f"⚠️ 欄位式儲存轉換失敗，沿用 CSV: {e}")
+        return table
+    
+    def _raw_columns(self, name):
+        """資料集中的原始欄位（不含編碼欄位）"""
+        return [column for column in self.store.columns(name) if not column.startswith(self.ENCODED_PREFIX)]
+    
+    @staticmethod
+    def _select(table, columns):
+        """只保留指定的原始欄位，沿用已計算的編碼"""
+        return AlgorithmTable(table.frame[list(columns)], table.levels, table.flags, table.scenario_codes)
+    
+    def save_table(self, table, name="algorithms", source=None):
+        """將演算法資料表的原始欄位與編碼（等級、旗標、場景分類）一起保存到欄位式儲存"""
+        prefix = self.ENCODED_PREFIX
+        encoded = {f"{prefix}level:{column}": codes for column, codes in table.levels.items()}
+        encoded.update({f"{prefix}flag:{flag}": values for flag, values in table.flags.items()})
+        encoded[f"{prefix}scenario"] = table.scenario_codes
+        frame = pd.concat([table.frame, pd.DataFrame(encoded, index=table.frame.index)], axis=1)
+        return self.store.save(name, frame, source)
+    
+    def load_table(self, name="algorithms", columns=None):
+        """從欄位式儲存載入已編碼的演算法資料表，columns 指定時只讀取這些原始欄位"""
+        prefix = self.ENCODED_PREFIX
+        stored = self.store.columns(name)
+        encoded = self.store.load(name, [column for column in stored if column.startswith(prefix)])
+        frame = self.store.load(name, self._raw_columns(name) if columns is None else columns)
+        
+        levels = {column: encoded[f"{prefix}level:{column}"].to_numpy()
+                  for column in LEVEL_COLUMNS if f"{prefix}level:{column}" in encoded}
+        flags = {flag: encoded[f"{prefix}flag:{flag}"].to_numpy() for flag in FLAG_ANNOTATIONS}
+        return AlgorithmTable(frame, levels, flags, encoded[f"{prefix}scenario"].to_numpy())
+    
+    def open_catalog(self, filename="algorithms.csv"):
+        """開啟 CSV 對應的 SQLite 目錄（data/<名稱>.sqlite），供條件查詢
+        
+        資料庫不存在或 CSV 變更後自動重建（經由欄位式儲存載入，不重新解析等級字串）
+        """
+        csv_path = self.data_path / filename
+        source = self._source_fingerprint(csv_path) if csv_path.exists() else None
+        catalog = CatalogDatabase(self.data_path / Path(filename).with_suffix('.sqlite').name)
+        if not catalog.exists() or catalog.source != source:
+            print(f"🗄️ 建立演算法目錄資料庫: {catalog.path}")
+            catalog.import_table(self.load_table_from_csv(filename), source)
+        return catalog
+    
+    def query_catalog(self, constraints, filename="algorithms.csv", limit=None):
+        """以條件查詢演算法目錄，回傳已編碼的子集（可直接傳給圖表生成器）
+        
+        constraints 為條件字串（例如 '記憶體需求<=中, 可平行化>=高, 適用場景~預測'）
+        或 [(欄位, 運算子, 值)]
+        """
+        with self.open_catalog(filename) as catalog:
+            return catalog.query(constraints, limit)
+    
+    def open_recommendation_index(self, filename="algorithms.csv", index_path=None):
+        """開啟 CSV 對應的推薦索引（data/<名稱>.recidx），不存在或 CSV 變更後自動重建"""
+        csv_path = self.data_path / filename
+        source = self._source_fingerprint(csv_path) if csv_path.exists() else None
+        index = RecommendationIndex(index_path or self.data_path / Path(filename).with_suffix(INDEX_SUFFIX).name)
+        if not index.exists() or index.source != source:
+            print(f"🔖 建立推薦索引: {index.path}")
+            index.close()
+            index = RecommendationIndex.build(self.load_table_from_csv(filename), index.path, source)
+        return index
+    
+    def recommend(self, constraints, filename="algorithms.csv", limit=10):
+        """依條件推薦演算法，回傳依推薦排名排列的結果（見 RecommendationIndex.recommend）"""
+        with self.open_recommendation_index(filename) as index:
+            return index.recommend(constraints, limit)
+    
+    def save_benchmark_results(self, performance_data, name=None):
+        """將效能數據（generate_performance_data 的結果）保存到欄位式儲存"""
+        return self.store.save(name or self.BENCHMARK_DATASET, pd.DataFrame(performance_data))
+    
+    def load_benchmark_results(self, columns=None, name=None):
+        """載入已保存的效能數據（DataFrame，可直接當作效能數據使用），columns 指定時只讀取這些欄位"""
+        return self.store.load(name or self.BENCHMARK_DATASET, columns)
+    
     def save_data_to_csv(self, df, filename="algorithms.csv"):
-        """將數據保存到 CSV 文件"""
+        """將數據保存到 CSV 文件，內容未變更時不重寫，回傳是否寫入"""
         try:
             csv_path = self.data_path / filename
-            csv_path.parent.mkdir(parents=True, exist_ok=True)
-            df.to_csv(csv_path, index=False, encoding='utf-8-sig')
-            print(f"數據已保存到: {csv_path}")
+            content = df.to_csv(index=False).encode('utf-8-sig')
+            if write_if_changed(csv_path, content):
+                print(f"數據已保存到: {csv_path}")
+                return True
+            print(f"數據未變更，略過寫入: {csv_path}")
         except Exception as e:
             print(f"保存 CSV 數據時發生錯誤: {e}")
+        return False
     
     def create_smart_labels(self, algorithm_names, max_length=2):
         """建立純數字標籤映射"""
@@ -81,21 +249,35 @@ class DataManager:
     
     def get_complexity_value(self, complexity_str):
         """將複雜度字符串轉換為數值"""
-        clean_str = complexity_str.split('(')[0]
-        return self.complexity_map.get(clean_str, 3)
+        clean_str, _ = parse_level(complexity_str)
+        return COMPLEXITY_MAPPING.get(clean_str, COMPLEXITY_MAPPING['中'])
+    
+    def generate_performance_data(self, algorithm_names=None, **runner_options):
+        """實際執行基準測試，產生效能數據（執行時間為毫秒，記憶體為 MB）
+        
+        runner_options 會傳給 BenchmarkRunner（n_points、warmup、repeats、seed）
+        """
+        if algorithm_names is None:
+            algorithm_names = self.create_algorithm_dataframe()['演算法']
+        return BenchmarkRunner(**runner_options).performance_data(algorithm_names)
+    
+    def ingest_benchmark_log(self, path, algorithm_names=None, statistic='mean', chunksize=100_000, **options):
+        """串流匯入每次執行一列的基準測試紀錄（CSV / JSONL），回傳效能數據
+        
+        options 會傳給 log_ingest.ingest_benchmark_log（columns、relative_accuracy）
+        """
+        aggregator = ingest_benchmark_log(path, chunksize, **options)
+        print(f"📥 已匯入 {aggregator.rows} 筆紀錄，{len(aggregator.algorithms)} 種演算法")
+        return aggregator.performance_data(algorithm_names, statistic)
+    
+    def pareto_front(self, performance_data, objectives=None):
+        """效能數據中不被支配的配置（布林陣列），objectives 為 2 或 3 個目標，預設為準確度、執行時間與記憶體"""
+        return pareto_front(performance_data, objectives)
     
-    def generate_mock_performance_data(self, num_algorithms=10):
-        """生成模擬效能數據"""
-        np.random.seed(42)  # 確保可重現
+    def calculate_efficiency_score(self, execution_time, memory_usage, accuracy, profile='legacy', **options):
+        """計算綜合效率評分（NumPy 陣列）
         
-        return {
-            'algorithms': [str(i+1) for i in range(num_algorithms)],
-            'execution_time': np.random.randint(10, 600, num_algorithms).tolist(),
-            'accuracy': np.random.randint(65, 99, num_algorithms).tolist(),
-            'memory_usage': np.random.randint(50, 1200, num_algorithms).tolist()
-        }
-    
-    def calculate_efficiency_score(self, execution_time, memory_usage, accuracy):
-        """計算綜合效率評分"""
-        return [100 - (t/10 + m/20 - a/2) 
-                for t, m, a in zip(execution_time, memory_usage, accuracy)]
+        預設為舊版公式 100 - (t/10 + m/20 - a/2)；profile 與 options 會傳給 ScoringEngine
+        （weights、normalization、method）
+        """
+        return ScoringEngine(profile, **options).score_arrays(execution_time, memory_usage, accuracy)
@@ -1,134 +1,451 @@
 # -*- coding: utf-8 -*-
 """
 增強版圖表生成模組
-提供現代化、單獨顯示的圖表生成功能（無動畫，純靜態圖表）
+提供現代化、單獨顯示的圖表生成功能（靜態圖表；動畫由 animation_engine 串流編碼）
 支援逐一生成各種類型的專業圖表
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
 import numpy as np
 import pandas as pd
 from pathlib import Path
 import warnings
-import seaborn as sns
-
-# 嘗試導入可選依賴
-try:
-    import plotly.graph_objects as go
-    import plotly.express as px
-    from plotly.subplots import make_subplots
-    PLOTLY_AVAILABLE = True
-except ImportError:
-    PLOTLY_AVAILABLE = False
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
 
 warnings.filterwarnings('ignore')
 
 # 動態導入配置模組
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
-from config.chart_config import ChartConfig
+from config.chart_config import ChartConfig, themed
+from src.algorithm_table import AlgorithmTable, SCENARIO_CATEGORIES
+from src.animation_engine import create_memory_animation
+from src.pareto import pareto_front
+from src.png_pipeline import PngPipeline
+from src.render_cache import RenderCache, hash_dataframe_columns
+from src.render_manifest import RenderManifest, hash_columns
+from src.render_output import RenderCapture, encode_figure
+from src.render_tiers import QualityTier
+from src.vector_output import PdfReport
+from src import tracing
+from src.utils import lazy_import, module_available, write_if_changed
+
+# matplotlib 延遲到第一張圖表繪製時才載入
+matplotlib = lazy_import('matplotlib')
+plt = lazy_import('matplotlib.pyplot')
+patches = lazy_import('matplotlib.patches')
+ticker = lazy_import('matplotlib.ticker')
+
+# 可選依賴：只檢查是否安裝，實際匯入延後到 create_interactive_dashboard
+PLOTLY_AVAILABLE = module_available('plotly')
 
 
 class EnhancedChartGenerator:
     """增強版圖表生成器"""
     
-    def __init__(self, font_manager, output_dir=None, theme='professional'):
+    # 支援的圖表類型，順序即序列模式的生成順序
+    # columns 為圖表讀取的數據欄位，與其他設定一起組成渲染快取鍵，
+    # 也是增量渲染的相依關係（只有這些欄位變更時才重新渲染該圖表）
+    CHART_TYPES = {
+        'scatter': {
+            'name': '3D風格散點圖',
+            'filename': 'enhanced_scatter_3d.png',
+            'figsize': (12, 9),
+            'color_scheme': 'cyberpunk',
+            'columns': ['演算法', '計算複雜度', '算力需求']
+        },
+        'bar': {
+            'name': '增強柱狀圖',
+            'filename': 'enhanced_bar_memory.png',
+            'figsize': (14, 8),
+            'color_scheme': 'gradient_blue',
+            'columns': ['演算法', '記憶體需求']
+        },
+        'heatmap': {
+            'name': '熱力圖',
+            'filename': 'enhanced_heatmap.png',
+            'figsize': (12, 8),
+            'color_scheme': 'RdYlBu_r',
+            'columns': ['演算法', '計算複雜度', '算力需求', '記憶體需求']
+        },
+        'radar': {
+            'name': '雷達圖',
+            'filename': 'enhanced_radar.png',
+            'figsize': (10, 10),
+            'color_scheme': 'cyberpunk',
+            # 大型目錄模式依適用場景分組繪製平均輪廓
+            'columns': ['計算複雜度', '算力需求', '記憶體需求', '適用場景']
+        },
+        'pie': {
+            'name': '圓餅圖',
+            'filename': 'enhanced_pie_scenarios.png',
+            'figsize': (10, 8),
+            'color_scheme': 'neon',
+            'columns': ['適用場景']
+        },
+        'bubble': {
+            'name': '氣泡圖',
+            'filename': 'enhanced_bubble.png',
+            'figsize': (12, 9),
+            'color_scheme': 'viridis',
+            'columns': ['演算法', '計算複雜度', '算力需求', '記憶體需求']
+        }
+    }
+    
+    # 繪圖程式碼變更會影響輸出時需遞增，使舊的快取項目失效
+    RENDER_CACHE_VERSION = 2
+    
+    # 資料列數超過此值時切換為大型目錄模式：散點與氣泡圖彙總為密度分箱，
+    # 逐列的標籤、文字與色塊改為單一集合物件
+    LARGE_CATALOG_THRESHOLD = 100
+    
+    # 圖內編號對照表每頁的列數，超過時完整對照表另存為 LEGEND_FILENAME
+    LEGEND_PAGE_SIZE = 30
+    LEGEND_FILENAME = 'algorithm_legend.csv'
+    
+    # Pareto 前緣圖：x 軸、y 軸與顏色依序對應的目標，被支配的點最多繪製的數量
+    PARETO_FILENAME = 'pareto_frontier.png'
+    PARETO_OBJECTIVES = ('execution_time', 'accuracy', 'memory_usage')
+    PARETO_AXIS_LABELS = {
+        'execution_time': '執行時間 (毫秒)',
+        'accuracy': '準確度 (%)',
+        'memory_usage': '峰值記憶體 (MB)'
+    }
+    PARETO_MAX_DOMINATED = 2000
+    
+    # 動畫影格的 DPI：每一幀都要編碼，使用靜態圖表的高 DPI 會使檔案過大
+    ANIMATION_DPI = 100
+    
+    def __init__(self, font_manager, output_dir=None, theme='professional', n_jobs=1,
+                 render_cache=None, dpi=None, image_format='png', incremental=False,
+                 quality='full', full_queue=None, png_pipeline=None):
         self.font_manager = font_manager
         self.zh_font = font_manager.get_font()
         self.output_dir = output_dir or Path(__file__).parent.parent / "output"
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.theme = theme
+        self.n_jobs = n_jobs
+        # 品質等級：preview 以預覽 DPI 輸出並保存圖表描述，完整解析度由 full_queue 在背景輸出
+        self.tier = QualityTier(quality, dpi, queue=full_queue)
+        self.dpi = self.tier.dpi
+        self.image_format = image_format
+        self.render_cache = render_cache
+        self.incremental = incremental
+        self._capture = None  # 擷取模式時為 RenderCapture
+        self._report = None  # 報告模式時為 PdfReport
+        # 背景 PNG 編碼：主執行緒點陣化後即繼續繪製，寫檔後的工作延到 finish_encoding
+        self.png_pipeline = png_pipeline
+        self._encoding = []  # 目前圖表背景編碼中的 Future
+        self._deferred = []  # (圖表類型, Future 列表, 寫檔後的工作, 參數)
         self.setup_style()
     
     def setup_style(self):
-        """設置全局樣式"""
-        plt.style.use('seaborn-v0_8' if hasattr(plt.style, 'seaborn-v0_8') else 'default')
-        
-        # 設置中文字體
-        plt.rcParams['font.sans-serif'] = ['Microsoft YaHei', 'SimHei', 'DejaVu Sans']
-        plt.rcParams['axes.unicode_minus'] = False
-        
-        # 設置主題樣式
-        theme_style = ChartConfig.get_theme_style(self.theme)
-        plt.rcParams['figure.facecolor'] = theme_style['background']
-        plt.rcParams['axes.facecolor'] = theme_style['background']
-        plt.rcParams['text.color'] = theme_style['text_color']
-        plt.rcParams['axes.labelcolor'] = theme_style['text_color']
-        plt.rcParams['xtick.color'] = theme_style['text_color']
-        plt.rcParams['ytick.color'] = theme_style['text_color']
-    
-    def create_enhanced_main_comparison(self, df):
-        """建立增強版演算法比較圖表 - 分別生成多個獨立圖表"""
+        """準備主題樣式（僅在繪圖時以 context 套用，不修改全局 rcParams）"""
+        self.style_rc = ChartConfig.get_theme_rc(self.theme)
+    
+    def style_context(self):
+        """建立此生成器主題的樣式 context"""
+        return ChartConfig.theme_context(self.theme)
+    
+    def generator_options(self):
+        """在工作行程中重建相同生成器所需的參數（PNG 編碼設定以 png_ 前綴的鍵傳遞）"""
+        options = {'dpi': self.tier.full_dpi, 'image_format': self.image_format, 'quality': self.tier.quality}
+        if self.png_pipeline is not None:
+            options.update(self.png_pipeline.settings())
+        return options
+    
+    def output_path(self, chart_type):
+        """圖表的輸出路徑（副檔名依輸出格式而定）"""
+        filename = Path(self.CHART_TYPES[chart_type]['filename'])
+        return self.output_dir / filename.with_suffix(f'.{self.image_format}')
+    
+    def create_enhanced_main_comparison(self, df, n_jobs=None, chart_types=None):
+        """建立增強版演算法比較圖表 - 分別生成多個獨立圖表
+
+        n_jobs 大於 1 時改用行程池平行渲染，每張圖表為一個獨立工作；
+        任一圖表失敗時仍會完成其餘圖表，最後拋出第一個例外
+        """
         print("\n🎨 開始生成增強版圖表系列...")
         
-        # 建立顏色映射和數據
-        colors = ChartConfig.get_color_scheme('cyberpunk')
-        gradient_colors = ChartConfig.get_gradient_colors('gradient_blue', len(df))
-        complexity_map = {'極低': 1, '低': 2, '中': 3, '中-高': 4, '高': 5, '極高': 6}
+        errors = self.render_charts(df, chart_types, n_jobs)
+        for error in errors.values():
+            if error is not None:
+                raise error
         
-        # 準備數據
-        x = [complexity_map.get(x.split('(')[0], 3) for x in df['計算複雜度']]
-        y = [complexity_map.get(x.split('(')[0], 3) for x in df['算力需求']]
-        labels = [str(i+1) for i in range(len(df))]
-        
-        # 逐一生成每個圖表，不批量處理
-        chart_methods = [
-            ('3D風格散點圖', lambda: self._create_single_3d_scatter(df, x, y, colors, complexity_map)),
-            ('增強柱狀圖', lambda: self._create_single_enhanced_bar(df, gradient_colors, labels, complexity_map)),
-            ('熱力圖', lambda: self._create_single_heatmap(df, complexity_map)),
-            ('雷達圖', lambda: self._create_single_radar(df, colors, labels, complexity_map)),
-            ('圓餅圖', lambda: self._create_single_pie(df)),
-            ('氣泡圖', lambda: self._create_single_bubble(df, complexity_map))
-        ]
+        print("✨ 所有增強版圖表已生成完成！")
+    
+    def render_charts(self, df, chart_types=None, n_jobs=None):
+        """渲染指定的圖表類型（預設為全部），回傳 {圖表類型: 例外或 None}"""
+        table = AlgorithmTable.ensure(df)
+        n_jobs = self.n_jobs if n_jobs is None else n_jobs
+        chart_types = list(chart_types or self.CHART_TYPES)
         
-        for chart_name, chart_method in chart_methods:
-            print(f"📊 正在生成 {chart_name}...")
-            chart_method()
+        # 增量模式：只渲染相依欄位或設定與上次不同的圖表，其餘沿用上次的輸出
+        plan = self.plan_incremental(table, chart_types) if self.incremental else None
+        stale_types = plan['stale'] if plan else chart_types
+        errors = {chart_type: None for chart_type in chart_types}
         
-        print("✨ 所有增強版圖表已生成完成！")
+        if n_jobs > 1 and stale_types:
+            errors.update(self._render_charts_parallel(table, stale_types, n_jobs))
+        else:
+            # 逐一生成每個圖表，不批量處理
+            for chart_type in stale_types:
+                print(f"📊 正在生成 {self.CHART_TYPES[chart_type]['name']}...")
+                try:
+                    self._render_chart(table, chart_type)
+                    errors[chart_type] = None
+                except Exception as e:
+                    print(f"❌ {self.CHART_TYPES[chart_type]['name']} 生成失敗: {e}")
+                    errors[chart_type] = e
+            for chart_type, error in self.finish_encoding().items():
+                print(f"❌ {self.CHART_TYPES[chart_type]['name']} 編碼失敗: {error}")
+                errors[chart_type] = error
+        
+        if plan:
+            self.record_incremental(plan, {chart_type: errors[chart_type] for chart_type in stale_types})
+            self.queue_missing_full([chart_type for chart_type in chart_types if chart_type not in stale_types])
+        if len(table) > self.LEGEND_PAGE_SIZE:
+            self.export_legend_pages(table)
+        return errors
     
     def create_single_chart(self, df, chart_type):
         """生成單個指定類型的圖表"""
-        colors = ChartConfig.get_color_scheme('cyberpunk')
-        gradient_colors = ChartConfig.get_gradient_colors('gradient_blue', len(df))
-        complexity_map = {'極低': 1, '低': 2, '中': 3, '中-高': 4, '高': 5, '極高': 6}
-        
-        # 準備數據
-        x = [complexity_map.get(x.split('(')[0], 3) for x in df['計算複雜度']]
-        y = [complexity_map.get(x.split('(')[0], 3) for x in df['算力需求']]
-        labels = [str(i+1) for i in range(len(df))]
-        
-        chart_types = {
-            'scatter': lambda: self._create_single_3d_scatter(df, x, y, colors, complexity_map),
-            'bar': lambda: self._create_single_enhanced_bar(df, gradient_colors, labels, complexity_map),
-            'heatmap': lambda: self._create_single_heatmap(df, complexity_map),
-            'radar': lambda: self._create_single_radar(df, colors, labels, complexity_map),
-            'pie': lambda: self._create_single_pie(df),
-            'bubble': lambda: self._create_single_bubble(df, complexity_map)
-        }
-        
-        if chart_type.lower() in chart_types:
+        if chart_type.lower() in self.CHART_TYPES:
             print(f"📊 正在生成 {chart_type} 圖表...")
-            chart_types[chart_type.lower()]()
+            self._render_chart(AlgorithmTable.ensure(df), chart_type.lower())
+            for error in self.finish_encoding().values():
+                raise error
             print(f"✨ {chart_type} 圖表生成完成！")
         else:
-            available_types = ', '.join(chart_types.keys())
+            available_types = ', '.join(self.CHART_TYPES.keys())
             print(f"❌ 不支援的圖表類型: {chart_type}")
             print(f"可用的圖表類型: {available_types}")
     
+    def _render_chart(self, table, chart_type):
+        """渲染指定類型的圖表，輸入未變更時直接重用快取的結果
+        
+        回傳是否命中快取
+        """
+        table = AlgorithmTable.ensure(table)
+        with tracing.span(f'render:{chart_type}', 'chart', theme=self.theme, rows=len(table),
+                          image_format=self.image_format, dpi=self.dpi):
+            if self.render_cache is None:
+                self._draw_chart(table, chart_type)
+                self._after_encoding(chart_type, self._finish_chart, chart_type)
+                return False
+            
+            spec = self.CHART_TYPES[chart_type]
+            output_paths = self.tier.output_paths(self.output_path(chart_type))
+            with tracing.span('cache_lookup', 'cache'):
+                key = self._render_cache_key(table, chart_type)
+                cache_hit = self.render_cache.fetch(key, output_paths)
+            if cache_hit:
+                print(f"♻️ {spec['name']} 輸入未變更，沿用快取: {output_paths[0]}")
+                self._finish_chart(chart_type)
+            else:
+                self._draw_chart(table, chart_type)
+                self._after_encoding(chart_type, self._finish_chart, chart_type, key, output_paths)
+            return cache_hit
+    
+    def _finish_chart(self, chart_type, cache_key=None, output_paths=None):
+        """圖表寫入磁碟後的工作：存入渲染快取，預覽的圖表描述（新繪製或取自快取）排入完整解析度渲染"""
+        if cache_key is not None:
+            with tracing.span('cache_store', 'cache'):
+                self.render_cache.store(cache_key, output_paths)
+        self.tier.queue_full(self.output_path(chart_type))
+    
+    def _after_encoding(self, chart_type, fn, *args):
+        """需要讀取輸出檔的工作：沒有背景編碼中的輸出時立即執行，否則延到 finish_encoding"""
+        futures, self._encoding = self._encoding, []
+        if futures:
+            self._deferred.append((chart_type, futures, fn, args))
+        else:
+            fn(*args)
+    
+    def finish_encoding(self):
+        """等待背景 PNG 編碼寫檔完成並執行延後的工作，回傳失敗的 {圖表類型: 例外}"""
+        # 不屬於 _render_chart 的輸出（例如 Pareto 前緣圖）
+        self._after_encoding(None, lambda: None)
+        deferred, self._deferred = self._deferred, []
+        errors = {}
+        for chart_type, futures, fn, args in deferred:
+            try:
+                for future in futures:
+                    future.result()
+                fn(*args)
+            except Exception as e:
+                errors[chart_type] = e
+        return errors
+    
+    @classmethod
+    def dependency_graph(cls, chart_types=None):
+        """欄位 → 讀取該欄位的圖表類型"""
+        graph = {}
+        for chart_type in chart_types or cls.CHART_TYPES:
+            for column in cls.CHART_TYPES[chart_type]['columns']:
+                graph.setdefault(column, []).append(chart_type)
+        return graph
+    
+    def plan_incremental(self, table, chart_types=None):
+        """比對上次的渲染紀錄，找出需要重新渲染的圖表
+        
+        每個相依欄位只計算一次雜湊值；回傳供 record_incremental 使用的計畫
+        """
+        chart_types = list(chart_types or self.CHART_TYPES)
+        manifest = RenderManifest(self.output_dir)
+        column_hashes = hash_columns(table.frame, self.dependency_graph(chart_types))
+        settings = {chart_type: self._render_settings_key(table, chart_type) for chart_type in chart_types}
+        stale = [chart_type for chart_type in chart_types
+                 if manifest.is_stale(self.output_path(chart_type).name,
+                                      self.CHART_TYPES[chart_type]['columns'], settings[chart_type],
+                                      self.tier.output_paths(self.output_path(chart_type)), column_hashes)]
+        
+        changed = manifest.changed_columns(column_hashes)
+        if manifest.column_hashes and changed:
+            print(f"🔍 變更的欄位: {', '.join(sorted(changed))}")
+        skipped = [self.CHART_TYPES[chart_type]['name'] for chart_type in chart_types if chart_type not in stale]
+        if skipped:
+            print(f"⏭️ 輸入未變更，沿用上次的輸出: {', '.join(skipped)}")
+        return {'manifest': manifest, 'column_hashes': column_hashes, 'settings': settings, 'stale': stale}
+    
+    def queue_missing_full(self, chart_types):
+        """沿用上次預覽的圖表若還沒有完整解析度輸出，同樣排入背景渲染"""
+        for chart_type in chart_types:
+            if not self.output_path(chart_type).exists():
+                self.tier.queue_full(self.output_path(chart_type))
+    
+    def record_incremental(self, plan, errors):
+        """將本次成功渲染的圖表寫入渲染紀錄；失敗的圖表移除紀錄，下次必定重新渲染"""
+        manifest = plan['manifest']
+        for chart_type, error in errors.items():
+            name = self.output_path(chart_type).name
+            if error is None:
+                manifest.record(name, self.CHART_TYPES[chart_type]['columns'], plan['settings'][chart_type],
+                                self.tier.output_paths(self.output_path(chart_type)), plan['column_hashes'])
+            else:
+                manifest.forget(name)
+        manifest.save()
+    
+    def _render_settings(self, table, chart_type):
+        """數據以外的所有渲染輸入"""
+        spec = self.CHART_TYPES[chart_type]
+        settings = dict(
+            version=self.RENDER_CACHE_VERSION,
+            matplotlib=matplotlib.__version__,
+            chart_type=chart_type,
+            layout='large' if self.is_large_catalog(table) else 'detail',
+            theme=ChartConfig.get_theme_style(self.theme),
+            style=self.style_rc,
+            dpi=self.dpi,
+            quality=self.tier.quality,
+            image_format=self.image_format,
+            figsize=spec['figsize'],
+            color_scheme=spec['color_scheme'],
+            colors=self._color_fingerprint(spec['color_scheme']),
+            font=self.zh_font.get_fontconfig_pattern()
+        )
+        if self.png_pipeline is not None and self.image_format == 'png':
+            # 背景編碼的壓縮設定會改變輸出的位元組
+            settings.update(self.png_pipeline.settings())
+        return settings
+    
+    def _render_settings_key(self, table, chart_type):
+        """數據以外的渲染輸入的雜湊值（增量渲染比對用）"""
+        return RenderCache.make_key(**self._render_settings(table, chart_type))
+    
+    def _render_cache_key(self, table, chart_type):
+        """以圖表的所有渲染輸入計算快取鍵"""
+        columns = self.CHART_TYPES[chart_type]['columns']
+        return RenderCache.make_key(data=hash_dataframe_columns(table.frame, columns),
+                                    **self._render_settings(table, chart_type))
     
-    def _create_single_3d_scatter(self, df, x, y, colors, complexity_map):
+    @staticmethod
+    def _color_fingerprint(scheme):
+        """顏色方案的穩定表示（漸變色以取樣值表示，避免物件位址進入快取鍵）"""
+        colors = ChartConfig.COLORS.get(scheme)
+        if callable(colors):
+            colors = colors(np.linspace(0, 1, 16))
+        return np.asarray(colors if colors is not None else scheme).tolist()
+    
+    def is_large_catalog(self, table):
+        """是否以大型目錄模式繪製"""
+        return len(table) > self.LARGE_CATALOG_THRESHOLD
+    
+    @themed
+    def _draw_chart(self, table, chart_type):
+        """準備數據並繪製指定類型的圖表
+        
+        追蹤時為 figure_build 區段；其中 tight_layout 與 savefig 為子區段，
+        扣除子區段後的自身時間即建立圖表物件的時間
+        """
+        layout = 'large' if self.is_large_catalog(table) else 'detail'
+        with tracing.span('figure_build', 'chart', layout=layout):
+            self._build_chart(table, chart_type)
+    
+    def _build_chart(self, table, chart_type):
+        """依資料規模選擇繪圖方法並繪製、儲存圖表"""
+        if self.is_large_catalog(table):
+            large_methods = {
+                'scatter': self._create_density_scatter,
+                'bar': self._create_large_bar,
+                'heatmap': self._create_large_heatmap,
+                'radar': self._create_distribution_radar,
+                'pie': self._create_single_pie,
+                'bubble': self._create_density_bubble
+            }
+            large_methods[chart_type](table)
+            return
+        
+        colors = ChartConfig.get_colors('cyberpunk', len(table))
+        gradient_colors = ChartConfig.get_gradient_colors('gradient_blue', len(table))
+        
+        # 準備數據
+        x = table.level('計算複雜度')
+        y = table.level('算力需求')
+        labels = table.labels
+        
+        chart_methods = {
+            'scatter': lambda: self._create_single_3d_scatter(table, x, y, colors),
+            'bar': lambda: self._create_single_enhanced_bar(table, gradient_colors, labels),
+            'heatmap': lambda: self._create_single_heatmap(table),
+            'radar': lambda: self._create_single_radar(table, colors, labels),
+            'pie': lambda: self._create_single_pie(table),
+            'bubble': lambda: self._create_single_bubble(table)
+        }
+        chart_methods[chart_type]()
+    
+    def _render_charts_parallel(self, table, chart_types, n_jobs):
+        """以行程池平行渲染多張圖表，回傳 {圖表類型: 例外或 None}"""
+        jobs = [(self.output_dir, self.theme, chart_type) for chart_type in chart_types]
+        print(f"⚡ 使用 {min(n_jobs, len(jobs))} 個工作行程平行渲染 {len(jobs)} 張圖表...")
+        
+        errors = {}
+        results = _run_render_jobs(self.font_manager, table, jobs, n_jobs, self.render_cache,
+                                   self.generator_options())
+        for (_, _, chart_type), cache_hit, error in results:
+            errors[chart_type] = error
+            if error is not None:
+                print(f"❌ {self.CHART_TYPES[chart_type]['name']} 生成失敗: {error}")
+                continue
+            if self.render_cache is not None:
+                self.render_cache.record(cache_hit)
+            self.tier.queue_full(self.output_path(chart_type))
+            print(f"📊 {self.CHART_TYPES[chart_type]['name']} 已完成")
+        return errors
+    
+    
+    def _create_single_3d_scatter(self, table, x, y, colors):
         """創建獨立的3D風格散點圖"""
-        fig, ax = plt.subplots(figsize=(12, 9))
+        fig, ax = plt.subplots(figsize=self.CHART_TYPES['scatter']['figsize'])
         
-        # 模擬3D效果的散點圖
-        z_values = np.random.rand(len(x)) * 100  # 模擬第三維度
+        # 模擬3D效果的散點圖（固定種子，確保平行與序列輸出一致）
+        rng = np.random.default_rng(ChartConfig.RANDOM_SEED)
+        z_values = rng.random(len(x)) * 100  # 模擬第三維度
         
         # 創建氣泡大小變化
         sizes = [300 + z*5 for z in z_values]
         
-        scatter = ax.scatter(x, y, c=colors[:len(x)], s=sizes, 
+        scatter = ax.scatter(x, y, c=colors, s=sizes, 
                            alpha=ChartConfig.CHART_STYLE['alpha'], 
                            edgecolors='white', 
                            linewidth=3)
@@ -150,24 +467,20 @@ class EnhancedChartGenerator:
                        fontweight='bold', fontsize=12, color='white')
         
         # 添加演算法對照表
-        self._add_algorithm_legend(ax, df)
+        self._add_algorithm_legend(ax, table)
         
         # 保存圖表
-        output_path = self.output_dir / "enhanced_scatter_3d.png"
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
-        print(f"✨ 3D風格散點圖已儲存: {output_path}")
-        plt.close()
+        self._save_chart('scatter', '3D風格散點圖')
     
-    def _create_single_enhanced_bar(self, df, colors, labels, complexity_map):
+    def _create_single_enhanced_bar(self, table, colors, labels):
         """創建獨立的增強柱狀圖"""
-        fig, ax = plt.subplots(figsize=(14, 8))
+        fig, ax = plt.subplots(figsize=self.CHART_TYPES['bar']['figsize'])
         
-        memory_values = [complexity_map.get(x, 3) for x in df['記憶體需求']]
+        memory_values = table.level('記憶體需求')
         
         # 創建漸變柱狀圖
-        bars = ax.bar(range(len(df)), memory_values, 
-                     color=colors[:len(df)], 
+        bars = ax.bar(range(len(table)), memory_values, 
+                     color=colors[:len(table)], 
                      alpha=ChartConfig.CHART_STYLE['alpha'], 
                      edgecolor='white', 
                      linewidth=2)
@@ -191,48 +504,35 @@ class EnhancedChartGenerator:
         ChartConfig.apply_modern_style(ax, '記憶體需求比較 (增強版)', self.theme)
         ax.set_xlabel('演算法編號', fontproperties=self.zh_font, fontsize=14)
         ax.set_ylabel('記憶體需求等級', fontproperties=self.zh_font, fontsize=14)
-        ax.set_xticks(range(len(df)))
+        ax.set_xticks(range(len(table)))
         ax.set_xticklabels(labels)
         
         # 添加演算法對照表
-        self._add_algorithm_legend(ax, df)
+        self._add_algorithm_legend(ax, table)
         
         # 保存圖表
-        output_path = self.output_dir / "enhanced_bar_memory.png"
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
-        print(f"✨ 增強版記憶體需求圖已儲存: {output_path}")
-        plt.close()
+        self._save_chart('bar', '增強版記憶體需求圖')
     
-    def _create_single_heatmap(self, df, complexity_map):
+    def _create_single_heatmap(self, table):
         """創建獨立的熱力圖"""
-        fig, ax = plt.subplots(figsize=(12, 8))
+        fig, ax = plt.subplots(figsize=self.CHART_TYPES['heatmap']['figsize'])
         
         # 準備熱力圖數據
         features = ['計算複雜度', '算力需求', '記憶體需求']
-        data = []
-        
-        for feature in features:
-            if feature == '記憶體需求':
-                row = [complexity_map.get(val, 3) for val in df[feature]]
-            else:
-                row = [complexity_map.get(val.split('(')[0], 3) for val in df[feature]]
-            data.append(row)
-        
-        data = np.array(data)
+        data = table.level_matrix(features)
         
         # 創建熱力圖
         im = ax.imshow(data, cmap='RdYlBu_r', aspect='auto', alpha=0.8)
         
         # 設置標籤
-        ax.set_xticks(range(len(df)))
-        ax.set_xticklabels([str(i+1) for i in range(len(df))])
+        ax.set_xticks(range(len(table)))
+        ax.set_xticklabels(table.labels)
         ax.set_yticks(range(len(features)))
         ax.set_yticklabels(features, fontproperties=self.zh_font)
         
         # 添加數值標籤
         for i in range(len(features)):
-            for j in range(len(df)):
+            for j in range(len(table)):
                 text = ax.text(j, i, f'{data[i, j]:.0f}',
                              ha="center", va="center", color="white", fontweight='bold')
         
@@ -243,30 +543,24 @@ class EnhancedChartGenerator:
         cbar.set_label('複雜度等級', fontproperties=self.zh_font)
         
         # 添加演算法對照表
-        self._add_algorithm_legend_below(fig, df)
+        self._add_algorithm_legend_below(fig, table)
         
         # 保存圖表
-        output_path = self.output_dir / "enhanced_heatmap.png"
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
-        print(f"✨ 熱力圖已儲存: {output_path}")
-        plt.close()
+        self._save_chart('heatmap', '熱力圖')
     
-    def _create_single_radar(self, df, colors, labels, complexity_map):
+    def _create_single_radar(self, table, colors, labels):
         """創建獨立的雷達圖"""
-        fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection='polar'))
+        fig, ax = plt.subplots(figsize=self.CHART_TYPES['radar']['figsize'],
+                               subplot_kw=dict(projection='polar'))
         
         categories = ['計算複雜度', '算力需求', '記憶體需求']
         angles = np.linspace(0, 2 * np.pi, len(categories), endpoint=False).tolist()
         angles += angles[:1]
         
         # 繪製前5個演算法
-        for i in range(min(5, len(df))):
-            values = [
-                complexity_map.get(df.iloc[i]['計算複雜度'].split('(')[0], 3),
-                complexity_map.get(df.iloc[i]['算力需求'].split('(')[0], 3),
-                complexity_map.get(df.iloc[i]['記憶體需求'], 3)
-            ]
+        radar_values = table.level_matrix(categories).T
+        for i in range(min(5, len(table))):
+            values = radar_values[i].tolist()
             values += values[:1]
             
             # 創建漸變效果
@@ -286,27 +580,13 @@ class EnhancedChartGenerator:
         ax.grid(True, alpha=0.3)
         
         # 保存圖表
-        output_path = self.output_dir / "enhanced_radar.png"
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
-        print(f"✨ 雷達圖已儲存: {output_path}")
-        plt.close()
+        self._save_chart('radar', '雷達圖')
     
-    def _create_single_pie(self, df):
+    def _create_single_pie(self, table):
         """創建獨立的圓餅圖"""
-        fig, ax = plt.subplots(figsize=(10, 8))
-        
-        scenario_counts = {}
-        for scenario in df['適用場景']:
-            if '預測' in scenario:
-                key = '預測類'
-            elif '分類' in scenario or '特徵' in scenario:
-                key = '分類類'
-            elif '建模' in scenario or '圖像' in scenario or '多模態' in scenario:
-                key = '深度學習類'
-            else:
-                key = '其他類'
-            scenario_counts[key] = scenario_counts.get(key, 0) + 1
+        fig, ax = plt.subplots(figsize=self.CHART_TYPES['pie']['figsize'])
+        
+        scenario_counts = table.scenario_counts()
         
         colors = ChartConfig.get_color_scheme('neon')
         explode = [0.05] * len(scenario_counts)
@@ -335,25 +615,21 @@ class EnhancedChartGenerator:
                     fontsize=16, fontweight='bold')
         
         # 保存圖表
-        output_path = self.output_dir / "enhanced_pie_scenarios.png"
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
-        print(f"✨ 適用場景圓餅圖已儲存: {output_path}")
-        plt.close()
+        self._save_chart('pie', '適用場景圓餅圖')
     
-    def _create_single_bubble(self, df, complexity_map):
+    def _create_single_bubble(self, table):
         """創建獨立的氣泡圖"""
-        fig, ax = plt.subplots(figsize=(12, 9))
+        fig, ax = plt.subplots(figsize=self.CHART_TYPES['bubble']['figsize'])
         
         # 準備數據
-        x_vals = [complexity_map.get(x.split('(')[0], 3) for x in df['計算複雜度']]
-        y_vals = [complexity_map.get(x.split('(')[0], 3) for x in df['算力需求']]
-        sizes = [complexity_map.get(x, 3) * 100 for x in df['記憶體需求']]
+        x_vals = table.level('計算複雜度')
+        y_vals = table.level('算力需求')
+        sizes = table.level('記憶體需求').astype(np.int32) * 100
         
-        colors = ChartConfig.get_color_scheme('viridis')
+        colors = ChartConfig.get_colors('viridis', len(table))
         
         # 創建氣泡圖
-        scatter = ax.scatter(x_vals, y_vals, s=sizes, c=colors[:len(df)], 
+        scatter = ax.scatter(x_vals, y_vals, s=sizes, c=colors, 
                            alpha=0.7, edgecolors='white', linewidth=2)
         
         # 添加標籤
@@ -374,38 +650,361 @@ class EnhancedChartGenerator:
         ax.legend(handles=legend_elements, loc='upper left')
         
         # 添加演算法對照表
-        self._add_algorithm_legend(ax, df)
+        self._add_algorithm_legend(ax, table)
         
         # 保存圖表
-        output_path = self.output_dir / "enhanced_bubble.png"
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
-        print(f"✨ 氣泡圖已儲存: {output_path}")
-        plt.close()
+        self._save_chart('bubble', '氣泡圖')
     
-    def _add_algorithm_legend(self, ax, df):
+    def _create_density_scatter(self, table):
+        """大型目錄：計算複雜度 vs 算力需求的密度分箱圖"""
+        fig, ax = plt.subplots(figsize=self.CHART_TYPES['scatter']['figsize'])
+        
+        x_bins, y_bins, counts = _level_bins(table.level('計算複雜度'), table.level('算力需求'))
+        sizes = 300 + 2700 * np.sqrt(counts / counts.max())
+        
+        # 每個分箱一個點，所有點共用一個集合物件
+        scatter = ax.scatter(x_bins, y_bins, s=sizes, c=counts,
+                             cmap=ChartConfig.get_colormap('cyberpunk'),
+                             alpha=ChartConfig.CHART_STYLE['alpha'],
+                             edgecolors='white', linewidth=2)
+        for xi, yi, count in zip(x_bins, y_bins, counts):
+            ax.annotate(str(count), (xi, yi), ha='center', va='center',
+                       fontweight='bold', fontsize=10, color='white')
+        
+        cbar = plt.colorbar(scatter, ax=ax, shrink=0.8)
+        cbar.set_label('演算法數量', fontproperties=self.zh_font)
+        
+        ChartConfig.apply_modern_style(ax, '計算複雜度 vs 算力需求 (密度分布)', self.theme)
+        ax.set_xlabel('計算複雜度', fontproperties=self.zh_font, fontsize=14)
+        ax.set_ylabel('算力需求', fontproperties=self.zh_font, fontsize=14)
+        ax.set_xlim(0.5, 6.5)
+        ax.set_ylim(0.5, 6.5)
+        
+        self._add_catalog_summary(ax, table)
+        self._save_chart('scatter', '密度分布散點圖')
+    
+    def _create_large_bar(self, table):
+        """大型目錄：以單一線段集合繪製每個演算法的記憶體需求"""
+        fig, ax = plt.subplots(figsize=self.CHART_TYPES['bar']['figsize'])
+        
+        memory_values = table.level('記憶體需求')
+        colormap = ChartConfig.get_colormap('gradient_blue')
+        ax.vlines(np.arange(1, len(table) + 1), 0, memory_values,
+                  colors=colormap(memory_values / 6), linewidth=1, antialiased=False,
+                  alpha=ChartConfig.CHART_STYLE['alpha'])
+        ax.axhline(memory_values.mean(), color='#FF4500', linestyle='--', linewidth=2,
+                   label=f'平均 {memory_values.mean():.2f}')
+        
+        ChartConfig.apply_modern_style(ax, '記憶體需求比較 (增強版)', self.theme)
+        ax.set_xlabel('演算法編號', fontproperties=self.zh_font, fontsize=14)
+        ax.set_ylabel('記憶體需求等級', fontproperties=self.zh_font, fontsize=14)
+        ax.set_xlim(0.5, len(table) + 0.5)
+        ax.set_ylim(0, 6.5)
+        ax.xaxis.set_major_locator(ticker.MaxNLocator(10, integer=True))
+        ax.legend(loc='upper left', prop=self.zh_font)
+        
+        self._add_catalog_summary(ax, table)
+        self._save_chart('bar', '增強版記憶體需求圖')
+    
+    def _create_large_heatmap(self, table):
+        """大型目錄：不含逐格數值標籤的熱力圖"""
+        fig, ax = plt.subplots(figsize=self.CHART_TYPES['heatmap']['figsize'])
+        
+        features = ['計算複雜度', '算力需求', '記憶體需求']
+        data = table.level_matrix(features)
+        im = ax.imshow(data, cmap='RdYlBu_r', aspect='auto', alpha=0.8,
+                       interpolation='nearest')
+        
+        # 刻度以 1 起算的演算法編號顯示
+        ax.xaxis.set_major_locator(ticker.MaxNLocator(10, integer=True))
+        ax.xaxis.set_major_formatter(ticker.FuncFormatter(_one_based_tick))
+        ax.set_yticks(range(len(features)))
+        ax.set_yticklabels(features, fontproperties=self.zh_font)
+        
+        ChartConfig.apply_modern_style(ax, '演算法特性熱力圖', self.theme)
+        
+        cbar = plt.colorbar(im, ax=ax, shrink=0.8)
+        cbar.set_label('複雜度等級', fontproperties=self.zh_font)
+        
+        self._add_catalog_summary(ax, table)
+        self._save_chart('heatmap', '熱力圖')
+    
+    def _create_distribution_radar(self, table):
+        """大型目錄：全體平均與 10%~90% 分布帶，以及各場景分類的平均輪廓"""
+        fig, ax = plt.subplots(figsize=self.CHART_TYPES['radar']['figsize'],
+                               subplot_kw=dict(projection='polar'))
+        
+        categories = ['計算複雜度', '算力需求', '記憶體需求']
+        angles = np.linspace(0, 2 * np.pi, len(categories), endpoint=False).tolist()
+        angles += angles[:1]
+        
+        def closed(values):
+            return np.append(values, values[0])
+        
+        data = table.level_matrix(categories)
+        low, high = np.percentile(data, [10, 90], axis=1)
+        ax.fill_between(angles, closed(low), closed(high), color='gray', alpha=0.25,
+                        label='10%~90% 分布')
+        ax.plot(angles, closed(data.mean(axis=1)), 'o-', linewidth=3, color='black',
+                label='全體平均', markersize=8)
+        
+        # 各場景分類的平均值以 bincount 一次計算
+        counts = np.bincount(table.scenario_codes)
+        present = np.flatnonzero(counts)
+        colors = ChartConfig.get_colors('cyberpunk', len(present))
+        for color, code in zip(colors, present):
+            means = [np.bincount(table.scenario_codes, weights=row)[code] / counts[code]
+                     for row in data]
+            ax.plot(angles, closed(means), 'o-', linewidth=2, color=color, markersize=6,
+                    label=f'{SCENARIO_CATEGORIES[code]} ({counts[code]})')
+        
+        ax.set_xticks(angles[:-1])
+        ax.set_xticklabels(categories, fontproperties=self.zh_font)
+        ax.set_ylim(0, 6)
+        ax.set_title('多維度演算法比較 (雷達圖)', fontproperties=self.zh_font, 
+                    fontsize=16, fontweight='bold', pad=30)
+        ax.legend(loc='upper right', bbox_to_anchor=(1.3, 1.0), prop=self.zh_font)
+        ax.grid(True, alpha=0.3)
+        
+        self._save_chart('radar', '雷達圖')
+    
+    def _create_density_bubble(self, table):
+        """大型目錄：氣泡大小為分箱數量，顏色為分箱內的平均記憶體需求"""
+        fig, ax = plt.subplots(figsize=self.CHART_TYPES['bubble']['figsize'])
+        
+        x_bins, y_bins, counts, mean_memory = _level_bins(
+            table.level('計算複雜度'), table.level('算力需求'), table.level('記憶體需求'))
+        sizes = 200 + 2800 * np.sqrt(counts / counts.max())
+        
+        scatter = ax.scatter(x_bins, y_bins, s=sizes, c=mean_memory, vmin=1, vmax=6,
+                             cmap=ChartConfig.get_colormap('viridis'),
+                             alpha=0.7, edgecolors='white', linewidth=2)
+        for xi, yi, count in zip(x_bins, y_bins, counts):
+            ax.annotate(str(count), (xi, yi), ha='center', va='center',
+                       fontweight='bold', color='white', fontsize=10)
+        
+        cbar = plt.colorbar(scatter, ax=ax, shrink=0.8)
+        cbar.set_label('平均記憶體需求', fontproperties=self.zh_font)
+        
+        ChartConfig.apply_modern_style(ax, '綜合特性氣泡圖', self.theme)
+        ax.set_xlabel('計算複雜度', fontproperties=self.zh_font, fontsize=14)
+        ax.set_ylabel('算力需求', fontproperties=self.zh_font, fontsize=14)
+        ax.set_xlim(0.5, 6.5)
+        ax.set_ylim(0.5, 6.5)
+        
+        self._add_catalog_summary(ax, table)
+        self._save_chart('bubble', '氣泡圖')
+    
+    def _save_chart(self, chart_type, label, output_path=None):
+        """將目前的圖表編碼到記憶體後關閉，回傳 RenderedChart
+        
+        擷取模式（capture / render）下只收集編碼結果，報告模式下加入 PDF 報告的一頁，否則寫入輸出路徑；
+        設定 png_pipeline 時 PNG 只在此點陣化，回傳背景編碼的 Future；
+        直接呼叫 Figure.savefig：pyplot.savefig 存檔後會再呼叫 draw_idle，
+        在 Agg 後端等於把整張圖多點陣化一次
+        """
+        output_path = Path(output_path or self.output_path(chart_type))
+        capture = self._capture
+        fig = plt.gcf()
+        fig.tight_layout()
+        if self._report is not None:
+            self._report.add(fig, output_path.stem, bbox_inches='tight', facecolor='white')
+            plt.close(fig)
+            print(f"📄 {label}已加入報告（第 {len(self._report.pages)} 頁）")
+            return None
+        if capture is None and self.png_pipeline is not None and self.image_format == 'png':
+            future = self.tier.submit(self.png_pipeline, fig, output_path, bbox_inches='tight', facecolor='white')
+            self._encoding.append(future)
+            plt.close(fig)
+            print(f"✨ {label}已點陣化，背景編碼寫入: {self.tier.output_path(output_path)}")
+            return future
+        if capture is None:
+            chart = self.tier.save(fig, output_path, self.image_format, bbox_inches='tight', facecolor='white')
+        else:
+            chart = encode_figure(fig, output_path.stem, capture.image_format, capture.dpi,
+                                  started=capture.started, bbox_inches='tight', facecolor='white')
+        plt.close(fig)
+        
+        if capture is not None:
+            return capture.add(chart)
+        print(f"✨ {label}已儲存: {chart.path}")
+        return chart
+    
+    @contextmanager
+    def capture(self, image_format=None, dpi=None, output_dir=None):
+        """擷取模式：期間生成的圖表只編碼到記憶體，收集在回傳的 RenderCapture 中
+        
+        格式與 DPI 預設沿用生成器的設定；指定 output_dir 時同時寫入該目錄
+        """
+        previous = self._capture
+        self._capture = RenderCapture(image_format or self.image_format, dpi or self.dpi, output_dir)
+        try:
+            yield self._capture
+        finally:
+            self._capture = previous
+    
+    @contextmanager
+    def pdf_report(self, output_path=None, title=None):
+        """報告模式：期間生成的圖表依序成為同一份多頁 PDF 的頁面，不另外輸出圖檔"""
+        output_path = output_path or self.output_dir / ChartConfig.OUTPUT_FILES['pdf_report']
+        previous = self._report
+        with PdfReport(output_path, title, self.tier.full_dpi) as report:
+            self._report = report
+            try:
+                yield report
+            finally:
+                self._report = previous
+    
+    def create_pdf_report(self, df, chart_types=None, output_path=None):
+        """將指定的圖表類型（預設為全部）在一次輸出中寫成多頁 PDF 報告，回傳路徑
+        
+        所有頁面共用一份字體子集；不讀寫渲染快取也不寫入個別圖檔
+        """
+        table = AlgorithmTable.ensure(df)
+        with self.pdf_report(output_path, title='演算法比較分析報告') as report:
+            for chart_type in chart_types or self.CHART_TYPES:
+                self._draw_chart(table, chart_type)
+        print(f"📑 PDF 報告已儲存: {report.path}（共 {len(report.pages)} 頁）")
+        return report.path
+    
+    def render(self, df, chart_type, image_format=None, dpi=None, output_path=None):
+        """在記憶體中渲染單張圖表，回傳含位元組與中繼資料的 RenderedChart
+        
+        不讀寫渲染快取也不寫入輸出目錄；指定 output_path 時另外寫入該檔案
+        """
+        if chart_type not in self.CHART_TYPES:
+            raise ValueError(f"不支援的圖表類型: {chart_type}（可用: {', '.join(self.CHART_TYPES)}）")
+        with self.capture(image_format, dpi) as capture:
+            self._draw_chart(AlgorithmTable.ensure(df), chart_type)
+        chart = capture.charts[-1]
+        if output_path is not None:
+            chart.save(output_path)
+        return chart
+    
+    def _add_catalog_summary(self, ax, table):
+        """大型目錄的圖內說明（取代逐列的編號對照表）"""
+        summary = f"共 {len(table)} 個演算法配置\n編號對照見 {self.LEGEND_FILENAME}"
+        ax.text(1.02, 1, summary, transform=ax.transAxes, 
+               fontproperties=self.zh_font, fontsize=9, 
+               verticalalignment='top', bbox=dict(boxstyle="round,pad=0.3", 
+               facecolor='lightgray', alpha=0.8))
+    
+    def export_legend_pages(self, table):
+        """將完整的編號對照表依 LEGEND_PAGE_SIZE 分頁存為 CSV"""
+        numbers = np.arange(1, len(table) + 1)
+        legend = pd.DataFrame({
+            '頁': (numbers - 1) // self.LEGEND_PAGE_SIZE + 1,
+            '編號': numbers,
+            '演算法': table.names
+        })
+        output_path = self.output_dir / self.LEGEND_FILENAME
+        if write_if_changed(output_path, legend.to_csv(index=False).encode('utf-8-sig')):
+            print(f"📋 編號對照表已儲存: {output_path}")
+        return output_path
+    
+    def _legend_page(self, table):
+        """圖內對照表顯示的第一頁名稱與分頁說明"""
+        names = table.names[:self.LEGEND_PAGE_SIZE]
+        if len(table) <= self.LEGEND_PAGE_SIZE:
+            return names, ''
+        pages = -(-len(table) // self.LEGEND_PAGE_SIZE)
+        return names, f"（第 1/{pages} 頁，完整對照見 {self.LEGEND_FILENAME}）"
+    
+    def _add_algorithm_legend(self, ax, table):
         """添加演算法對照表"""
+        names, page_note = self._legend_page(table)
         legend_text = "演算法編號對照:\n"
-        for i, row in df.iterrows():
-            legend_text += f"{i+1}. {row['演算法']}\n"
+        for i, name in enumerate(names):
+            legend_text += f"{i+1}. {name}\n"
+        legend_text += page_note
         
         ax.text(1.02, 1, legend_text, transform=ax.transAxes, 
                fontproperties=self.zh_font, fontsize=9, 
                verticalalignment='top', bbox=dict(boxstyle="round,pad=0.3", 
                facecolor='lightgray', alpha=0.8))
     
-    def _add_algorithm_legend_below(self, fig, df):
+    def _add_algorithm_legend_below(self, fig, table):
         """在圖表下方添加演算法對照表"""
+        names, page_note = self._legend_page(table)
         legend_text = "演算法編號對照: "
-        for i, row in df.iterrows():
+        for i, name in enumerate(names):
             if i > 0 and i % 3 == 0:
                 legend_text += "\n"
-            legend_text += f"{i+1}.{row['演算法']}  "
+            legend_text += f"{i+1}.{name}  "
+        legend_text += page_note
         
         fig.text(0.5, 0.02, legend_text, ha='center', va='bottom',
                 fontproperties=self.zh_font, fontsize=10, 
                 bbox=dict(boxstyle="round,pad=0.5", facecolor='lightgray', alpha=0.8))
     
+    @themed
+    def create_pareto_frontier_chart(self, performance_data, objectives=None, show_dominated=True):
+        """效能數據的 Pareto 前緣圖，回傳前緣布林陣列
+        
+        objectives 依序為 x 軸、y 軸與（3 個目標時）顏色，預設為 PARETO_OBJECTIVES；
+        前緣點全部繪製並標示，被支配的點淡化並均勻抽樣到 PARETO_MAX_DOMINATED 個，
+        show_dominated=False 時只繪製前緣
+        """
+        objectives = list(objectives or self.PARETO_OBJECTIVES)
+        front = pareto_front(performance_data, objectives)
+        values = [np.asarray(performance_data[objective], dtype=float) for objective in objectives]
+        labels = np.asarray(performance_data['algorithms'], dtype=str)
+        
+        fig, ax = plt.subplots(figsize=self.CHART_TYPES['scatter']['figsize'])
+        
+        dominated = np.flatnonzero(~front & ~np.isnan(np.column_stack(values)).any(axis=1))
+        if show_dominated and len(dominated):
+            if len(dominated) > self.PARETO_MAX_DOMINATED:
+                dominated = dominated[np.linspace(0, len(dominated) - 1, self.PARETO_MAX_DOMINATED).astype(int)]
+            ax.scatter(values[0][dominated], values[1][dominated], s=12, c='lightgray',
+                       alpha=0.5, linewidths=0, label='被支配', rasterized=len(dominated) > 500)
+        
+        # 前緣點依 x 軸排序，2 個目標時以階梯線連接
+        indices = np.flatnonzero(front)
+        indices = indices[np.argsort(values[0][indices], kind='stable')]
+        x, y = values[0][indices], values[1][indices]
+        if len(objectives) == 3:
+            scatter = ax.scatter(x, y, s=80, c=values[2][indices], cmap=ChartConfig.get_colormap('viridis'),
+                                 edgecolors='white', linewidth=1.5, label='Pareto 前緣', zorder=3)
+            cbar = plt.colorbar(scatter, ax=ax, shrink=0.8)
+            cbar.set_label(self.PARETO_AXIS_LABELS[objectives[2]], fontproperties=self.zh_font)
+        else:
+            ax.scatter(x, y, s=80, c=ChartConfig.get_colors('cyberpunk', 1)[0],
+                       edgecolors='white', linewidth=1.5, label='Pareto 前緣', zorder=3)
+            ax.step(x, y, where='post', color='gray', linewidth=1.5, alpha=0.7, zorder=2)
+        if len(indices) <= self.LEGEND_PAGE_SIZE:
+            for index, xi, yi in zip(indices, x, y):
+                ax.annotate(labels[index], (xi, yi), textcoords='offset points', xytext=(0, 8),
+                           ha='center', fontsize=9, fontweight='bold')
+        
+        ChartConfig.apply_modern_style(ax, f'Pareto 前緣 ({len(indices)} / {len(front)} 個配置)', self.theme)
+        ax.set_xlabel(self.PARETO_AXIS_LABELS[objectives[0]], fontproperties=self.zh_font, fontsize=14)
+        ax.set_ylabel(self.PARETO_AXIS_LABELS[objectives[1]], fontproperties=self.zh_font, fontsize=14)
+        # 執行時間與記憶體常跨越數個數量級，此時以對數座標才看得出前緣
+        for values_axis, set_scale in ((values[0], ax.set_xscale), (values[1], ax.set_yscale)):
+            finite = values_axis[~np.isnan(values_axis)]
+            if len(finite) and finite.min() > 0 and finite.max() / finite.min() > 100:
+                set_scale('log')
+        ax.legend(loc='best', prop=self.zh_font)
+        
+        output_path = self.output_dir / Path(self.PARETO_FILENAME).with_suffix(f'.{self.image_format}')
+        self._save_chart(None, 'Pareto 前緣圖', output_path)
+        for error in self.finish_encoding().values():
+            raise error
+        return front
+    
+    @themed
+    def create_animated_comparison(self, df, image_format='gif'):
+        """記憶體需求逐一顯示的動畫，以 blit 逐幀串流寫入 GIF / APNG / WebP，回傳輸出路徑
+        
+        動畫影格使用 ANIMATION_DPI，不使用靜態圖表的 dpi
+        """
+        table = AlgorithmTable.ensure(df)
+        output_path = create_memory_animation(table, self.output_dir, self.zh_font, image_format,
+                                              dpi=self.ANIMATION_DPI)
+        print(f"🎬 動畫圖表已儲存: {output_path}")
+        return output_path
+    
     def create_interactive_dashboard(self, df):
         """創建交互式儀表板（不含動畫）"""
         if not PLOTLY_AVAILABLE:
@@ -413,6 +1012,9 @@ class EnhancedChartGenerator:
             return None
             
         try:
+            import plotly.graph_objects as go
+            from plotly.subplots import make_subplots
+            
             # 創建互動式Plotly圖表
             fig = make_subplots(
                 rows=2, cols=2,
@@ -422,38 +1024,35 @@ class EnhancedChartGenerator:
                        [{"type": "scatterpolar"}, {"type": "pie"}]]
             )
             
-            complexity_map = {'極低': 1, '低': 2, '中': 3, '中-高': 4, '高': 5, '極高': 6}
+            table = AlgorithmTable.ensure(df)
             
             # 1. 散點圖
-            x = [complexity_map.get(x.split('(')[0], 3) for x in df['計算複雜度']]
-            y = [complexity_map.get(x.split('(')[0], 3) for x in df['算力需求']]
+            x = table.level('計算複雜度')
+            y = table.level('算力需求')
             
             fig.add_trace(
                 go.Scatter(x=x, y=y, mode='markers+text',
-                          text=[str(i+1) for i in range(len(df))],
+                          text=table.labels,
                           textposition="middle center",
-                          marker=dict(size=15, color=np.arange(len(df)), 
+                          marker=dict(size=15, color=np.arange(len(table)), 
                                     colorscale='Viridis', showscale=True),
                           name='演算法'),
                 row=1, col=1
             )
             
             # 2. 柱狀圖
-            memory_values = [complexity_map.get(x, 3) for x in df['記憶體需求']]
+            memory_values = table.level('記憶體需求')
             fig.add_trace(
-                go.Bar(x=[str(i+1) for i in range(len(df))], y=memory_values,
+                go.Bar(x=table.labels, y=memory_values,
                       name='記憶體需求', marker_color='lightblue'),
                 row=1, col=2
             )
             
             # 3. 雷達圖
             categories = ['計算複雜度', '算力需求', '記憶體需求']
-            for i in range(min(3, len(df))):
-                values = [
-                    complexity_map.get(df.iloc[i]['計算複雜度'].split('(')[0], 3),
-                    complexity_map.get(df.iloc[i]['算力需求'].split('(')[0], 3),
-                    complexity_map.get(df.iloc[i]['記憶體需求'], 3)
-                ]
+            radar_values = table.level_matrix(categories).T
+            for i in range(min(3, len(table))):
+                values = radar_values[i].tolist()
                 
                 fig.add_trace(
                     go.Scatterpolar(r=values, theta=categories,
@@ -462,17 +1061,7 @@ class EnhancedChartGenerator:
                 )
             
             # 4. 圓餅圖
-            scenario_counts = {}
-            for scenario in df['適用場景']:
-                if '預測' in scenario:
-                    key = '預測類'
-                elif '分類' in scenario or '特徵' in scenario:
-                    key = '分類類'
-                elif '建模' in scenario or '圖像' in scenario or '多模態' in scenario:
-                    key = '深度學習類'
-                else:
-                    key = '其他類'
-                scenario_counts[key] = scenario_counts.get(key, 0) + 1
+            scenario_counts = table.scenario_counts()
             
             fig.add_trace(
                 go.Pie(labels=list(scenario_counts.keys()), 
@@ -498,3 +1087,150 @@ class EnhancedChartGenerator:
         except Exception as e:
             print(f"⚠️ 交互式儀表板生成失敗: {e}")
             return None
+
+
+def _one_based_tick(value, position):
+    """刻度以 1 起算的演算法編號顯示（模組層級函數，圖表描述才能以 pickle 保存）"""
+    return f'{int(value) + 1}'
+
+
+def _level_bins(x, y, values=None):
+    """將兩個等級欄位彙總為非空的 (x, y) 分箱
+    
+    回傳各分箱的 x、y 與數量；提供 values 時另回傳分箱內 values 的平均值
+    """
+    n_levels = int(max(x.max(), y.max())) + 1
+    flat = x.astype(np.int64) * n_levels + y
+    counts = np.bincount(flat, minlength=n_levels * n_levels)
+    occupied = np.flatnonzero(counts)
+    x_bins, y_bins = np.divmod(occupied, n_levels)
+    if values is None:
+        return x_bins, y_bins, counts[occupied]
+    sums = np.bincount(flat, weights=values, minlength=n_levels * n_levels)
+    return x_bins, y_bins, counts[occupied], sums[occupied] / counts[occupied]
+
+
+def render_multi_theme(font_manager, df, theme_dirs, n_jobs, render_cache=None,
+                       chart_types=None, generator_options=None, incremental=False, full_queue=None):
+    """同時渲染多個主題的圖表（預設為全部圖表類型）
+    
+    主題 × 圖表攤平成同一個行程池的工作，N 個主題的總時間接近單一主題。
+    rcParams 為行程內的全局狀態，因此以行程而非執行緒隔離主題。
+    generator_options 為工作行程建立生成器時的額外參數（dpi、image_format、quality，
+    以及 generator_options() 的 png_ 編碼設定）；
+    incremental 為 True 時每個主題只渲染輸入有變更的圖表；
+    預覽等級且提供 full_queue 時，每張預覽完成後排入完整解析度渲染。
+    回傳 {主題: 第一個失敗的例外或 None}
+    """
+    table = AlgorithmTable.ensure(df)
+    chart_types = list(chart_types or EnhancedChartGenerator.CHART_TYPES)
+    options, png_settings = _split_png_settings(generator_options)
+    # 主行程的生成器只用來計算增量計畫與渲染紀錄，編碼設定須與工作行程相同才會得到相同的設定鍵
+    png_pipeline = PngPipeline.from_settings(png_settings) if png_settings else None
+    generators = {theme: EnhancedChartGenerator(font_manager, Path(output_dir), theme=theme, full_queue=full_queue,
+                                                png_pipeline=png_pipeline, **options)
+                  for theme, output_dir in theme_dirs.items()}
+    plans = {theme: generator.plan_incremental(table, chart_types)
+             for theme, generator in generators.items()} if incremental else {}
+    
+    jobs = [(output_dir, theme, chart_type)
+            for theme, output_dir in theme_dirs.items()
+            for chart_type in (plans[theme]['stale'] if incremental else chart_types)]
+    errors = {theme: None for theme in theme_dirs}
+    chart_errors = {theme: {} for theme in theme_dirs}
+    
+    for (_, theme, chart_type), cache_hit, error in _run_render_jobs(
+            font_manager, table, jobs, n_jobs, render_cache, generator_options):
+        chart_errors[theme][chart_type] = error
+        if error is not None:
+            errors[theme] = errors[theme] or error
+            continue
+        if render_cache is not None:
+            render_cache.record(cache_hit)
+        generators[theme].tier.queue_full(generators[theme].output_path(chart_type))
+    
+    for theme, plan in plans.items():
+        generators[theme].record_incremental(plan, chart_errors[theme])
+        generators[theme].queue_missing_full([chart_type for chart_type in chart_types
+                                              if chart_type not in plan['stale']])
+    return errors
+
+
+def _run_render_jobs(font_manager, table, jobs, n_jobs, render_cache=None,
+                     generator_options=None):
+    """在行程池中執行 (輸出目錄, 主題, 圖表類型) 工作
+    
+    依完成順序產生 (工作, 是否命中快取, 例外)
+    """
+    if not jobs:
+        return
+    # 啟用追蹤時，工作行程各自記錄區段，隨結果回傳後併入目前的追蹤器
+    tracer = tracing.get_tracer()
+    trace_memory = tracer.trace_memory if tracer is not None else None
+    with ProcessPoolExecutor(max_workers=min(n_jobs, len(jobs)),
+                             initializer=_init_render_worker,
+                             initargs=(type(font_manager), trace_memory)) as executor:
+        futures = {
+            executor.submit(_render_chart_job, output_dir, theme, chart_type, table, render_cache,
+                            generator_options):
+                (output_dir, theme, chart_type)
+            for output_dir, theme, chart_type in jobs
+        }
+        for future in as_completed(futures):
+            error = future.exception()
+            cache_hit = False
+            if error is None:
+                cache_hit, events = future.result()
+                if tracer is not None:
+                    tracer.merge(events)
+            yield futures[future], cache_hit, error
+
+
+def _split_png_settings(generator_options):
+    """將 generator_options 拆為 (生成器參數, PngPipeline 參數)；沒有 PNG 編碼設定時後者為空"""
+    options = dict(generator_options or {})
+    png_settings = {name: options.pop(name) for name in list(options) if name.startswith('png_')}
+    return options, png_settings
+
+
+# 行程池工作者狀態：每個行程只初始化一次 matplotlib 與字體
+_WORKER_FONT_MANAGER = None
+_WORKER_GENERATORS = {}
+
+
+def _init_render_worker(font_manager_cls, trace_memory=None):
+    """渲染工作行程初始化：切換至無介面後端並預先設定字體
+    
+    trace_memory 不為 None 時，在工作行程中啟用追蹤
+    """
+    global _WORKER_FONT_MANAGER
+    plt.switch_backend('Agg')
+    _WORKER_FONT_MANAGER = font_manager_cls()
+    if trace_memory is not None:
+        tracing.start_tracing(trace_memory)
+
+
+def _render_chart_job(output_dir, theme, chart_type, table, render_cache=None,
+                      generator_options=None):
+    """在工作行程中渲染單張圖表，相同設定的生成器會被重複使用
+    
+    有 PNG 編碼設定時以工作行程自己的 PngPipeline 編碼，與依序渲染的輸出相同；
+    回傳 (是否命中快取, 此工作記錄的追蹤事件)
+    """
+    generator_options = generator_options or {}
+    key = (str(output_dir), theme, tuple(sorted(generator_options.items())))
+    generator = _WORKER_GENERATORS.get(key)
+    if generator is None:
+        options, png_settings = _split_png_settings(generator_options)
+        # 行程池已平行處理多張圖表，每個工作行程只需一個編碼執行緒
+        png_pipeline = PngPipeline.from_settings(png_settings, workers=1) if png_settings else None
+        generator = EnhancedChartGenerator(_WORKER_FONT_MANAGER, Path(output_dir), theme=theme,
+                                           png_pipeline=png_pipeline, **options)
+        _WORKER_GENERATORS[key] = generator
+    generator.render_cache = render_cache
+    cache_hit = generator._render_chart(table, chart_type)
+    # 寫檔完成（及存入渲染快取）後才回報完成
+    for error in generator.finish_encoding().values():
+        raise error
+    tracer = tracing.get_tracer()
+    return cache_hit, tracer.drain() if tracer is not None else []
@@ -4,8 +4,14 @@
 負責處理中文字體設定和字體相關功能
 """
 
-import matplotlib.font_manager as fm
-import matplotlib.pyplot as plt
+from pathlib import Path
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from src.utils import lazy_import
+
+fm = lazy_import('matplotlib.font_manager')
+plt = lazy_import('matplotlib.pyplot')
 
 
 class FontManager:
@@ -28,6 +34,9 @@ class FontManager:
             ]
             
             for font_path in font_paths:
+                # FontProperties 不會檢查路徑，缺檔要到繪圖時才報錯
+                if not Path(font_path).exists():
+                    continue
                 try:
                     zh_font = fm.FontProperties(fname=font_path)
                     return zh_font
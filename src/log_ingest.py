@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+基準測試紀錄串流匯入模組
+分塊讀取每次執行一列的 CSV / JSONL 紀錄，以可合併的統計量累計每個演算法的
+次數、平均、變異數、最小 / 最大值與近似分位數，記憶體用量與檔案大小無關
+"""
+
+import math
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 紀錄欄位：指標名稱 -> 預設欄位名稱（與 BenchmarkRunner.measure 的結果鍵相同）
+DEFAULT_COLUMNS = {
+    'algorithm': 'algorithm',
+    'time': 'time_ms',
+    'memory': 'peak_memory_mb',
+    'accuracy': 'accuracy'
+}
+METRICS = ['time', 'memory', 'accuracy']
+
+# performance_data 輸出的鍵（與 BenchmarkRunner.performance_data 相同）
+PERFORMANCE_KEYS = {'time': 'execution_time', 'accuracy': 'accuracy', 'memory': 'memory_usage'}
+
+
+class QuantileSketch:
+    """對數分桶的分位數草圖（DDSketch 形式）
+
+    每個正值落入 ceil(log_gamma(x)) 號桶，估計值的相對誤差不超過 relative_accuracy；
+    桶數只與數值範圍有關（1e-3 到 1e6 約 1000 桶），與資料量無關，且可直接相加合併。
+    非正值一律計入零桶（效能指標皆為非負值）
+    """
+
+    ZERO_BUCKET = np.iinfo(np.int32).min
+
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        # (分組鍵, 桶號) -> 次數
+        self.counts = pd.Series(dtype=np.int64)
+
+    def buckets(self, values):
+        """將數值轉為桶號（向量化）"""
+        values = np.asarray(values, dtype=float)
+        buckets = np.full(len(values), self.ZERO_BUCKET, dtype=np.int64)
+        positive = values > 0
+        buckets[positive] = np.ceil(np.log(values[positive]) / self._log_gamma)
+        return buckets
+
+    def add(self, groups, values):
+        """加入一批 (分組, 數值)，缺值忽略"""
+        values = np.asarray(values, dtype=float)
+        present = ~np.isnan(values)
+        if not present.any():
+            return
+        chunk = pd.DataFrame({'group': np.asarray(groups)[present], 'bucket': self.buckets(values[present])})
+        chunk_counts = chunk.value_counts(sort=False)
+        self.counts = chunk_counts if self.counts.empty else self.counts.add(chunk_counts, fill_value=0)
+
+    def quantiles(self, group, qs):
+        """指定分組的近似分位數"""
+        try:
+            counts = self.counts.xs(group, level='group').sort_index()
+        except KeyError:
+            return [np.nan] * len(qs)
+        cumulative = counts.to_numpy().cumsum()
+        results = []
+        for q in qs:
+            rank = q * (cumulative[-1] - 1)
+            bucket = counts.index[np.searchsorted(cumulative, rank, side='right')]
+            # 桶 (gamma^(k-1), gamma^k] 的代表值，相對誤差不超過 relative_accuracy
+            results.append(0.0 if bucket == self.ZERO_BUCKET else 2 * self.gamma ** bucket / (self.gamma + 1))
+        return results
+
+
+class BenchmarkLogAggregator:
+    """每個演算法、每個指標的累計統計量
+
+    平均與變異數以 Chan 等人的平行演算法逐塊合併（每塊先以 groupby 向量化彙總），
+    數值穩定且結果與一次載入整個檔案相同
+    """
+
+    STAT_COLUMNS = ['count', 'mean', 'm2', 'min', 'max']
+
+    def __init__(self, columns=None, relative_accuracy=0.01):
+        self.columns = {**DEFAULT_COLUMNS, **(columns or {})}
+        self.rows = 0
+        self.stats = {metric: pd.DataFrame(columns=self.STAT_COLUMNS, dtype=float) for metric in METRICS}
+        self.sketches = {metric: QuantileSketch(relative_accuracy) for metric in METRICS}
+        # 依第一次出現的順序記錄演算法
+        self._order = {}
+
+    @property
+    def algorithms(self):
+        """紀錄中出現過的演算法（依第一次出現的順序）"""
+        return list(self._order)
+
+    def update(self, chunk):
+        """併入一塊紀錄（DataFrame）"""
+        algorithm_column = self.columns['algorithm']
+        chunk = chunk.dropna(subset=[algorithm_column])
+        if chunk.empty:
+            return self
+        algorithms = chunk[algorithm_column].astype(str)
+        self.rows += len(chunk)
+        for algorithm in algorithms.unique():
+            self._order.setdefault(algorithm, len(self._order))
+
+        for metric in METRICS:
+            column = self.columns[metric]
+            if column not in chunk.columns:
+                continue
+            values = pd.to_numeric(chunk[column], errors='coerce')
+            grouped = values.groupby(algorithms, sort=False)
+            batch = pd.DataFrame({
+                'count': grouped.count().astype(float),
+                'mean': grouped.mean(),
+                'm2': grouped.var(ddof=0) * grouped.count(),
+                'min': grouped.min(),
+                'max': grouped.max()
+            })
+            self.stats[metric] = self._merge(self.stats[metric], batch[batch['count'] > 0])
+            self.sketches[metric].add(algorithms.to_numpy(), values.to_numpy())
+        return self
+
+    @staticmethod
+    def _merge(running, batch):
+        """合併兩組 (次數, 平均, M2, 最小, 最大)"""
+        if running.empty:
+            return batch.copy()
+        index = running.index.union(batch.index, sort=False)
+        a = running.reindex(index)
+        b = batch.reindex(index)
+        n_a, n_b = a['count'].fillna(0), b['count'].fillna(0)
+        total = n_a + n_b
+        delta = b['mean'].fillna(0) - a['mean'].fillna(0)
+        weight_b = (n_b / total).where(total > 0, 0)
+        return pd.DataFrame({
+            'count': total,
+            'mean': a['mean'].fillna(0) + delta * weight_b,
+            'm2': a['m2'].fillna(0) + b['m2'].fillna(0) + delta ** 2 * n_a * weight_b,
+            'min': np.fmin(a['min'], b['min']),
+            'max': np.fmax(a['max'], b['max'])
+        })
+
+    def summary(self, quantiles=(0.5, 0.9, 0.99)):
+        """每個演算法、每個指標一列：次數、平均、標準差（母體）、最小、分位數、最大"""
+        rows = []
+        for metric in METRICS:
+            stats = self.stats[metric]
+            for algorithm in self.algorithms:
+                if algorithm not in stats.index:
+                    continue
+                row = stats.loc[algorithm]
+                estimates = self.sketches[metric].quantiles(algorithm, quantiles)
+                rows.append({
+                    'algorithm': algorithm, 'metric': metric, 'count': int(row['count']),
+                    'mean': row['mean'], 'std': math.sqrt(row['m2'] / row['count']),
+                    'min': row['min'],
+                    **{f"p{round(q * 100):g}": value for q, value in zip(quantiles, estimates)},
+                    'max': row['max']
+                })
+        return pd.DataFrame(rows)
+
+    def performance_data(self, algorithm_names=None, statistic='mean'):
+        """轉為效能圖表使用的格式（與 BenchmarkRunner.performance_data 相同）
+
+        指定 algorithm_names（目錄順序）時 algorithms 為目錄中的編號，只輸出有紀錄的演算法；
+        否則依紀錄中第一次出現的順序輸出演算法名稱。statistic 可為 'mean' 或 'p50' 等分位數
+        """
+        if algorithm_names is None:
+            algorithms = self.algorithms
+            labels = algorithms
+        else:
+            algorithm_names = [str(name) for name in algorithm_names]
+            algorithms = [name for name in algorithm_names if name in self._order]
+            labels = [str(algorithm_names.index(name) + 1) for name in algorithms]
+            for name in self.algorithms:
+                if name not in algorithm_names:
+                    print(f"⚠️ {name} 不在演算法目錄中，略過")
+
+        data = {'algorithms': labels}
+        for metric, key in PERFORMANCE_KEYS.items():
+            data[key] = [self._statistic(metric, algorithm, statistic) for algorithm in algorithms]
+        return data
+
+    def _statistic(self, metric, algorithm, statistic):
+        if algorithm not in self.stats[metric].index:
+            return float('nan')
+        if statistic == 'mean':
+            return float(self.stats[metric].loc[algorithm, 'mean'])
+        if statistic.startswith('p'):
+            return float(self.sketches[metric].quantiles(algorithm, [float(statistic[1:]) / 100])[0])
+        raise ValueError(f"不支援的統計量: {statistic}")
+
+
+def read_log_chunks(path, chunksize=100_000, columns=None):
+    """依副檔名以 CSV 或 JSONL 分塊讀取紀錄（支援 pandas 可自動解壓的 .gz 等）"""
+    path = Path(path)
+    suffixes = [suffix.lower() for suffix in path.suffixes]
+    if '.jsonl' in suffixes or '.ndjson' in suffixes:
+        with pd.read_json(path, lines=True, chunksize=chunksize) as reader:
+            yield from reader
+        return
+    usecols = (lambda column: column in set(columns)) if columns else None
+    with pd.read_csv(path, chunksize=chunksize, usecols=usecols) as reader:
+        yield from reader
+
+
+def ingest_benchmark_log(path, chunksize=100_000, columns=None, relative_accuracy=0.01):
+    """串流匯入基準測試紀錄，回傳累計統計量"""
+    aggregator = BenchmarkLogAggregator(columns, relative_accuracy)
+    for chunk in read_log_chunks(path, chunksize, list(aggregator.columns.values())):
+        aggregator.update(chunk)
+    return aggregator
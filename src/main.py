@@ -4,24 +4,36 @@
 演算法比較分析專案
 """
 
+import argparse
 import sys
 from pathlib import Path
 
+import pandas as pd
+
 # 添加專案根目錄到 Python 路徑
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from config.chart_config import ChartConfig
+from src.algorithm_table import AlgorithmTable
+from src.catalog_db import CatalogDatabase, parse_constraints
 from src.font_manager import FontManager
 from src.data_manager import DataManager
 from src.chart_generator import ChartGenerator
+from src.png_pipeline import PngPipeline
+from src.render_cache import RenderCache
+from src.render_tiers import FullResolutionQueue
+from src import tracing
 from src.utils import (
     timer, log_operation, ProgressIndicator, 
-    print_algorithm_reference, generate_report_summary
+    print_algorithm_reference, generate_report_summary, lazy_import
 )
 
+plt = lazy_import('matplotlib.pyplot')
+
 # 導入增強版圖表生成器
 try:
-    from src.enhanced_chart_generator import EnhancedChartGenerator
+    from src.enhanced_chart_generator import EnhancedChartGenerator, render_multi_theme
     ENHANCED_AVAILABLE = True
 except ImportError:
     ENHANCED_AVAILABLE = False
@@ -30,21 +42,35 @@ except ImportError:
 class AlgorithmComparisonApp:
     """演算法比較分析應用程式主類"""
     
-    def __init__(self, enhanced_mode=False):
+    def __init__(self, enhanced_mode=False, n_jobs=1, use_render_cache=True, show_plots=True,
+                 incremental=True):
         self.font_manager = FontManager()
         self.data_manager = DataManager()
         self.enhanced_mode = enhanced_mode and ENHANCED_AVAILABLE
+        self.n_jobs = n_jobs
+        self.show_plots = show_plots
+        self.incremental = incremental
+        self.render_cache = (RenderCache(project_root / "output" / ".render_cache")
+                             if use_render_cache else None)
+        # PNG 壓縮在背景執行緒進行，主執行緒點陣化後即繼續繪製下一張
+        self.png_pipeline = PngPipeline()
         
         if self.enhanced_mode:
             self.chart_generator = EnhancedChartGenerator(
                 self.font_manager, 
-                project_root / "output"
+                project_root / "output",
+                n_jobs=n_jobs,
+                render_cache=self.render_cache,
+                incremental=incremental,
+                png_pipeline=self.png_pipeline
             )
             self.progress = ProgressIndicator(5, "生成增強圖表")
         else:
             self.chart_generator = ChartGenerator(
                 self.font_manager, 
-                project_root / "output"
+                project_root / "output",
+                show=show_plots,
+                png_pipeline=self.png_pipeline
             )
             self.progress = ProgressIndicator(4, "生成圖表")
     
@@ -57,14 +83,14 @@ class AlgorithmComparisonApp:
         try:
             # 1. 載入數據
             self.progress.update("載入演算法數據...")
-            df = self._load_data()
+            table = self._load_data()
             
             if self.enhanced_mode:
                 # 增強模式
-                self._run_enhanced_mode(df)
+                self._run_enhanced_mode(table)
             else:
                 # 標準模式
-                self._run_standard_mode(df)
+                self._run_standard_mode(table)
             
             # 顯示結果摘要
             self._show_summary()
@@ -77,46 +103,51 @@ class AlgorithmComparisonApp:
             import traceback
             traceback.print_exc()
             return False
+        finally:
+            self.png_pipeline.close()
     
-    def _run_standard_mode(self, df):
+    def _run_standard_mode(self, table):
         """運行標準模式"""
         # 2. 生成主要比較圖表
         self.progress.update("生成主要比較圖表...")
-        self.chart_generator.create_main_comparison_chart(df)
+        self.chart_generator.create_main_comparison_chart(table)
         
         # 3. 生成效能比較圖表
         self.progress.update("生成效能比較圖表...")
-        performance_data = self.data_manager.generate_mock_performance_data()
+        performance_data = None
+        if self.chart_generator.USES_PERFORMANCE_DATA:
+            performance_data = self.data_manager.generate_performance_data(table.names)
         self.chart_generator.create_performance_comparison_chart(performance_data)
         
         # 4. 生成摘要表格
         self.progress.update("生成摘要表格...")
-        self.chart_generator.create_summary_table(df)
+        self.chart_generator.create_summary_table(table)
         
         self.progress.finish("所有圖表生成完成!")
     
-    def _run_enhanced_mode(self, df):
+    def _run_enhanced_mode(self, table):
         """運行增強模式"""
         try:
             # 2. 生成增強版主要比較圖表
             self.progress.update("生成增強版比較圖表...")
-            self.chart_generator.create_enhanced_main_comparison(df)
+            self.chart_generator.create_enhanced_main_comparison(table)
             
             # 3. 生成交互式儀表板
             self.progress.update("生成交互式儀表板...")
             try:
-                self.chart_generator.create_interactive_dashboard(df)
+                self.chart_generator.create_interactive_dashboard(table)
             except Exception as e:
                 log_operation(f"交互式儀表板生成失敗 (可能是依賴問題): {e}", "WARNING")
             
             # 4. 生成多主題版本
             self.progress.update("生成多主題圖表...")
-            self._generate_multi_theme_charts(df)
+            self._generate_multi_theme_charts(table)
             
             # 5. 生成標準圖表以便比較
             self.progress.update("生成標準圖表以便比較...")
-            standard_generator = ChartGenerator(self.font_manager, project_root / "output" / "standard")
-            standard_generator.create_main_comparison_chart(df)
+            standard_generator = ChartGenerator(self.font_manager, project_root / "output" / "standard",
+                                                show=self.show_plots, png_pipeline=self.png_pipeline)
+            standard_generator.create_main_comparison_chart(table)
             
             self.progress.finish("所有增強圖表生成完成! ✨")
             
@@ -127,22 +158,39 @@ class AlgorithmComparisonApp:
             # 重新創建標準模式的圖表生成器
             self.chart_generator = ChartGenerator(
                 self.font_manager, 
-                project_root / "output"
+                project_root / "output",
+                show=self.show_plots,
+                png_pipeline=self.png_pipeline
             )
-            self._run_standard_mode(df)
+            self._run_standard_mode(table)
     
-    def _generate_multi_theme_charts(self, df):
+    def _generate_multi_theme_charts(self, table):
         """生成多主題圖表"""
         themes = ['dark', 'cyberpunk']
         
+        if self.n_jobs > 1:
+            # 所有主題同時渲染
+            theme_dirs = {theme: project_root / "output" / f"{theme}_theme" for theme in themes}
+            errors = render_multi_theme(self.font_manager, table, theme_dirs, self.n_jobs,
+                                        self.render_cache, incremental=self.incremental)
+            for theme, error in errors.items():
+                if error is None:
+                    log_operation(f"{theme} 主題圖表生成成功", "INFO")
+                else:
+                    log_operation(f"{theme} 主題圖表生成失敗: {error}", "WARNING")
+            return
+        
         for theme in themes:
             try:
                 theme_generator = EnhancedChartGenerator(
                     self.font_manager,
                     project_root / "output" / f"{theme}_theme",
-                    theme=theme
+                    theme=theme,
+                    render_cache=self.render_cache,
+                    incremental=self.incremental,
+                    png_pipeline=self.png_pipeline
                 )
-                theme_generator.create_enhanced_main_comparison(df)
+                theme_generator.create_enhanced_main_comparison(table)
                 log_operation(f"{theme} 主題圖表生成成功", "INFO")
             except Exception as e:
                 log_operation(f"{theme} 主題圖表生成失敗: {e}", "WARNING")
@@ -150,14 +198,15 @@ class AlgorithmComparisonApp:
     def _load_data(self):
         """載入演算法數據"""
         try:
-            # 嘗試從 CSV 載入，如果不存在則使用預設數據
-            df = self.data_manager.load_data_from_csv()
+            with tracing.span('data_load', 'data'):
+                # 嘗試從 CSV 載入，如果不存在則使用預設數據
+                table = self.data_manager.load_table_from_csv()
+                
+                # 保存數據到 CSV（如果是第一次運行）
+                self.data_manager.save_data_to_csv(table.frame)
             
-            # 保存數據到 CSV（如果是第一次運行）
-            self.data_manager.save_data_to_csv(df)
-            
-            log_operation(f"成功載入 {len(df)} 個演算法的數據")
-            return df
+            log_operation(f"成功載入 {len(table)} 個演算法的數據")
+            return table
             
         except Exception as e:
             log_operation(f"數據載入失敗: {e}", "ERROR")
@@ -165,10 +214,6 @@ class AlgorithmComparisonApp:
     
     def _show_summary(self):
         """顯示程式執行摘要"""
-        import sys
-        sys.path.append(str(project_root))
-        from config.chart_config import ChartConfig
-        
         output_dir = project_root / "output"
         
         if self.enhanced_mode:
@@ -217,17 +262,305 @@ class AlgorithmComparisonApp:
         print("   • 系統相容性 - 移除所有特殊字符和 emoji")
         print("   • 視覺層次感 - 白色邊框和透明度設計")
         print("   • 資訊完整性 - 通過顏色和對照表保持所有資訊")
-        print("   • 高解析度輸出 - 300 DPI 專業品質")
+        print(f"   • 輸出解析度 - {self.chart_generator.tier.dpi} DPI")
         
         # 顯示演算法對照表
         print_algorithm_reference()
         
         # 生成詳細報告
-        generate_report_summary(chart_files)
+        cache_stats = self.render_cache.stats() if self.render_cache else None
+        generate_report_summary(chart_files, cache_stats, self.png_pipeline.stats(),
+                                self.chart_generator.tier.dpi)
+
+
+# 批次模式的結束代碼（參數錯誤由 argparse 以 2 結束）
+EXIT_OK = 0
+EXIT_CHART_FAILED = 1
+EXIT_USAGE = 2
+EXIT_DATA_ERROR = 3
+
+IMAGE_FORMATS = ['png', 'svg', 'pdf']
+
+
+def build_parser():
+    """建立批次模式的命令列參數解析器"""
+    chart_types = list(EnhancedChartGenerator.CHART_TYPES) if ENHANCED_AVAILABLE else []
+    parser = argparse.ArgumentParser(
+        prog='main.py',
+        description='演算法比較分析專案 - 批次圖表生成（無介面，不需互動）',
+        epilog='未提供任何參數且在終端機中執行時，進入互動模式。'
+               f'結束代碼: {EXIT_OK}=成功, {EXIT_CHART_FAILED}=部分圖表失敗, '
+               f'{EXIT_USAGE}=參數錯誤, {EXIT_DATA_ERROR}=數據載入失敗'
+    )
+    
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--data', type=Path, metavar='CSV',
+                        help='從 CSV 文件載入演算法數據（預設使用內建數據）')
+    source.add_argument('--synthetic', type=int, metavar='N',
+                        help='使用 N 筆模擬超參數配置')
+    
+    parser.add_argument('--where', metavar='CONDITIONS',
+                        help="只渲染符合條件的演算法，例如 '記憶體需求<=中, 可平行化>=高, 適用場景~預測'"
+                             "（等級欄位可用 < <= = >= > !=，~ 表示包含）")
+    parser.add_argument('--mode', choices=['standard', 'enhanced'], default='enhanced',
+                        help='標準模式 (ChartGenerator) 或增強模式 (EnhancedChartGenerator)，預設 enhanced')
+    parser.add_argument('--charts', nargs='+', choices=chart_types + ['all'], default=['all'],
+                        help='增強模式要生成的圖表類型，預設 all')
+    parser.add_argument('--themes', nargs='+', choices=list(ChartConfig.THEMES),
+                        default=['professional'], help='主題，預設 professional')
+    parser.add_argument('--formats', nargs='+', choices=IMAGE_FORMATS, default=['png'],
+                        help='輸出格式，預設 png（svg / pdf 為向量輸出，字體只嵌入用到的字元）')
+    parser.add_argument('--dpi', type=int, default=ChartConfig.CHART_STYLE['dpi'],
+                        help=f"增強模式的輸出解析度，預設 {ChartConfig.CHART_STYLE['dpi']}")
+    parser.add_argument('--png-compress-level', type=int, choices=range(10), metavar='0-9',
+                        default=ChartConfig.CHART_STYLE['png_compress_level'],
+                        help=f"PNG 的 zlib 壓縮等級，越低越快、檔案越大，預設 {ChartConfig.CHART_STYLE['png_compress_level']}")
+    parser.add_argument('--png-colors', type=int, metavar='N',
+                        help='將 PNG 量化為最多 N 色 (2-256) 的調色盤圖片，檔案更小；預設不量化')
+    parser.add_argument('--png-compare', action='store_true',
+                        help='調整過 PNG 設定時，另外以預設設定編碼一次以回報節省的位元組（背景編碼時間加倍）')
+    parser.add_argument('--preview', action='store_true',
+                        help=f"先以預覽解析度 ({ChartConfig.CHART_STYLE['preview_dpi']} DPI) 輸出到 <輸出目錄>/preview/，"
+                             "完整解析度由同一份圖表描述在背景佇列中輸出")
+    parser.add_argument('--preview-only', action='store_true',
+                        help='只輸出預覽與圖表描述，完整解析度之後再以 src/render_tiers.py 依需求輸出')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='平行渲染的工作行程數，預設 1')
+    parser.add_argument('-o', '--output', type=Path, default=project_root / "output",
+                        help='輸出目錄，預設為專案的 output/')
+    parser.add_argument('--dashboard', action='store_true', help='另外輸出交互式儀表板 (HTML)')
+    parser.add_argument('--report', action='store_true',
+                        help=f"另外將所有圖表在一次輸出中寫成多頁 PDF 報告 "
+                             f"(<輸出目錄>/{ChartConfig.OUTPUT_FILES['pdf_report']})")
+    parser.add_argument('--no-cache', action='store_true', help='停用渲染快取')
+    parser.add_argument('--force', action='store_true',
+                        help='忽略上次的渲染紀錄，重新渲染所有圖表（預設只渲染相依欄位或設定有變更的圖表）')
+    parser.add_argument('--trace', type=Path, metavar='JSON',
+                        help='記錄各階段的時間與記憶體，匯出 Chrome trace JSON，摘要另存為 <JSON>.summary.json')
+    parser.add_argument('--trace-memory', action='store_true',
+                        help='追蹤時以 tracemalloc 量測各區段的峰值記憶體（繪圖會慢數倍，時間僅供相對比較）')
+    return parser
+
+
+def parse_args(argv):
+    """解析並檢查批次模式參數"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.dpi <= 0:
+        parser.error('--dpi 必須為正整數')
+    if args.jobs < 1:
+        parser.error('--jobs 必須至少為 1')
+    if args.png_colors is not None and not 2 <= args.png_colors <= 256:
+        parser.error('--png-colors 必須介於 2 到 256')
+    if args.preview_only:
+        args.preview = True
+    if args.synthetic is not None and args.synthetic < 1:
+        parser.error('--synthetic 必須至少為 1')
+    if args.where is not None:
+        try:
+            args.where = parse_constraints(args.where)
+        except ValueError as e:
+            parser.error(f'--where: {e}')
+    if args.mode == 'enhanced' and not ENHANCED_AVAILABLE:
+        parser.error('增強模式功能未安裝，請改用 --mode standard')
+    if 'all' in args.charts:
+        args.charts = list(EnhancedChartGenerator.CHART_TYPES) if ENHANCED_AVAILABLE else []
+    return args
+
+
+def load_batch_table(args, data_manager):
+    """依參數載入數據，CSV 不存在或缺少圖表所需欄位時拋出例外"""
+    with tracing.span('data_load', 'data'):
+        if args.synthetic is not None:
+            table = AlgorithmTable.from_frame(data_manager.create_synthetic_catalog(args.synthetic))
+        elif args.data is not None:
+            if not args.data.exists():
+                raise FileNotFoundError(f"找不到數據文件: {args.data}")
+            table = AlgorithmTable.from_frame(pd.read_csv(args.data))
+        else:
+            table = data_manager.create_algorithm_table()
+        
+        if args.where:
+            # 經由索引的 SQLite 目錄篩選，回傳已編碼的子集
+            with CatalogDatabase() as catalog:
+                table = catalog.import_table(table).query(args.where)
+            if not len(table):
+                raise ValueError("沒有符合 --where 條件的演算法")
+    
+    required = {'演算法', '計算複雜度', '算力需求', '記憶體需求', '適用場景'}
+    if args.mode == 'enhanced':
+        required = {column for chart_type in args.charts
+                    for column in EnhancedChartGenerator.CHART_TYPES[chart_type]['columns']}
+    missing = sorted(required - set(table.columns))
+    if missing:
+        raise ValueError(f"數據缺少欄位: {', '.join(missing)}")
+    if not len(table):
+        raise ValueError("數據沒有任何演算法")
+    return table
+
+
+def run_batch(args):
+    """以批次模式生成圖表，回傳結束代碼；指定 --trace 時記錄並匯出追蹤結果"""
+    if args.trace is None:
+        return _run_batch(args)
+    
+    tracer = tracing.start_tracing(trace_memory=args.trace_memory)
+    try:
+        with tracing.span('batch', 'app', mode=args.mode):
+            return _run_batch(args)
+    finally:
+        tracing.stop_tracing()
+        trace_path = tracer.export_chrome_trace(args.trace)
+        summary_path = tracer.save_summary(args.trace.with_suffix('.summary.json'))
+        print(f"\n🔍 追蹤摘要\n{tracer.format_summary()}")
+        print(f"🔍 追蹤結果已儲存: {trace_path}（摘要: {summary_path}）")
+
+
+def _run_batch(args):
+    """批次模式主流程"""
+    plt.switch_backend('Agg')
+    log_operation(f"批次模式開始: {args.mode}, 主題 {args.themes}, 格式 {args.formats}")
+    
+    font_manager = FontManager()
+    data_manager = DataManager()
+    try:
+        table = load_batch_table(args, data_manager)
+    except Exception as e:
+        log_operation(f"數據載入失敗: {e}", "ERROR")
+        return EXIT_DATA_ERROR
+    log_operation(f"成功載入 {len(table)} 個演算法的數據")
+    
+    # 單一主題直接輸出到輸出目錄，多個主題各自輸出到 <主題>_theme 子目錄
+    theme_dirs = {theme: args.output if len(args.themes) == 1 else args.output / f"{theme}_theme"
+                  for theme in args.themes}
+    render_cache = None if args.no_cache else RenderCache(args.output / ".render_cache")
+    quality = 'preview' if args.preview else 'full'
+    full_queue = FullResolutionQueue(args.jobs) if args.preview and not args.preview_only else None
+    # PNG 壓縮交給背景執行緒；平行渲染時各工作行程以相同的壓縮設定建立自己的編碼管線
+    png_pipeline = PngPipeline(args.png_compress_level, args.png_colors, compare=args.png_compare)
+    
+    try:
+        if args.mode == 'standard':
+            failures = _run_batch_standard(font_manager, data_manager, table, theme_dirs, quality, full_queue,
+                                           args.formats, args.report, png_pipeline)
+        else:
+            failures = _run_batch_enhanced(font_manager, table, theme_dirs, args, render_cache, full_queue,
+                                           png_pipeline)
+        if full_queue is not None:
+            failures += _wait_full_resolution(full_queue)
+    finally:
+        png_pipeline.close()
+        if full_queue is not None:
+            full_queue.close()
+    
+    stats = png_pipeline.stats()
+    if stats['charts']:
+        saved = '' if stats['bytes_saved'] is None else f"，較預設設定節省 {stats['bytes_saved'] / 1024:.1f} KB"
+        print(f"🗜️ 背景 PNG 編碼: {len(stats['charts'])} 張，主執行緒節省 {stats['time_saved_ms'] / 1000:.2f} 秒{saved}")
+    
+    if render_cache is not None:
+        stats = render_cache.stats()
+        print(f"♻️ 渲染快取: 命中 {stats['hits']} / 未命中 {stats['misses']}")
+    if failures:
+        for failure in failures:
+            log_operation(f"生成失敗: {failure}", "ERROR")
+        print(f"\n❌ 批次執行完成，{len(failures)} 項失敗")
+        return EXIT_CHART_FAILED
+    print(f"\n✅ 批次執行完成，輸出目錄: {args.output}")
+    return EXIT_OK
+
+
+def _run_batch_standard(font_manager, data_manager, table, theme_dirs, quality='full', full_queue=None,
+                        formats=('png',), report=False, png_pipeline=None):
+    """批次模式：以標準圖表生成器輸出 主題 × 格式，回傳失敗項目"""
+    failures = []
+    # 基準測試與主題、格式無關：只在圖表實際使用時執行一次
+    performance_data = None
+    if ChartGenerator.USES_PERFORMANCE_DATA:
+        performance_data = data_manager.generate_performance_data(table.names)
+    for theme, output_dir in theme_dirs.items():
+        for image_format in formats:
+            generator = ChartGenerator(font_manager, output_dir, theme=theme, show=False,
+                                       quality=quality, full_queue=full_queue, image_format=image_format,
+                                       png_pipeline=png_pipeline)
+            try:
+                generator.create_main_comparison_chart(table)
+                generator.create_performance_comparison_chart(performance_data)
+                generator.create_summary_table(table)
+            except Exception as e:
+                failures.append(f"{theme}/{image_format}: {e}")
+            finally:
+                plt.close('all')
+        if report:
+            try:
+                ChartGenerator(font_manager, output_dir, theme=theme, show=False).create_pdf_report(
+                    table, 'main_comparison')
+            except Exception as e:
+                failures.append(f"{theme}/report: {e}")
+            finally:
+                plt.close('all')
+    return failures
+
+
+def _run_batch_enhanced(font_manager, table, theme_dirs, args, render_cache, full_queue=None, png_pipeline=None):
+    """批次模式：以增強版圖表生成器輸出 主題 × 格式 × 圖表，回傳失敗項目"""
+    failures = []
+    for image_format in args.formats:
+        options = {'dpi': args.dpi, 'image_format': image_format,
+                   'quality': 'preview' if args.preview else 'full'}
+        
+        if args.jobs > 1 and len(theme_dirs) > 1:
+            # 所有主題攤平到同一個行程池
+            png_settings = png_pipeline.settings() if png_pipeline is not None else {}
+            errors = render_multi_theme(font_manager, table, theme_dirs, args.jobs, render_cache,
+                                        chart_types=args.charts, generator_options={**options, **png_settings},
+                                        incremental=not args.force, full_queue=full_queue)
+            failures += [f"{theme}/{image_format}: {error}"
+                         for theme, error in errors.items() if error is not None]
+            continue
+        
+        for theme, output_dir in theme_dirs.items():
+            generator = EnhancedChartGenerator(font_manager, output_dir, theme=theme,
+                                               render_cache=render_cache, incremental=not args.force,
+                                               full_queue=full_queue, png_pipeline=png_pipeline, **options)
+            errors = generator.render_charts(table, args.charts, n_jobs=args.jobs)
+            failures += [f"{theme}/{image_format}/{chart_type}: {error}"
+                         for chart_type, error in errors.items() if error is not None]
+    
+    for theme, output_dir in theme_dirs.items():
+        generator = EnhancedChartGenerator(font_manager, output_dir, theme=theme, dpi=args.dpi)
+        if args.jobs > 1 and len(theme_dirs) > 1 and len(table) > generator.LEGEND_PAGE_SIZE:
+            generator.export_legend_pages(table)
+        if args.dashboard and generator.create_interactive_dashboard(table) is None:
+            failures.append(f"{theme}/dashboard: 交互式儀表板生成失敗")
+        if args.report:
+            try:
+                generator.create_pdf_report(table, args.charts)
+            except Exception as e:
+                failures.append(f"{theme}/report: {e}")
+            finally:
+                plt.close('all')
+    return failures
+
+
+def _wait_full_resolution(full_queue):
+    """等待背景的完整解析度渲染完成，回傳失敗項目"""
+    print(f"\n⏳ 預覽已完成，等待 {full_queue.pending()} 張完整解析度圖表...")
+    with tracing.span('full_resolution', 'app'):
+        errors = full_queue.wait()
+    print(f"🖼️ 完整解析度已輸出 {sum(error is None for error in errors.values())} 張")
+    return [f"{path}: {error}" for path, error in errors.items() if error is not None]
+
+
+def main(argv=None):
+    """主函數：提供參數時以批次模式執行並回傳結束代碼，否則進入互動模式"""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv and sys.stdin.isatty():
+        return interactive_main()
+    return run_batch(parse_args(argv))
 
 
-def main():
-    """主函數"""
+def interactive_main():
+    """互動模式主函數"""
     print("="*80)
     print("演算法比較分析專案 v2.0.0")
     print("專業的演算法比較分析工具")
@@ -277,4 +610,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
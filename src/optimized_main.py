@@ -13,20 +13,22 @@ sys.path.insert(0, str(project_root))
 
 from font_manager import FontManager
 from data_manager import DataManager
-from enhanced_chart_generator import EnhancedChartGenerator
+from enhanced_chart_generator import EnhancedChartGenerator, render_multi_theme
 from utils import timer, log_operation, ProgressIndicator
 
 
 class ChartOptimizationApp:
     """圖表優化應用程式"""
     
-    def __init__(self):
+    def __init__(self, n_jobs=1):
         self.font_manager = FontManager()
         self.data_manager = DataManager()
+        self.n_jobs = n_jobs
         self.enhanced_generator = EnhancedChartGenerator(
             self.font_manager, 
             project_root / "output",
-            theme='professional'  # 可選: 'professional', 'dark', 'cyberpunk'
+            theme='professional',  # 可選: 'professional', 'dark', 'cyberpunk'
+            n_jobs=n_jobs
         )
         self.progress = ProgressIndicator(5, "生成優化圖表")
     
@@ -69,6 +71,16 @@ class ChartOptimizationApp:
         """生成多主題圖表"""
         themes = ['professional', 'dark', 'cyberpunk']
         
+        if self.n_jobs > 1:
+            # 所有主題同時渲染，失敗時與序列模式一樣拋出例外
+            print(f"🎨 同時生成 {', '.join(themes)} 主題圖表...")
+            theme_dirs = {theme: project_root / "output" / f"{theme}_theme" for theme in themes}
+            errors = render_multi_theme(self.font_manager, df, theme_dirs, self.n_jobs)
+            for error in errors.values():
+                if error is not None:
+                    raise error
+            return
+        
         for theme in themes:
             print(f"🎨 生成 {theme} 主題圖表...")
             theme_generator = EnhancedChartGenerator(
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+總覽圖拼接模組
+以已輸出的單張圖表點陣圖拼接儀表板總覽，不重新繪製任何圖表
+"""
+
+import math
+from pathlib import Path
+
+from PIL import Image, ImageDraw, ImageFont
+
+
+class OverviewCompositor:
+    """總覽圖拼接器：將多張圖檔依網格縮放後貼到同一張畫布"""
+
+    def __init__(self, figsize=(24, 18), dpi=300, columns=3, background='white', padding=0.15):
+        self.dpi = dpi
+        self.size = (round(figsize[0] * dpi), round(figsize[1] * dpi))
+        self.columns = columns
+        self.background = background
+        self.padding = round(padding * dpi)  # 英吋轉像素
+
+    def _load_font(self, font_path, size_pt):
+        """載入與圖表相同的字型；無法載入時使用 Pillow 內建字型"""
+        size_px = round(size_pt * self.dpi / 72)
+        if font_path:
+            try:
+                return ImageFont.truetype(str(font_path), size_px)
+            except OSError:
+                pass
+        return ImageFont.load_default(size_px)
+
+    def _draw_text(self, canvas, text, font, anchor, position, fill):
+        """繪製單行文字並回傳其高度"""
+        draw = ImageDraw.Draw(canvas)
+        draw.text(position, text, font=font, anchor=anchor, fill=fill)
+        left, top, right, bottom = draw.textbbox(position, text, font=font, anchor=anchor)
+        return bottom - top
+
+    def compose(self, tiles, output_path, title=None, footer=None, font_path=None,
+                title_size=24, footer_size=8, text_color='#2C3E50'):
+        """依序將 tiles（圖檔路徑、檔案物件或 PIL 影像）貼入網格，儲存並回傳輸出路徑
+
+        output_path 也可以是可寫入的檔案物件（例如 BytesIO），此時以 PNG 編碼寫入並原樣回傳
+        """
+        tiles = list(tiles)
+        if not tiles:
+            raise ValueError("沒有可拼接的圖表")
+
+        width, height = self.size
+        canvas = Image.new('RGB', self.size, self.background)
+
+        top = self.padding
+        if title:
+            font = self._load_font(font_path, title_size)
+            top += self._draw_text(canvas, title, font, 'mt', (width // 2, top), text_color) + self.padding
+
+        rows = math.ceil(len(tiles) / self.columns)
+        cell_width = (width - self.padding * (self.columns + 1)) // self.columns
+        cell_height = (height - top - self.padding * rows) // rows
+
+        for index, tile in enumerate(tiles):
+            if isinstance(tile, Image.Image):
+                self._paste(canvas, tile, index, top, cell_width, cell_height)
+                continue
+            # 自行開啟的圖檔貼上後立即關閉，不佔用檔案描述子
+            with Image.open(tile) as image:
+                self._paste(canvas, image, index, top, cell_width, cell_height)
+
+        if footer:
+            font = self._load_font(font_path, footer_size)
+            self._draw_text(canvas, footer, font, 'rb',
+                            (width - self.padding, height - self.padding // 2), '#888888')
+
+        # 總覽圖像素量大，PNG 編碼佔拼接時間的大半，以最低壓縮等級換取速度
+        if not hasattr(output_path, 'write'):
+            output_path = Path(output_path)
+        canvas.save(output_path, format='PNG', dpi=(self.dpi, self.dpi), compress_level=1)
+        return output_path
+
+    def _paste(self, canvas, image, index, top, cell_width, cell_height):
+        """縮放第 index 張圖表並置中貼入對應的格子"""
+        image = self._fit(self._flatten(image), cell_width, cell_height)
+        row, column = divmod(index, self.columns)
+        x = self.padding + column * (cell_width + self.padding) + (cell_width - image.width) // 2
+        y = top + row * (cell_height + self.padding) + (cell_height - image.height) // 2
+        canvas.paste(image, (x, y), image if image.mode == 'RGBA' else None)
+
+    @staticmethod
+    def _flatten(image):
+        """完全不透明的圖檔轉為 RGB，省去貼上時的 alpha 混合"""
+        if image.mode == 'RGBA' and image.getchannel('A').getextrema()[0] == 255:
+            return image.convert('RGB')
+        if image.mode not in ('RGB', 'RGBA'):
+            return image.convert('RGBA')
+        return image
+
+    @staticmethod
+    def _fit(image, max_width, max_height):
+        """等比例縮放到格子內（大幅縮小時 reducing_gap 先以整數倍縮小再重取樣）"""
+        scale = min(max_width / image.width, max_height / image.height)
+        if scale == 1:
+            return image
+        size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+        return image.resize(size, Image.Resampling.HAMMING, reducing_gap=2.0)
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+Pareto 前緣（skyline）計算模組
+找出在準確度、執行時間與記憶體上不被其他配置支配的配置：
+2 個目標為排序加前綴最小值，3 個目標為排序加階梯掃描，皆為 O(n log n)
+"""
+
+from bisect import bisect_right
+
+import numpy as np
+
+# 效能數據鍵 -> 方向（min 越小越好、max 越大越好）
+OBJECTIVES = {
+    'accuracy': 'max',
+    'execution_time': 'min',
+    'memory_usage': 'min'
+}
+
+
+def pareto_mask(points, maximize=None):
+    """回傳每一列是否位於 Pareto 前緣的布林陣列
+
+    points 為 (列數, 目標數) 陣列，目標數為 2 或 3；maximize 指定各目標是否越大越好
+    （預設皆越小越好）。完全相同的列彼此不支配，會一起留在前緣；含缺值的列一律為 False
+    """
+    points = np.asarray(points, dtype=float)
+    if points.ndim != 2 or points.shape[1] not in (2, 3):
+        raise ValueError(f"只支援 2 或 3 個目標，收到形狀 {points.shape}")
+    if maximize is not None:
+        points = np.where(np.asarray(maximize, dtype=bool), -points, points)
+
+    mask = np.zeros(len(points), dtype=bool)
+    valid = np.flatnonzero(~np.isnan(points).any(axis=1))
+    if not len(valid):
+        return mask
+
+    # 依字典序排序並合併重複列：任何支配者都必定排在被支配者之前
+    points = points[valid]
+    order = np.lexsort(points.T[::-1])
+    ordered = points[order]
+    first = np.r_[True, (ordered[1:] != ordered[:-1]).any(axis=1)]
+    unique = ordered[first]
+    front = _front_2d(unique) if unique.shape[1] == 2 else _front_3d(unique)
+    mask[valid[order]] = front[np.cumsum(first) - 1]
+    return mask
+
+
+def _front_2d(unique):
+    """已排序且不重複的 2 目標點：第二目標嚴格小於前面所有點的最小值才不被支配"""
+    second = unique[:, 1]
+    previous_min = np.minimum.accumulate(np.r_[np.inf, second[:-1]])
+    return second < previous_min
+
+
+def _front_3d(unique):
+    """已排序且不重複的 3 目標點：以 (第二, 第三目標) 的階梯掃描
+
+    階梯只保留目前為止不被支配的點，依第二目標遞增、第三目標遞減；
+    查詢第二目標不超過自身的點中第三目標的最小值即可判斷是否被支配
+    """
+    front = np.zeros(len(unique), dtype=bool)
+    stair_b, stair_c = [], []
+    for index, (b, c) in enumerate(unique[:, 1:].tolist()):
+        position = bisect_right(stair_b, b)
+        if position and stair_c[position - 1] <= c:
+            continue
+        front[index] = True
+        # 移除被新點支配的階梯點（第二目標較大且第三目標不小於新點）
+        end = position
+        while end < len(stair_b) and stair_c[end] >= c:
+            end += 1
+        stair_b[position:end] = [b]
+        stair_c[position:end] = [c]
+    return front
+
+
+def pareto_front(performance_data, objectives=None):
+    """效能數據（DataManager.generate_performance_data 的格式）的 Pareto 前緣布林陣列
+
+    objectives 為 OBJECTIVES 中的 2 或 3 個鍵，預設為全部三個
+    """
+    objectives = list(objectives or OBJECTIVES)
+    unknown = [objective for objective in objectives if objective not in OBJECTIVES]
+    if unknown:
+        raise ValueError(f"未知的目標: {', '.join(unknown)}（可用: {', '.join(OBJECTIVES)}）")
+    points = np.column_stack([np.asarray(performance_data[objective], dtype=float)
+                              for objective in objectives])
+    return pareto_mask(points, [OBJECTIVES[objective] == 'max' for objective in objectives])
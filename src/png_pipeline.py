@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+背景 PNG 編碼管線
+主執行緒只把圖表點陣化為 RGBA（與 savefig 相同的裁切與背景），複製後立即繼續繪製下一張；
+zlib 壓縮與可選的調色盤量化在執行緒池中進行（Pillow 與 zlib 壓縮時會釋放 GIL）
+"""
+
+import io
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from config.chart_config import ChartConfig
+from src.render_output import RenderedChart
+from src.utils import lazy_import
+
+np = lazy_import('numpy')
+matplotlib = lazy_import('matplotlib')
+Image = lazy_import('PIL.Image')
+PngImagePlugin = lazy_import('PIL.PngImagePlugin')
+
+# Pillow / zlib 的預設壓縮等級：與 matplotlib 的 savefig 輸出逐位元組相同
+DEFAULT_COMPRESS_LEVEL = 6
+DEFAULT_WORKERS = 2
+
+
+class _RasterSink:
+    """savefig(format='raw') 的寫入目標：直接保留 Agg 緩衝區的 (高, 寬, 4) 副本，不經過位元組串接"""
+
+    def __init__(self):
+        self.rgba = None
+
+    def seek(self, *args):
+        return 0
+
+    def tell(self):
+        return 0
+
+    def write(self, data):
+        # Agg 的緩衝區在下一次繪製時會被重用，必須複製
+        self.rgba = np.array(data, dtype=np.uint8)
+        return self.rgba.nbytes
+
+
+def resolve_dpi(fig, dpi=None):
+    """savefig 實際使用的 DPI"""
+    dpi = dpi if dpi is not None else matplotlib.rcParams['savefig.dpi']
+    return fig.dpi if dpi == 'figure' else dpi
+
+
+def rasterize(fig, dpi=None, **savefig_options):
+    """在目前執行緒點陣化圖表，回傳 (RGBA 陣列, dpi)；裁切與背景設定同 savefig"""
+    dpi = resolve_dpi(fig, dpi)
+    sink = _RasterSink()
+    fig.savefig(sink, format='raw', dpi=dpi, **savefig_options)
+    return sink.rgba, dpi
+
+
+def encode_png(rgba, dpi, compress_level=DEFAULT_COMPRESS_LEVEL, colors=None):
+    """以 Pillow 將 RGBA 編碼為 PNG，中繼資料與 matplotlib 相同
+
+    colors 指定時先量化為最多 colors 色的調色盤 PNG（圖表多為平塗色塊，通常看不出差異）
+    """
+    image = Image.frombuffer('RGBA', (rgba.shape[1], rgba.shape[0]), rgba, 'raw', 'RGBA', 0, 1)
+    if colors:
+        image = image.quantize(colors, method=Image.Quantize.FASTOCTREE)
+    info = PngImagePlugin.PngInfo()
+    info.add_text('Software', f"Matplotlib version{matplotlib.__version__}, https://matplotlib.org/")
+    buffer = io.BytesIO()
+    image.save(buffer, format='png', dpi=(dpi, dpi), pnginfo=info, compress_level=compress_level)
+    return buffer.getvalue()
+
+
+class PngPipeline:
+    """背景 PNG 編碼管線
+
+    submit 在呼叫端點陣化後回傳 Future（結果為 RenderedChart），呼叫端可立即關閉圖表繼續繪製；
+    壓縮等級與量化色數預設取自 ChartConfig.CHART_STYLE。每張圖表記錄主執行緒省下的編碼時間；
+    compare 為 True 且調整過設定時，另外以預設設定（等級 6、不量化）編碼一次，記錄節省的位元組
+    （會使背景編碼的 CPU 時間加倍，預設關閉）
+    """
+
+    def __init__(self, compress_level=None, colors=None, workers=DEFAULT_WORKERS, compare=False):
+        style = ChartConfig.CHART_STYLE
+        self.compress_level = style['png_compress_level'] if compress_level is None else compress_level
+        self.colors = style['png_colors'] if colors is None else colors
+        if not 0 <= self.compress_level <= 9:
+            raise ValueError(f"PNG 壓縮等級必須介於 0 到 9: {self.compress_level}")
+        if self.colors and not 2 <= self.colors <= 256:
+            raise ValueError(f"調色盤色數必須介於 2 到 256: {self.colors}")
+        self.workers = workers
+        self.compare = compare
+        self._executor = None
+        self._lock = threading.Lock()
+        self.records = []
+
+    def settings(self):
+        """影響輸出位元組的編碼設定；鍵以 png_ 為前綴，可併入渲染設定或傳給工作行程"""
+        return {'png_compress_level': self.compress_level, 'png_colors': self.colors}
+
+    @classmethod
+    def from_settings(cls, settings, **options):
+        """由 settings() 的結果重建相同編碼設定的管線"""
+        return cls(settings['png_compress_level'], settings['png_colors'], **options)
+
+    @property
+    def is_tuned(self):
+        """是否與預設的編碼設定不同"""
+        return self.compress_level != DEFAULT_COMPRESS_LEVEL or bool(self.colors)
+
+    def submit(self, fig, name, dpi=None, started=None, output_path=None, **savefig_options):
+        """點陣化圖表並排入背景編碼，回傳 Future；指定 output_path 時編碼完成後寫入"""
+        began = time.perf_counter()
+        rgba, dpi = rasterize(fig, dpi, **savefig_options)
+        raster_ms = (time.perf_counter() - began) * 1000
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='png-encode')
+        return self._executor.submit(self._encode, rgba, name, dpi, raster_ms,
+                                     began if started is None else started, output_path)
+
+    def _encode(self, rgba, name, dpi, raster_ms, started, output_path):
+        """工作執行緒：編碼、記錄統計並寫檔"""
+        began = time.perf_counter()
+        cpu_began = time.thread_time()
+        data = encode_png(rgba, dpi, self.compress_level, self.colors)
+        cpu_ms = (time.thread_time() - cpu_began) * 1000
+        finished = time.perf_counter()
+        if not self.is_tuned:
+            baseline = len(data)
+        else:
+            baseline = len(encode_png(rgba, dpi)) if self.compare else None
+        chart = RenderedChart(name, data, 'png', dpi=dpi, render_ms=(finished - started) * 1000,
+                              encode_ms=(finished - began) * 1000)
+        if output_path is not None:
+            chart.save(output_path)
+        with self._lock:
+            self.records.append({
+                'name': name,
+                'raster_ms': raster_ms,
+                'encode_ms': cpu_ms,  # 移出主執行緒的編碼 CPU 時間（牆鐘時間在單核心上會與主執行緒重疊計算）
+                'bytes': len(data),
+                'baseline_bytes': baseline,
+                'bytes_saved': None if baseline is None else baseline - len(data)
+            })
+        return chart
+
+    def stats(self):
+        """編碼統計：設定、每張圖表的紀錄與合計（未比較位元組時 bytes_saved 為 None）"""
+        with self._lock:
+            records = list(self.records)
+        compared = [record['bytes_saved'] for record in records if record['bytes_saved'] is not None]
+        return {
+            'compress_level': self.compress_level,
+            'colors': self.colors,
+            'charts': records,
+            'time_saved_ms': sum(record['encode_ms'] for record in records),
+            'bytes_saved': sum(compared) if compared else None
+        }
+
+    def close(self):
+        """等待所有編碼完成並關閉執行緒池"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,356 @@
+# -*- coding: utf-8 -*-
+"""
+演算法推薦索引模組
+預先為每個等級欄位的「<= 等級」與「>= 等級」、每個旗標、場景分類與場景文字建立位元集合，
+位元依推薦排名排列；查詢只需幾次位元 AND，取出最低的幾個位元即為排名最前的結果
+
+查詢端只使用標準函式庫（位元集合為 Python 整數），命令列不必載入 NumPy / pandas；
+建立索引時才載入 AlgorithmTable
+"""
+
+import argparse
+import json
+import mmap
+import re
+import struct
+import sys
+import time
+from pathlib import Path
+
+# 動態導入條件語法模組
+sys.path.append(str(Path(__file__).parent.parent))
+from src.constraints import OPERATORS, SCENARIO_CATEGORY_COLUMN, parse_constraints, parse_flag
+from src.utils import source_fingerprint, write_if_changed
+
+# 預設推薦排名：依序比較的等級欄位與方向（同等級時保持目錄順序）
+DEFAULT_RANKING = [
+    ('預測精度', 'desc'),
+    ('計算複雜度', 'asc'),
+    ('記憶體需求', 'asc'),
+    ('算力需求', 'asc'),
+    ('可平行化', 'desc')
+]
+
+# 不重複的適用場景文字超過此數量時不建立文字索引（改用場景分類篩選）
+SCENARIO_TEXT_LIMIT = 4096
+
+INDEX_SUFFIX = '.recidx'
+EXIT_OK = 0
+EXIT_USAGE = 2
+
+
+class RecommendationIndex:
+    """推薦索引檔：MAGIC、4 位元組的標頭長度、JSON 標頭，其後為各區段的二進位資料
+
+    位元集合的第 i 個位元對應推薦排名第 i 的列；order 區段將排名對應回目錄中的列，
+    名稱與等級編碼依目錄中的列存放，只在輸出結果時以記憶體映射讀取
+    """
+
+    MAGIC = b'ALGOIDX1'
+    VERSION = 1
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = None
+        self._map = None
+        self._header = None
+        self._bitsets = {}
+
+    def _open(self):
+        """延遲開啟並讀取標頭；檔案不存在或格式不符時標頭為 None"""
+        if self._file is not None or not self.path.exists():
+            return self._header
+        self._file = open(self.path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return None
+        prefix = len(self.MAGIC) + 4
+        if self._map[:len(self.MAGIC)] != self.MAGIC:
+            return None
+        header_length, = struct.unpack_from('<I', self._map, len(self.MAGIC))
+        header = json.loads(self._map[prefix:prefix + header_length].decode('utf-8'))
+        if header.get('version') == self.VERSION:
+            self._header = header
+            self._data_start = prefix + header_length
+        return self._header
+
+    @property
+    def header(self):
+        header = self._open()
+        if header is None:
+            raise FileNotFoundError(f"找不到推薦索引: {self.path}")
+        return header
+
+    def close(self):
+        """關閉記憶體映射與檔案"""
+        if self._map is not None:
+            self._map.close()
+        if self._file is not None:
+            self._file.close()
+        self._file = self._map = self._header = None
+        self._bitsets = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def exists(self):
+        """索引檔是否存在且格式正確"""
+        return self._open() is not None
+
+    @property
+    def source(self):
+        """建立索引時來源 CSV 的指紋"""
+        return self.header['source']
+
+    def __len__(self):
+        return self.header['rows']
+
+    @classmethod
+    def build(cls, table, path, source=None, ranking=None):
+        """由演算法資料表建立索引檔（內容未變時不重寫），回傳開啟的索引"""
+        import numpy as np
+        from src.algorithm_table import AlgorithmTable, FLAG_ANNOTATIONS, LEVEL_COLUMNS, SCENARIO_CATEGORIES
+
+        table = AlgorithmTable.ensure(table)
+        n = len(table)
+        ranking = [(column, direction) for column, direction in (ranking or DEFAULT_RANKING)
+                   if column in table.levels]
+        # lexsort 以最後一個鍵為主排序；列號為最次要的鍵，同等級時保持目錄順序
+        keys = [np.arange(n)] + [table.level(column).astype(np.int16) * (-1 if direction == 'desc' else 1)
+                                 for column, direction in reversed(ranking)]
+        order = np.lexsort(keys).astype(np.uint32)
+
+        sections, blobs = {}, []
+        offset = 0
+
+        def add(name, data):
+            nonlocal offset
+            sections[name] = [offset, len(data)]
+            blobs.append(data)
+            offset += len(data)
+
+        def add_bitset(name, mask):
+            add(f"bits:{name}", np.packbits(np.asarray(mask)[order], bitorder='little').tobytes())
+
+        add('order', order.tobytes())
+        add_bitset('all', np.ones(n, dtype=bool))
+        levels = {}
+        for column, codes in table.levels.items():
+            levels[column] = LEVEL_COLUMNS[column][0]
+            for code in range(len(levels[column]) + 1):
+                add_bitset(f"{column}<={code}", codes <= code)
+                add_bitset(f"{column}>={code}", codes >= code)
+            add(f"codes:{column}", codes.astype(np.uint8).tobytes())
+        for flag in FLAG_ANNOTATIONS:
+            add_bitset(f"flag:{flag}", table.flags[flag])
+        for code, category in enumerate(SCENARIO_CATEGORIES):
+            add_bitset(f"category:{category}", table.scenario_codes == code)
+
+        texts = []
+        if '適用場景' in table.columns:
+            text_codes, uniques = table['適用場景'].factorize()
+            if len(uniques) <= SCENARIO_TEXT_LIMIT:
+                texts = [str(text) for text in uniques]
+                for code in range(len(texts)):
+                    add_bitset(f"text:{code}", text_codes == code)
+                add('scenario_ids', text_codes.astype(np.int32).tobytes())
+
+        names = [str(name).encode('utf-8') for name in table.names] if '演算法' in table.columns else []
+        if names:
+            add('name_offsets', np.concatenate([[0], np.cumsum([len(name) for name in names])]).astype(np.uint64).tobytes())
+            add('names', b''.join(names))
+
+        header = json.dumps({
+            'version': cls.VERSION,
+            'rows': n,
+            'source': source,
+            'ranking': ranking,
+            'levels': levels,
+            'flags': list(FLAG_ANNOTATIONS),
+            'scenario_categories': list(SCENARIO_CATEGORIES),
+            'scenario_texts': texts,
+            'sections': sections
+        }, ensure_ascii=False).encode('utf-8')
+        write_if_changed(path, b''.join([cls.MAGIC, struct.pack('<I', len(header)), header] + blobs))
+        return cls(path)
+
+    def _section(self, name):
+        """區段在檔案中的 (起點, 長度)"""
+        start, length = self.header['sections'][name]
+        return self._data_start + start, length
+
+    def _bits(self, name):
+        """載入位元集合為 Python 整數（第 i 個位元為排名第 i 的列）"""
+        if name not in self._bitsets:
+            start, length = self._section(f"bits:{name}")
+            self._bitsets[name] = int.from_bytes(self._map[start:start + length], 'little')
+        return self._bitsets[name]
+
+    def _constraint_bits(self, column, operator, value):
+        """單一條件的位元集合"""
+        header = self.header
+        if operator not in OPERATORS:
+            raise ValueError(f"不支援的運算子: {operator}")
+        operator = OPERATORS[operator]
+
+        if column in header['levels']:
+            order = header['levels'][column]
+            if value not in order:
+                raise ValueError(f"{column} 沒有等級 {value}，可用等級: {', '.join(order)}")
+            code = order.index(value) + 1
+            if operator == '<=':
+                return self._bits(f"{column}<={code}")
+            if operator == '<':
+                return self._bits(f"{column}<={code - 1}")
+            if operator == '>=':
+                return self._bits(f"{column}>={code}")
+            if operator == '>':
+                return self._bits(f"{column}>={code + 1}") if code < len(order) else 0
+            equal = self._bits(f"{column}<={code}") & self._bits(f"{column}>={code}")
+            if operator == '=':
+                return equal
+            if operator == '!=':
+                return self._bits('all') ^ equal
+            raise ValueError(f"{column} 為等級欄位，請使用比較運算子")
+
+        if column in header['flags']:
+            if operator not in ('=', '!='):
+                raise ValueError(f"{column} 為旗標欄位，只支援 = 與 !=")
+            bits = self._bits(f"flag:{column}")
+            return bits if parse_flag(value) == (operator == '=') else self._bits('all') ^ bits
+
+        if column == SCENARIO_CATEGORY_COLUMN:
+            if value not in header['scenario_categories'] or operator not in ('=', '!='):
+                raise ValueError(f"{column} 只支援 = 與 !=，"
+                                 f"可用分類: {', '.join(header['scenario_categories'])}")
+            bits = self._bits(f"category:{value}")
+            return bits if operator == '=' else self._bits('all') ^ bits
+
+        if column == '適用場景' and operator in ('contains', '=') and header['scenario_texts']:
+            bits = 0
+            for code, text in enumerate(header['scenario_texts']):
+                if (value in text) if operator == 'contains' else (value == text):
+                    bits |= self._bits(f"text:{code}")
+            return bits
+
+        raise ValueError(f"無法查詢的欄位或運算子: {column} {operator}")
+
+    def match(self, constraints=()):
+        """符合所有條件的位元集合"""
+        if isinstance(constraints, str):
+            constraints = parse_constraints(constraints)
+        bits = self._bits('all')
+        for column, operator, value in constraints:
+            bits &= self._constraint_bits(column, operator, value)
+            if not bits:
+                break
+        return bits
+
+    def count(self, constraints=()):
+        """符合條件的列數"""
+        # int.bit_count 需要 Python 3.10
+        return bin(self.match(constraints)).count('1')
+
+    def ranked_rows(self, constraints=(), limit=None):
+        """符合條件的列在目錄中的位置，依推薦排名排列"""
+        bits = self.match(constraints)
+        start, _ = self._section('order')
+        rows = []
+        if not bits:
+            return rows
+        # 以正規表示式跳過全為 0 的位元組，只展開有設定位元的位元組
+        data = bits.to_bytes((bits.bit_length() + 7) // 8, 'little')
+        for match in re.finditer(rb'[^\x00]', data):
+            byte, base = match.group()[0], match.start() * 8
+            while byte:
+                low = byte & -byte
+                position = base + low.bit_length() - 1
+                rows.append(struct.unpack_from('<I', self._map, start + 4 * position)[0])
+                if limit is not None and len(rows) >= limit:
+                    return rows
+                byte ^= low
+        return rows
+
+    def recommend(self, constraints=(), limit=10):
+        """依推薦排名回傳符合條件的演算法：[{'編號', '演算法', 各等級欄位, '適用場景'}]"""
+        header = self.header
+        results = []
+        for row in self.ranked_rows(constraints, limit):
+            result = {'編號': row + 1}
+            if 'names' in header['sections']:
+                offsets_start, _ = self._section('name_offsets')
+                begin, end = struct.unpack_from('<QQ', self._map, offsets_start + 8 * row)
+                names_start, _ = self._section('names')
+                result['演算法'] = self._map[names_start + begin:names_start + end].decode('utf-8')
+            for column, order in header['levels'].items():
+                codes_start, _ = self._section(f"codes:{column}")
+                code = self._map[codes_start + row]
+                result[column] = order[code - 1] if 1 <= code <= len(order) else '-'
+            if header['scenario_texts']:
+                ids_start, _ = self._section('scenario_ids')
+                text_id, = struct.unpack_from('<i', self._map, ids_start + 4 * row)
+                result['適用場景'] = header['scenario_texts'][text_id] if text_id >= 0 else '-'
+            results.append(result)
+        return results
+
+
+def open_index(csv_path, index_path=None):
+    """開啟 CSV 對應的推薦索引；索引與 CSV 一致時只使用標準函式庫，否則經由 DataManager 重建"""
+    csv_path = Path(csv_path)
+    index_path = Path(index_path) if index_path else csv_path.with_suffix(INDEX_SUFFIX)
+    index = RecommendationIndex(index_path)
+    if index.exists() and (not csv_path.exists() or index.source == source_fingerprint(csv_path)):
+        return index
+    index.close()
+    from src.data_manager import DataManager
+    return DataManager(csv_path.parent).open_recommendation_index(csv_path.name, index_path)
+
+
+def build_parser():
+    """命令列參數"""
+    parser = argparse.ArgumentParser(
+        description='依條件推薦演算法（例如 "記憶體需求<=中, 可平行化>=高, 適用場景~預測"）')
+    parser.add_argument('constraints', nargs='?', default='',
+                        help='條件，以逗號分隔；等級欄位可用 < <= = >= > !=，~ 表示包含')
+    parser.add_argument('--data', type=Path, default=Path('data/algorithms.csv'), help='演算法目錄 CSV')
+    parser.add_argument('--index', type=Path, help=f'索引檔（預設為 CSV 同名的 {INDEX_SUFFIX}）')
+    parser.add_argument('-n', '--limit', type=int, default=10, help='最多列出的筆數')
+    parser.add_argument('--count', action='store_true', help='只輸出符合條件的數量')
+    parser.add_argument('--json', action='store_true', help='以 JSON 輸出')
+    return parser
+
+
+def main(argv=None):
+    """命令列入口：依條件列出推薦的演算法"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        constraints = parse_constraints(args.constraints)
+    except ValueError as e:
+        parser.error(str(e))
+
+    with open_index(args.data, args.index) as index:
+        started = time.perf_counter()
+        try:
+            total = index.count(constraints)
+            results = [] if args.count else index.recommend(constraints, args.limit)
+        except ValueError as e:
+            parser.error(str(e))
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+    if args.json:
+        print(json.dumps({'count': total, 'results': results}, ensure_ascii=False))
+        return EXIT_OK
+    if not args.count:
+        for rank, result in enumerate(results, 1):
+            print(f"{rank:>4}. " + '  '.join(f"{key}={value}" for key, value in result.items()))
+    print(f"🔎 符合條件: {total} 個演算法（查詢 {elapsed_ms:.2f} ms）")
+    return EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
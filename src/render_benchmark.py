@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+"""
+圖表渲染基準測試模組
+對每個圖表方法在不同主題、DPI 與目錄規模下計時，
+結果可存為基準 JSON，之後的執行若比基準慢超過容許範圍即視為效能退化
+"""
+
+import argparse
+import fnmatch
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import matplotlib
+matplotlib.use('Agg')  # 基準測試一律無介面執行
+import matplotlib.pyplot as plt
+
+# 動態導入配置模組
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.append(str(PROJECT_ROOT))
+from config.chart_config import ChartConfig
+from src.algorithm_table import AlgorithmTable
+from src.chart_generator import ChartGenerator
+from src.data_manager import DataManager
+from src.enhanced_chart_generator import EnhancedChartGenerator
+from src.font_manager import FontManager
+
+DEFAULT_BASELINE = PROJECT_ROOT / "benchmarks" / "render_baseline.json"
+DEFAULT_SIZES = [10, 1000, 100000]
+DEFAULT_DPIS = [100, ChartConfig.CHART_STYLE['dpi']]
+
+EXIT_OK = 0
+EXIT_REGRESSION = 1
+EXIT_ERROR = 3  # 有案例執行失敗（2 為 argparse 的參數錯誤）
+
+
+def _standard_generator(context):
+    return ChartGenerator(context['font_manager'], context['output_dir'],
+                          theme=context['theme'], show=False)
+
+
+def _enhanced_generator(context):
+    return EnhancedChartGenerator(context['font_manager'], context['output_dir'],
+                                  theme=context['theme'], dpi=context['dpi'])
+
+
+def _summary_table(context):
+    # simplified_main 在匯入時修改全局 rcParams，只在需要時才匯入
+    from src.simplified_main import AlgorithmComparisonGenerator
+    generator = AlgorithmComparisonGenerator(context['output_dir'])
+    generator.create_summary_table(context['table'].frame)
+
+
+# 基準測試案例：
+#   max_rows  方法能處理的最大列數（逐列標註、逐列動畫影格或固定 10 色的方法無法擴展），超過則略過
+#   themed    是否依主題重複量測
+#   dpi_aware 是否依 DPI 重複量測（其餘方法使用固定 DPI）
+RENDER_CASES = {
+    'standard.main_comparison': {
+        'run': lambda context: _standard_generator(context).create_main_comparison_chart(context['table']),
+        'max_rows': 10, 'themed': True, 'dpi_aware': False
+    },
+    **{
+        f'enhanced.{chart_type}': {
+            'run': lambda context, chart_type=chart_type:
+                _enhanced_generator(context)._draw_chart(context['table'], chart_type),
+            'max_rows': None, 'themed': True, 'dpi_aware': True
+        }
+        for chart_type in EnhancedChartGenerator.CHART_TYPES
+    },
+    'standard.dashboard': {
+        'run': lambda context: _standard_generator(context).create_interactive_dashboard(context['table']),
+        'max_rows': None, 'themed': False, 'dpi_aware': False
+    },
+    'enhanced.dashboard': {
+        'run': lambda context: _enhanced_generator(context).create_interactive_dashboard(context['table']),
+        'max_rows': None, 'themed': False, 'dpi_aware': False
+    },
+    'standard.animated': {
+        'run': lambda context: _standard_generator(context).create_animated_comparison(context['table']),
+        'max_rows': 1000, 'themed': True, 'dpi_aware': False
+    },
+    'simplified.summary_table': {
+        'run': _summary_table,
+        'max_rows': 10, 'themed': False, 'dpi_aware': False
+    }
+}
+
+
+def case_key(case, theme, dpi, rows):
+    """結果與基準共用的案例鍵"""
+    return f"{case}|{theme}|{dpi}|{rows}"
+
+
+def build_matrix(cases=None, themes=None, dpis=None, sizes=None):
+    """展開 案例 × 主題 × DPI × 規模，回傳 [(鍵, 案例名稱, 主題, DPI, 列數)]
+
+    不依主題或 DPI 變化的案例只量測一次，對應欄位記為 '-'
+    """
+    themes = themes or list(ChartConfig.THEMES)
+    dpis = dpis or DEFAULT_DPIS
+    sizes = sizes or DEFAULT_SIZES
+    matrix = []
+    for case, spec in RENDER_CASES.items():
+        if cases and not any(fnmatch.fnmatch(case, pattern) for pattern in cases):
+            continue
+        for theme in (themes if spec['themed'] else ['-']):
+            for dpi in (dpis if spec['dpi_aware'] else ['-']):
+                for rows in sizes:
+                    matrix.append((case_key(case, theme, dpi, rows), case, theme, dpi, rows))
+    return matrix
+
+
+def make_table(data_manager, rows):
+    """基準測試用資料：10 列使用內建目錄，其餘使用固定種子的模擬目錄"""
+    if rows == len(data_manager.create_algorithm_dataframe()):
+        return data_manager.create_algorithm_table()
+    return AlgorithmTable.from_frame(data_manager.create_synthetic_catalog(rows))
+
+
+def run_suite(matrix, repeats=3, warmup=1, output_dir=None):
+    """依序執行每個案例，回傳 {鍵: 量測結果}"""
+    font_manager = FontManager()
+    data_manager = DataManager()
+    tables = {}
+    results = {}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_dir = Path(output_dir or temp_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for key, case, theme, dpi, rows in matrix:
+            spec = RENDER_CASES[case]
+            if spec['max_rows'] is not None and rows > spec['max_rows']:
+                results[key] = {'status': 'skipped',
+                                'reason': f"此方法最多支援 {spec['max_rows']} 列"}
+                continue
+            if rows not in tables:
+                tables[rows] = make_table(data_manager, rows)
+
+            context = {
+                'font_manager': font_manager, 'output_dir': output_dir,
+                'theme': 'professional' if theme == '-' else theme,
+                'dpi': ChartConfig.CHART_STYLE['dpi'] if dpi == '-' else dpi,
+                'table': tables[rows]
+            }
+            results[key] = _measure(spec['run'], context, repeats, warmup)
+            print(f"⏱️ {key}: {results[key].get('median_ms', 0):.1f} ms ({results[key]['status']})")
+    return results
+
+
+def _measure(run, context, repeats, warmup):
+    """預熱後重複計時，回傳中位數與最小值（毫秒）"""
+    timings = []
+    try:
+        for attempt in range(warmup + repeats):
+            start = time.perf_counter()
+            run(context)
+            elapsed = time.perf_counter() - start
+            plt.close('all')
+            if attempt >= warmup:
+                timings.append(elapsed * 1000)
+    except Exception as e:
+        plt.close('all')
+        return {'status': 'error', 'reason': str(e)}
+    return {
+        'status': 'ok',
+        'median_ms': statistics.median(timings),
+        'min_ms': min(timings),
+        'repeats': repeats
+    }
+
+
+def environment():
+    """記錄基準的執行環境（跨機器比較時提示）"""
+    return {
+        'python': platform.python_version(),
+        'matplotlib': matplotlib.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor()
+    }
+
+
+def load_baseline(path):
+    """讀取基準 JSON，不存在時回傳 None"""
+    path = Path(path)
+    if not path.exists():
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(results, path, previous=None):
+    """儲存基準：只更新本次成功量測的案例，保留其他案例的既有基準"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    merged = dict((previous or {}).get('results', {}))
+    merged.update({key: result for key, result in results.items() if result['status'] == 'ok'})
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'environment': environment(), 'results': dict(sorted(merged.items()))},
+                  f, ensure_ascii=False, indent=2)
+    return path
+
+
+def compare(results, baseline, tolerance=0.25, min_slack_ms=50.0):
+    """與基準比較，回傳 (退化列表, 改善列表)
+
+    中位數超過 基準 × (1 + tolerance) + min_slack_ms 視為退化；
+    min_slack_ms 避免極短案例因計時雜訊誤判。基準中沒有的案例不比較
+    """
+    regressions, improvements = [], []
+    for key, result in results.items():
+        reference = baseline.get('results', {}).get(key)
+        if result['status'] != 'ok' or reference is None:
+            continue
+        limit = reference['median_ms'] * (1 + tolerance) + min_slack_ms
+        change = {'key': key, 'baseline_ms': reference['median_ms'],
+                  'current_ms': result['median_ms'], 'limit_ms': limit}
+        if result['median_ms'] > limit:
+            regressions.append(change)
+        elif result['median_ms'] < reference['median_ms'] * (1 - tolerance):
+            improvements.append(change)
+    return regressions, improvements
+
+
+def build_parser():
+    """建立命令列參數解析器"""
+    parser = argparse.ArgumentParser(
+        description='圖表渲染基準測試：量測各圖表方法並與基準比較，效能退化時以結束代碼 1 結束')
+    parser.add_argument('--cases', nargs='+', metavar='PATTERN',
+                        help=f"只執行符合的案例（可用萬用字元），可用案例: {', '.join(RENDER_CASES)}")
+    parser.add_argument('--themes', nargs='+', choices=list(ChartConfig.THEMES),
+                        help='主題，預設全部')
+    parser.add_argument('--dpis', nargs='+', type=int, help=f'DPI，預設 {DEFAULT_DPIS}')
+    parser.add_argument('--sizes', nargs='+', type=int, help=f'目錄列數，預設 {DEFAULT_SIZES}')
+    parser.add_argument('--repeats', type=int, default=3, help='每個案例的計時次數（取中位數），預設 3')
+    parser.add_argument('--warmup', type=int, default=1, help='計時前的預熱次數，預設 1')
+    parser.add_argument('--quick', action='store_true',
+                        help='快速檢查：未指定時只用 professional 主題、100 DPI、10 列，且各計時一次')
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE,
+                        help='基準 JSON 路徑，預設 benchmarks/render_baseline.json')
+    parser.add_argument('--save-baseline', action='store_true', help='以本次結果更新基準')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='容許的相對變慢比例，預設 0.25')
+    parser.add_argument('--min-slack-ms', type=float, default=50.0,
+                        help='容許的絕對變慢毫秒數（避免短案例誤判），預設 50')
+    parser.add_argument('-o', '--output', type=Path, help='將本次結果另存為 JSON')
+    return parser
+
+
+def main(argv=None):
+    """命令列入口：執行基準測試並與基準比較，回傳結束代碼"""
+    args = build_parser().parse_args(argv)
+    if args.quick:
+        args.themes = args.themes or ['professional']
+        args.dpis = args.dpis or [100]
+        args.sizes = args.sizes or [10]
+        args.repeats, args.warmup = 1, 0
+
+    matrix = build_matrix(args.cases, args.themes, args.dpis, args.sizes)
+    print(f"📏 執行 {len(matrix)} 個渲染基準案例...")
+    results = run_suite(matrix, args.repeats, args.warmup)
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'environment': environment(), 'results': results}, f, ensure_ascii=False, indent=2)
+
+    baseline = load_baseline(args.baseline)
+    exit_code = EXIT_OK
+    if baseline is None:
+        print(f"ℹ️ 尚無基準: {args.baseline}")
+    else:
+        if baseline.get('environment', {}).get('platform') != environment()['platform']:
+            print("⚠️ 基準在不同的平台上建立，比較結果僅供參考")
+        regressions, improvements = compare(results, baseline, args.tolerance, args.min_slack_ms)
+        for change in improvements:
+            print(f"🚀 {change['key']}: {change['baseline_ms']:.1f} → {change['current_ms']:.1f} ms")
+        for change in regressions:
+            print(f"❌ {change['key']}: {change['baseline_ms']:.1f} → {change['current_ms']:.1f} ms "
+                  f"(上限 {change['limit_ms']:.1f} ms)")
+        if regressions:
+            print(f"❌ {len(regressions)} 個案例效能退化")
+            exit_code = EXIT_REGRESSION
+        else:
+            print("✅ 沒有效能退化")
+
+    errors = [key for key, result in results.items() if result['status'] == 'error']
+    for key in errors:
+        print(f"❌ {key} 執行失敗: {results[key]['reason']}")
+    if errors:
+        # 拋出例外的圖表方法不能通過檢查，優先於效能退化
+        print(f"❌ {len(errors)} 個案例執行失敗")
+        exit_code = EXIT_ERROR
+
+    if args.save_baseline:
+        print(f"💾 基準已更新: {save_baseline(results, args.baseline, baseline)}")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
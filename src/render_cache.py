@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+渲染快取模組
+以圖表輸入內容的雜湊值為鍵，保存已渲染的圖表檔案，輸入未變更時直接重用
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+
+def hash_dataframe_columns(df, columns):
+    """計算 DataFrame 指定欄位內容的雜湊值（向量化，與索引無關）"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps(list(columns), ensure_ascii=False).encode('utf-8'))
+    if len(df):
+        row_hashes = pd.util.hash_pandas_object(df[list(columns)], index=False)
+        digest.update(row_hashes.values.tobytes())
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """內容定址的渲染快取，以總容量為上限並依最近使用時間 (LRU) 淘汰
+
+    每個快取項目為一個目錄，目錄的修改時間即最近使用時間，
+    因此多個渲染行程可共用同一快取目錄而不需要共享索引檔。
+    """
+
+    def __init__(self, cache_dir, max_bytes=256 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(**parts):
+        """將所有渲染輸入組合成快取鍵"""
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _entry_dir(self, key):
+        return self.cache_dir / key[:2] / key
+
+    def fetch(self, key, output_paths):
+        """快取命中時將保存的檔案複製到輸出路徑並回傳 True"""
+        entry_dir = self._entry_dir(key)
+        try:
+            for output_path in output_paths:
+                output_path = Path(output_path)
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(entry_dir / output_path.name, output_path)
+            os.utime(entry_dir)  # 更新最近使用時間
+        except OSError:
+            # 項目不存在或正被其他行程淘汰
+            self.misses += 1
+            return False
+
+        self.hits += 1
+        return True
+
+    def store(self, key, output_paths):
+        """保存渲染結果，超出容量時淘汰最久未使用的項目"""
+        entry_dir = self._entry_dir(key)
+        entry_dir.parent.mkdir(parents=True, exist_ok=True)
+
+        # 先寫入暫存目錄再改名，避免其他行程讀到不完整的項目
+        temp_dir = Path(tempfile.mkdtemp(dir=entry_dir.parent, prefix='.tmp-'))
+        try:
+            for output_path in output_paths:
+                shutil.copyfile(output_path, temp_dir / Path(output_path).name)
+            os.rename(temp_dir, entry_dir)
+        except OSError:
+            # 其他行程已寫入相同的項目
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+        self._evict()
+
+    def _entries(self):
+        """列出 (最近使用時間, 大小, 路徑)"""
+        entries = []
+        for entry_dir in self.cache_dir.glob('*/*'):
+            if entry_dir.name.startswith('.tmp-'):
+                continue
+            try:
+                size = sum(f.stat().st_size for f in entry_dir.iterdir())
+                entries.append((entry_dir.stat().st_mtime, size, entry_dir))
+            except OSError:
+                continue
+        return entries
+
+    def _evict(self):
+        """淘汰最久未使用的項目直到總容量不超過上限"""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry_dir in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total -= size
+            self.evictions += 1
+
+    def record(self, hit):
+        """記錄在其他行程中發生的命中或未命中"""
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def stats(self):
+        """獲取快取統計資訊"""
+        entries = self._entries()
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': len(entries),
+            'size_bytes': sum(size for _, size, _ in entries),
+            'max_bytes': self.max_bytes
+        }
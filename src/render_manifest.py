@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+增量渲染模組
+記錄上次執行時每個數據欄位的雜湊值與每張圖表的渲染設定，
+下次執行時依「欄位 → 圖表」相依關係只重新渲染輸入有變更的圖表
+"""
+
+import json
+from pathlib import Path
+
+from src.render_cache import hash_dataframe_columns
+from src.utils import write_if_changed
+
+
+def hash_columns(df, columns):
+    """逐欄計算雜湊值，回傳 {欄位: 雜湊值}；缺少的欄位記為 None"""
+    return {column: hash_dataframe_columns(df, [column]) if column in df.columns else None
+            for column in columns}
+
+
+class RenderManifest:
+    """輸出目錄的渲染紀錄：上次的欄位雜湊值，以及每張圖表的相依欄位、設定鍵與輸出檔
+
+    圖表在下列情況才需要重新渲染：沒有紀錄、輸出檔不存在、設定鍵不同，
+    或任一相依欄位的雜湊值與上次不同
+    """
+
+    FILENAME = '.render_manifest.json'
+    VERSION = 1
+
+    def __init__(self, output_dir):
+        self.path = Path(output_dir) / self.FILENAME
+        self.column_hashes = {}
+        self.charts = {}
+        self._load()
+
+    def _load(self):
+        """讀取上次的紀錄；檔案不存在、損毀或版本不同時視為沒有紀錄"""
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') != self.VERSION:
+            return
+        self.column_hashes = data.get('columns', {})
+        self.charts = data.get('charts', {})
+
+    def changed_columns(self, column_hashes):
+        """與上次紀錄相比內容有變更（或新增）的欄位"""
+        return {column for column, digest in column_hashes.items()
+                if self.column_hashes.get(column) != digest}
+
+    def is_stale(self, chart, columns, settings_key, output_paths, column_hashes):
+        """圖表是否需要重新渲染"""
+        entry = self.charts.get(chart)
+        if entry is None or entry['settings'] != settings_key:
+            return True
+        if sorted(entry['columns']) != sorted(columns):
+            return True
+        if not all(Path(output_path).exists() for output_path in output_paths):
+            return True
+        return any(entry['hashes'].get(column) != column_hashes.get(column) for column in columns)
+
+    def record(self, chart, columns, settings_key, output_paths, column_hashes):
+        """記錄圖表已以目前的輸入渲染完成"""
+        self.charts[chart] = {
+            'columns': list(columns),
+            'settings': settings_key,
+            'outputs': [Path(output_path).name for output_path in output_paths],
+            'hashes': {column: column_hashes.get(column) for column in columns}
+        }
+        self.column_hashes.update(column_hashes)
+
+    def forget(self, chart):
+        """移除圖表紀錄（渲染失敗時呼叫，下次必定重新渲染）"""
+        self.charts.pop(chart, None)
+
+    def save(self):
+        """原子寫入紀錄（內容未變更時不重寫）"""
+        content = json.dumps({'version': self.VERSION, 'columns': self.column_hashes, 'charts': self.charts},
+                             ensure_ascii=False, indent=2)
+        write_if_changed(self.path, content)
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+記憶體內渲染輸出模組
+圖表以 savefig 編碼到記憶體緩衝區，回傳位元組與尺寸、格式、渲染時間等中繼資料；
+寫入磁碟只是其中一個可選的輸出目的地，嵌入網頁服務時不必先寫檔再讀回
+"""
+
+import io
+import re
+import struct
+import time
+from pathlib import Path
+
+from src.utils import write_if_changed
+from src.vector_output import is_vector, save_vector_figure
+
+# 支援的編碼格式與 MIME 類型
+RENDER_FORMATS = {'png': 'image/png', 'svg': 'image/svg+xml', 'pdf': 'application/pdf'}
+
+_SVG_SIZE_PATTERN = re.compile(rb'<svg[^>]*?\swidth="([\d.]+)pt"[^>]*?\sheight="([\d.]+)pt"', re.S)
+_PDF_MEDIABOX_PATTERN = re.compile(rb'/MediaBox\s*\[\s*[\d.]+\s+[\d.]+\s+([\d.]+)\s+([\d.]+)\s*\]')
+
+
+def check_format(image_format):
+    """確認是否為支援的編碼格式，回傳小寫格式名稱；不支援時拋出 ValueError"""
+    image_format = str(image_format).lower()
+    if image_format not in RENDER_FORMATS:
+        raise ValueError(f"不支援的輸出格式: {image_format}（可用: {', '.join(RENDER_FORMATS)}）")
+    return image_format
+
+
+def image_size(data, image_format):
+    """由編碼後的內容讀出圖片尺寸：PNG 為像素，SVG / PDF 為點 (pt)"""
+    if image_format == 'png':
+        width, height = struct.unpack('>II', data[16:24])  # IHDR 區塊
+        return width, height
+    pattern = _SVG_SIZE_PATTERN if image_format == 'svg' else _PDF_MEDIABOX_PATTERN
+    match = pattern.search(data)
+    if match is None:
+        return None, None
+    return float(match.group(1)), float(match.group(2))
+
+
+class RenderedChart:
+    """記憶體中已編碼的圖表與其中繼資料"""
+
+    def __init__(self, name, data, image_format, dpi=None, render_ms=None, encode_ms=None):
+        self.name = name
+        self.data = data
+        self.image_format = image_format
+        self.dpi = dpi
+        self.width, self.height = image_size(data, image_format)
+        self.render_ms = render_ms  # 建立圖表到編碼完成的總時間
+        self.encode_ms = encode_ms  # 其中 savefig 編碼的時間
+        self.path = None
+
+    @property
+    def mime_type(self):
+        return RENDER_FORMATS[self.image_format]
+
+    @property
+    def size_unit(self):
+        """尺寸單位：點陣格式為像素，向量格式為點"""
+        return 'px' if self.image_format == 'png' else 'pt'
+
+    @property
+    def filename(self):
+        return f'{self.name}.{self.image_format}'
+
+    def metadata(self):
+        """不含內容的中繼資料（可直接轉為 JSON 或 HTTP 標頭）"""
+        return {
+            'name': self.name,
+            'format': self.image_format,
+            'mime_type': self.mime_type,
+            'bytes': len(self.data),
+            'width': self.width,
+            'height': self.height,
+            'size_unit': self.size_unit,
+            'dpi': self.dpi,
+            'render_ms': self.render_ms,
+            'encode_ms': self.encode_ms,
+            'path': str(self.path) if self.path is not None else None
+        }
+
+    def save(self, path):
+        """寫入磁碟（內容未變更時不重寫），回傳路徑"""
+        self.path = Path(path)
+        write_if_changed(self.path, self.data)
+        return self.path
+
+    def __repr__(self):
+        return (f"RenderedChart({self.filename!r}, {len(self.data)} bytes, "
+                f"{self.width}x{self.height}{self.size_unit})")
+
+
+def encode_figure(fig, name, image_format='png', dpi=None, started=None, **savefig_options):
+    """將圖表編碼到記憶體緩衝區，回傳 RenderedChart
+
+    started 為開始建立圖表時的 time.perf_counter()，用於計算 render_ms；
+    SVG / PDF 經由 save_vector_figure 輸出，字體只嵌入用到的字元
+    """
+    image_format = check_format(image_format)
+    buffer = io.BytesIO()
+    began = time.perf_counter()
+    if is_vector(image_format):
+        save_vector_figure(fig, buffer, image_format, dpi, **savefig_options)
+    else:
+        fig.savefig(buffer, format=image_format, dpi=dpi, **savefig_options)
+    finished = time.perf_counter()
+    return RenderedChart(name, buffer.getvalue(), image_format, dpi=dpi,
+                         render_ms=(finished - (began if started is None else started)) * 1000,
+                         encode_ms=(finished - began) * 1000)
+
+
+class RenderCapture:
+    """渲染期間收集輸出的圖表；生成器處於擷取狀態時不寫入磁碟"""
+
+    def __init__(self, image_format='png', dpi=None, output_dir=None):
+        self.image_format = check_format(image_format)
+        self.dpi = dpi
+        self.output_dir = Path(output_dir) if output_dir is not None else None
+        self.charts = []
+        self.started = time.perf_counter()
+
+    def add(self, chart):
+        """收集圖表；指定 output_dir 時同時寫入磁碟"""
+        if self.output_dir is not None:
+            chart.save(self.output_dir / chart.filename)
+        self.charts.append(chart)
+        # 下一張圖表的渲染時間從現在開始計算
+        self.started = time.perf_counter()
+        return chart
+
+    def __getitem__(self, name):
+        for chart in self.charts:
+            if chart.name == name:
+                return chart
+        raise KeyError(name)
+
+    def __iter__(self):
+        return iter(self.charts)
+
+    def __len__(self):
+        return len(self.charts)
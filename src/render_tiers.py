@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""
+渲染品質等級模組
+預覽等級以低 DPI（預設 72）輸出到 preview/ 子目錄，並把建立好的圖表以 pickle 保存為圖表描述；
+完整解析度由同一份圖表描述依需求或在背景佇列中輸出，不必重新準備數據與建立圖表
+"""
+
+import argparse
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+# 動態導入配置模組
+sys.path.append(str(Path(__file__).parent.parent))
+from config.chart_config import ChartConfig
+from src.render_output import encode_figure
+from src.utils import lazy_import, write_if_changed
+
+matplotlib = lazy_import('matplotlib')
+plt = lazy_import('matplotlib.pyplot')
+
+QUALITY_TIERS = ('full', 'preview')
+PREVIEW_DIRNAME = 'preview'
+SNAPSHOT_SUFFIX = '.figure'  # 圖表描述附加在輸出檔名之後，例如 enhanced_bar.png.figure
+
+# 繪製時才讀取的 rcParams（字體解析、文字與輸出格式）；其餘設定在建立圖表物件時已寫入物件
+DRAW_TIME_RC_PREFIXES = ('font.', 'text.', 'mathtext.', 'axes.unicode_minus', 'savefig.', 'path.',
+                         'agg.', 'hatch.', 'pdf.', 'svg.', 'ps.')
+
+
+def save_snapshot(fig, path, image_format='png', **savefig_options):
+    """將建立好的圖表、輸出參數與繪製時的 rcParams（主題 context 內的值）保存為圖表描述，回傳路徑"""
+    rc = {key: value for key, value in matplotlib.rcParams.items() if key.startswith(DRAW_TIME_RC_PREFIXES)}
+    payload = {'figure': fig, 'image_format': image_format, 'savefig': savefig_options, 'rc': rc}
+    path = Path(path)
+    write_if_changed(path, pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+    return path
+
+
+def render_snapshot(path, dpi=None, output_path=None):
+    """由圖表描述輸出圖表，回傳 RenderedChart；指定 output_path 時同時寫入"""
+    path = Path(path)
+    payload = pickle.loads(path.read_bytes())
+    fig = payload['figure']
+    name = Path(output_path).stem if output_path is not None else Path(path.stem).stem
+    try:
+        with matplotlib.rc_context(payload['rc']):
+            chart = encode_figure(fig, name, payload['image_format'], dpi or ChartConfig.CHART_STYLE['dpi'],
+                                  **payload['savefig'])
+    finally:
+        plt.close(fig)
+    if output_path is not None:
+        chart.save(output_path)
+    return chart
+
+
+def full_output_path(snapshot_path):
+    """圖表描述對應的完整解析度輸出路徑（preview/ 的上一層目錄）"""
+    snapshot_path = Path(snapshot_path)
+    name = snapshot_path.name
+    # str.removesuffix 需要 Python 3.9
+    if name.endswith(SNAPSHOT_SUFFIX):
+        name = name[:-len(SNAPSHOT_SUFFIX)]
+    return snapshot_path.parent.parent / name
+
+
+class QualityTier:
+    """圖表輸出的品質等級
+
+    full 以完整解析度寫入輸出路徑；preview 以預覽 DPI 寫入 preview/ 子目錄並保存圖表描述，
+    設定 queue 時每張預覽完成後即排入完整解析度渲染
+    """
+
+    def __init__(self, quality='full', dpi=None, preview_dpi=None, queue=None):
+        if quality not in QUALITY_TIERS:
+            raise ValueError(f"不支援的品質等級: {quality}（可用: {', '.join(QUALITY_TIERS)}）")
+        self.quality = quality
+        self.full_dpi = dpi or ChartConfig.CHART_STYLE['dpi']
+        self.preview_dpi = preview_dpi or ChartConfig.CHART_STYLE['preview_dpi']
+        self.queue = queue
+
+    @property
+    def is_preview(self):
+        return self.quality == 'preview'
+
+    @property
+    def dpi(self):
+        """此等級的輸出 DPI"""
+        return self.preview_dpi if self.is_preview else self.full_dpi
+
+    def output_path(self, path):
+        """此等級的實際輸出路徑"""
+        path = Path(path)
+        return path.parent / PREVIEW_DIRNAME / path.name if self.is_preview else path
+
+    def snapshot_path(self, path):
+        """圖表描述的路徑"""
+        path = Path(path)
+        return path.parent / PREVIEW_DIRNAME / f'{path.name}{SNAPSHOT_SUFFIX}'
+
+    def output_paths(self, path):
+        """此等級寫入的所有檔案（渲染快取與增量渲染紀錄用）"""
+        if self.is_preview:
+            return [self.output_path(path), self.snapshot_path(path)]
+        return [Path(path)]
+
+    def save(self, fig, path, image_format='png', started=None, **savefig_options):
+        """依品質等級編碼並寫入圖表，回傳 RenderedChart；預覽等級另外保存圖表描述"""
+        if self.is_preview:
+            save_snapshot(fig, self.snapshot_path(path), image_format, **savefig_options)
+        chart = encode_figure(fig, Path(path).stem, image_format, self.dpi, started=started, **savefig_options)
+        chart.save(self.output_path(path))
+        return chart
+
+    def submit(self, pipeline, fig, path, started=None, **savefig_options):
+        """依品質等級點陣化圖表並交給 PngPipeline 在背景編碼寫入，回傳 Future；預覽等級另外保存圖表描述"""
+        if self.is_preview:
+            save_snapshot(fig, self.snapshot_path(path), 'png', **savefig_options)
+        return pipeline.submit(fig, Path(path).stem, self.dpi, started=started,
+                               output_path=self.output_path(path), **savefig_options)
+
+    def queue_full(self, path):
+        """由圖表描述排入完整解析度渲染，回傳 Future；非預覽等級或未設定佇列時回傳 None"""
+        if not self.is_preview or self.queue is None:
+            return None
+        return self.queue.submit(self.snapshot_path(path), path, self.full_dpi)
+
+    def after_full(self, paths, output_path, fn, *args):
+        """paths 的完整解析度全部完成後呼叫 fn(*args)（例如拼接總覽）"""
+        if self.is_preview and self.queue is not None:
+            self.queue.after(paths, output_path, fn, *args)
+
+    def render_full(self, path):
+        """依需求立即由圖表描述輸出完整解析度，回傳 RenderedChart"""
+        return render_snapshot(self.snapshot_path(path), self.full_dpi, output_path=path)
+
+
+class FullResolutionQueue:
+    """背景的完整解析度渲染佇列
+
+    工作行程只載入圖表描述並以完整 DPI 編碼，前景繼續輸出其餘預覽；
+    wait 等待所有工作完成，再依序執行 after 登記的後續工作
+    """
+
+    def __init__(self, n_jobs=1):
+        self.n_jobs = n_jobs
+        self._executor = None
+        self._futures = {}  # 輸出路徑 → Future
+        self._followups = []
+
+    def submit(self, snapshot_path, output_path, dpi=None):
+        """排入一張圖表，回傳 Future（結果為輸出路徑）"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.n_jobs, initializer=_init_full_worker)
+        output_path = Path(output_path)
+        future = self._executor.submit(_render_full_job, Path(snapshot_path), output_path, dpi)
+        self._futures[output_path] = future
+        return future
+
+    def after(self, paths, output_path, fn, *args):
+        """登記後續工作：paths 全部成功輸出後，在 wait 時呼叫 fn(*args) 產生 output_path"""
+        self._followups.append(([Path(path) for path in paths], Path(output_path), fn, args))
+
+    def pending(self):
+        """尚未完成的圖表數"""
+        return sum(not future.done() for future in self._futures.values())
+
+    def wait(self):
+        """等待所有圖表與後續工作完成，回傳 {輸出路徑: 例外或 None}"""
+        paths = {future: path for path, future in self._futures.items()}
+        errors = {}
+        for future in as_completed(paths):
+            errors[paths[future]] = future.exception()
+
+        for paths, output_path, fn, args in self._followups:
+            failed = [errors[path] if path in errors else LookupError(f"未排入完整解析度渲染: {path}")
+                      for path in paths if errors.get(path) is not None or path not in errors]
+            if failed:
+                errors[output_path] = failed[0]
+                continue
+            try:
+                fn(*args)
+                errors[output_path] = None
+            except Exception as e:
+                errors[output_path] = e
+        self._futures = {}
+        self._followups = []
+        return errors
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _init_full_worker():
+    """完整解析度工作行程初始化：切換至無介面後端"""
+    plt.switch_backend('Agg')
+
+
+def _render_full_job(snapshot_path, output_path, dpi):
+    """在工作行程中由圖表描述輸出完整解析度，回傳輸出路徑"""
+    render_snapshot(snapshot_path, dpi, output_path=output_path)
+    return output_path
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="由預覽時保存的圖表描述輸出完整解析度圖表")
+    parser.add_argument('preview_dir', type=Path, help=f"預覽目錄（輸出目錄下的 {PREVIEW_DIRNAME}/）")
+    parser.add_argument('--dpi', type=int, default=ChartConfig.CHART_STYLE['dpi'],
+                        help=f"輸出解析度，預設 {ChartConfig.CHART_STYLE['dpi']}")
+    parser.add_argument('-j', '--jobs', type=int, default=1, help="工作行程數，預設 1")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    snapshots = sorted(args.preview_dir.glob(f'*{SNAPSHOT_SUFFIX}'))
+    if not snapshots:
+        print(f"❌ 找不到圖表描述: {args.preview_dir}")
+        return 1
+    with FullResolutionQueue(args.jobs) as queue:
+        for snapshot_path in snapshots:
+            queue.submit(snapshot_path, full_output_path(snapshot_path), args.dpi)
+        errors = queue.wait()
+    for output_path, error in errors.items():
+        print(f"❌ {output_path}: {error}" if error else f"✨ 完整解析度已儲存: {output_path}")
+    return 1 if any(errors.values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+多準則效率評分模組
+以 NumPy 陣列一次計算所有配置的綜合效率評分，支援具名權重組合、
+正規化策略（min-max、z-score、排名、向量）與評分方法（加權總和、TOPSIS）
+"""
+
+import numpy as np
+
+# 評分準則：效能數據鍵 -> 方向（cost 越小越好、benefit 越大越好）
+CRITERIA = {
+    'execution_time': 'cost',
+    'memory_usage': 'cost',
+    'accuracy': 'benefit'
+}
+
+# 具名評分組合；normalization 為 'none' 時權重即原始單位的係數，否則先正規化為總和 1
+SCORING_PROFILES = {
+    # 舊版公式 100 - (t/10 + m/20 - a/2)
+    'legacy': {
+        'weights': {'execution_time': 0.1, 'memory_usage': 0.05, 'accuracy': 0.5},
+        'normalization': 'none', 'method': 'weighted_sum', 'offset': 100
+    },
+    'balanced': {
+        'weights': {'execution_time': 1, 'memory_usage': 1, 'accuracy': 1},
+        'normalization': 'minmax', 'method': 'weighted_sum'
+    },
+    'accuracy_first': {
+        'weights': {'execution_time': 0.2, 'memory_usage': 0.1, 'accuracy': 0.7},
+        'normalization': 'minmax', 'method': 'weighted_sum'
+    },
+    'speed_first': {
+        'weights': {'execution_time': 0.6, 'memory_usage': 0.1, 'accuracy': 0.3},
+        'normalization': 'minmax', 'method': 'weighted_sum'
+    },
+    'low_memory': {
+        'weights': {'execution_time': 0.2, 'memory_usage': 0.6, 'accuracy': 0.2},
+        'normalization': 'minmax', 'method': 'weighted_sum'
+    },
+    'topsis': {
+        'weights': {'execution_time': 1, 'memory_usage': 1, 'accuracy': 1},
+        'normalization': 'vector', 'method': 'topsis'
+    }
+}
+
+
+def _orient(matrix, directions):
+    """將 cost 準則取負號，使所有欄位都是越大越好"""
+    signs = np.where(np.asarray(directions) == 'cost', -1.0, 1.0)
+    return matrix * signs
+
+
+def _minmax(oriented):
+    """線性縮放到 [0, 1]；整欄相同時為 1"""
+    low = np.nanmin(oriented, axis=0)
+    span = np.nanmax(oriented, axis=0) - low
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(span > 0, (oriented - low) / np.where(span > 0, span, 1), 1.0)
+
+
+def _zscore(oriented):
+    """標準分數；整欄相同時為 0"""
+    std = np.nanstd(oriented, axis=0)
+    return (oriented - np.nanmean(oriented, axis=0)) / np.where(std > 0, std, 1)
+
+
+def _rank(oriented):
+    """百分位排名 (0, 1]，同值取平均排名"""
+    ranks = np.empty_like(oriented)
+    for column in range(oriented.shape[1]):
+        values = oriented[:, column]
+        order = np.argsort(values)
+        ordered = values[order]
+        # 相同數值為一段，段內取平均排名（NaN 排在最後並保持 NaN）
+        starts = np.flatnonzero(np.r_[True, ordered[1:] != ordered[:-1]])
+        ends = np.r_[starts[1:], len(values)]
+        average = (starts + ends + 1) / 2
+        ranks[order, column] = np.repeat(average, ends - starts)
+        missing = np.isnan(values)
+        ranks[missing, column] = np.nan
+        ranks[:, column] /= max(len(values) - missing.sum(), 1)
+    return ranks
+
+
+def _vector(oriented):
+    """向量正規化（除以各欄的 L2 範數），TOPSIS 的標準做法"""
+    norm = np.sqrt(np.nansum(oriented ** 2, axis=0))
+    return oriented / np.where(norm > 0, norm, 1)
+
+
+NORMALIZATIONS = {
+    'none': lambda oriented: oriented,
+    'minmax': _minmax,
+    'zscore': _zscore,
+    'rank': _rank,
+    'vector': _vector
+}
+
+
+def _weighted_sum(normalized, weights, offset):
+    """加權總和；min-max / 排名正規化時結果介於 0 ~ 100"""
+    score = normalized @ weights
+    return offset + score
+
+
+def _topsis(normalized, weights, offset):
+    """TOPSIS：與理想解、負理想解的相對接近度 × 100"""
+    weighted = normalized * weights
+    best = np.nanmax(weighted, axis=0)
+    worst = np.nanmin(weighted, axis=0)
+    to_best = np.sqrt(((weighted - best) ** 2).sum(axis=1))
+    to_worst = np.sqrt(((weighted - worst) ** 2).sum(axis=1))
+    total = to_best + to_worst
+    with np.errstate(invalid='ignore', divide='ignore'):
+        closeness = np.where(total == 0, 1.0, to_worst / total)
+    return offset + 100 * closeness
+
+
+METHODS = {
+    'weighted_sum': _weighted_sum,
+    'topsis': _topsis
+}
+
+
+class ScoringEngine:
+    """綜合效率評分引擎
+
+    profile 選擇 SCORING_PROFILES 的組合，weights / normalization / method 可個別覆寫；
+    輸入可為效能數據字典、DataFrame（例如 load_benchmark_results 的結果）或
+    各準則的陣列，所有列以單次向量化運算評分，缺值的列評分為 NaN
+    """
+
+    def __init__(self, profile='balanced', weights=None, normalization=None, method=None):
+        if profile not in SCORING_PROFILES:
+            raise ValueError(f"未知的評分組合: {profile}（可用: {', '.join(SCORING_PROFILES)}）")
+        settings = SCORING_PROFILES[profile]
+        self.profile = profile
+        self.normalization = normalization or settings['normalization']
+        self.method = method or settings['method']
+        self.offset = settings.get('offset', 0)
+        if self.normalization not in NORMALIZATIONS:
+            raise ValueError(f"不支援的正規化方式: {self.normalization}")
+        if self.method not in METHODS:
+            raise ValueError(f"不支援的評分方法: {self.method}")
+
+        weights = {**settings['weights'], **(weights or {})}
+        unknown = set(weights) - set(CRITERIA)
+        if unknown:
+            raise ValueError(f"未知的評分準則: {', '.join(sorted(unknown))}")
+        self.criteria = [criterion for criterion in CRITERIA if weights.get(criterion, 0)]
+        if not self.criteria:
+            raise ValueError("至少需要一個權重不為 0 的準則")
+        weight_vector = np.array([weights[criterion] for criterion in self.criteria], dtype=float)
+        # 正規化後的數值無單位，權重轉為總和 1；min-max / 排名的加權總和再放大到 0 ~ 100
+        if self.normalization != 'none':
+            weight_vector = weight_vector / weight_vector.sum()
+            if self.method == 'weighted_sum' and self.normalization in ('minmax', 'rank'):
+                weight_vector = weight_vector * 100
+        self.weights = weight_vector
+
+    def matrix(self, data):
+        """取出評分準則的 (列數, 準則數) 浮點數矩陣"""
+        return np.column_stack([np.asarray(data[criterion], dtype=float) for criterion in self.criteria])
+
+    def score(self, data):
+        """計算每一列的綜合效率評分（越大越好）"""
+        oriented = _orient(self.matrix(data), [CRITERIA[criterion] for criterion in self.criteria])
+        normalized = NORMALIZATIONS[self.normalization](oriented)
+        return METHODS[self.method](normalized, self.weights, self.offset)
+
+    def score_arrays(self, execution_time, memory_usage, accuracy):
+        """以各準則的陣列評分"""
+        return self.score({'execution_time': execution_time, 'memory_usage': memory_usage,
+                           'accuracy': accuracy})
+
+    def rank(self, data, top=None):
+        """依評分由高到低排序的列索引（同分保持原順序，NaN 排最後）"""
+        order = np.argsort(-self.score(data), kind='stable')
+        return order if top is None else order[:top]
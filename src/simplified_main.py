@@ -12,6 +12,13 @@ import warnings
 from pathlib import Path
 import time
 
+# 動態導入演算法資料表
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from src.algorithm_table import AlgorithmTable
+from src.data_manager import DataManager
+from src.render_tiers import QualityTier
+
 warnings.filterwarnings('ignore')
 
 # 設定中文顯示
@@ -31,6 +38,8 @@ def setup_chinese_font():
         ]
         
         for font_path in font_paths:
+            if not Path(font_path).exists():
+                continue
             try:
                 return fm.FontProperties(fname=font_path)
             except:
@@ -56,22 +65,32 @@ def create_algorithm_dataframe():
 class AlgorithmComparisonGenerator:
     """演算法比較圖表生成器"""
     
-    def __init__(self, output_dir="output"):
+    def __init__(self, output_dir="output", quality='full', full_queue=None):
         self.zh_font = setup_chinese_font()
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        # 品質等級：preview 以預覽 DPI 輸出並保存圖表描述，完整解析度由 full_queue 在背景輸出
+        self.tier = QualityTier(quality, queue=full_queue)
         
         # 配置參數
         self.colors = plt.cm.tab10(np.linspace(0, 1, 10))
-        self.complexity_map = {'極低': 1, '低': 2, '中': 3, '中-高': 4, '高': 5, '極高': 6}
         self.level_symbols = ['LOW', 'MID', 'HIGH', 'MAX', 'SUPER', 'ULTRA']
     
+    def _save(self, fig, filename):
+        """依品質等級儲存圖表（預覽等級寫入 preview/ 並排入完整解析度渲染），回傳輸出路徑"""
+        full_path = self.output_dir / filename
+        output_path = self.tier.save(fig, full_path, bbox_inches='tight').path
+        self.tier.queue_full(full_path)
+        return output_path
+    
     def create_main_comparison_chart(self, df):
         """建立主要演算法比較圖表"""
+        table = AlgorithmTable.ensure(df)
+        
         # 準備數據
-        x = [self.complexity_map.get(x.split('(')[0], 3) for x in df['計算複雜度']]
-        y = [self.complexity_map.get(x.split('(')[0], 3) for x in df['算力需求']]
-        labels = [str(i+1) for i in range(len(df))]
+        x = table.level('計算複雜度')
+        y = table.level('算力需求')
+        labels = table.labels
         
         # 建立圖表
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(20, 16))
@@ -93,8 +112,8 @@ class AlgorithmComparisonGenerator:
         ax1.set_yticklabels(complexity_labels, fontproperties=self.zh_font)
         
         # 2. 柱狀圖
-        memory_values = [self.complexity_map.get(x, 3) for x in df['記憶體需求']]
-        bars = ax2.bar(range(len(df)), memory_values, color=self.colors, alpha=0.8, edgecolor='white', linewidth=2)
+        memory_values = table.level('記憶體需求')
+        bars = ax2.bar(range(len(table)), memory_values, color=self.colors, alpha=0.8, edgecolor='white', linewidth=2)
         
         for i, (bar, val) in enumerate(zip(bars, memory_values)):
             height = bar.get_height()
@@ -105,7 +124,7 @@ class AlgorithmComparisonGenerator:
         ax2.set_xlabel('演算法編號', fontproperties=self.zh_font, fontsize=14)
         ax2.set_ylabel('記憶體需求', fontproperties=self.zh_font, fontsize=14)
         ax2.set_title('記憶體需求比較', fontproperties=self.zh_font, fontsize=16, fontweight='bold')
-        ax2.set_xticks(range(len(df)))
+        ax2.set_xticks(range(len(table)))
         ax2.set_xticklabels(labels, fontsize=12)
         ax2.grid(axis='y', alpha=0.3, linestyle='--')
         
@@ -116,12 +135,9 @@ class AlgorithmComparisonGenerator:
         
         ax3 = fig.add_subplot(2, 2, 3, projection='polar')
         
-        for i in range(min(5, len(df))):
-            values = [
-                self.complexity_map.get(df.iloc[i]['計算複雜度'].split('(')[0], 3),
-                self.complexity_map.get(df.iloc[i]['算力需求'].split('(')[0], 3),
-                self.complexity_map.get(df.iloc[i]['記憶體需求'], 3)
-            ]
+        radar_values = table.level_matrix(categories).T
+        for i in range(min(5, len(table))):
+            values = radar_values[i].tolist()
             values += values[:1]
             
             ax3.plot(angles, values, 'o-', linewidth=3, label=labels[i], color=self.colors[i], markersize=8)
@@ -135,17 +151,7 @@ class AlgorithmComparisonGenerator:
         ax3.grid(True, alpha=0.5)
         
         # 4. 圓餅圖
-        scenario_counts = {}
-        for scenario in df['適用場景']:
-            if '預測' in scenario:
-                key = '預測類'
-            elif '分類' in scenario or '特徵' in scenario:
-                key = '分類類'
-            elif '建模' in scenario or '圖像' in scenario or '多模態' in scenario:
-                key = '深度學習類'
-            else:
-                key = '其他類'
-            scenario_counts[key] = scenario_counts.get(key, 0) + 1
+        scenario_counts = table.scenario_counts()
         
         wedges, texts, autotexts = ax4.pie(scenario_counts.values(), 
                                            labels=scenario_counts.keys(),
@@ -164,20 +170,23 @@ class AlgorithmComparisonGenerator:
         ax4.set_title('適用場景分布', fontproperties=self.zh_font, fontsize=16, fontweight='bold')
         
         plt.tight_layout()
-        output_path = self.output_dir / 'ultra_clean_algorithm_comparison.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
+        output_path = self._save(plt.gcf(), 'ultra_clean_algorithm_comparison.png')
         print(f"✅ 主要比較圖表已儲存: {output_path}")
         plt.show()
         return output_path
     
-    def create_performance_comparison_chart(self):
-        """建立效能比較圖表"""
-        # 模擬效能數據
-        algorithms = [str(i+1) for i in range(10)]
-        np.random.seed(42)
-        execution_time = np.random.randint(10, 600, 10).tolist()
-        accuracy = np.random.randint(65, 99, 10).tolist()
-        memory_usage = np.random.randint(50, 1200, 10).tolist()
+    def create_performance_comparison_chart(self, performance_data=None, scoring='legacy'):
+        """建立效能比較圖表（未提供數據時實際執行基準測試）
+        
+        scoring 為綜合效率評分使用的評分組合（見 src.scoring.SCORING_PROFILES）
+        """
+        data_manager = DataManager()
+        if performance_data is None:
+            performance_data = data_manager.generate_performance_data(create_algorithm_dataframe()['演算法'])
+        algorithms = performance_data['algorithms']
+        execution_time = performance_data['execution_time']
+        accuracy = performance_data['accuracy']
+        memory_usage = performance_data['memory_usage']
         
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(18, 14))
         fig.suptitle('演算法效能比較分析', fontproperties=self.zh_font, fontsize=20, fontweight='bold', y=0.95)
@@ -187,7 +196,7 @@ class AlgorithmComparisonGenerator:
         # 1. 執行時間比較
         bars1 = ax1.bar(algorithms, execution_time, color=colors, alpha=0.8, edgecolor='white', linewidth=2)
         ax1.set_xlabel('演算法編號', fontproperties=self.zh_font, fontsize=14)
-        ax1.set_ylabel('執行時間 (秒)', fontproperties=self.zh_font, fontsize=14)
+        ax1.set_ylabel('執行時間 (毫秒)', fontproperties=self.zh_font, fontsize=14)
         ax1.set_title('執行時間比較', fontproperties=self.zh_font, fontsize=16, fontweight='bold')
         ax1.grid(axis='y', alpha=0.3, linestyle='--')
         
@@ -204,24 +213,24 @@ class AlgorithmComparisonGenerator:
         ax2.set_ylabel('準確度 (%)', fontproperties=self.zh_font, fontsize=14)
         ax2.set_title('準確度比較', fontproperties=self.zh_font, fontsize=16, fontweight='bold')
         ax2.grid(True, alpha=0.3, linestyle='--')
-        ax2.set_ylim(60, 100)
+        ax2.set_ylim(max(0, min(accuracy) - 10), min(100, max(accuracy) + 10))
         
         for i, acc in enumerate(accuracy):
-            ax2.annotate(f'{acc}%', (i, acc), textcoords="offset points", xytext=(0,10), 
+            ax2.annotate(f'{acc:.1f}%', (i, acc), textcoords="offset points", xytext=(0,10), 
                         ha='center', fontsize=10, fontweight='bold')
         
         # 3. 記憶體使用量
         ax3.scatter(range(len(algorithms)), memory_usage, c=colors, s=250, alpha=0.8, 
                    edgecolors='white', linewidth=2)
         ax3.set_xlabel('演算法編號', fontproperties=self.zh_font, fontsize=14)
-        ax3.set_ylabel('記憶體使用量 (MB)', fontproperties=self.zh_font, fontsize=14)
+        ax3.set_ylabel('峰值記憶體 (MB)', fontproperties=self.zh_font, fontsize=14)
         ax3.set_title('記憶體使用量比較', fontproperties=self.zh_font, fontsize=16, fontweight='bold')
         ax3.set_xticks(range(len(algorithms)))
         ax3.set_xticklabels(algorithms, fontsize=12)
         ax3.grid(True, alpha=0.3, linestyle='--')
         
         # 4. 綜合效率評分
-        efficiency_score = [100 - (t/10 + m/20 - a/2) for t, m, a in zip(execution_time, memory_usage, accuracy)]
+        efficiency_score = data_manager.calculate_efficiency_score(execution_time, memory_usage, accuracy, scoring)
         bars4 = ax4.barh(algorithms, efficiency_score, color=colors, alpha=0.8, edgecolor='white', linewidth=2)
         ax4.set_xlabel('效率評分', fontproperties=self.zh_font, fontsize=14)
         ax4.set_ylabel('演算法編號', fontproperties=self.zh_font, fontsize=14)
@@ -235,8 +244,7 @@ class AlgorithmComparisonGenerator:
                     ha='center', va='center', fontweight='bold', fontsize=10, color='white')
         
         plt.tight_layout()
-        output_path = self.output_dir / 'ultra_clean_comparison_table.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
+        output_path = self._save(plt.gcf(), 'ultra_clean_comparison_table.png')
         print(f"✅ 效能比較圖表已儲存: {output_path}")
         plt.show()
         return output_path
@@ -248,12 +256,9 @@ class AlgorithmComparisonGenerator:
         
         # 準備表格數據
         table_data = []
-        for i, row in df.iterrows():
-            table_data.append([
-                str(i+1), row['演算法'], row['預測精度'], 
-                row['計算複雜度'], row['算力需求'], 
-                row['記憶體需求'], row['適用場景']
-            ])
+        columns = ['演算法', '預測精度', '計算複雜度', '算力需求', '記憶體需求', '適用場景']
+        for label, row in zip(AlgorithmTable.ensure(df).labels, df[columns].itertuples(index=False)):
+            table_data.append([label, *row])
         
         # 建立表格
         table = ax.table(cellText=table_data,
@@ -282,8 +287,7 @@ class AlgorithmComparisonGenerator:
         
         plt.title('演算法比較摘要表', fontproperties=self.zh_font, fontsize=18, fontweight='bold', pad=20)
         
-        output_path = self.output_dir / 'algorithm_summary_table.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
+        output_path = self._save(plt.gcf(), 'algorithm_summary_table.png')
         print(f"✅ 摘要表格已儲存: {output_path}")
         plt.show()
         return output_path
@@ -325,10 +329,7 @@ def main():
         print(f"   成功載入 {len(df)} 個演算法的數據")
         
         # 儲存數據到 CSV
-        csv_path = Path("data") / "algorithms.csv"
-        csv_path.parent.mkdir(exist_ok=True)
-        df.to_csv(csv_path, index=False, encoding='utf-8-sig')
-        print(f"   數據已儲存到: {csv_path}")
+        DataManager(Path("data")).save_data_to_csv(df)
         
         print("\n🎨 開始生成圖表...")
         
@@ -375,7 +376,7 @@ def main():
         print("   • 零重疊保證 - 數字標籤確保完全無重疊")
         print("   • 系統相容性 - 移除所有特殊字符和 emoji")
         print("   • 視覺層次感 - 白色邊框和透明度設計")
-        print("   • 高解析度輸出 - 300 DPI 專業品質")
+        print(f"   • 輸出解析度 - {generator.tier.dpi} DPI")
         
         # 顯示演算法對照表
         print(f"\n📋 演算法編號對照表:")
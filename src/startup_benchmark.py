@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+啟動時間基準測試模組
+在全新的 Python 子程序中以 -X importtime 匯入各入口模組，
+記錄每個模組的匯入時間，以及是否提前載入了繪圖相關的重量級依賴
+"""
+
+import argparse
+import csv
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# 量測的入口模組（依相依順序，由底層到主程式）
+ENTRY_MODULES = [
+    'config.chart_config',
+    'src.font_manager',
+    'src.data_manager',
+    'src.chart_generator',
+    'src.enhanced_chart_generator',
+    'src.main'
+]
+
+# 應延遲到實際繪圖才載入的依賴
+HEAVY_MODULES = ['matplotlib.pyplot', 'seaborn', 'plotly', 'mpl_toolkits.mplot3d', 'scipy']
+
+
+def parse_importtime(stderr):
+    """解析 -X importtime 輸出，回傳 {模組: (自身微秒, 累計微秒)}"""
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # 標題列
+        timings[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+    return timings
+
+
+def measure_import(module, python=None):
+    """在全新子程序中匯入模組一次，回傳匯入時間與已載入的重量級依賴"""
+    code = f"import sys; sys.path.insert(0, {str(PROJECT_ROOT)!r}); import {module}"
+    start = time.perf_counter()
+    result = subprocess.run([python or sys.executable, '-X', 'importtime', '-c', code],
+                            cwd=PROJECT_ROOT, capture_output=True, text=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(f"匯入 {module} 失敗:\n{result.stderr[-2000:]}")
+
+    timings = parse_importtime(result.stderr)
+    # 模組已被其他模組先行匯入時不會有自己的紀錄，改以所有紀錄的總和估計
+    total_us = sum(own for own, _ in timings.values())
+    return {
+        'module': module,
+        'import_ms': timings.get(module, (0, total_us))[1] / 1000,
+        'process_ms': wall_ms,
+        'heavy_loaded': [name for name in HEAVY_MODULES if name in timings]
+    }
+
+
+def run_startup_benchmark(modules=None, repeats=3):
+    """每個模組重複量測 repeats 次，回傳取中位數後的結果列表"""
+    rows = []
+    for module in modules or ENTRY_MODULES:
+        samples = [measure_import(module) for _ in range(repeats)]
+        rows.append({
+            'module': module,
+            'import_ms': statistics.median(s['import_ms'] for s in samples),
+            'process_ms': statistics.median(s['process_ms'] for s in samples),
+            'heavy_loaded': samples[0]['heavy_loaded']
+        })
+    return rows
+
+
+def save_results(rows, output_path):
+    """將量測結果寫成 CSV"""
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', newline='', encoding='utf-8-sig') as f:
+        writer = csv.writer(f)
+        writer.writerow(['模組', '匯入時間(ms)', '程序總時間(ms)', '已載入的重量級依賴'])
+        for row in rows:
+            writer.writerow([row['module'], f"{row['import_ms']:.1f}", f"{row['process_ms']:.1f}",
+                             ' '.join(row['heavy_loaded'])])
+    return output_path
+
+
+def main(argv=None):
+    """命令列入口：印出各入口模組的冷啟動匯入時間"""
+    parser = argparse.ArgumentParser(description='量測各入口模組的冷啟動匯入時間')
+    parser.add_argument('--modules', nargs='+', default=ENTRY_MODULES, help='要量測的模組')
+    parser.add_argument('--repeats', type=int, default=3, help='每個模組的量測次數（取中位數）')
+    parser.add_argument('-o', '--output', type=Path, help='將結果另存為 CSV')
+    args = parser.parse_args(argv)
+
+    rows = run_startup_benchmark(args.modules, args.repeats)
+    print(f"{'模組':<32}{'匯入(ms)':>10}{'程序(ms)':>10}  重量級依賴")
+    for row in rows:
+        print(f"{row['module']:<32}{row['import_ms']:>10.1f}{row['process_ms']:>10.1f}  "
+              f"{', '.join(row['heavy_loaded']) or '-'}")
+
+    if args.output:
+        print(f"📊 結果已儲存: {save_results(rows, args.output)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+"""
+效能追蹤模組
+記錄巢狀區段（span）的牆鐘時間、CPU 時間與峰值記憶體，
+匯出為 Chrome trace JSON（chrome://tracing、Perfetto 可開啟）與每次執行的摘要
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows 沒有 resource 模組
+    resource = None
+
+
+class Tracer:
+    """區段追蹤器：以堆疊記錄巢狀區段，每個區段結束時產生一筆 Chrome trace 完整事件
+
+    每個區段都記錄行程 RSS 的歷史高點（成本極低）；trace_memory 為 True 時
+    另以 tracemalloc 量測區段內的峰值記憶體，涵蓋 Python 與 NumPy 的配置，
+    但會讓繪圖慢數倍，且 matplotlib Agg 在 C++ 端配置的點陣緩衝區不在統計範圍內
+    """
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.events = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._started_tracemalloc = False
+
+    def start(self):
+        """開始記錄（需要時啟動 tracemalloc）"""
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        return self
+
+    def stop(self):
+        """停止記錄（只關閉由本追蹤器啟動的 tracemalloc）"""
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _stack(self):
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    def _current_peak(self):
+        if self.trace_memory and tracemalloc.is_tracing():
+            return tracemalloc.get_traced_memory()[1]
+        return 0
+
+    @contextmanager
+    def span(self, name, category='app', **args):
+        """記錄一個區段；巢狀區段的峰值記憶體會回報給外層區段"""
+        stack = self._stack()
+        if stack:
+            # 子區段會重設 tracemalloc 峰值，先把目前為止的峰值記到外層
+            stack[-1]['peak'] = max(stack[-1]['peak'], self._current_peak())
+        if self.trace_memory and tracemalloc.is_tracing():
+            if hasattr(tracemalloc, 'reset_peak'):
+                tracemalloc.reset_peak()
+            else:
+                # Python 3.8 沒有 reset_peak：清除追蹤紀錄同樣會重設峰值（外層峰值已先記錄）
+                tracemalloc.clear_traces()
+        frame = {'peak': 0}
+        stack.append(frame)
+
+        start_ns = time.perf_counter_ns()
+        cpu_start_ns = time.thread_time_ns()
+        try:
+            yield frame
+        finally:
+            duration_ns = time.perf_counter_ns() - start_ns
+            cpu_ns = time.thread_time_ns() - cpu_start_ns
+            peak = max(frame['peak'], self._current_peak())
+            stack.pop()
+            if stack:
+                stack[-1]['peak'] = max(stack[-1]['peak'], peak)
+
+            event_args = dict(args, cpu_ms=round(cpu_ns / 1e6, 3))
+            if self.trace_memory:
+                event_args['peak_mb'] = round(peak / (1024 * 1024), 3)
+            max_rss = _max_rss_mb()
+            if max_rss is not None:
+                event_args['max_rss_mb'] = round(max_rss, 3)
+            self._record({
+                'name': name, 'cat': category, 'ph': 'X',
+                'ts': start_ns / 1000, 'dur': duration_ns / 1000,
+                'pid': os.getpid(), 'tid': threading.get_ident(),
+                'args': event_args
+            })
+
+    def instant(self, name, category='log', **args):
+        """記錄瞬間事件（例如日誌訊息）"""
+        self._record({
+            'name': name, 'cat': category, 'ph': 'i', 's': 't',
+            'ts': time.perf_counter_ns() / 1000,
+            'pid': os.getpid(), 'tid': threading.get_ident(),
+            'args': args
+        })
+
+    def _record(self, event):
+        with self._lock:
+            self.events.append(event)
+
+    def merge(self, events):
+        """併入其他行程（例如渲染工作行程）記錄的事件"""
+        with self._lock:
+            self.events.extend(events)
+
+    def drain(self):
+        """取出並清空目前記錄的事件"""
+        with self._lock:
+            events, self.events = self.events, []
+        return events
+
+    def export_chrome_trace(self, output_path):
+        """匯出 Chrome trace JSON"""
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        events = sorted(self.events, key=lambda event: event['ts'])
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
+        return output_path
+
+    def summary(self):
+        """依區段名稱彙總：次數、總時間、自身時間（扣除子區段）、CPU 時間、
+        最大峰值記憶體（tracemalloc）與結束時的行程 RSS 高點
+
+        依總時間由大到小排序
+        """
+        spans = [event for event in self.events if event['ph'] == 'X']
+        child_time = [0.0] * len(spans)
+        # 同一執行緒內，完全落在另一區段時間範圍內的最內層區段即為其子區段
+        order = sorted(range(len(spans)),
+                       key=lambda i: (spans[i]['pid'], spans[i]['tid'], spans[i]['ts'], -spans[i]['dur']))
+        open_spans = []
+        for i in order:
+            span = spans[i]
+            while open_spans and not _contains(spans[open_spans[-1]], span):
+                open_spans.pop()
+            if open_spans:
+                child_time[open_spans[-1]] += span['dur']
+            open_spans.append(i)
+
+        rows = {}
+        for span, children in zip(spans, child_time):
+            row = rows.setdefault(span['name'], {
+                'name': span['name'], 'category': span['cat'], 'count': 0,
+                'total_ms': 0.0, 'self_ms': 0.0, 'cpu_ms': 0.0, 'peak_mb': 0.0, 'max_rss_mb': 0.0
+            })
+            row['count'] += 1
+            row['total_ms'] += span['dur'] / 1000
+            row['self_ms'] += (span['dur'] - children) / 1000
+            row['cpu_ms'] += span['args'].get('cpu_ms', 0.0)
+            row['peak_mb'] = max(row['peak_mb'], span['args'].get('peak_mb', 0.0))
+            row['max_rss_mb'] = max(row['max_rss_mb'], span['args'].get('max_rss_mb', 0.0))
+        return sorted(rows.values(), key=lambda row: row['total_ms'], reverse=True)
+
+    def format_summary(self, limit=15):
+        """以精簡表格呈現摘要"""
+        lines = [f"{'區段':<28}{'次數':>6}{'總計(ms)':>12}{'自身(ms)':>12}{'CPU(ms)':>12}"
+                 f"{'峰值(MB)':>10}{'RSS(MB)':>10}"]
+        for row in self.summary()[:limit]:
+            peak = f"{row['peak_mb']:>10.1f}" if self.trace_memory else f"{'-':>10}"
+            lines.append(f"{row['name'][:27]:<28}{row['count']:>6}{row['total_ms']:>12.1f}"
+                         f"{row['self_ms']:>12.1f}{row['cpu_ms']:>12.1f}{peak}{row['max_rss_mb']:>10.1f}")
+        return '\n'.join(lines)
+
+    def save_summary(self, output_path):
+        """將摘要存為 JSON"""
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, ensure_ascii=False, indent=2)
+        return output_path
+
+
+def _max_rss_mb():
+    """行程 RSS 的歷史高點（MB）；平台不支援時為 None"""
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 以 KB 回報，macOS 以位元組回報
+    return max_rss / (1024 * 1024) if sys.platform == 'darwin' else max_rss / 1024
+
+
+def _contains(outer, inner):
+    """outer 區段是否完全涵蓋 inner 區段（同一行程與執行緒）"""
+    return (outer['pid'] == inner['pid'] and outer['tid'] == inner['tid']
+            and outer['ts'] <= inner['ts']
+            and inner['ts'] + inner['dur'] <= outer['ts'] + outer['dur'])
+
+
+# 目前啟用的追蹤器；為 None 時所有區段皆為零成本的空操作
+_ACTIVE_TRACER = None
+_MATPLOTLIB_ORIGINALS = {}
+
+
+def get_tracer():
+    """取得目前啟用的追蹤器（未啟用時為 None）"""
+    return _ACTIVE_TRACER
+
+
+def span(name, category='app', **args):
+    """在目前的追蹤器中記錄區段；未啟用追蹤時不做任何事"""
+    if _ACTIVE_TRACER is None:
+        return nullcontext()
+    return _ACTIVE_TRACER.span(name, category, **args)
+
+
+def instant(name, category='log', **args):
+    """在目前的追蹤器中記錄瞬間事件；未啟用追蹤時不做任何事"""
+    if _ACTIVE_TRACER is not None:
+        _ACTIVE_TRACER.instant(name, category, **args)
+
+
+def start_tracing(trace_memory=False):
+    """建立並啟用追蹤器，同時為 matplotlib 的版面配置、存檔、點陣化與編碼加上區段"""
+    global _ACTIVE_TRACER
+    if _ACTIVE_TRACER is not None:
+        stop_tracing()
+    _ACTIVE_TRACER = Tracer(trace_memory).start()
+    _instrument_matplotlib()
+    return _ACTIVE_TRACER
+
+
+def stop_tracing():
+    """停用追蹤器並還原 matplotlib，回傳停用的追蹤器"""
+    global _ACTIVE_TRACER
+    tracer, _ACTIVE_TRACER = _ACTIVE_TRACER, None
+    _restore_matplotlib()
+    if tracer is not None:
+        tracer.stop()
+    return tracer
+
+
+@contextmanager
+def tracing(trace_memory=False):
+    """在區塊內啟用追蹤"""
+    tracer = start_tracing(trace_memory)
+    try:
+        yield tracer
+    finally:
+        stop_tracing()
+
+
+def _traced(function, name):
+    """包裝函式，使每次呼叫成為一個 matplotlib 類別的區段"""
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        with span(name, 'matplotlib'):
+            return function(*args, **kwargs)
+    return wrapper
+
+
+def _instrument_matplotlib():
+    """替 matplotlib 的熱點加上區段：tight_layout、savefig、Agg 點陣化與影像編碼"""
+    if _MATPLOTLIB_ORIGINALS:
+        return
+    import matplotlib.figure
+    import matplotlib.image
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    targets = [
+        (matplotlib.figure.Figure, 'tight_layout', 'tight_layout'),
+        (matplotlib.figure.Figure, 'savefig', 'savefig'),
+        (FigureCanvasAgg, 'draw', 'rasterize'),
+        (matplotlib.image, 'imsave', 'encode')
+    ]
+    for owner, attribute, name in targets:
+        original = owner.__dict__[attribute]
+        _MATPLOTLIB_ORIGINALS[(owner, attribute)] = original
+        setattr(owner, attribute, _traced(original, name))
+
+
+def _restore_matplotlib():
+    """還原被包裝的 matplotlib 函式"""
+    for (owner, attribute), original in _MATPLOTLIB_ORIGINALS.items():
+        setattr(owner, attribute, original)
+    _MATPLOTLIB_ORIGINALS.clear()
@@ -4,23 +4,63 @@
 提供通用的工具函數
 """
 
+import hashlib
+import importlib
+import importlib.util
+import os
+import stat
+import sys
+import tempfile
 import time
+import types
 from functools import wraps
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).parent.parent))
+from src import tracing
+
 
 def timer(func):
-    """執行時間裝飾器"""
+    """執行時間裝飾器（啟用追蹤時同時記錄為一個區段）"""
     @wraps(func)
     def wrapper(*args, **kwargs):
         start_time = time.time()
-        result = func(*args, **kwargs)
+        with tracing.span(func.__qualname__, 'timer'):
+            result = func(*args, **kwargs)
         end_time = time.time()
         print(f"{func.__name__} 執行時間: {end_time - start_time:.2f} 秒")
         return result
     return wrapper
 
 
+class LazyModule(types.ModuleType):
+    """延遲載入的模組代理：第一次存取屬性時才真正 import"""
+    
+    def __init__(self, name):
+        super().__init__(name)
+    
+    def __getattr__(self, attr):
+        # 每次委派給 sys.modules 中的實際模組，避免快取到之後會變動的模組屬性
+        return getattr(importlib.import_module(self.__name__), attr)
+    
+    def __dir__(self):
+        return dir(importlib.import_module(self.__name__))
+
+
+def lazy_import(name):
+    """回傳延遲載入的模組；若模組已載入則直接回傳"""
+    module = sys.modules.get(name)
+    return module if module is not None else LazyModule(name)
+
+
+def module_available(name):
+    """檢查模組是否可匯入（只尋找模組，不執行 import）"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
 def ensure_directory(directory_path):
     """確保目錄存在"""
     path = Path(directory_path)
@@ -28,10 +68,76 @@ def ensure_directory(directory_path):
     return path
 
 
+def file_checksum(file_path):
+    """檔案內容的 SHA-256；檔案不存在時為 None"""
+    digest = hashlib.sha256()
+    try:
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+def source_fingerprint(file_path):
+    """來源檔的名稱、大小與修改時間（只需 stat），用來判斷衍生檔案是否需要重建"""
+    stat = os.stat(file_path)
+    return {'file': Path(file_path).name, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def _read_umask():
+    """目前行程的 umask（os.umask 只能以設定的方式讀取）"""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# 匯入時讀取一次：之後在背景執行緒中寫檔時再暫時改動 umask 並不安全
+_UMASK = _read_umask()
+
+
+def write_if_changed(file_path, content):
+    """內容與現有檔案不同時才寫入，回傳是否寫入
+
+    內容相同時不動檔案（修改時間不變，下游的檔案監看與快取不會被觸發）；
+    寫入時先寫到同目錄的暫存檔再以 os.replace 原子改名，
+    其他行程只會讀到舊檔或完整的新檔，不會讀到寫到一半的檔案；
+    權限沿用現有檔案，新檔依 umask 設定（mkstemp 建立的暫存檔只有擁有者可讀寫）
+    """
+    path = Path(file_path)
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    # 大小不同必定有變更，省去讀檔計算雜湊
+    existing = path.stat() if path.exists() else None
+    if existing is not None and existing.st_size == len(content):
+        if file_checksum(path) == hashlib.sha256(content).hexdigest():
+            return False
+    mode = stat.S_IMODE(existing.st_mode) if existing is not None else 0o666 & ~_UMASK
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return True
+
+
 def log_operation(message, level="INFO"):
-    """記錄操作日誌"""
+    """記錄操作日誌（啟用追蹤時同時記錄為瞬間事件）"""
     timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
     print(f"[{timestamp}] [{level}] {message}")
+    tracing.instant(message, 'log', level=level)
 
 
 def validate_dataframe(df, required_columns):
@@ -106,8 +212,8 @@ def print_algorithm_reference():
     print("圖表中的數字標籤對應上述演算法編號")
 
 
-def generate_report_summary(chart_files):
-    """生成報告摘要"""
+def generate_report_summary(chart_files, cache_stats=None, encoding_stats=None, dpi=None):
+    """生成報告摘要（encoding_stats 為 PngPipeline.stats()，dpi 為實際輸出的 QualityTier.dpi）"""
     print("\n" + "=" * 60)
     print("圖表生成完成報告")
     print("=" * 60)
@@ -135,6 +241,29 @@ def generate_report_summary(chart_files):
             print(f"   • {name}: {path}")
     
     print(f"\n總共生成 {len(existing_files)} 個圖表文件")
-    if existing_files:
-        print("所有圖表均採用 300 DPI 高品質輸出")
+    if existing_files and dpi:
+        print(f"所有圖表均以 {dpi} DPI 輸出")
+    
+    # 顯示渲染快取統計（如果有啟用）
+    if cache_stats:
+        print(f"\n渲染快取: 命中 {cache_stats['hits']} 次 / 未命中 {cache_stats['misses']} 次"
+              f" (命中率 {cache_stats['hit_rate']:.0%})")
+        print(f"   快取項目: {cache_stats['entries']} 個，"
+              f"{cache_stats['size_bytes'] / 1024 / 1024:.1f} / "
+              f"{cache_stats['max_bytes'] / 1024 / 1024:.0f} MB，"
+              f"淘汰 {cache_stats['evictions']} 個")
+    
+    # 顯示背景 PNG 編碼統計（如果有啟用）
+    if encoding_stats and encoding_stats['charts']:
+        colors = encoding_stats['colors']
+        print(f"\n背景 PNG 編碼: 壓縮等級 {encoding_stats['compress_level']}，"
+              f"{f'量化為 {colors} 色' if colors else '不量化'}")
+        for record in encoding_stats['charts']:
+            saved = ('' if record['bytes_saved'] is None
+                     else f"（較預設設定節省 {record['bytes_saved'] / 1024:.1f} KB）")
+            print(f"   • {record['name']}: 主執行緒節省 {record['encode_ms']:.0f} ms，"
+                  f"{record['bytes'] / 1024:.1f} KB{saved}")
+        total_saved = ('' if encoding_stats['bytes_saved'] is None
+                       else f"、{encoding_stats['bytes_saved'] / 1024:.1f} KB")
+        print(f"   合計節省 {encoding_stats['time_saved_ms'] / 1000:.2f} 秒{total_saved}")
     print("=" * 60)
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+向量輸出模組
+SVG / PDF 只嵌入圖表實際用到的字元：PDF 以 TrueType (Type 42) 嵌入，由 matplotlib 以 fontTools 取子集；
+SVG 保留可選取的文字，並以 @font-face 內嵌 fontTools 取出的 WOFF / WOFF2 子集，
+FontManager 找到的多 MB 中文 TTC 字體在輸出中只剩用到的字形
+"""
+
+import base64
+import io
+import sys
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.utils import lazy_import, module_available, write_if_changed
+
+matplotlib = lazy_import('matplotlib')
+fm = lazy_import('matplotlib.font_manager')
+mtext = lazy_import('matplotlib.text')
+backend_pdf = lazy_import('matplotlib.backends.backend_pdf')
+font_subset = lazy_import('fontTools.subset')
+
+VECTOR_FORMATS = ('svg', 'pdf')
+
+# 輸出時才套用：主題 context 以 'default' 樣式重設 rcParams，在外層設定會被覆蓋
+VECTOR_RC = {
+    'pdf.fonttype': 42,        # TrueType 子集，取代逐字元轉為 Type 3 程序
+    'svg.fonttype': 'none',    # 保留文字，字形改由 @font-face 提供
+    'svg.hashsalt': 'algorithm-comparison'  # 固定 SVG 內的 id
+}
+
+# 不寫入建立時間：內容未變更時輸出逐位元組相同，write_if_changed 與渲染快取才能判斷未變更
+VECTOR_METADATA = {'svg': {'Date': None}, 'pdf': {'CreationDate': None}}
+
+# 安裝 brotli 時使用壓縮率較高的 WOFF2
+FONT_FLAVOR = 'woff2' if module_available('brotli') else 'woff'
+SUBSET_CACHE_SIZE = 64
+
+# fontTools 不認得、也不影響顯示的表格，直接丟棄以免警告
+_DROPPED_TABLES = ['FFTM', 'PfEd', 'BDF', 'meta', 'MERG', 'TSIV', 'Zapf', 'bdat', 'bloc', 'cidg',
+                   'fdsc', 'feat', 'fmtx', 'fond', 'just', 'kerx', 'ltag', 'morx', 'trak', 'xref']
+_GENERIC_FAMILIES = {'sans': 'sans-serif', 'sans serif': 'sans-serif'}
+
+
+def is_vector(image_format):
+    return image_format in VECTOR_FORMATS
+
+
+def save_vector_figure(fig, buffer, image_format, dpi=None, **savefig_options):
+    """以向量格式將圖表寫入 buffer，字體只嵌入用到的字元"""
+    metadata = {**VECTOR_METADATA[image_format], **savefig_options.pop('metadata', {})}
+    with matplotlib.rc_context(VECTOR_RC):
+        if image_format == 'pdf':
+            fig.savefig(buffer, format='pdf', dpi=dpi, metadata=metadata, **savefig_options)
+            return
+        # 先完成版面配置，刻度標籤等文字才會建立
+        fig.draw_without_rendering()
+        with pinned_fonts(fig) as fonts:
+            svg = io.BytesIO()
+            fig.savefig(svg, format='svg', dpi=dpi, metadata=metadata, **savefig_options)
+    buffer.write(embed_svg_fonts(svg.getvalue(), fonts))
+
+
+def resolve_fonts(prop):
+    """文字實際使用的字體檔，順序同 matplotlib 的字體備援（找不到時為預設字體）"""
+    if prop.get_file():
+        return [str(prop.get_file())]
+    paths = []
+    for family in prop.get_family():
+        family = _GENERIC_FAMILIES.get(family, family)
+        names = matplotlib.rcParams[f'font.{family}'] if family in fm.font_family_aliases else [family]
+        for name in names:
+            candidate = prop.copy()
+            candidate.set_family(name)
+            try:
+                path = fm.findfont(candidate, fallback_to_default=False)
+            except ValueError:
+                continue
+            if path not in paths:
+                paths.append(path)
+    return paths or [fm.findfont(prop)]
+
+
+@contextmanager
+def pinned_fonts(fig):
+    """輸出期間把每段文字的字體族固定為實際使用的字體名稱，yield {字體檔: 用到的字元}
+
+    以 fname 指定的字體（FontManager 的中文字體）在 SVG 中原本只寫出通用字體族，
+    固定後瀏覽器才會對應到內嵌的 @font-face；離開時還原原本的設定
+    """
+    fonts = {}
+    restore = []
+    for text in fig.findobj(mtext.Text):
+        content = text.get_text()
+        if not content or not text.get_visible() or text.get_usetex():
+            continue
+        prop = text.get_fontproperties()
+        paths = resolve_fonts(prop)
+        for path in paths:
+            fonts[path] = fonts.get(path, '') + content
+        restore.append((prop, prop.get_family()))
+        prop.set_family([_font_entry(path).name for path in paths])
+    try:
+        yield {path: ''.join(sorted(set(chars))) for path, chars in fonts.items()}
+    finally:
+        for prop, family in reversed(restore):
+            prop.set_family(family)
+
+
+def embed_svg_fonts(svg, fonts):
+    """在 SVG 的樣式表加入各字體子集的 @font-face"""
+    rules = ''.join(_font_face(path, chars) for path, chars in sorted(fonts.items()))
+    if not rules:
+        return svg
+    marker = b'<style type="text/css">'
+    if marker in svg:
+        return svg.replace(marker, marker + rules.encode('ascii'), 1)
+    # 沒有既有樣式表時，在根元素之後建立
+    end = svg.index(b'>', svg.index(b'<svg')) + 1
+    return svg[:end] + f'\n <defs><style type="text/css">{rules}</style></defs>'.encode('ascii') + svg[end:]
+
+
+def subset_font(path, chars):
+    """取出只含 chars 字形的字體子集（TTC 取第一個字體），回傳 WOFF / WOFF2 位元組"""
+    return _subset_font(str(path), ''.join(sorted(set(chars))))
+
+
+@lru_cache(maxsize=SUBSET_CACHE_SIZE)
+def _subset_font(path, chars):
+    options = font_subset.Options()
+    options.flavor = FONT_FLAVOR
+    options.font_number = 0
+    options.hinting = False  # 向量輸出由檢視器縮放，不需要 hinting 指令
+    options.desubroutinize = True
+    options.drop_tables += _DROPPED_TABLES
+    font = font_subset.load_font(path, options)
+    subsetter = font_subset.Subsetter(options)
+    subsetter.populate(text=chars)
+    subsetter.subset(font)
+    buffer = io.BytesIO()
+    font_subset.save_font(font, buffer, options)
+    font.close()
+    return buffer.getvalue()
+
+
+def _font_entry(path):
+    """字體檔的族名、粗細與樣式（與 matplotlib 字體清單相同的解析方式）"""
+    return fm.ttfFontProperty(fm.get_font(path))
+
+
+def _font_face(path, chars):
+    entry = _font_entry(path)
+    data = base64.b64encode(subset_font(path, chars)).decode('ascii')
+    return (f"@font-face{{font-family:{_css_string(entry.name)};font-weight:{entry.weight};"
+            f"font-style:{entry.style};src:url(data:font/{FONT_FLAVOR};base64,{data}) format('{FONT_FLAVOR}')}}")
+
+
+def _css_string(value):
+    """與 matplotlib SVG 後端相同的字體名稱引號寫法"""
+    return repr(value)
+
+
+class PdfReport:
+    """多頁 PDF 報告：期間加入的每張圖表為一頁，所有頁面在同一次輸出中寫入
+
+    字體在整份文件只嵌入一次，子集為所有頁面用到的字元；關閉時才寫入磁碟（內容未變更時不重寫）
+    """
+
+    def __init__(self, path, title=None, dpi=None):
+        self.path = Path(path)
+        self.title = title
+        self.dpi = dpi
+        self.pages = []
+        self._buffer = None
+        self._pdf = None
+
+    def open(self):
+        metadata = {**VECTOR_METADATA['pdf'], 'Title': self.title} if self.title else VECTOR_METADATA['pdf']
+        self._buffer = io.BytesIO()
+        self._pdf = backend_pdf.PdfPages(self._buffer, metadata=metadata)
+        return self
+
+    def add(self, fig, name, **savefig_options):
+        """加入一頁（不關閉圖表），回傳頁碼"""
+        with matplotlib.rc_context(VECTOR_RC):
+            self._pdf.savefig(fig, dpi=self.dpi, **savefig_options)
+        self.pages.append(name)
+        return len(self.pages)
+
+    def close(self):
+        """完成文件並寫入，回傳路徑；沒有任何頁面時不寫檔"""
+        if self._pdf is None:
+            return self.path
+        # 字體在關閉時才寫入，同樣需要 Type 42 設定
+        with matplotlib.rc_context(VECTOR_RC):
+            self._pdf.close()
+        if self.pages:
+            write_if_changed(self.path, self._buffer.getvalue())
+        self._pdf = self._buffer = None
+        return self.path
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+演算法資料表測試模組
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# 添加專案路徑
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from src.data_manager import DataManager
+from src.algorithm_table import AlgorithmTable
+
+
+class TestAlgorithmTable(unittest.TestCase):
+    """演算法資料表測試"""
+
+    def setUp(self):
+        """測試前置設定"""
+        self.data_manager = DataManager()
+        self.df = self.data_manager.create_algorithm_dataframe()
+        self.table = AlgorithmTable.from_frame(self.df)
+
+    def test_levels_match_legacy_parsing(self):
+        """測試等級編碼與逐列字串解析的結果一致"""
+        for column in ['計算複雜度', '算力需求', '記憶體需求']:
+            expected = [self.data_manager.get_complexity_value(value) for value in self.df[column]]
+            self.assertEqual(self.table.level(column).tolist(), expected, column)
+            self.assertEqual(self.table.level(column).dtype, np.int8)
+
+    def test_annotations_become_flags(self):
+        """測試括號註記拆為旗標欄位"""
+        self.assertEqual(self.table.level('可平行化').tolist(), [1, 1, 1, 2, 3, 3, 4, 4, 4, 3])
+        self.assertEqual(np.flatnonzero(self.table.flags['GPU']).tolist(), [6, 7, 8])
+        self.assertEqual(np.flatnonzero(self.table.flags['波動']).tolist(), [2])
+
+    def test_unknown_and_missing_values_use_default(self):
+        """測試無法辨識或缺值時使用預設等級"""
+        df = self.df.copy()
+        df.loc[0, '計算複雜度'] = '未知'
+        df.loc[1, '計算複雜度'] = None
+        table = AlgorithmTable.from_frame(df)
+
+        self.assertEqual(table.level('計算複雜度')[:2].tolist(), [3, 3])
+        self.assertEqual(table.categorical('計算複雜度')[0], '中')
+
+    def test_scenario_counts_and_subset(self):
+        """測試場景分類統計與子集選取"""
+        self.assertEqual(list(self.table.scenario_counts().items()),
+                         [('預測類', 3), ('分類類', 3), ('其他類', 2), ('深度學習類', 2)])
+
+        subset = self.table.subset(self.table.flags['GPU'])
+        self.assertEqual(subset.names, ['RNN/LSTM', 'CNN', 'Transformer'])
+        self.assertEqual(subset.scenario_counts(), {'深度學習類': 2, '分類類': 1})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+動畫引擎測試模組
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# 添加專案路徑
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+from PIL import Image
+
+from src.animation_engine import ANIMATION_FORMATS, GifStreamWriter, build_bar_reveal, save_animation
+from src.chart_generator import ChartGenerator
+from src.data_manager import DataManager
+from src.font_manager import FontManager
+
+
+def render_frames(values, start=0, **options):
+    """以 blit 與每幀完整重繪產生成對的影格"""
+    blitted = build_bar_reveal(values, dpi=30, **options)
+    redrawn = build_bar_reveal(values, dpi=30, blit=False, **options)
+    try:
+        for (frame, box), (expected, _) in zip(blitted.frames(start), redrawn.frames(start)):
+            yield frame.copy(), box, expected.copy()
+    finally:
+        plt.close(blitted.fig)
+        plt.close(redrawn.fig)
+
+
+class TestBlitAnimation(unittest.TestCase):
+    """blit 繪製測試"""
+
+    def test_blit_matches_full_redraw(self):
+        """測試每一幀 blit 的結果與完整重繪逐像素相同，變更區域之外的像素不變"""
+        previous = None
+        for frame, box, expected in render_frames([3, 2, 4, 1, 5, 2, 3, 4, 2, 1], grow_steps=2):
+            np.testing.assert_array_equal(frame, expected)
+            if previous is not None:
+                left, top, right, bottom = box
+                outside = frame != previous
+                outside[top:bottom, left:right] = False
+                self.assertFalse(outside.any())
+            previous = frame
+
+    def test_large_catalog_frames(self):
+        """測試超過數值標籤上限的柱數，從中間開始的影格仍與完整重繪相同"""
+        values = np.random.default_rng(0).integers(1, 6, 300)
+        count = 0
+        for frame, box, expected in render_frames(values, start=290):
+            np.testing.assert_array_equal(frame, expected)
+            count += 1
+        self.assertEqual(count, 10)
+
+
+class TestAnimationWriters(unittest.TestCase):
+    """動畫串流編碼測試"""
+
+    def setUp(self):
+        """測試前置設定"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        """清理暫存目錄"""
+        self.temp_dir.cleanup()
+
+    def test_formats_decode_to_same_frames(self):
+        """測試 GIF、APNG、WebP 的影格數與內容（APNG 無損，GIF 量化為 256 色，WebP 有損）"""
+        df = DataManager(storage=None).create_algorithm_dataframe()
+        generator = ChartGenerator(FontManager(), self.output_dir, show=False)
+        decoded = {}
+        for image_format, suffix in ANIMATION_FORMATS.items():
+            output_path = generator.create_animated_comparison(df, image_format=image_format)
+            self.assertEqual(output_path, self.output_dir / f'animated_comparison{suffix}')
+            with Image.open(output_path) as image:
+                self.assertEqual(image.n_frames, len(df))
+                frames = []
+                for frame in (1, len(df) - 1):
+                    image.seek(frame)
+                    frames.append(np.asarray(image.convert('RGB'), dtype=float))
+                decoded[image_format] = np.stack(frames)
+
+        self.assertLess(np.abs(decoded['gif'] - decoded['apng']).mean(), 0.5)
+        self.assertLess(np.abs(decoded['webp'] - decoded['apng']).mean(), 2)
+        self.assertIsNone(generator.create_animated_comparison(df, image_format='avi'))
+
+    def test_frames_streamed_to_encoder(self):
+        """測試每一幀繪製後立即寫入，只寫入變更區域"""
+        animation = build_bar_reveal([1, 2, 3, 4], dpi=30)
+        rendered = []
+        update = animation.update
+        animation.update = lambda frame: rendered.append(frame) or update(frame)
+
+        written = []
+        write = GifStreamWriter.write
+
+        def record(writer, frame, box):
+            written.append((len(rendered), box))
+            write(writer, frame, box)
+
+        with mock.patch.object(GifStreamWriter, 'write', record):
+            save_animation(animation, self.output_dir / 'stream.gif', 'gif')
+        plt.close(animation.fig)
+
+        self.assertEqual([count for count, _ in written], [1, 2, 3, 4])
+        width, height = animation.size
+        self.assertEqual(written[0][1], (0, 0, width, height))
+        for _, (left, top, right, bottom) in written[1:]:
+            self.assertLess((right - left) * (bottom - top), width * height)
+        with self.assertRaises(ValueError):
+            save_animation(animation, self.output_dir / 'stream.mp4', 'mp4')
+
+
+if __name__ == '__main__':
+    unittest.main()
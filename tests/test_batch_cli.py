@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+批次命令列模式測試模組
+"""
+
+import unittest
+import shutil
+import sys
+from pathlib import Path
+from unittest import mock
+
+# 添加專案路徑
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import matplotlib
+matplotlib.use('Agg')
+
+from src import main as cli
+from src.data_manager import DataManager
+
+
+class TestBatchCli(unittest.TestCase):
+    """批次命令列模式測試"""
+
+    def setUp(self):
+        """測試前置設定"""
+        self.test_output_dir = Path("test_output_cli")
+
+    def test_invalid_arguments_exit_with_usage_code(self):
+        """測試參數錯誤時以結束代碼 2 結束"""
+        for argv in (['--charts', 'unknown'], ['--dpi', '0'], ['--jobs', '0']):
+            with self.assertRaises(SystemExit) as context, mock.patch('sys.stderr'):
+                cli.parse_args(argv)
+            self.assertEqual(context.exception.code, cli.EXIT_USAGE, argv)
+
+    def test_missing_data_file_reports_data_error(self):
+        """測試數據文件不存在時回傳數據錯誤代碼"""
+        args = cli.parse_args(['--data', 'missing.csv', '-o', str(self.test_output_dir)])
+        self.assertEqual(cli.run_batch(args), cli.EXIT_DATA_ERROR)
+
+    def test_batch_renders_selected_charts_without_showing(self):
+        """測試批次模式只生成指定的圖表與格式，且不呼叫 plt.show"""
+        args = cli.parse_args(['--charts', 'pie', 'bar', '--formats', 'png', 'svg',
+                               '--dpi', '50', '--no-cache', '-o', str(self.test_output_dir)])
+        with mock.patch('matplotlib.pyplot.show') as show:
+            self.assertEqual(cli.run_batch(args), cli.EXIT_OK)
+        show.assert_not_called()
+
+        # 除了圖表之外只有增量渲染紀錄
+        produced = sorted(p.name for p in self.test_output_dir.iterdir())
+        self.assertEqual(produced, ['.render_manifest.json',
+                                    'enhanced_bar_memory.png', 'enhanced_bar_memory.svg',
+                                    'enhanced_pie_scenarios.png', 'enhanced_pie_scenarios.svg'])
+
+        # 輸入未變更時第二次執行不重新渲染
+        with mock.patch('src.enhanced_chart_generator.EnhancedChartGenerator._draw_chart') as draw:
+            self.assertEqual(cli.run_batch(args), cli.EXIT_OK)
+        draw.assert_not_called()
+
+    def test_where_renders_matching_subset(self):
+        """測試 --where 只以符合條件的演算法渲染，沒有符合時回報數據錯誤"""
+        args = cli.parse_args(['--where', '可平行化>=高, 適用場景~特徵', '--charts', 'pie'])
+        table = cli.load_batch_table(args, DataManager())
+        self.assertEqual(table.names, ['隨機森林', 'CNN'])
+
+        args = cli.parse_args(['--where', '記憶體需求>極高', '--charts', 'pie', '--no-cache',
+                               '-o', str(self.test_output_dir)])
+        self.assertEqual(cli.run_batch(args), cli.EXIT_DATA_ERROR)
+        with self.assertRaises(SystemExit):
+            cli.parse_args(['--where', '記憶體需求'])
+
+    def test_preview_then_full_resolution(self):
+        """測試 --preview 先輸出預覽，完整解析度由背景佇列輸出；--preview-only 只輸出預覽"""
+        args = cli.parse_args(['--charts', 'pie', '--preview-only', '--dpi', '50', '--no-cache',
+                               '-o', str(self.test_output_dir)])
+        self.assertTrue(args.preview)
+        self.assertEqual(cli.run_batch(args), cli.EXIT_OK)
+        self.assertEqual(sorted(p.name for p in (self.test_output_dir / 'preview').iterdir()),
+                         ['enhanced_pie_scenarios.png', 'enhanced_pie_scenarios.png.figure'])
+        self.assertFalse((self.test_output_dir / 'enhanced_pie_scenarios.png').exists())
+
+        args = cli.parse_args(['--charts', 'pie', '--preview', '--dpi', '50', '--no-cache', '--force',
+                               '-o', str(self.test_output_dir)])
+        self.assertEqual(cli.run_batch(args), cli.EXIT_OK)
+        self.assertTrue((self.test_output_dir / 'enhanced_pie_scenarios.png').exists())
+
+    def test_report_and_standard_vector_formats(self):
+        """測試 --report 另外輸出多頁 PDF 報告，標準模式也依 --formats 輸出向量格式"""
+        args = cli.parse_args(['--mode', 'standard', '--formats', 'pdf', '--report', '--no-cache',
+                               '-o', str(self.test_output_dir)])
+        # 標準生成器的效能圖表不讀取數據，不應執行基準測試
+        with mock.patch.object(DataManager, 'generate_performance_data') as benchmark:
+            self.assertEqual(cli.run_batch(args), cli.EXIT_OK)
+        benchmark.assert_not_called()
+        produced = sorted(p.name for p in self.test_output_dir.iterdir())
+        self.assertEqual(produced, ['algorithm_report.pdf', 'bar_memory_requirements.pdf',
+                                    'scatter_complexity_vs_power.pdf'])
+
+    def tearDown(self):
+        """測試清理"""
+        if self.test_output_dir.exists():
+            shutil.rmtree(self.test_output_dir)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
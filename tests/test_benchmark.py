@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+效能基準測試模組的測試
+"""
+
+import contextlib
+import io
+import unittest
+import sys
+from pathlib import Path
+
+# 添加專案路徑
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.benchmark import BenchmarkRunner, BENCHMARKS
+
+
+class TestBenchmarkRunner(unittest.TestCase):
+    """基準測試執行器測試"""
+
+    def setUp(self):
+        """測試前置設定（縮小序列與重複次數以加快測試）"""
+        self.runner = BenchmarkRunner(n_points=600, warmup=0, repeats=1)
+
+    def test_performance_data_covers_catalog(self):
+        """測試每個目錄演算法都產生實際量測值"""
+        data = self.runner.performance_data(BENCHMARKS)
+
+        self.assertEqual(data['algorithms'], [str(i+1) for i in range(len(BENCHMARKS))])
+        for key in ['execution_time', 'accuracy', 'memory_usage']:
+            self.assertEqual(len(data[key]), len(BENCHMARKS), key)
+        self.assertTrue(all(t > 0 for t in data['execution_time']))
+        self.assertTrue(all(m > 0 for m in data['memory_usage']))
+        self.assertTrue(all(0 <= a <= 100 for a in data['accuracy']))
+
+    def test_unknown_algorithms_are_skipped(self):
+        """測試沒有參考實作的演算法被略過，編號仍對應目錄位置，且只彙總一行警告"""
+        names = ['自訂模型', 'ARIMA', 'CNN'] + [f'ARIMA#{i}' for i in range(1, 9)]
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            data = self.runner.performance_data(names)
+        self.assertEqual(data['algorithms'], ['2', '3'])
+        warnings = [line for line in output.getvalue().splitlines() if '沒有參考實作' in line]
+        self.assertEqual(len(warnings), 1)
+        self.assertIn('9 個演算法', warnings[0])
+        self.assertNotIn('ARIMA#8', warnings[0])
+
+    def test_accuracy_is_reproducible(self):
+        """測試相同種子的準確度可重現"""
+        first = self.runner.run(['SVM', '基因演算法'])
+        second = BenchmarkRunner(n_points=600, warmup=0, repeats=1).run(['SVM', '基因演算法'])
+        for name in first:
+            self.assertEqual(first[name]['accuracy'], second[name]['accuracy'])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
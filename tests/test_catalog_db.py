@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+SQLite 演算法目錄測試模組
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# 添加專案路徑
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pandas as pd
+
+from src.algorithm_table import AlgorithmTable
+from src.catalog_db import CatalogDatabase, parse_constraints
+from src.data_manager import DataManager
+from src.enhanced_chart_generator import EnhancedChartGenerator
+from src.font_manager import FontManager
+
+
+class TestCatalogDatabase(unittest.TestCase):
+    """SQLite 目錄測試"""
+
+    @classmethod
+    def setUpClass(cls):
+        """所有測試共用同一份模擬目錄"""
+        cls.table = AlgorithmTable.from_frame(DataManager().create_synthetic_catalog(5000))
+        cls.catalog = CatalogDatabase().import_table(cls.table)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.catalog.close()
+
+    def test_parse_constraints(self):
+        """測試條件字串解析（支援全形逗號）"""
+        self.assertEqual(parse_constraints('記憶體需求<=中，可平行化>=高, 適用場景~預測'),
+                         [('記憶體需求', '<=', '中'), ('可平行化', '>=', '高'), ('適用場景', '~', '預測')])
+        with self.assertRaises(ValueError):
+            parse_constraints('記憶體需求 中')
+
+    def test_query_matches_numpy_filter(self):
+        """測試查詢結果與以編碼直接篩選相同，且保留原目錄順序與編碼"""
+        constraints = '記憶體需求<=中, 計算複雜度>=中, 適用場景~預測'
+        mask = ((self.table.level('記憶體需求') <= 3) & (self.table.level('計算複雜度') >= 3)
+                & self.table['適用場景'].str.contains('預測').to_numpy())
+
+        subset = self.catalog.query(constraints)
+        expected = self.table.frame[mask].reset_index(drop=True)
+        self.assertGreater(len(subset), 0)
+        pd.testing.assert_frame_equal(subset.frame, expected, check_dtype=False)
+        np.testing.assert_array_equal(subset.level('記憶體需求'), self.table.level('記憶體需求')[mask])
+        np.testing.assert_array_equal(subset.scenario_codes, self.table.scenario_codes[mask])
+        np.testing.assert_array_equal(self.catalog.row_numbers(constraints), np.flatnonzero(mask))
+        self.assertEqual(self.catalog.count(constraints), mask.sum())
+        self.assertEqual(len(self.catalog.query(constraints, limit=3)), 3)
+
+    def test_flags_categories_and_raw_columns(self):
+        """測試旗標、場景分類與未編碼原始欄位的條件"""
+        self.assertEqual(self.catalog.count([('GPU', '=', '是')]), self.table.flags['GPU'].sum())
+        self.assertEqual(self.catalog.count('場景分類=預測類'), (self.table.scenario_codes == 0).sum())
+        name = self.table.names[0]
+        self.assertEqual(self.catalog.query(f'演算法={name}').names, [name])
+        self.assertEqual(self.catalog.count('演算法~#4999, 計算複雜度>=極低'), 1)
+
+    def test_invalid_constraints_rejected(self):
+        """測試不存在的等級、欄位或運算子拋出 ValueError"""
+        for constraints in ['記憶體需求<=超高', '不存在>=高', '記憶體需求~中', 'GPU>1']:
+            with self.assertRaises(ValueError):
+                self.catalog.count(constraints)
+
+    def test_generators_accept_subsets(self):
+        """測試查詢回傳的子集可直接交給圖表生成器"""
+        subset = self.catalog.query('適用場景~預測', limit=8)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            generator = EnhancedChartGenerator(FontManager(), Path(temp_dir), dpi=30)
+            self.assertEqual(generator.render_charts(subset, ['pie', 'bar']), {'pie': None, 'bar': None})
+
+
+class TestDataManagerCatalog(unittest.TestCase):
+    """DataManager 的目錄資料庫測試"""
+
+    def test_catalog_rebuilt_when_csv_changes(self):
+        """測試資料庫依 CSV 自動建立，CSV 變更後重建"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_manager = DataManager(Path(temp_dir), storage='npy')
+            df = data_manager.create_algorithm_dataframe()
+            data_manager.save_data_to_csv(df)
+
+            self.assertEqual(len(data_manager.query_catalog('可平行化>=高')), 6)
+            self.assertTrue((Path(temp_dir) / 'algorithms.sqlite').exists())
+
+            df.loc[0, '可平行化'] = '高'
+            data_manager.save_data_to_csv(df)
+            subset = data_manager.query_catalog('可平行化>=高')
+            self.assertEqual(len(subset), 7)
+            self.assertEqual(subset.names[0], 'ARIMA')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+圖表 HTTP 服務測試模組
+"""
+
+import io
+import json
+import sys
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+# 添加專案路徑
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from PIL import Image
+
+from src.chart_service import (ChartHTTPServer, ChartService, RenderLRU, ServiceBusy,
+                               content_etag, etag_matches, parse_chart_request)
+from src.data_manager import DataManager
+from src.render_output import RenderedChart
+
+
+def fetch(url, headers=None):
+    """送出 GET 請求，回傳 (狀態碼, 標頭, 內容)；錯誤狀態碼不拋出例外"""
+    try:
+        with urlopen(Request(url, headers=headers or {}), timeout=60) as response:
+            return response.status, response.headers, response.read()
+    except HTTPError as e:
+        return e.code, e.headers, e.read()
+
+
+class TestChartServiceHelpers(unittest.TestCase):
+    """請求解析、ETag 與 LRU 測試"""
+
+    def test_parse_chart_request(self):
+        """測試預設值與不合法參數"""
+        self.assertEqual(parse_chart_request('bar', {}), ('bar', 'professional', 100, 'png'))
+        self.assertEqual(parse_chart_request('pie', {'dpi': ['50'], 'format': ['SVG']}),
+                         ('pie', 'professional', 50, 'svg'))
+        with self.assertRaises(LookupError):
+            parse_chart_request('timeline', {})
+        for query in ({'theme': ['neon']}, {'dpi': ['abc']}, {'dpi': ['5000']}, {'format': ['gif']}):
+            with self.assertRaises(ValueError):
+                parse_chart_request('bar', query)
+
+    def test_etag_matches(self):
+        """測試 If-None-Match 的多值、萬用字元與弱比較"""
+        etag = content_etag(b'chart')
+        self.assertTrue(etag_matches(etag, etag))
+        self.assertTrue(etag_matches(f'"other", W/{etag}', etag))
+        self.assertTrue(etag_matches('*', etag))
+        self.assertFalse(etag_matches('"other"', etag))
+        self.assertFalse(etag_matches(None, etag))
+
+    def test_lru_evicts_by_entries_and_bytes(self):
+        """測試超過項目數或位元組上限時淘汰最久未使用的項目"""
+        def entry(size):
+            return {'chart': RenderedChart('chart', b'<svg' + b' ' * (size - 4), 'svg'), 'etag': ''}
+
+        cache = RenderLRU(max_entries=2, max_bytes=100)
+        cache.put('a', entry(10))
+        cache.put('b', entry(10))
+        cache.get('a')
+        cache.put('c', entry(10))
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('a'))
+
+        cache.put('d', entry(95))
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.nbytes, 95)
+        cache.put('e', entry(200))
+        self.assertIsNone(cache.get('e'))
+        self.assertEqual(cache.evictions, 3)
+
+
+class TestChartService(unittest.TestCase):
+    """HTTP 服務端對端測試（單一常駐工作行程）"""
+
+    @classmethod
+    def setUpClass(cls):
+        table = DataManager(storage=None).create_algorithm_table()
+        cls.service = ChartService(table, workers=1, concurrency=2).start()
+        cls.server = ChartHTTPServer(('127.0.0.1', 0), cls.service, quiet=True)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f'http://127.0.0.1:{cls.server.server_address[1]}'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.service.close()
+
+    def test_render_etag_and_cache(self):
+        """測試首次渲染、快取命中與 If-None-Match 回應 304"""
+        url = f'{self.base_url}/chart/pie?dpi=30'
+        status, headers, body = fetch(url)
+        self.assertEqual(status, 200)
+        self.assertEqual(headers['Content-Type'], 'image/png')
+        self.assertEqual(headers['ETag'], content_etag(body))
+        self.assertEqual(headers['X-Cache'], 'miss')
+        with Image.open(io.BytesIO(body)) as image:
+            self.assertEqual(image.format, 'PNG')
+
+        status, headers, cached = fetch(url)
+        self.assertEqual((status, headers['X-Cache'], cached), (200, 'hit', body))
+
+        status, headers, empty = fetch(url, {'If-None-Match': headers['ETag']})
+        self.assertEqual((status, empty), (304, b''))
+        self.assertEqual(headers['ETag'], content_etag(body))
+
+        status, headers, svg = fetch(f'{self.base_url}/chart/pie?dpi=30&format=svg&theme=dark')
+        self.assertEqual(status, 200)
+        self.assertEqual(headers['Content-Type'], 'image/svg+xml')
+        self.assertNotEqual(headers['ETag'], content_etag(body))
+
+    def test_concurrent_identical_requests_render_once(self):
+        """測試同時送出的相同請求只渲染一次，且都由同一個預熱過的工作行程處理"""
+        misses = self.service.stats['misses']
+        url = f'{self.base_url}/chart/bar?dpi=25'
+        with ThreadPoolExecutor(4) as pool:
+            responses = list(pool.map(fetch, [url] * 4))
+        self.assertEqual({status for status, _, _ in responses}, {200})
+        self.assertEqual(len({body for _, _, body in responses}), 1)
+        self.assertEqual(self.service.stats['misses'], misses + 1)
+
+        status, _, body = fetch(f'{self.base_url}/health')
+        health = json.loads(body)
+        self.assertEqual(status, 200)
+        self.assertEqual(len(health['workers']), 1)
+        self.assertGreaterEqual(health['cache']['entries'], 1)
+
+    def test_errors(self):
+        """測試不合法參數回應 400、未知路徑或圖表類型回應 404、渲染名額已滿時拋出 ServiceBusy"""
+        self.assertEqual(fetch(f'{self.base_url}/chart/bar?dpi=1')[0], 400)
+        self.assertEqual(fetch(f'{self.base_url}/chart/bar?format=gif')[0], 400)
+        self.assertEqual(fetch(f'{self.base_url}/chart/timeline')[0], 404)
+        self.assertEqual(fetch(f'{self.base_url}/charts')[0], 404)
+
+        service = ChartService(workers=1, concurrency=1, queue_timeout=0)
+        # 尚未啟動時明確拋出錯誤，名額隨即歸還
+        with self.assertRaisesRegex(RuntimeError, '尚未啟動'):
+            service.render('bar')
+        service._slots.acquire()
+        with self.assertRaises(ServiceBusy):
+            service.render('bar')
+        self.assertEqual(service.stats['busy'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
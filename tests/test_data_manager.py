@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+數據管理模組的持久化測試
+"""
+
+import os
+import stat
+import tempfile
+import threading
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+# 添加專案路徑
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+import pandas as pd
+
+from src.columnar_store import ColumnarStore, NpyBackend, PYARROW_AVAILABLE
+from src.data_manager import DataManager
+from src.utils import write_if_changed
+
+
+class TestSaveDataToCsv(unittest.TestCase):
+    """CSV 保存測試"""
+
+    def setUp(self):
+        """測試前置設定"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_path = Path(self.temp_dir.name)
+        self.data_manager = DataManager(self.data_path)
+        self.df = self.data_manager.create_algorithm_dataframe()
+        self.csv_path = self.data_path / "algorithms.csv"
+
+    def tearDown(self):
+        """清理暫存目錄"""
+        self.temp_dir.cleanup()
+
+    def test_unchanged_data_is_not_rewritten(self):
+        """測試內容相同時不重寫檔案，修改時間保持不變"""
+        self.assertTrue(self.data_manager.save_data_to_csv(self.df))
+        os.utime(self.csv_path, (0, 0))
+
+        self.assertFalse(self.data_manager.save_data_to_csv(self.df))
+        self.assertEqual(self.csv_path.stat().st_mtime, 0)
+
+        changed = self.df.copy()
+        changed.loc[0, '記憶體需求'] = '極高'
+        self.assertTrue(self.data_manager.save_data_to_csv(changed))
+        self.assertNotEqual(self.csv_path.stat().st_mtime, 0)
+        self.assertEqual(self.data_manager.load_data_from_csv().loc[0, '記憶體需求'], '極高')
+
+    def test_saved_file_matches_pandas_output(self):
+        """測試輸出與 pandas 直接寫檔相同（含 BOM）"""
+        self.data_manager.save_data_to_csv(self.df)
+        reference = self.data_path / "reference.csv"
+        self.df.to_csv(reference, index=False, encoding='utf-8-sig')
+        self.assertEqual(self.csv_path.read_bytes(), reference.read_bytes())
+
+    def test_failed_write_keeps_previous_file(self):
+        """測試寫入中斷時保留原檔，且不留下暫存檔"""
+        write_if_changed(self.csv_path, b'old')
+        with mock.patch('src.utils.os.replace', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                write_if_changed(self.csv_path, b'new content')
+
+        self.assertEqual(self.csv_path.read_bytes(), b'old')
+        self.assertEqual(os.listdir(self.data_path), ['algorithms.csv'])
+
+    def test_write_keeps_mode_and_honours_umask(self):
+        """測試原子寫入保留現有檔案的權限，新檔依 umask 設定而非暫存檔的 0600"""
+        write_if_changed(self.csv_path, b'old')
+        umask = os.umask(0)
+        os.umask(umask)
+        self.assertEqual(stat.S_IMODE(self.csv_path.stat().st_mode), 0o666 & ~umask)
+
+        os.chmod(self.csv_path, 0o640)
+        write_if_changed(self.csv_path, b'new content')
+        self.assertEqual(stat.S_IMODE(self.csv_path.stat().st_mode), 0o640)
+
+
+class TestColumnarStorage(unittest.TestCase):
+    """欄位式儲存測試"""
+
+    def setUp(self):
+        """測試前置設定"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_path = Path(self.temp_dir.name)
+        self.data_manager = DataManager(self.data_path, storage='npy')
+        self.df = self.data_manager.create_synthetic_catalog(500)
+        self.df.loc[3, '適用場景'] = np.nan
+        self.df.to_csv(self.data_path / "algorithms.csv", index=False, encoding='utf-8-sig')
+
+    def tearDown(self):
+        """清理暫存目錄"""
+        self.temp_dir.cleanup()
+
+    def test_csv_converted_once_and_matches(self):
+        """測試第一次載入自動轉換，之後不再解析 CSV，且內容與編碼與 CSV 相同"""
+        reference = pd.read_csv(self.data_path / "algorithms.csv")
+        first = self.data_manager.load_table_from_csv()
+        self.assertTrue((self.data_path / ".columnar" / "algorithms" / "schema.json").exists())
+
+        with mock.patch('src.data_manager.pd.read_csv') as read_csv:
+            stored = self.data_manager.load_table_from_csv()
+            frame = self.data_manager.load_data_from_csv()
+        read_csv.assert_not_called()
+
+        pd.testing.assert_frame_equal(stored.frame, reference)
+        pd.testing.assert_frame_equal(frame, reference)
+        for column in first.levels:
+            np.testing.assert_array_equal(stored.level(column), first.level(column))
+        np.testing.assert_array_equal(stored.flags['GPU'], first.flags['GPU'])
+        np.testing.assert_array_equal(stored.scenario_codes, first.scenario_codes)
+
+    def test_reads_only_requested_columns(self):
+        """測試只讀取指定欄位，編碼仍完整"""
+        self.data_manager.load_table_from_csv()
+        table = self.data_manager.load_table_from_csv(columns=['記憶體需求'])
+        self.assertEqual(list(table.columns), ['記憶體需求'])
+        self.assertEqual(len(table), 500)
+        self.assertEqual(len(table.level('計算複雜度')), 500)
+
+    def test_changed_csv_is_reconverted(self):
+        """測試 CSV 內容變更後重新轉換"""
+        self.data_manager.load_table_from_csv()
+        changed = self.df.copy()
+        changed.loc[0, '記憶體需求'] = '極高'
+        self.data_manager.save_data_to_csv(changed)
+        self.assertEqual(self.data_manager.load_data_from_csv().loc[0, '記憶體需求'], '極高')
+
+    def test_benchmark_results_roundtrip(self):
+        """測試效能數據以欄位式儲存保存與部分載入"""
+        performance = {'algorithms': ['1', '2'], 'execution_time': [1.5, 2.5],
+                       'accuracy': [60.0, 55.0], 'memory_usage': [0.1, 0.2]}
+        self.data_manager.save_benchmark_results(performance)
+        loaded = self.data_manager.load_benchmark_results(['execution_time'])
+        self.assertEqual(list(loaded.columns), ['execution_time'])
+        self.assertEqual(loaded['execution_time'].tolist(), [1.5, 2.5])
+
+    def test_concurrent_saves_keep_each_generation_until_swapped(self):
+        """測試並行寫入時後到的寫入端等待寫入鎖，不會刪除尚未切換的世代"""
+        writer = ColumnarStore(self.data_path / ".store", 'npy')
+        other = ColumnarStore(self.data_path / ".store", 'npy')
+        changed = self.df.copy()
+        changed.loc[0, '記憶體需求'] = '極高'
+        finished = threading.Event()
+
+        def concurrent_save():
+            other.save('algorithms', changed)
+            finished.set()
+
+        thread = threading.Thread(target=concurrent_save)
+        test = self
+
+        class SlowBackend(NpyBackend):
+            def write(self, data_dir, frame):
+                # 寫入途中另一個寫入端開始保存，須等到這次保存完成
+                thread.start()
+                test.assertFalse(finished.wait(0.3))
+                return super().write(data_dir, frame)
+
+        writer.backend = SlowBackend()
+        writer.save('algorithms', self.df)
+        thread.join()
+
+        self.assertEqual(writer.load('algorithms').loc[0, '記憶體需求'], '極高')
+        generations = [path for path in (self.data_path / ".store" / "algorithms").iterdir() if path.is_dir()]
+        self.assertEqual([path.name for path in generations], [writer.schema('algorithms')['generation']])
+
+    def test_load_retries_when_generation_is_replaced(self):
+        """測試讀取到的世代在開啟前被並行的寫入端取代並刪除時，改讀新的世代"""
+        store = ColumnarStore(self.data_path / ".store", 'npy')
+        store.save('algorithms', self.df)
+        changed = self.df.copy()
+        changed.loc[0, '記憶體需求'] = '極高'
+        original_read = NpyBackend.read
+        replaced = []
+
+        def racing_read(backend, data_dir, schema, columns):
+            if not replaced:
+                # 讀取端解析 schema.json 之後、開啟檔案之前，另一個寫入端完成保存
+                replaced.append(data_dir)
+                ColumnarStore(self.data_path / ".store", 'npy').save('algorithms', changed)
+            return original_read(backend, data_dir, schema, columns)
+
+        with mock.patch.object(NpyBackend, 'read', racing_read):
+            frame = store.load('algorithms', ['記憶體需求'])
+        self.assertFalse(replaced[0].exists())
+        self.assertEqual(frame.loc[0, '記憶體需求'], '極高')
+
+    def test_storage_disabled_or_unavailable(self):
+        """測試可停用欄位式儲存；未安裝 pyarrow 時 arrow 後端拋出 ImportError"""
+        DataManager(self.data_path, storage=None).load_data_from_csv()
+        self.assertFalse((self.data_path / ".columnar").exists())
+        if not PYARROW_AVAILABLE:
+            with self.assertRaises(ImportError):
+                ColumnarStore(self.data_path, 'arrow')
+
+
+if __name__ == '__main__':
+    unittest.main()
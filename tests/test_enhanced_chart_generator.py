@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+增強版圖表生成器測試模組
+"""
+
+import unittest
+import shutil
+import sys
+from pathlib import Path
+
+# 添加專案路徑
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import pandas as pd
+
+from src.font_manager import FontManager
+from src.data_manager import DataManager
+from src.enhanced_chart_generator import EnhancedChartGenerator
+from src.algorithm_table import AlgorithmTable
+
+
+class TestEnhancedChartGenerator(unittest.TestCase):
+    """增強版圖表生成器測試"""
+
+    def setUp(self):
+        """測試前置設定"""
+        self.test_output_dir = Path("test_output_enhanced")
+        self.font_manager = FontManager()
+        self.df = DataManager().create_algorithm_dataframe()
+
+    def test_parallel_output_matches_serial(self):
+        """測試平行渲染與序列渲染輸出完全一致"""
+        serial_dir = self.test_output_dir / "serial"
+        parallel_dir = self.test_output_dir / "parallel"
+
+        EnhancedChartGenerator(self.font_manager, serial_dir).create_enhanced_main_comparison(self.df)
+        EnhancedChartGenerator(self.font_manager, parallel_dir, n_jobs=2).create_enhanced_main_comparison(self.df)
+
+        serial_files = sorted(p.name for p in serial_dir.glob("*.png"))
+        self.assertEqual(len(serial_files), len(EnhancedChartGenerator.CHART_TYPES))
+        for name in serial_files:
+            self.assertEqual((serial_dir / name).read_bytes(),
+                             (parallel_dir / name).read_bytes(), name)
+
+    def test_theme_does_not_leak_into_global_rcparams(self):
+        """測試主題樣式只作用於圖表本身，不修改全局 rcParams"""
+        before = dict(plt.rcParams)
+        generator = EnhancedChartGenerator(self.font_manager, self.test_output_dir, theme='cyberpunk')
+        generator.create_single_chart(self.df, 'pie')
+
+        self.assertTrue((self.test_output_dir / "enhanced_pie_scenarios.png").exists())
+        self.assertEqual(plt.rcParams['figure.facecolor'], before['figure.facecolor'])
+        self.assertEqual(plt.rcParams['text.color'], before['text.color'])
+
+    def test_large_catalog_mode(self):
+        """測試大型目錄改用密度分箱與分頁對照表"""
+        catalog = DataManager().create_synthetic_catalog(2000)
+        generator = EnhancedChartGenerator(self.font_manager, self.test_output_dir)
+        self.assertTrue(generator.is_large_catalog(AlgorithmTable.from_frame(catalog)))
+
+        generator.create_enhanced_main_comparison(catalog)
+
+        for spec in EnhancedChartGenerator.CHART_TYPES.values():
+            self.assertTrue((self.test_output_dir / spec['filename']).exists(), spec['filename'])
+        legend = pd.read_csv(self.test_output_dir / EnhancedChartGenerator.LEGEND_FILENAME)
+        self.assertEqual(len(legend), 2000)
+        self.assertEqual(legend['頁'].max(), -(-2000 // EnhancedChartGenerator.LEGEND_PAGE_SIZE))
+
+    def tearDown(self):
+        """測試清理"""
+        if self.test_output_dir.exists():
+            shutil.rmtree(self.test_output_dir)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
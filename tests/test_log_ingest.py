@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+基準測試紀錄串流匯入測試模組
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# 添加專案路徑
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+import pandas as pd
+
+from src.data_manager import DataManager
+from src.log_ingest import QuantileSketch, ingest_benchmark_log
+
+
+class TestLogIngest(unittest.TestCase):
+    """串流匯入測試"""
+
+    @classmethod
+    def setUpClass(cls):
+        """產生一份模擬紀錄（含缺值與多餘欄位）"""
+        rng = np.random.default_rng(0)
+        n = 20000
+        cls.log = pd.DataFrame({
+            'algorithm': rng.choice(['ARIMA', 'LSTM', 'XGBoost'], n),
+            'time_ms': rng.lognormal(3, 1, n),
+            'peak_memory_mb': rng.gamma(2, 5, n),
+            'accuracy': rng.uniform(40, 90, n),
+            'host': 'bench-01'
+        })
+        cls.log.loc[5, 'accuracy'] = np.nan
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.csv_path = Path(cls.temp_dir.name) / 'runs.csv'
+        cls.log.to_csv(cls.csv_path, index=False)
+        # 以讀回的數值比較，避免浮點數文字轉換的誤差
+        cls.log = pd.read_csv(cls.csv_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def test_chunked_stats_match_pandas(self):
+        """測試分塊累計的統計量與一次載入整個檔案相同"""
+        aggregator = ingest_benchmark_log(self.csv_path, chunksize=3000)
+        self.assertEqual(aggregator.rows, len(self.log))
+        self.assertEqual(aggregator.algorithms, list(self.log['algorithm'].unique()))
+
+        summary = aggregator.summary().set_index(['metric', 'algorithm'])
+        for metric, column in [('time', 'time_ms'), ('accuracy', 'accuracy')]:
+            grouped = self.log.groupby('algorithm')[column]
+            rows = summary.loc[metric].loc[grouped.mean().index]
+            np.testing.assert_array_equal(rows['count'], grouped.count())
+            np.testing.assert_allclose(rows['mean'], grouped.mean(), rtol=1e-10)
+            np.testing.assert_allclose(rows['std'], grouped.std(ddof=0), rtol=1e-8)
+            np.testing.assert_array_equal(rows['min'], grouped.min())
+            np.testing.assert_array_equal(rows['max'], grouped.max())
+
+    def test_quantiles_within_relative_accuracy(self):
+        """測試近似分位數的相對誤差不超過設定值"""
+        aggregator = ingest_benchmark_log(self.csv_path, chunksize=7000, relative_accuracy=0.01)
+        for algorithm, times in self.log.groupby('algorithm')['time_ms']:
+            estimates = aggregator.sketches['time'].quantiles(algorithm, [0.5, 0.9, 0.99])
+            exact = np.quantile(times, [0.5, 0.9, 0.99], method='lower')
+            np.testing.assert_allclose(estimates, exact, rtol=0.0101)
+        self.assertEqual(QuantileSketch().buckets([0.0, -1.0])[0], QuantileSketch.ZERO_BUCKET)
+
+    def test_jsonl_and_column_mapping(self):
+        """測試 JSONL 紀錄與自訂欄位名稱"""
+        jsonl_path = Path(self.temp_dir.name) / 'runs.jsonl'
+        self.log.rename(columns={'time_ms': 'elapsed'}).to_json(jsonl_path, orient='records', lines=True)
+        aggregator = ingest_benchmark_log(jsonl_path, chunksize=4000, columns={'time': 'elapsed'})
+        means = aggregator.summary().set_index(['metric', 'algorithm']).loc['time', 'mean']
+        np.testing.assert_allclose(means.sort_index(), self.log.groupby('algorithm')['time_ms'].mean(), rtol=1e-10)
+
+    def test_performance_data_uses_catalog_numbers(self):
+        """測試 DataManager 回傳的效能數據以目錄編號標示，並略過目錄外的演算法"""
+        catalog = ['SVM', 'LSTM', 'ARIMA']
+        data = DataManager(storage=None).ingest_benchmark_log(self.csv_path, catalog, chunksize=5000)
+        self.assertEqual(data['algorithms'], ['2', '3'])
+        self.assertEqual(set(data), {'algorithms', 'execution_time', 'accuracy', 'memory_usage'})
+        expected = self.log.groupby('algorithm')['peak_memory_mb'].mean()
+        np.testing.assert_allclose(data['memory_usage'], expected[['LSTM', 'ARIMA']], rtol=1e-10)
+
+
+if __name__ == '__main__':
+    unittest.main()
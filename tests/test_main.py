@@ -13,6 +13,7 @@ sys.path.insert(0, str(project_root / "src"))
 
 try:
     from simplified_main import AlgorithmComparisonGenerator, create_algorithm_dataframe
+    from src.algorithm_table import AlgorithmTable
 except ImportError:
     print("無法導入主模組，請檢查專案結構")
 
@@ -54,9 +55,9 @@ class TestAlgorithmComparison(unittest.TestCase):
     
     def test_complexity_mapping(self):
         """測試複雜度映射"""
-        complexity_map = self.generator.complexity_map
-        self.assertEqual(complexity_map['極低'], 1)
-        self.assertEqual(complexity_map['極高'], 6)
+        complexity = AlgorithmTable.ensure(self.df).level('計算複雜度')
+        self.assertEqual(complexity[list(self.df['計算複雜度']).index('極低')], 1)
+        self.assertEqual(complexity[list(self.df['計算複雜度']).index('極高')], 6)
     
     def tearDown(self):
         """測試清理"""
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+總覽圖拼接模組的測試
+"""
+
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+
+import matplotlib
+matplotlib.use('Agg')  # 使用非互動式後端
+from PIL import Image
+
+# 添加專案路徑
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.overview_compositor import OverviewCompositor
+from src.font_manager import FontManager
+from src.chart_generator import ChartGenerator
+
+
+class TestOverviewCompositor(unittest.TestCase):
+    """總覽圖拼接測試"""
+
+    def setUp(self):
+        """測試前置設定"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+        self.tiles = []
+        for index, color in enumerate(['red', 'lime', 'blue', 'yellow', 'cyan']):
+            path = self.output_dir / f"tile_{index}.png"
+            Image.new('RGBA', (300, 200), color).save(path)
+            self.tiles.append(path)
+
+    def tearDown(self):
+        """清理暫存目錄"""
+        self.temp_dir.cleanup()
+
+    def test_tiles_placed_in_grid(self):
+        """測試圖檔依網格順序縮放貼上，輸出尺寸與解析度符合設定"""
+        compositor = OverviewCompositor(figsize=(6, 4), dpi=100, columns=3, padding=0)
+        output_path = compositor.compose(self.tiles, self.output_dir / "overview.png")
+
+        with Image.open(output_path) as overview:
+            self.assertEqual(overview.size, (600, 400))
+            self.assertEqual(round(overview.info['dpi'][0]), 100)
+            # 每格 200x200，300x200 的圖縮為 200x133 並垂直置中
+            self.assertEqual(overview.getpixel((100, 100)), (255, 0, 0))
+            self.assertEqual(overview.getpixel((300, 100)), (0, 255, 0))
+            self.assertEqual(overview.getpixel((500, 300)), (255, 255, 255))  # 空格
+            self.assertEqual(overview.getpixel((100, 10)), (255, 255, 255))   # 置中留白
+
+    def test_empty_tiles_rejected(self):
+        """測試沒有圖檔時拋出例外"""
+        with self.assertRaises(ValueError):
+            OverviewCompositor().compose([], self.output_dir / "overview.png")
+
+    def test_chart_generator_overview(self):
+        """測試 ChartGenerator 以 main_comparison 的尺寸拼接總覽圖"""
+        generator = ChartGenerator(FontManager(), self.output_dir, show=False)
+        output_path = generator.compose_overview(self.tiles)
+
+        self.assertEqual(output_path.name, 'ultra_enhanced_algorithm_comparison.png')
+        with Image.open(output_path) as overview:
+            self.assertEqual(overview.size, (24 * 300, 18 * 300))
+
+
+if __name__ == '__main__':
+    unittest.main()
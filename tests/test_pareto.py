@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Pareto 前緣計算與前緣圖測試模組
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# 添加專案路徑
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+
+from src.data_manager import DataManager
+from src.enhanced_chart_generator import EnhancedChartGenerator
+from src.font_manager import FontManager
+from src.pareto import pareto_mask
+
+
+def brute_force_front(points):
+    """逐對比較的參考實作（越小越好）"""
+    front = np.ones(len(points), dtype=bool)
+    for i, point in enumerate(points):
+        dominates = (points <= point).all(axis=1) & (points < point).any(axis=1)
+        front[i] = not dominates.any()
+    return front
+
+
+class TestParetoFront(unittest.TestCase):
+    """Pareto 前緣計算測試"""
+
+    def test_matches_brute_force_with_ties(self):
+        """測試 2 / 3 個目標（含大量同值與重複列）與逐對比較相同"""
+        rng = np.random.default_rng(0)
+        for objectives in (2, 3):
+            for _ in range(50):
+                points = rng.integers(0, 5, (rng.integers(1, 60), objectives)).astype(float)
+                np.testing.assert_array_equal(pareto_mask(points), brute_force_front(points))
+
+    def test_directions_and_missing_values(self):
+        """測試準確度越大越好，含缺值的配置不列入前緣"""
+        performance = {
+            'algorithms': ['1', '2', '3', '4', '5'],
+            'execution_time': [10.0, 20.0, 5.0, 10.0, np.nan],
+            'accuracy': [80.0, 90.0, 60.0, 70.0, 99.0],
+            'memory_usage': [1.0, 1.0, 1.0, 0.5, 0.1]
+        }
+        data_manager = DataManager(storage=None)
+        self.assertEqual(data_manager.pareto_front(performance, ['execution_time', 'accuracy']).tolist(),
+                         [True, True, True, False, False])
+        self.assertEqual(data_manager.pareto_front(performance).tolist(), [True, True, True, True, False])
+        with self.assertRaises(ValueError):
+            data_manager.pareto_front(performance, ['latency', 'accuracy'])
+        with self.assertRaises(ValueError):
+            pareto_mask(np.zeros((3, 4)))
+
+    def test_large_input(self):
+        """測試 10 萬個配置的 3 目標前緣與分段逐對比較一致"""
+        rng = np.random.default_rng(1)
+        points = rng.random((100000, 3))
+        front = pareto_mask(points)
+        candidates = points[front]
+        # 前緣點彼此不支配，且每個被支配的點都被某個前緣點支配
+        np.testing.assert_array_equal(brute_force_front(candidates), np.ones(len(candidates), dtype=bool))
+        for point in points[~front][::997]:
+            self.assertTrue(((candidates <= point).all(axis=1) & (candidates < point).any(axis=1)).any())
+
+
+class TestParetoChart(unittest.TestCase):
+    """Pareto 前緣圖測試"""
+
+    def test_chart_thins_dominated_points(self):
+        """測試前緣圖輸出，被支配的點抽樣到上限"""
+        rng = np.random.default_rng(2)
+        n = 5000
+        performance = {'algorithms': [str(i + 1) for i in range(n)],
+                       'execution_time': rng.lognormal(3, 1, n), 'memory_usage': rng.gamma(2, 5, n),
+                       'accuracy': rng.uniform(40, 90, n)}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            generator = EnhancedChartGenerator(FontManager(), Path(temp_dir), dpi=30)
+            generator.PARETO_MAX_DOMINATED = 100
+            front = generator.create_pareto_frontier_chart(performance)
+            self.assertTrue((Path(temp_dir) / 'pareto_frontier.png').exists())
+            np.testing.assert_array_equal(front, DataManager(storage=None).pareto_front(performance))
+
+            front_2d = generator.create_pareto_frontier_chart(
+                performance, objectives=['execution_time', 'accuracy'], show_dominated=False)
+            self.assertLess(front_2d.sum(), front.sum())
+
+
+if __name__ == '__main__':
+    unittest.main()
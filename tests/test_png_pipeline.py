@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+背景 PNG 編碼管線測試模組
+"""
+
+import contextlib
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# 添加專案路徑
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from PIL import Image
+
+from config.chart_config import ChartConfig
+from src.chart_generator import ChartGenerator
+from src.data_manager import DataManager
+from src.enhanced_chart_generator import EnhancedChartGenerator
+from src.font_manager import FontManager
+from src.png_pipeline import PngPipeline
+from src.render_cache import RenderCache
+from src.render_output import encode_figure
+from src.utils import generate_report_summary
+
+
+class TestPngPipeline(unittest.TestCase):
+    """背景編碼、壓縮設定與統計測試"""
+
+    def setUp(self):
+        """測試前置設定"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+        self.table = DataManager(storage=None).create_algorithm_table()
+        self.font_manager = FontManager()
+
+    def tearDown(self):
+        """清理暫存目錄"""
+        self.temp_dir.cleanup()
+
+    def test_default_settings_match_savefig(self):
+        """測試預設設定與 savefig 輸出逐位元組相同，量化與壓縮等級依設定改變大小"""
+        fig, ax = plt.subplots(figsize=(4, 3))
+        ax.bar(range(5), [3, 1, 4, 1, 5], color='tab:blue')
+        options = {'bbox_inches': 'tight', 'facecolor': 'white'}
+        expected = encode_figure(fig, 'bar', 'png', 80, **options).data
+
+        with PngPipeline() as pipeline:
+            chart = pipeline.submit(fig, 'bar', 80, **options).result()
+        self.assertEqual(chart.data, expected)
+        self.assertEqual(pipeline.stats()['bytes_saved'], 0)
+
+        with PngPipeline(colors=16, compare=True) as pipeline, PngPipeline(compress_level=1) as fast_pipeline:
+            quantized = pipeline.submit(fig, 'bar', 80, output_path=self.output_dir / 'bar.png', **options)
+            fast = fast_pipeline.submit(fig, 'fast', 80, **options)
+        plt.close(fig)
+        with Image.open(self.output_dir / 'bar.png') as image:
+            self.assertEqual(image.mode, 'P')
+        self.assertEqual(quantized.result().path, self.output_dir / 'bar.png')
+        record = pipeline.stats()['charts'][0]
+        self.assertEqual(record['baseline_bytes'], len(expected))
+        self.assertGreater(record['bytes_saved'], 0)
+        self.assertGreater(len(fast.result().data), len(expected))
+        # 未要求比較時不另外以預設設定編碼
+        self.assertIsNone(fast_pipeline.stats()['bytes_saved'])
+
+        with self.assertRaises(ValueError):
+            PngPipeline(compress_level=10)
+        with self.assertRaises(ValueError):
+            PngPipeline(colors=1)
+
+    def test_generators_write_after_background_encoding(self):
+        """測試生成器以背景編碼輸出相同檔案，寫檔完成後才存入渲染快取與拼接總覽"""
+        direct = EnhancedChartGenerator(self.font_manager, self.output_dir / 'direct', dpi=50)
+        direct.render_charts(self.table, ['pie', 'bar'])
+
+        cache = RenderCache(self.output_dir / '.render_cache')
+        with PngPipeline() as pipeline:
+            generator = EnhancedChartGenerator(self.font_manager, self.output_dir / 'pipelined', dpi=50,
+                                               render_cache=cache, png_pipeline=pipeline)
+            self.assertEqual(generator.render_charts(self.table, ['pie', 'bar']), {'pie': None, 'bar': None})
+            for name in ('enhanced_pie_scenarios.png', 'enhanced_bar_memory.png'):
+                self.assertEqual((generator.output_dir / name).read_bytes(),
+                                 (direct.output_dir / name).read_bytes())
+            self.assertEqual(cache.stats()['entries'], 2)
+
+            with contextlib.redirect_stdout(io.StringIO()), \
+                    mock.patch.dict(ChartConfig.CHART_STYLE, {'dpi': 30}):
+                standard = ChartGenerator(self.font_manager, self.output_dir / 'standard', show=False,
+                                          png_pipeline=pipeline)
+                standard.create_enhanced_main_comparison(self.table)
+            self.assertTrue((standard.output_dir / ChartConfig.OUTPUT_FILES['main_comparison']).exists())
+
+        stats = pipeline.stats()
+        self.assertEqual(len(stats['charts']), 7)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            generate_report_summary({}, encoding_stats=stats)
+        self.assertIn('enhanced_pie_scenarios: 主執行緒節省', output.getvalue())
+
+    def test_changed_settings_invalidate_cache_and_incremental(self):
+        """測試改變壓縮設定時增量渲染與渲染快取都不沿用上次的輸出"""
+        cache = RenderCache(self.output_dir / '.render_cache')
+        output = self.output_dir / 'enhanced_bar_memory.png'
+        sizes = []
+        for colors in (None, 16):
+            with PngPipeline(colors=colors) as pipeline:
+                generator = EnhancedChartGenerator(self.font_manager, self.output_dir, dpi=50, render_cache=cache,
+                                                   incremental=True, png_pipeline=pipeline)
+                generator.render_charts(self.table, ['bar'])
+            sizes.append(output.stat().st_size)
+            with Image.open(output) as image:
+                self.assertEqual(image.mode, 'P' if colors else 'RGBA')
+        self.assertLess(sizes[1], sizes[0])
+        self.assertEqual(cache.stats()['hits'], 0)
+
+    def test_parallel_workers_encode_with_same_settings(self):
+        """測試平行渲染時工作行程以相同的壓縮設定編碼，輸出與依序渲染相同"""
+        outputs = {}
+        for n_jobs in (2, 1):
+            with PngPipeline(colors=16) as pipeline:
+                generator = EnhancedChartGenerator(self.font_manager, self.output_dir / str(n_jobs), dpi=50,
+                                                   incremental=True, png_pipeline=pipeline)
+                self.assertEqual(generator.render_charts(self.table, ['bar', 'pie'], n_jobs=n_jobs),
+                                 {'bar': None, 'pie': None})
+            outputs[n_jobs] = generator.output_path('bar')
+            with Image.open(outputs[n_jobs]) as image:
+                self.assertEqual(image.mode, 'P')
+                self.assertLessEqual(len(image.getpalette()) // 3, 16)
+        self.assertEqual(outputs[2].read_bytes(), outputs[1].read_bytes())
+
+        # 渲染紀錄的設定鍵與實際編碼相同：相同設定不重畫，改變設定才重畫
+        with PngPipeline(colors=16) as pipeline:
+            same = EnhancedChartGenerator(self.font_manager, self.output_dir / '2', dpi=50,
+                                          incremental=True, png_pipeline=pipeline)
+            self.assertEqual(same.plan_incremental(self.table, ['bar', 'pie'])['stale'], [])
+        changed = EnhancedChartGenerator(self.font_manager, self.output_dir / '2', dpi=50,
+                                         incremental=True, png_pipeline=PngPipeline())
+        self.assertEqual(changed.plan_incremental(self.table, ['bar', 'pie'])['stale'], ['bar', 'pie'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+演算法推薦索引測試模組
+"""
+
+import io
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+# 添加專案路徑
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from src.algorithm_table import AlgorithmTable
+from src.catalog_db import CatalogDatabase
+from src.data_manager import DataManager
+from src.recommendation import RecommendationIndex, main, open_index
+
+
+class TestRecommendationIndex(unittest.TestCase):
+    """位元集合索引測試"""
+
+    @classmethod
+    def setUpClass(cls):
+        """以模擬目錄建立索引，並以 SQLite 目錄作為參考結果"""
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.table = AlgorithmTable.from_frame(DataManager(storage=None).create_synthetic_catalog(5000))
+        cls.index = RecommendationIndex.build(cls.table, Path(cls.temp_dir.name) / 'catalog.recidx')
+        cls.catalog = CatalogDatabase().import_table(cls.table)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.index.close()
+        cls.catalog.close()
+        cls.temp_dir.cleanup()
+
+    def test_matches_catalog_queries(self):
+        """測試各種條件的結果與 SQLite 目錄相同"""
+        for constraints in ['記憶體需求<=中, 可平行化>=高, 適用場景~預測', '計算複雜度>中-高', '計算複雜度<低',
+                            '算力需求=中, GPU=是', '記憶體需求!=中, 波動!=是', '場景分類=分類類',
+                            '場景分類!=預測類, 預測精度>=中-高', '適用場景=圖像特徵', '記憶體需求>極高', '']:
+            expected = self.catalog.row_numbers(constraints)
+            self.assertEqual(self.index.count(constraints), len(expected), constraints)
+            self.assertEqual(sorted(self.index.ranked_rows(constraints)), expected.tolist(), constraints)
+
+    def test_results_follow_ranking(self):
+        """測試結果依推薦排名排列（精度高、複雜度與記憶體低優先，同等級保持目錄順序）"""
+        rows = self.index.ranked_rows('適用場景~預測')
+        keys = [(-self.table.level('預測精度')[row], self.table.level('計算複雜度')[row],
+                 self.table.level('記憶體需求')[row], self.table.level('算力需求')[row],
+                 -self.table.level('可平行化')[row], row) for row in rows]
+        self.assertEqual(keys, sorted(keys))
+
+        top = self.index.recommend('適用場景~預測', limit=3)
+        self.assertEqual([result['編號'] for result in top], [row + 1 for row in rows[:3]])
+        self.assertEqual(top[0]['演算法'], self.table.names[rows[0]])
+        self.assertEqual(top[0]['記憶體需求'], self.table['記憶體需求'][rows[0]])
+
+    def test_invalid_constraints_rejected(self):
+        """測試不存在的等級、欄位或運算子拋出 ValueError"""
+        for constraints in ['記憶體需求<=超高', '不存在>=高', '記憶體需求~中', 'GPU>1', '場景分類=不存在']:
+            with self.assertRaises(ValueError):
+                self.index.count(constraints)
+
+
+class TestRecommendationCli(unittest.TestCase):
+    """推薦命令列測試"""
+
+    def setUp(self):
+        """測試前置設定"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_path = Path(self.temp_dir.name)
+        self.data_manager = DataManager(self.data_path, storage=None)
+        self.df = self.data_manager.create_algorithm_dataframe()
+        self.data_manager.save_data_to_csv(self.df)
+        self.csv_path = self.data_path / 'algorithms.csv'
+
+    def tearDown(self):
+        """清理暫存目錄"""
+        self.temp_dir.cleanup()
+
+    def run_cli(self, *argv):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            code = main(list(argv) + ['--data', str(self.csv_path)])
+        return code, output.getvalue()
+
+    def test_index_rebuilt_only_when_csv_changes(self):
+        """測試索引依 CSV 建立，之後直接開啟，CSV 變更後重建"""
+        self.assertEqual(len(self.data_manager.recommend('可平行化>=高', limit=None)), 6)
+        with mock.patch.object(DataManager, 'open_recommendation_index') as rebuild:
+            open_index(self.csv_path).close()
+        rebuild.assert_not_called()
+
+        self.df.loc[0, '可平行化'] = '高'
+        self.data_manager.save_data_to_csv(self.df)
+        results = self.data_manager.recommend('可平行化>=高', limit=None)
+        self.assertEqual(len(results), 7)
+        self.assertIn('ARIMA', [result['演算法'] for result in results])
+
+    def test_cli_output_and_errors(self):
+        """測試 JSON 輸出、數量模式與錯誤條件的結束代碼"""
+        code, output = self.run_cli('記憶體需求<=中, 可平行化>=高', '--json')
+        self.assertEqual(code, 0)
+        payload = json.loads(output.splitlines()[-1])
+        self.assertEqual(payload['count'], 1)
+        self.assertEqual(payload['results'][0]['演算法'], '基因演算法')
+
+        code, output = self.run_cli('適用場景~預測', '--count')
+        self.assertIn('符合條件: 3 個演算法', output)
+
+        with self.assertRaises(SystemExit) as context:
+            with redirect_stdout(io.StringIO()), mock.patch('sys.stderr', io.StringIO()):
+                self.run_cli('記憶體需求<=超高')
+        self.assertEqual(context.exception.code, 2)
+
+    def test_query_path_does_not_load_numpy(self):
+        """測試索引已建立時，命令列查詢不載入 NumPy 與 pandas"""
+        open_index(self.csv_path).close()
+        code = ("import sys; from src.recommendation import main; "
+                f"main(['--count', '--data', {str(self.csv_path)!r}]); "
+                "print(sorted(m for m in ('numpy', 'pandas') if m in sys.modules))")
+        result = subprocess.run([sys.executable, '-c', code], cwd=project_root,
+                                capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.splitlines()[-1], '[]')
+
+
+if __name__ == '__main__':
+    unittest.main()
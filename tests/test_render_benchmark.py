@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+渲染基準測試模組的測試
+"""
+
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+import matplotlib
+matplotlib.use('Agg')  # 使用非互動式後端
+
+# 添加專案路徑
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src import render_benchmark
+from src.render_benchmark import build_matrix, compare, load_baseline, save_baseline
+
+
+class TestRenderBenchmark(unittest.TestCase):
+    """渲染基準測試"""
+
+    def setUp(self):
+        """測試前置設定"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.baseline_path = Path(self.temp_dir.name) / "baseline.json"
+
+    def tearDown(self):
+        """清理暫存目錄"""
+        self.temp_dir.cleanup()
+
+    def test_matrix_expands_only_relevant_axes(self):
+        """測試只有依主題或 DPI 變化的案例才依該維度展開"""
+        matrix = build_matrix(themes=['professional', 'dark'], dpis=[100, 300], sizes=[10])
+        keys = {key for key, *_ in matrix}
+
+        self.assertIn('enhanced.pie|dark|300|10', keys)
+        self.assertIn('standard.main_comparison|dark|-|10', keys)
+        self.assertIn('simplified.summary_table|-|-|10', keys)
+        self.assertEqual(len([key for key in keys if key.startswith('enhanced.pie|')]), 4)
+
+        filtered = build_matrix(cases=['enhanced.b*'], themes=['dark'], dpis=[100], sizes=[10, 1000])
+        self.assertEqual({case for _, case, *_ in filtered}, {'enhanced.bar', 'enhanced.bubble'})
+
+    def test_compare_applies_tolerance_and_slack(self):
+        """測試超過 基準 × (1 + 容許比例) + 絕對容許毫秒 才算退化"""
+        baseline = {'results': {
+            'a': {'status': 'ok', 'median_ms': 1000.0},
+            'b': {'status': 'ok', 'median_ms': 10.0},
+            'c': {'status': 'ok', 'median_ms': 1000.0}
+        }}
+        results = {
+            'a': {'status': 'ok', 'median_ms': 1400.0},   # 上限 1300
+            'b': {'status': 'ok', 'median_ms': 40.0},     # 上限 62.5，短案例不誤判
+            'c': {'status': 'ok', 'median_ms': 500.0},
+            'd': {'status': 'ok', 'median_ms': 9999.0},   # 基準中沒有
+            'e': {'status': 'skipped', 'reason': ''}
+        }
+        regressions, improvements = compare(results, baseline, tolerance=0.25, min_slack_ms=50)
+
+        self.assertEqual([change['key'] for change in regressions], ['a'])
+        self.assertEqual([change['key'] for change in improvements], ['c'])
+
+    def test_save_baseline_merges_previous_results(self):
+        """測試更新基準時保留本次未量測的案例，且不寫入失敗或略過的案例"""
+        save_baseline({'a': {'status': 'ok', 'median_ms': 1.0}}, self.baseline_path)
+        save_baseline({'b': {'status': 'ok', 'median_ms': 2.0},
+                       'c': {'status': 'error', 'reason': 'x'}},
+                      self.baseline_path, load_baseline(self.baseline_path))
+
+        baseline = load_baseline(self.baseline_path)
+        self.assertEqual(set(baseline['results']), {'a', 'b'})
+        self.assertIn('matplotlib', baseline['environment'])
+        self.assertIsNone(load_baseline(Path(self.temp_dir.name) / "missing.json"))
+
+    def test_regression_gate_exit_code(self):
+        """測試快速執行：大型目錄略過不支援的方法，變慢超過基準時回傳結束代碼 1"""
+        argv = ['--quick', '--cases', 'enhanced.pie', 'simplified.summary_table',
+                '--sizes', '1000', '--baseline', str(self.baseline_path)]
+        self.assertEqual(render_benchmark.main(argv + ['--save-baseline']), render_benchmark.EXIT_OK)
+
+        baseline = load_baseline(self.baseline_path)
+        self.assertEqual(set(baseline['results']), {'enhanced.pie|professional|100|1000'})
+
+        # 把基準改成不可能達到的速度，模擬效能退化
+        baseline['results']['enhanced.pie|professional|100|1000']['median_ms'] = 0.001
+        save_baseline(baseline['results'], self.baseline_path)
+        self.assertEqual(render_benchmark.main(argv + ['--min-slack-ms', '0']),
+                         render_benchmark.EXIT_REGRESSION)
+
+    def test_failed_case_exit_code(self):
+        """測試圖表方法拋出例外時回傳結束代碼 3，即使沒有效能退化"""
+        argv = ['--quick', '--cases', 'enhanced.pie', '--baseline', str(self.baseline_path)]
+        with mock.patch.dict(render_benchmark.RENDER_CASES['enhanced.pie'],
+                             {'run': mock.Mock(side_effect=RuntimeError('broken'))}):
+            self.assertEqual(render_benchmark.main(argv), render_benchmark.EXIT_ERROR)
+
+
+if __name__ == '__main__':
+    unittest.main()
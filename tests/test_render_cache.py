@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+渲染快取測試模組
+"""
+
+import os
+import shutil
+import sys
+import unittest
+from pathlib import Path
+
+# 添加專案路徑
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import matplotlib
+matplotlib.use('Agg')
+
+from src.font_manager import FontManager
+from src.data_manager import DataManager
+from src.enhanced_chart_generator import EnhancedChartGenerator
+from src.render_cache import RenderCache, hash_dataframe_columns
+
+
+class TestRenderCache(unittest.TestCase):
+    """渲染快取測試"""
+
+    def setUp(self):
+        """測試前置設定"""
+        self.test_dir = Path("test_output_cache")
+        self.test_dir.mkdir(exist_ok=True)
+        self.df = DataManager().create_algorithm_dataframe()
+
+    def _make_artifact(self, name, size):
+        path = self.test_dir / name
+        path.write_bytes(b'x' * size)
+        return path
+
+    def test_column_hash_tracks_only_selected_columns(self):
+        """測試欄位雜湊只受指定欄位影響"""
+        changed = self.df.copy()
+        changed.loc[0, '記憶體需求'] = '極高'
+
+        self.assertEqual(hash_dataframe_columns(self.df, ['適用場景']),
+                         hash_dataframe_columns(changed, ['適用場景']))
+        self.assertNotEqual(hash_dataframe_columns(self.df, ['記憶體需求']),
+                            hash_dataframe_columns(changed, ['記憶體需求']))
+
+    def test_lru_eviction(self):
+        """測試超出容量時淘汰最久未使用的項目"""
+        cache = RenderCache(self.test_dir / "cache", max_bytes=250)
+        artifact = self._make_artifact("chart.png", 100)
+
+        cache.store('a' * 64, [artifact])
+        cache.store('b' * 64, [artifact])
+        # 讓 a 成為最近使用的項目
+        os.utime(cache._entry_dir('b' * 64), (0, 0))
+        self.assertTrue(cache.fetch('a' * 64, [artifact]))
+        cache.store('c' * 64, [artifact])
+
+        self.assertFalse(cache.fetch('b' * 64, [artifact]))
+        self.assertTrue(cache.fetch('c' * 64, [artifact]))
+        stats = cache.stats()
+        self.assertEqual(stats['entries'], 2)
+        self.assertEqual(stats['evictions'], 1)
+        self.assertEqual((stats['hits'], stats['misses']), (2, 1))
+
+    def test_generator_reuses_cached_chart(self):
+        """測試輸入未變更時圖表生成器直接沿用快取"""
+        cache = RenderCache(self.test_dir / "cache")
+        generator = EnhancedChartGenerator(FontManager(), self.test_dir / "charts",
+                                           render_cache=cache)
+        output_path = self.test_dir / "charts" / "enhanced_bar_memory.png"
+
+        self.assertFalse(generator._render_chart(self.df, 'bar'))
+        first_render = output_path.read_bytes()
+        output_path.unlink()
+        self.assertTrue(generator._render_chart(self.df, 'bar'))
+        self.assertEqual(output_path.read_bytes(), first_render)
+
+        # 不相關欄位的變更仍命中快取，相關欄位的變更則重新渲染
+        changed = self.df.copy()
+        changed.loc[0, '適用場景'] = '異常偵測'
+        self.assertTrue(generator._render_chart(changed, 'bar'))
+        changed.loc[0, '記憶體需求'] = '極高'
+        self.assertFalse(generator._render_chart(changed, 'bar'))
+
+    def tearDown(self):
+        """測試清理"""
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+增量渲染測試模組
+"""
+
+import shutil
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# 添加專案路徑
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import matplotlib
+matplotlib.use('Agg')
+
+from src.font_manager import FontManager
+from src.data_manager import DataManager
+from src.enhanced_chart_generator import EnhancedChartGenerator, render_multi_theme
+from src.render_manifest import RenderManifest
+
+
+class TestIncrementalRender(unittest.TestCase):
+    """增量渲染測試"""
+
+    def setUp(self):
+        """測試前置設定"""
+        self.test_dir = Path("test_output_manifest")
+        self.font_manager = FontManager()
+        self.df = DataManager().create_algorithm_dataframe()
+
+    def tearDown(self):
+        """測試清理"""
+        if self.test_dir.exists():
+            shutil.rmtree(self.test_dir)
+
+    def _render(self, df, dpi=30):
+        """以增量模式渲染全部圖表，回傳實際繪製的圖表類型"""
+        generator = EnhancedChartGenerator(self.font_manager, self.test_dir, dpi=dpi, incremental=True)
+        with mock.patch.object(EnhancedChartGenerator, '_draw_chart', autospec=True,
+                               side_effect=EnhancedChartGenerator._draw_chart) as draw:
+            errors = generator.render_charts(df)
+        self.assertTrue(all(error is None for error in errors.values()))
+        return [call.args[2] for call in draw.call_args_list]
+
+    def test_dependency_graph(self):
+        """測試欄位 → 圖表的相依關係"""
+        graph = EnhancedChartGenerator.dependency_graph()
+        self.assertEqual(graph['適用場景'], ['radar', 'pie'])
+        self.assertEqual(graph['記憶體需求'], ['bar', 'heatmap', 'radar', 'bubble'])
+
+    def test_only_charts_reading_changed_columns_rerender(self):
+        """測試只有讀取變更欄位的圖表重新渲染"""
+        self.assertEqual(self._render(self.df), list(EnhancedChartGenerator.CHART_TYPES))
+        self.assertEqual(self._render(self.df), [])
+
+        changed = self.df.copy()
+        changed.loc[0, '適用場景'] = '即時推論'
+        self.assertEqual(self._render(changed), ['radar', 'pie'])
+
+        changed.loc[0, '記憶體需求'] = '極高'
+        self.assertEqual(self._render(changed), ['bar', 'heatmap', 'radar', 'bubble'])
+
+    def test_missing_output_or_new_settings_rerender(self):
+        """測試輸出檔被刪除或渲染設定變更時重新渲染"""
+        self._render(self.df)
+        (self.test_dir / 'enhanced_radar.png').unlink()
+        self.assertEqual(self._render(self.df), ['radar'])
+        self.assertEqual(len(self._render(self.df, dpi=40)), len(EnhancedChartGenerator.CHART_TYPES))
+
+    def test_large_radar_follows_scenarios(self):
+        """測試大型目錄的雷達圖依適用場景分組，場景變更時重新渲染"""
+        catalog = DataManager(storage=None).create_synthetic_catalog(500)
+        self._render(catalog)
+        before = (self.test_dir / 'enhanced_radar.png').read_bytes()
+
+        changed = catalog.copy()
+        changed['適用場景'] = changed['適用場景'].iloc[::-1].to_numpy()
+        self.assertIn('radar', self._render(changed))
+        self.assertNotEqual((self.test_dir / 'enhanced_radar.png').read_bytes(), before)
+
+    def test_failed_chart_is_retried(self):
+        """測試渲染失敗的圖表不寫入紀錄，下次仍會重新渲染"""
+        generator = EnhancedChartGenerator(self.font_manager, self.test_dir, dpi=30, incremental=True)
+        with mock.patch.object(EnhancedChartGenerator, '_create_single_pie', side_effect=RuntimeError('x')):
+            errors = generator.render_charts(self.df, ['pie', 'bar'])
+        self.assertIsInstance(errors['pie'], RuntimeError)
+
+        manifest = RenderManifest(self.test_dir)
+        self.assertIn('enhanced_bar_memory.png', manifest.charts)
+        self.assertNotIn('enhanced_pie_scenarios.png', manifest.charts)
+
+    def test_multi_theme_incremental(self):
+        """測試多主題平行渲染時各主題各自記錄，未變更時不啟動任何工作"""
+        theme_dirs = {theme: self.test_dir / theme for theme in ['professional', 'dark']}
+        options = {'dpi': 30}
+        self.assertEqual(render_multi_theme(self.font_manager, self.df, theme_dirs, 2, chart_types=['pie'],
+                                            generator_options=options, incremental=True),
+                         {'professional': None, 'dark': None})
+        with mock.patch('src.enhanced_chart_generator.ProcessPoolExecutor') as executor:
+            render_multi_theme(self.font_manager, self.df, theme_dirs, 2, chart_types=['pie'],
+                               generator_options=options, incremental=True)
+        executor.assert_not_called()
+        self.assertIn('enhanced_pie_scenarios.png', RenderManifest(theme_dirs['dark']).charts)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+記憶體內渲染 API 測試模組
+"""
+
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# 添加專案路徑
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import matplotlib
+matplotlib.use('Agg')
+from PIL import Image
+
+from src.chart_generator import ChartGenerator
+from src.data_manager import DataManager
+from src.enhanced_chart_generator import EnhancedChartGenerator
+from src.font_manager import FontManager
+
+SIGNATURES = {'png': b'\x89PNG', 'svg': b'<?xml', 'pdf': b'%PDF'}
+
+
+class TestEnhancedRender(unittest.TestCase):
+    """EnhancedChartGenerator 記憶體內渲染測試"""
+
+    def setUp(self):
+        """測試前置設定"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+        self.data_manager = DataManager(storage=None)
+        self.df = self.data_manager.create_algorithm_dataframe()
+        self.generator = EnhancedChartGenerator(FontManager(), self.output_dir, dpi=40)
+
+    def tearDown(self):
+        """清理暫存目錄"""
+        self.temp_dir.cleanup()
+
+    def test_render_formats_without_disk(self):
+        """測試 PNG / SVG / PDF 以位元組回傳、尺寸與 MIME 類型正確，且不寫入輸出目錄"""
+        for image_format, signature in SIGNATURES.items():
+            chart = self.generator.render(self.df, 'pie', image_format=image_format)
+            self.assertTrue(chart.data.startswith(signature))
+            self.assertEqual(chart.filename, f'enhanced_pie_scenarios.{image_format}')
+            metadata = chart.metadata()
+            self.assertEqual(metadata['bytes'], len(chart.data))
+            self.assertGreater(metadata['render_ms'], metadata['encode_ms'])
+            self.assertGreater(metadata['width'], 0)
+        self.assertEqual(chart.mime_type, 'application/pdf')
+
+        png = self.generator.render(self.df, 'pie')
+        with Image.open(io.BytesIO(png.data)) as image:
+            self.assertEqual(image.size, (png.width, png.height))
+        self.assertEqual(list(self.output_dir.iterdir()), [])
+
+        with self.assertRaises(ValueError):
+            self.generator.render(self.df, 'pie', image_format='gif')
+        with self.assertRaises(ValueError):
+            self.generator.render(self.df, 'timeline')
+
+    def test_disk_output_is_optional_sink(self):
+        """測試記憶體內渲染的內容與寫入磁碟的圖檔相同，output_path 只是額外的輸出"""
+        self.generator.create_single_chart(self.df, 'bar')
+        on_disk = self.generator.output_path('bar').read_bytes()
+        chart = self.generator.render(self.df, 'bar', output_path=self.output_dir / 'served.png')
+        self.assertEqual(chart.data, on_disk)
+        self.assertEqual((self.output_dir / 'served.png').read_bytes(), on_disk)
+        self.assertEqual(chart.metadata()['path'], str(self.output_dir / 'served.png'))
+
+    def test_capture_collects_other_methods(self):
+        """測試擷取模式也涵蓋 Pareto 前緣圖等其他圖表方法"""
+        performance = {'algorithms': ['1', '2', '3', '4'], 'execution_time': [10.0, 20.0, 5.0, 30.0],
+                       'accuracy': [80.0, 90.0, 60.0, 70.0], 'memory_usage': [1.0, 2.0, 1.5, 3.0]}
+        with self.generator.capture('svg') as charts:
+            self.generator.create_pareto_frontier_chart(performance)
+        self.assertEqual([chart.filename for chart in charts], ['pareto_frontier.svg'])
+        self.assertEqual(list(self.output_dir.iterdir()), [])
+
+
+class TestChartGeneratorRender(unittest.TestCase):
+    """ChartGenerator 記憶體內渲染測試"""
+
+    def test_render_chart_set(self):
+        """測試增強版圖表組合（含總覽）在記憶體中渲染，指定 output_dir 時另外寫入相同內容"""
+        df = DataManager(storage=None).create_algorithm_dataframe()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir)
+            generator = ChartGenerator(FontManager(), output_dir / 'unused', show=False)
+            charts = generator.render(df, image_format='png', dpi=30)
+            self.assertEqual(len(charts), 6)
+            overview = charts['ultra_enhanced_algorithm_comparison']
+            with Image.open(io.BytesIO(overview.data)) as image:
+                self.assertEqual(image.size, (overview.width, overview.height))
+            self.assertEqual(list((output_dir / 'unused').iterdir()), [])
+
+            charts = generator.render(df, 'main_comparison', image_format='svg', dpi=30, output_dir=output_dir)
+            self.assertEqual(sorted(path.name for path in output_dir.glob('*.svg')),
+                             ['bar_memory_requirements.svg', 'scatter_complexity_vs_power.svg'])
+            self.assertEqual((output_dir / 'bar_memory_requirements.svg').read_bytes(),
+                             charts['bar_memory_requirements'].data)
+            with self.assertRaises(ValueError):
+                generator.render(df, 'dashboard')
+
+
+if __name__ == '__main__':
+    unittest.main()
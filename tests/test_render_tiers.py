@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+渲染品質等級測試模組
+"""
+
+import contextlib
+import io
+import struct
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# 添加專案路徑
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import matplotlib
+matplotlib.use('Agg')
+
+from config.chart_config import ChartConfig
+from src.algorithm_table import AlgorithmTable
+from src.chart_generator import ChartGenerator
+from src.data_manager import DataManager
+from src.enhanced_chart_generator import EnhancedChartGenerator
+from src.font_manager import FontManager
+from src.render_cache import RenderCache
+from src.render_tiers import FullResolutionQueue, main as render_tiers_main
+from src.utils import generate_report_summary
+
+
+def png_size(path):
+    """讀出 PNG 的像素尺寸"""
+    return struct.unpack('>II', Path(path).read_bytes()[16:24])
+
+
+class TestQualityTiers(unittest.TestCase):
+    """預覽與完整解析度測試"""
+
+    def setUp(self):
+        """測試前置設定"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+        self.data_manager = DataManager(storage=None)
+        self.table = self.data_manager.create_algorithm_table()
+        self.font_manager = FontManager()
+
+    def tearDown(self):
+        """清理暫存目錄"""
+        self.temp_dir.cleanup()
+
+    def test_background_full_matches_direct_render(self):
+        """測試預覽以預覽 DPI 輸出，背景佇列由同一份圖表描述輸出的完整解析度與直接渲染相同"""
+        with FullResolutionQueue() as queue:
+            generator = EnhancedChartGenerator(self.font_manager, self.output_dir, dpi=90,
+                                               quality='preview', full_queue=queue)
+            self.assertEqual(generator.render_charts(self.table, ['pie', 'bar']), {'pie': None, 'bar': None})
+            preview = self.output_dir / 'preview' / 'enhanced_pie_scenarios.png'
+            self.assertTrue((self.output_dir / 'preview' / 'enhanced_pie_scenarios.png.figure').exists())
+            errors = queue.wait()
+
+        full = self.output_dir / 'enhanced_pie_scenarios.png'
+        self.assertEqual(errors, {full: None, self.output_dir / 'enhanced_bar_memory.png': None})
+        direct = EnhancedChartGenerator(self.font_manager, self.output_dir, dpi=90).render(self.table, 'pie')
+        self.assertEqual(full.read_bytes(), direct.data)
+        # 像素數依 DPI 比例縮小
+        self.assertAlmostEqual(png_size(preview)[0] / png_size(full)[0], 72 / 90, delta=0.02)
+
+        # 摘要報告列出實際輸出的 DPI
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            generate_report_summary({'pie': preview}, dpi=generator.tier.dpi)
+        self.assertIn('以 72 DPI 輸出', output.getvalue())
+        self.assertNotIn('300 DPI', output.getvalue())
+
+    def test_on_demand_full_and_render_cache(self):
+        """測試未設定佇列時依需求輸出完整解析度，圖表描述隨預覽一起存入渲染快取"""
+        large = AlgorithmTable.from_frame(self.data_manager.create_synthetic_catalog(150))
+        cache = RenderCache(self.output_dir / '.render_cache')
+        generator = EnhancedChartGenerator(self.font_manager, self.output_dir, dpi=60,
+                                           render_cache=cache, quality='preview')
+        generator.render_charts(large, ['heatmap'])
+        snapshot = self.output_dir / 'preview' / 'enhanced_heatmap.png.figure'
+        snapshot.unlink()
+        self.assertTrue(generator._render_chart(large, 'heatmap'))
+        self.assertTrue(snapshot.exists())
+        self.assertFalse((self.output_dir / 'enhanced_heatmap.png').exists())
+
+        chart = generator.tier.render_full(generator.output_path('heatmap'))
+        self.assertEqual(chart.dpi, 60)
+        self.assertEqual((self.output_dir / 'enhanced_heatmap.png').read_bytes(), chart.data)
+
+        # 完整解析度與預覽的快取鍵不同
+        full = EnhancedChartGenerator(self.font_manager, self.output_dir, dpi=60, render_cache=cache)
+        self.assertNotEqual(full._render_cache_key(large, 'heatmap'),
+                            generator._render_cache_key(large, 'heatmap'))
+
+        self.assertEqual(render_tiers_main([str(self.output_dir / 'preview'), '--dpi', '30']), 0)
+        self.assertAlmostEqual(png_size(self.output_dir / 'enhanced_heatmap.png')[0] * 2, chart.width, delta=10)
+
+    def test_overview_composed_after_full_tiles(self):
+        """測試標準生成器的總覽在預覽等級以預覽 DPI 拼接，完整解析度的總覽在各圖表完成後拼接"""
+        with mock.patch.dict(ChartConfig.CHART_STYLE, {'dpi': 40, 'preview_dpi': 20}), \
+                FullResolutionQueue() as queue:
+            generator = ChartGenerator(self.font_manager, self.output_dir, show=False,
+                                       quality='preview', full_queue=queue)
+            generator.create_enhanced_main_comparison(self.table)
+            overview = ChartConfig.OUTPUT_FILES['main_comparison']
+            self.assertEqual(png_size(self.output_dir / 'preview' / overview), (24 * 20, 18 * 20))
+            self.assertFalse((self.output_dir / overview).exists())
+
+            errors = queue.wait()
+        self.assertEqual(len(errors), 6)
+        self.assertFalse(any(errors.values()))
+        self.assertEqual(png_size(self.output_dir / overview), (24 * 40, 18 * 40))
+
+
+if __name__ == '__main__':
+    unittest.main()
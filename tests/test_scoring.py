@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+多準則效率評分測試模組
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# 添加專案路徑
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+import pandas as pd
+
+from src.data_manager import DataManager
+from src.scoring import SCORING_PROFILES, ScoringEngine
+
+
+class TestScoringEngine(unittest.TestCase):
+    """評分引擎測試"""
+
+    def setUp(self):
+        """測試前置設定"""
+        self.data = {
+            'execution_time': [10.0, 200.0, 50.0, 50.0],
+            'memory_usage': [1.0, 0.5, 4.0, 2.0],
+            'accuracy': [60.0, 80.0, 70.0, 70.0]
+        }
+
+    def test_legacy_profile_matches_old_formula(self):
+        """測試預設評分與舊版公式 100 - (t/10 + m/20 - a/2) 相同"""
+        expected = [100 - (t/10 + m/20 - a/2) for t, m, a in zip(*self.data.values())]
+        scores = DataManager(storage=None).calculate_efficiency_score(*self.data.values())
+        np.testing.assert_allclose(scores, expected)
+
+    def test_normalizations_and_topsis(self):
+        """測試各正規化方式的範圍與 TOPSIS 接近度"""
+        for normalization in ['minmax', 'rank']:
+            scores = ScoringEngine('balanced', normalization=normalization).score(self.data)
+            self.assertTrue(((scores >= 0) & (scores <= 100)).all())
+        # 各項都最佳的配置得到 TOPSIS 100 分、都最差得到 0 分
+        dominant = {'execution_time': [1.0, 9.0, 5.0], 'memory_usage': [1.0, 9.0, 5.0], 'accuracy': [90.0, 10.0, 50.0]}
+        scores = ScoringEngine('topsis').score(dominant)
+        self.assertAlmostEqual(scores[0], 100)
+        self.assertAlmostEqual(scores[1], 0)
+        zscores = ScoringEngine('balanced', normalization='zscore').score(self.data)
+        self.assertAlmostEqual(zscores.mean(), 0)
+        # 同值同分
+        ranks = ScoringEngine('balanced', weights={'memory_usage': 0}, normalization='rank').score(self.data)
+        self.assertEqual(ranks[2], ranks[3])
+
+    def test_profiles_change_ranking(self):
+        """測試權重組合改變排名，且 DataFrame 與字典輸入結果相同"""
+        frame = pd.DataFrame(self.data)
+        self.assertEqual(ScoringEngine('speed_first').rank(frame)[0], 0)
+        self.assertEqual(ScoringEngine('accuracy_first').rank(self.data)[0], 1)
+        self.assertEqual(ScoringEngine('low_memory').rank(frame, top=1).tolist(), [1])
+        for profile in SCORING_PROFILES:
+            np.testing.assert_array_equal(ScoringEngine(profile).score(frame), ScoringEngine(profile).score(self.data))
+
+    def test_large_input_and_missing_values(self):
+        """測試大量列以單次呼叫評分，缺值的列為 NaN 並排在最後"""
+        rng = np.random.default_rng(0)
+        n = 200000
+        data = {'execution_time': rng.lognormal(3, 1, n), 'memory_usage': rng.gamma(2, 5, n),
+                'accuracy': rng.uniform(40, 90, n)}
+        data['accuracy'][7] = np.nan
+        for profile in ['balanced', 'topsis']:
+            scores = ScoringEngine(profile).score(data)
+            self.assertEqual(scores.shape, (n,))
+            self.assertTrue(np.isnan(scores[7]))
+            self.assertEqual(np.isnan(scores).sum(), 1)
+        self.assertEqual(ScoringEngine('balanced').rank(data)[-1], 7)
+
+    def test_invalid_settings_rejected(self):
+        """測試未知的組合、準則或方法拋出 ValueError"""
+        for options in [{'profile': 'fastest'}, {'weights': {'latency': 1}},
+                        {'normalization': 'log'}, {'method': 'ahp'},
+                        {'weights': {'execution_time': 0, 'memory_usage': 0, 'accuracy': 0}}]:
+            with self.assertRaises(ValueError):
+                ScoringEngine(**options)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+延遲載入與啟動時間基準測試的測試
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# 添加專案路徑
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config.chart_config import ChartConfig, ColorSchemes
+from src.startup_benchmark import measure_import, parse_importtime
+
+
+class TestLazyImports(unittest.TestCase):
+    """延遲載入測試"""
+
+    def test_entry_point_defers_plotting_dependencies(self):
+        """測試匯入主程式時不載入 matplotlib、seaborn 與 plotly"""
+        result = measure_import('src.main')
+        self.assertEqual(result['heavy_loaded'], [])
+        self.assertGreater(result['import_ms'], 0)
+
+    def test_color_schemes_built_on_first_access(self):
+        """測試色圖類顏色方案在第一次取用時才建立，且只建立一次"""
+        calls = []
+        schemes = ColorSchemes({'fixed': ['#000000']},
+                               {'lazy': lambda: calls.append(1) or ['#FFFFFF']})
+
+        self.assertEqual(len(schemes), 2)
+        self.assertIn('lazy', schemes)
+        self.assertEqual(calls, [])
+        self.assertEqual(schemes['lazy'], ['#FFFFFF'])
+        self.assertEqual(schemes.get('lazy'), ['#FFFFFF'])
+        self.assertEqual(calls, [1])
+        self.assertIsNone(schemes.get('missing'))
+
+    def test_chart_config_colors(self):
+        """測試延遲建立的色圖與原本的顏色方案一致"""
+        self.assertEqual(ChartConfig.get_color_scheme('primary').shape, (10, 4))
+        self.assertEqual(ChartConfig.get_colormap('gradient_blue').name, 'gradient_blue')
+        self.assertEqual(len(ChartConfig.get_colors('viridis', 25)), 25)
+        self.assertEqual(ChartConfig.get_colors('neon', 3), ['#FF0080', '#00FF80', '#8000FF'])
+
+
+class TestStartupBenchmark(unittest.TestCase):
+    """啟動時間基準測試"""
+
+    def test_parse_importtime(self):
+        """測試解析 -X importtime 輸出"""
+        stderr = ("import time: self [us] | cumulative | imported package\n"
+                  "import time:       120 |        120 |   numpy.version\n"
+                  "import time:      3000 |      45000 | pandas\n")
+        self.assertEqual(parse_importtime(stderr),
+                         {'numpy.version': (120, 120), 'pandas': (3000, 45000)})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+效能追蹤模組的測試
+"""
+
+import io
+import json
+import unittest
+import shutil
+import sys
+from pathlib import Path
+
+# 添加專案路徑
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+
+from src import tracing
+from src.tracing import Tracer
+from src import main as cli
+
+
+class TestTracer(unittest.TestCase):
+    """區段追蹤器測試"""
+
+    def test_nested_spans_and_summary(self):
+        """測試巢狀區段的自身時間扣除子區段，且摘要依總時間排序"""
+        tracer = Tracer()
+        with tracer.span('outer', chart='pie'):
+            with tracer.span('inner'):
+                sum(range(200000))
+        tracer.instant('訊息')
+
+        outer, inner = sorted((e for e in tracer.events if e['ph'] == 'X'), key=lambda e: e['ts'])
+        self.assertEqual(outer['name'], 'outer')
+        self.assertEqual(outer['args']['chart'], 'pie')
+        self.assertLessEqual(outer['ts'], inner['ts'])
+        self.assertGreaterEqual(outer['ts'] + outer['dur'], inner['ts'] + inner['dur'])
+
+        summary = {row['name']: row for row in tracer.summary()}
+        self.assertEqual([row['name'] for row in tracer.summary()], ['outer', 'inner'])
+        self.assertAlmostEqual(summary['outer']['self_ms'],
+                               (outer['dur'] - inner['dur']) / 1000, places=6)
+        self.assertEqual(summary['inner']['self_ms'], summary['inner']['total_ms'])
+
+    def test_peak_memory_propagates_to_parent(self):
+        """測試子區段的峰值記憶體會計入外層區段"""
+        tracer = Tracer(trace_memory=True).start()
+        try:
+            with tracer.span('outer'):
+                with tracer.span('inner'):
+                    buffer = bytearray(8 * 1024 * 1024)
+                    del buffer
+        finally:
+            tracer.stop()
+
+        peaks = {row['name']: row['peak_mb'] for row in tracer.summary()}
+        self.assertGreaterEqual(peaks['inner'], 8)
+        self.assertGreaterEqual(peaks['outer'], peaks['inner'])
+
+    def test_span_is_noop_without_active_tracer(self):
+        """測試未啟用追蹤時的區段不記錄任何事件"""
+        self.assertIsNone(tracing.get_tracer())
+        with tracing.span('ignored'):
+            pass
+        tracing.instant('ignored')
+
+    def test_matplotlib_instrumentation(self):
+        """測試 savefig 被拆為點陣化與編碼區段，停用後還原 matplotlib"""
+        original_savefig = Figure.savefig
+        with tracing.tracing() as tracer:
+            fig, ax = plt.subplots()
+            ax.plot([1, 2, 3])
+            fig.tight_layout()
+            fig.savefig(io.BytesIO(), format='png')
+            plt.close(fig)
+
+        names = {event['name'] for event in tracer.events}
+        self.assertTrue({'tight_layout', 'savefig', 'rasterize', 'encode'} <= names)
+        self.assertIs(Figure.savefig, original_savefig)
+        self.assertIsNone(tracing.get_tracer())
+
+
+class TestBatchTrace(unittest.TestCase):
+    """批次模式追蹤輸出測試"""
+
+    def setUp(self):
+        """測試前置設定"""
+        self.test_output_dir = Path("test_output_trace")
+
+    def test_batch_exports_chrome_trace(self):
+        """測試 --trace 匯出 Chrome trace 與摘要，包含數據載入與各圖表的區段"""
+        trace_path = self.test_output_dir / "trace.json"
+        args = cli.parse_args(['--charts', 'pie', '--dpi', '50', '--no-cache',
+                               '-o', str(self.test_output_dir), '--trace', str(trace_path)])
+        self.assertEqual(cli.run_batch(args), cli.EXIT_OK)
+
+        with open(trace_path, encoding='utf-8') as f:
+            events = json.load(f)['traceEvents']
+        names = {event['name'] for event in events}
+        self.assertTrue({'batch', 'data_load', 'render:pie', 'figure_build', 'savefig'} <= names)
+
+        with open(trace_path.with_suffix('.summary.json'), encoding='utf-8') as f:
+            summary = json.load(f)
+        self.assertEqual(summary[0]['name'], 'batch')
+
+    def tearDown(self):
+        """測試清理"""
+        if self.test_output_dir.exists():
+            shutil.rmtree(self.test_output_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
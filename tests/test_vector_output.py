@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+向量輸出與 PDF 報告測試模組
+"""
+
+import base64
+import io
+import re
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# 添加專案路徑
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.font_manager as fm
+from fontTools.ttLib import TTFont
+
+from src.chart_generator import ChartGenerator
+from src.data_manager import DataManager
+from src.enhanced_chart_generator import EnhancedChartGenerator
+from src.vector_output import FONT_FLAVOR
+
+
+class FileFontManager:
+    """以字體檔 (fname) 指定字體，與 FontManager 找到中文字體時相同"""
+
+    def __init__(self, family='DejaVu Serif'):
+        self.path = fm.findfont(family)
+
+    def get_font(self):
+        return fm.FontProperties(fname=self.path)
+
+
+def embedded_fonts(svg):
+    """讀出 SVG 內嵌的 {字體族: 子集 TTFont}"""
+    fonts = {}
+    pattern = rb"@font-face\{font-family:'([^']+)';[^}]*?base64,([A-Za-z0-9+/=]+)"
+    for family, data in re.findall(pattern, svg):
+        fonts[family.decode()] = TTFont(io.BytesIO(base64.b64decode(data)))
+    return fonts
+
+
+class TestVectorOutput(unittest.TestCase):
+    """SVG / PDF 字體子集與多頁報告測試"""
+
+    def setUp(self):
+        """測試前置設定"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+        self.table = DataManager(storage=None).create_algorithm_table()
+        self.font_manager = FileFontManager()
+
+    def tearDown(self):
+        """清理暫存目錄"""
+        self.temp_dir.cleanup()
+
+    def test_svg_keeps_text_and_embeds_subset(self):
+        """測試 SVG 保留文字、以實際字體名稱引用 fname 字體，並只內嵌用到的字形"""
+        generator = EnhancedChartGenerator(self.font_manager, self.output_dir)
+        svg = generator.render(self.table, 'pie', image_format='svg').data
+        self.assertIn('適用場景分布'.encode(), svg)
+        self.assertIn(b"font-family: 'DejaVu Serif'", svg)
+
+        fonts = embedded_fonts(svg)
+        self.assertEqual(fonts['DejaVu Serif'].flavor, FONT_FLAVOR)
+        self.assertLess(len(fonts['DejaVu Serif'].getGlyphOrder()), 60)
+        self.assertIn(ord('%'), fonts['DejaVu Sans'].getBestCmap())
+        self.assertLess(len(svg), Path(self.font_manager.path).stat().st_size / 10)
+
+        # 不含時間戳記，輸出可重現；字體設定在輸出後還原
+        self.assertEqual(generator.render(self.table, 'pie', image_format='svg').data, svg)
+        self.assertEqual(generator.zh_font.get_family(), ['sans-serif'])
+
+    def test_pdf_embeds_truetype_subset(self):
+        """測試 PDF 以 TrueType 子集嵌入字體，不轉為 Type 3 程序"""
+        generator = EnhancedChartGenerator(self.font_manager, self.output_dir, image_format='pdf')
+        generator.render_charts(self.table, ['bar'])
+        pdf = (self.output_dir / 'enhanced_bar_memory.pdf').read_bytes()
+        self.assertIn(b'/FontFile2', pdf)
+        self.assertNotIn(b'/Type3', pdf)
+        self.assertNotIn(b'/CreationDate', pdf)
+
+    def test_pdf_report_writes_every_chart(self):
+        """測試多頁 PDF 報告每張圖表一頁，且不輸出個別圖檔"""
+        generator = EnhancedChartGenerator(self.font_manager, self.output_dir)
+        path = generator.create_pdf_report(self.table, ['scatter', 'bar', 'pie'])
+        self.assertEqual(path, self.output_dir / 'algorithm_report.pdf')
+        pdf = path.read_bytes()
+        self.assertEqual(int(re.search(rb'/Type /Pages /Kids \[[^\]]*\] /Count (\d+)', pdf).group(1)), 3)
+        self.assertEqual(sorted(p.name for p in self.output_dir.iterdir()), ['algorithm_report.pdf'])
+
+        # 標準生成器：向量格式輸出各圖表，總覽只以點陣格式拼接
+        standard = ChartGenerator(self.font_manager, self.output_dir / 'standard', show=False, image_format='svg')
+        standard.create_enhanced_main_comparison(self.table)
+        self.assertEqual(len(list(standard.output_dir.glob('*.svg'))), 5)
+        self.assertEqual(list(standard.output_dir.glob('*.png')), [])
+        standard.create_pdf_report(self.table)
+        self.assertTrue((standard.output_dir / 'algorithm_report.pdf').exists())
+
+
+if __name__ == '__main__':
+    unittest.main()